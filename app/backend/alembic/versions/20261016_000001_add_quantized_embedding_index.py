@@ -0,0 +1,63 @@
+"""add_quantized_embedding_index
+
+Builds the compact HNSW index used by the quantized ANN stage
+(PGVECTOR_QUANTIZATION=halfvec|binary). The index is on an expression over
+the existing full-precision ``embedding`` column, so building it is the
+backfill: no new column or data copy is needed, and re-ranking still reads the
+original vectors.
+
+With PGVECTOR_QUANTIZATION=none this migration does nothing; enabling the mode
+later only needs POST /api/v1/maintenance/vector-indexes/sync.
+
+Revision ID: 20261016_000001
+Revises: 092591af635f
+Create Date: 2026-10-16 00:00:01.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+from research_agent.config import get_settings
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_000001"
+down_revision: Union[str, None] = "092591af635f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Kept in sync with infrastructure/vector_store/ann_index.py
+QUANTIZED_INDEXES = {
+    "halfvec": (
+        "ix_resource_chunks_embedding_halfvec_hnsw",
+        "(embedding::halfvec(1536)) halfvec_cosine_ops",
+    ),
+    "binary": (
+        "ix_resource_chunks_embedding_bit_hnsw",
+        "(binary_quantize(embedding)::bit(1536)) bit_hamming_ops",
+    ),
+}
+
+
+def upgrade() -> None:
+    mode = get_settings().pgvector_quantization
+    if mode not in QUANTIZED_INDEXES:
+        return
+
+    index_name, index_expression = QUANTIZED_INDEXES[mode]
+    # CONCURRENTLY cannot run inside a transaction; keeps chunk writes unblocked
+    with op.get_context().autocommit_block():
+        op.execute(
+            f"""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name}
+            ON resource_chunks
+            USING hnsw ({index_expression})
+            WITH (m = 16, ef_construction = 64)
+            """
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, _ in QUANTIZED_INDEXES.values():
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
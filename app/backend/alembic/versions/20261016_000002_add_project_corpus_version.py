@@ -0,0 +1,35 @@
+"""add_project_corpus_version
+
+Adds ``projects.corpus_version``, a counter bumped in the same transaction as
+every resource_chunks write/delete. The retrieval result cache includes it in
+its keys, so cached search results are dropped as soon as a project's chunks
+change.
+
+Revision ID: 20261016_000002
+Revises: 20261016_000001
+Create Date: 2026-10-16 00:00:02.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_000002"
+down_revision: Union[str, None] = "20261016_000001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "projects",
+        sa.Column("corpus_version", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("projects", "corpus_version")
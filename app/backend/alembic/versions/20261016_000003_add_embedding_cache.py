@@ -0,0 +1,55 @@
+"""add_embedding_cache
+
+Content-addressed embedding cache: one row per sha256(model + normalized
+text) holding the vector as a float16 blob (3 KB for 1536 dims). Lets
+re-processing, re-uploads and URL re-extraction reuse embeddings instead of
+calling the provider again.
+
+Revision ID: 20261016_000003
+Revises: 20261016_000002
+Create Date: 2026-10-16 00:00:03.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_000003"
+down_revision: Union[str, None] = "20261016_000002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "embedding_cache",
+        sa.Column("key", sa.LargeBinary(length=32), nullable=False),
+        sa.Column("model", sa.String(length=255), nullable=False),
+        sa.Column("dims", sa.Integer(), nullable=False),
+        sa.Column("embedding", sa.LargeBinary(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "last_used_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("key"),
+    )
+    op.create_index(
+        op.f("ix_embedding_cache_last_used_at"), "embedding_cache", ["last_used_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_embedding_cache_last_used_at"), table_name="embedding_cache")
+    op.drop_table("embedding_cache")
@@ -0,0 +1,44 @@
+"""unconstrained_embedding_columns
+
+Drops the fixed ``vector(1536)`` type modifier from the embedding columns of
+``resource_chunks`` and ``chat_memories`` so deployments can store
+reduced-dimension (Matryoshka) embeddings (EMBEDDING_DIMENSIONS). The size
+is still enforced where it matters: the HNSW indexes are built on
+``embedding::vector(N)`` expressions. Existing 1536-dim data and indexes are
+unchanged; switching to another size is done by
+scripts/backfill_embedding_dimensions.py.
+
+The type change rewrites both tables and their embedding indexes, so run it
+in a maintenance window on large deployments.
+
+Revision ID: 20261016_000004
+Revises: 20261016_000003
+Create Date: 2026-10-16 00:00:04.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_000004"
+down_revision: Union[str, None] = "20261016_000003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("resource_chunks", "chat_memories")
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN embedding TYPE vector")
+
+
+def downgrade() -> None:
+    # Fails if any row holds a non-1536 vector (backfill back to 1536 first)
+    for table in TABLES:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN embedding TYPE vector(1536) "
+            "USING embedding::vector(1536)"
+        )
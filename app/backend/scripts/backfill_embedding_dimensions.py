@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Rewrite stored embeddings at the configured EMBEDDING_DIMENSIONS.
+
+Run after changing EMBEDDING_DIMENSIONS (and after `alembic upgrade head`),
+with the new value in the environment. Stop ingest workers first: chunks
+written at the old size during the backfill would be missed.
+
+Modes:
+    truncate  first N components, re-normalized; no API calls
+              (only for text-embedding-3 vectors and a smaller N)
+    reembed   embed the stored text again with the configured model
+
+pgvector rows are rewritten in place and the HNSW indexes rebuilt at the new
+size. For Qdrant the collection is copied to --target-collection; switch
+QDRANT_COLLECTION_NAME to it once the copy is done.
+
+Usage:
+    EMBEDDING_DIMENSIONS=512 python scripts/backfill_embedding_dimensions.py truncate
+    EMBEDDING_DIMENSIONS=512 python scripts/backfill_embedding_dimensions.py reembed \
+        --target-collection resource_chunks_d512
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add backend src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("mode", choices=["truncate", "reembed"])
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument(
+        "--target-collection",
+        default=None,
+        help="Qdrant collection to copy into (default: <current>_d<dims>)",
+    )
+    args = parser.parse_args()
+
+    from research_agent.config import get_settings
+    from research_agent.infrastructure.embedding.backfill import (
+        backfill_pgvector,
+        backfill_qdrant,
+    )
+
+    settings = get_settings()
+    service = None
+    if args.mode == "reembed":
+        from research_agent.api.deps import get_embedding_service
+
+        service = get_embedding_service()
+
+    print(f"Backfilling embeddings to {settings.embedding_dimensions} dims ({args.mode})")
+    if settings.vector_store_provider == "qdrant":
+        target = (
+            args.target_collection
+            or f"{settings.qdrant_collection_name}_d{settings.embedding_dimensions}"
+        )
+        report = await backfill_qdrant(args.mode, target, service, batch_size=args.batch_size)
+        print(f"Qdrant: {report.rows}")
+
+    # Chat memories (and chunks, unless they live in Qdrant) are in PostgreSQL
+    report = await backfill_pgvector(args.mode, service, batch_size=args.batch_size)
+    print(f"PostgreSQL: {report.rows}")
+    if report.dropped_indexes:
+        print(f"Dropped indexes: {', '.join(report.dropped_indexes)}")
+    if report.created_indexes:
+        print(f"Created indexes: {', '.join(report.created_indexes)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
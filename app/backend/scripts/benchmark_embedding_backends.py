@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Compare the local ONNX embedding backend with the remote API.
+
+Measures, for each backend:
+
+- query latency: sequential single-text embed() calls (p50/p95)
+- ingest throughput: one embed_batch() over synthetic chunk-sized texts
+
+and prints a markdown table. The remote backend is measured only when
+OPENROUTER_API_KEY (or OPENAI_API_KEY) is configured.
+
+Export a local model first, e.g.:
+    optimum-cli export onnx --model BAAI/bge-small-en-v1.5 data/models/embedding
+    (keep model.onnx and tokenizer.json)
+
+Usage:
+    python scripts/benchmark_embedding_backends.py [--model-dir data/models/embedding] \
+        [--queries 30] [--chunks 256] [--words 200] [--skip-remote]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add backend src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+WORDS = (
+    "retrieval embedding vector model latency throughput document chunk query "
+    "research answer context token batch index search semantic result project"
+).split()
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def make_texts(count: int, words: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(WORDS) for _ in range(words)) for _ in range(count)]
+
+
+async def measure(name: str, service, args) -> dict:
+    # Warm up (model load / connection setup)
+    await service.embed("warm up")
+
+    latencies = []
+    for query in make_texts(args.queries, 12, seed=1):
+        started = time.perf_counter()
+        await service.embed(query)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    chunks = make_texts(args.chunks, args.words, seed=2)
+    started = time.perf_counter()
+    embeddings = await service.embed_batch(chunks)
+    batch_s = time.perf_counter() - started
+
+    return {
+        "backend": name,
+        "dims": len(embeddings[0]),
+        "p50": statistics.median(latencies),
+        "p95": percentile(latencies, 95),
+        "chunks_s": len(chunks) / batch_s,
+    }
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model-dir", default=None, help="Local model directory")
+    parser.add_argument("--queries", type=int, default=30)
+    parser.add_argument("--chunks", type=int, default=256)
+    parser.add_argument("--words", type=int, default=200)
+    parser.add_argument("--skip-remote", action="store_true")
+    args = parser.parse_args()
+
+    from research_agent.config import get_settings
+    from research_agent.infrastructure.embedding.local_onnx import LocalOnnxEmbeddingService
+    from research_agent.infrastructure.embedding.openrouter import (
+        OpenAIEmbeddingService,
+        OpenRouterEmbeddingService,
+    )
+
+    settings = get_settings()
+    rows = []
+
+    local = LocalOnnxEmbeddingService(model_path=args.model_dir)
+    rows.append(await measure("local-onnx", local, args))
+
+    if not args.skip_remote:
+        if settings.openrouter_api_key:
+            remote = OpenRouterEmbeddingService(
+                api_key=settings.openrouter_api_key, model=settings.embedding_model
+            )
+        elif settings.openai_api_key:
+            remote = OpenAIEmbeddingService(
+                api_key=settings.openai_api_key, model=settings.embedding_model.split("/")[-1]
+            )
+        else:
+            remote = None
+            print("No API key configured, skipping remote backend")
+        if remote is not None:
+            rows.append(await measure(f"remote ({settings.embedding_model})", remote, args))
+
+    print(
+        f"\n{args.queries} queries, {args.chunks} chunks x {args.words} words, "
+        f"workers={settings.local_embedding_workers}, batch={settings.local_embedding_batch_size}\n"
+    )
+    print("| backend | dims | query p50 ms | query p95 ms | ingest chunks/s |")
+    print("|---|---|---|---|---|")
+    for row in rows:
+        print(
+            f"| {row['backend']} | {row['dims']} | {row['p50']:.1f} | {row['p95']:.1f} "
+            f"| {row['chunks_s']:.1f} |"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Compare the Qdrant tuning profile against the previous defaults.
+
+Loads the same synthetic corpus (random unit vectors spread over several
+projects and users) into two collections:
+
+- default: no quantization, serial upsert batches of 100
+- tuned:   payload indexes, int8 quantization with rescoring, parallel
+           size-bounded upserts (QDRANT_UPSERT_* settings)
+
+and reports ingest throughput, filtered search latency and recall@k against
+an exact NumPy search as a markdown table.
+
+By default it runs against the in-process local Qdrant (``:memory:``) as a
+stand-in. Local mode searches exactly and ignores payload indexes and
+quantization, so there only the ingestion pipeline differs; pass --url to
+measure a real Qdrant server.
+
+Usage:
+    python scripts/benchmark_qdrant_profile.py [--url http://localhost:6333] \
+        [--points 20000] [--dims 1536] [--projects 20] [--queries 50] [--k 10]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from uuid import uuid4
+
+import numpy as np
+
+# Add backend src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def make_corpus(points: int, dims: int, projects: int) -> tuple[np.ndarray, list[dict]]:
+    from research_agent.domain.entities.resource import ResourceType
+
+    rng = np.random.default_rng(42)
+    vectors = rng.standard_normal((points, dims)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    project_ids = [uuid4() for _ in range(projects)]
+    resource_ids = [uuid4() for _ in range(projects * 10)]
+
+    chunks = [
+        {
+            "chunk_id": uuid4(),
+            "resource_id": resource_ids[i % len(resource_ids)],
+            "resource_type": ResourceType.DOCUMENT,
+            "project_id": project_ids[i % projects],
+            "chunk_index": i,
+            "content": f"synthetic chunk {i} " * 40,
+            "embedding": vectors[i].tolist(),
+            "metadata": {"page_number": i % 50},
+            "user_id": f"user-{i % projects}",
+        }
+        for i in range(points)
+    ]
+    return vectors, chunks
+
+
+async def run_profile(client, name: str, tuned: bool, vectors, chunks, args) -> dict:
+    from research_agent.config import get_settings
+    from research_agent.infrastructure.vector_store import qdrant as qdrant_module
+
+    settings = get_settings()
+    settings.qdrant_collection_name = f"bench_{name}_{uuid4().hex[:8]}"
+    settings.qdrant_quantization = "int8" if tuned else "none"
+    settings.qdrant_upsert_concurrency = args.concurrency if tuned else 1
+    settings.qdrant_upsert_max_batch_bytes = 8_000_000 if tuned else 10**12
+    qdrant_module._sparse_support.clear()
+    qdrant_module._tuned_collections.clear()
+
+    if tuned:
+        await qdrant_module.ensure_collection_exists(
+            client, settings.qdrant_collection_name, vector_size=args.dims
+        )
+    else:
+        # Previous defaults: same vectors, no payload indexes or quantization
+        from qdrant_client.models import Distance, Modifier, SparseVectorParams, VectorParams
+
+        await client.create_collection(
+            collection_name=settings.qdrant_collection_name,
+            vectors_config=VectorParams(size=args.dims, distance=Distance.COSINE),
+            sparse_vectors_config={
+                qdrant_module.SPARSE_VECTOR_NAME: SparseVectorParams(modifier=Modifier.IDF),
+            },
+        )
+
+    store = qdrant_module.QdrantVectorStore(client=client)
+
+    started = time.perf_counter()
+    for i in range(0, len(chunks), 1000):
+        await store.upsert_resource_chunks_batch(chunks[i : i + 1000], batch_size=100)
+    ingest_s = time.perf_counter() - started
+
+    rng = np.random.default_rng(7)
+    latencies, recalls = [], []
+    for q in rng.choice(len(chunks), size=args.queries, replace=False):
+        query = vectors[q] + rng.normal(0, 0.05, args.dims).astype(np.float32)
+        project_id = chunks[q]["project_id"]
+        user_id = chunks[q]["user_id"]
+
+        members = [i for i, c in enumerate(chunks) if c["project_id"] == project_id]
+        exact = np.asarray(members)[np.argsort(-(vectors[members] @ query))[: args.k]]
+        expected = {chunks[i]["chunk_id"] for i in exact}
+
+        started = time.perf_counter()
+        results = await store.search(
+            query.tolist(), project_id=project_id, limit=args.k, user_id=user_id
+        )
+        latencies.append((time.perf_counter() - started) * 1000)
+        recalls.append(len(expected & {r.chunk_id for r in results}) / args.k)
+
+    await client.delete_collection(settings.qdrant_collection_name)
+    return {
+        "profile": name,
+        "ingest_pts_s": len(chunks) / ingest_s,
+        "p50": statistics.median(latencies),
+        "p95": percentile(latencies, 95),
+        "recall": statistics.mean(recalls),
+    }
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="Qdrant server URL (default: local in-memory stand-in)")
+    parser.add_argument("--points", type=int, default=20000)
+    parser.add_argument("--dims", type=int, default=1536)
+    parser.add_argument("--projects", type=int, default=20)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    from qdrant_client import AsyncQdrantClient
+
+    client = AsyncQdrantClient(url=args.url) if args.url else AsyncQdrantClient(location=":memory:")
+    vectors, chunks = make_corpus(args.points, args.dims, args.projects)
+
+    rows = []
+    for name, tuned in (("default", False), ("tuned", True)):
+        rows.append(await run_profile(client, name, tuned, vectors, chunks, args))
+
+    target = args.url or "local :memory: (indexes/quantization have no effect)"
+    print(f"\n{args.points} points x {args.dims} dims, {args.projects} projects, {target}\n")
+    print(f"| profile | ingest pts/s | p50 ms | p95 ms | recall@{args.k} |")
+    print("|---|---|---|---|---|")
+    for row in rows:
+        print(
+            f"| {row['profile']} | {row['ingest_pts_s']:.0f} | {row['p50']:.2f} "
+            f"| {row['p95']:.2f} | {row['recall']:.3f} |"
+        )
+    await client.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Recall vs latency report for quantized pgvector search.
+
+Samples stored chunk embeddings of a project as queries, computes the exact
+top-k (full-precision, sequential scan) as ground truth, then runs the
+quantized two-stage search at several oversampling factors and reports
+recall@k and latency percentiles as a markdown table.
+
+Usage:
+    python scripts/benchmark_quantized_search.py <project_id> \
+        [--mode halfvec|binary] [--k 10] [--queries 50] [--oversample 2,5,10,20,40]
+
+Requirements:
+    - The compact index for the mode exists (migration or
+      POST /api/v1/maintenance/vector-indexes/sync)
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from uuid import UUID
+
+# Add backend src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+
+async def run_plan(session, plan, embedding: str, k: int) -> tuple[list, float]:
+    """Run one nearest-neighbour query under a plan; return ids and latency (ms)."""
+    from sqlalchemy import text
+
+    from research_agent.infrastructure.vector_store.ann_index import (
+        apply_planner_settings,
+        nearest_neighbors_sql,
+        reset_planner_settings,
+    )
+
+    where_clause, params = plan.project_filter()
+    query = text(nearest_neighbors_sql(plan, f"{where_clause} AND embedding IS NOT NULL"))
+    params = {**params, **plan.stage_params(), "embedding": embedding, "limit": k}
+
+    await apply_planner_settings(session, plan)
+    started = time.perf_counter()
+    result = await session.execute(query, params)
+    ids = [row.id for row in result]
+    elapsed = (time.perf_counter() - started) * 1000
+    await reset_planner_settings(session, plan)
+    return ids, elapsed
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("project_id", type=UUID)
+    parser.add_argument("--mode", choices=["halfvec", "binary"], default="halfvec")
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--oversample", default="2,5,10,20,40")
+    args = parser.parse_args()
+
+    from sqlalchemy import text
+
+    from research_agent.infrastructure.database.session import get_async_session
+    from research_agent.infrastructure.vector_store.ann_index import (
+        AnnSearchPlan,
+        ef_search_for,
+    )
+
+    factors = [int(f) for f in args.oversample.split(",")]
+
+    async with get_async_session() as session:
+        sample = await session.execute(
+            text("""
+                SELECT embedding::text AS embedding FROM resource_chunks
+                WHERE project_id = cast(:project_id as uuid) AND embedding IS NOT NULL
+                ORDER BY random()
+                LIMIT :n
+            """),
+            {"project_id": str(args.project_id), "n": args.queries},
+        )
+        queries = [row.embedding for row in sample]
+        count = (
+            await session.execute(
+                text(
+                    "SELECT count(*) FROM resource_chunks "
+                    "WHERE project_id = cast(:project_id as uuid) AND embedding IS NOT NULL"
+                ),
+                {"project_id": str(args.project_id)},
+            )
+        ).scalar_one()
+
+        if not queries:
+            print(f"No embedded chunks found for project {args.project_id}")
+            return 1
+
+        exact_plan = AnnSearchPlan(
+            project_id=args.project_id, strategy="exact", ef_search=40, iterative_scan="off"
+        )
+        truth: list[set] = []
+        exact_latency: list[float] = []
+        for embedding in queries:
+            ids, elapsed = await run_plan(session, exact_plan, embedding, args.k)
+            truth.append(set(ids))
+            exact_latency.append(elapsed)
+
+        print(
+            f"\nProject {args.project_id}: {count} chunks, {len(queries)} queries, "
+            f"k={args.k}, mode={args.mode}\n"
+        )
+        print("| stage | oversample | recall@k | p50 ms | p95 ms |")
+        print("|---|---|---|---|---|")
+        print(
+            f"| exact | - | 1.000 | {statistics.median(exact_latency):.1f} "
+            f"| {percentile(exact_latency, 95):.1f} |"
+        )
+
+        for factor in factors:
+            candidate_limit = args.k * factor
+            plan = AnnSearchPlan(
+                project_id=args.project_id,
+                strategy="global_index",
+                ef_search=ef_search_for(count, candidate_limit),
+                iterative_scan="strict_order",
+                quantization=args.mode,
+                candidate_limit=candidate_limit,
+            )
+            recalls: list[float] = []
+            latency: list[float] = []
+            for embedding, expected in zip(queries, truth):
+                ids, elapsed = await run_plan(session, plan, embedding, args.k)
+                recalls.append(len(expected & set(ids)) / max(len(expected), 1))
+                latency.append(elapsed)
+            print(
+                f"| {args.mode} | {factor} | {statistics.mean(recalls):.3f} "
+                f"| {statistics.median(latency):.1f} | {percentile(latency, 95):.1f} |"
+            )
+
+        await session.rollback()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
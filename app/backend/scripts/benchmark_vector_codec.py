@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Microbenchmark: text literal vs binary codec for pgvector parameters.
+
+Compares, per 1536-dim query embedding:
+- client CPU to encode the parameter (old text literal vs binary codec)
+- bytes sent on the wire for the parameter
+- client CPU to decode a returned vector (text parse vs binary)
+
+With --database, also times real round trips against PostgreSQL on two raw
+asyncpg connections (text format vs binary codec), with and without a
+prepared statement.
+
+Usage:
+    python scripts/benchmark_vector_codec.py [--iterations 2000] [--database]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add backend src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+DIMS = 1536
+
+
+def per_call_us(fn, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def cpu_report(iterations: int) -> None:
+    from pgvector import Vector
+
+    from research_agent.infrastructure.database.vector_params import (
+        _encode_vector,
+        vector_param,
+    )
+
+    embedding = [random.uniform(-0.1, 0.1) for _ in range(DIMS)]
+    text_literal = "[" + ",".join(map(str, embedding)) + "]"
+    binary = _encode_vector(vector_param(embedding))
+
+    encode_text = per_call_us(lambda: "[" + ",".join(map(str, embedding)) + "]", iterations)
+    encode_binary = per_call_us(lambda: _encode_vector(vector_param(embedding)), iterations)
+    decode_text = per_call_us(lambda: Vector.from_text(text_literal).to_list(), iterations)
+    decode_binary = per_call_us(lambda: Vector.from_binary(binary).to_list(), iterations)
+
+    print(f"\n{DIMS}-dim vector, {iterations} iterations\n")
+    print("| | text | binary | saved |")
+    print("|---|---|---|---|")
+    print(
+        f"| encode param (us) | {encode_text:.1f} | {encode_binary:.1f} "
+        f"| {encode_text - encode_binary:.1f} |"
+    )
+    print(
+        f"| decode result (us) | {decode_text:.1f} | {decode_binary:.1f} "
+        f"| {decode_text - decode_binary:.1f} |"
+    )
+    print(
+        f"| bytes on wire | {len(text_literal)} | {len(binary)} "
+        f"| {len(text_literal) - len(binary)} |"
+    )
+
+
+async def database_report(iterations: int) -> None:
+    import asyncpg
+
+    from research_agent.config import get_settings
+    from research_agent.infrastructure.database.vector_params import (
+        register_vector_codecs,
+        vector_param,
+    )
+
+    dsn = get_settings().async_database_url.replace("postgresql+asyncpg://", "postgresql://")
+    sql = f"SELECT $1::vector({DIMS}) <=> $1::vector({DIMS})"
+    embedding = [random.uniform(-0.1, 0.1) for _ in range(DIMS)]
+
+    text_conn = await asyncpg.connect(dsn, statement_cache_size=0)
+    binary_conn = await asyncpg.connect(dsn)
+    await register_vector_codecs(binary_conn)
+
+    async def timed(run) -> list[float]:
+        samples = []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            await run()
+            samples.append((time.perf_counter() - started) * 1000)
+        return samples
+
+    try:
+        cases = {
+            "text, unprepared": lambda: text_conn.fetchval(
+                sql, "[" + ",".join(map(str, embedding)) + "]"
+            ),
+            "binary, prepared": lambda: binary_conn.fetchval(sql, vector_param(embedding)),
+        }
+        print(f"\nRound trips ({iterations} each)\n")
+        print("| case | p50 ms | p95 ms |")
+        print("|---|---|---|")
+        for name, run in cases.items():
+            samples = sorted(await timed(run))
+            print(
+                f"| {name} | {statistics.median(samples):.3f} "
+                f"| {samples[int(0.95 * (len(samples) - 1))]:.3f} |"
+            )
+    finally:
+        await text_conn.close()
+        await binary_conn.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--database", action="store_true", help="Also time round trips")
+    args = parser.parse_args()
+
+    cpu_report(args.iterations)
+    if args.database:
+        asyncio.run(database_report(min(args.iterations, 500)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
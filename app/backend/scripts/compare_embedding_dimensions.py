@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Compare retrieval quality of reduced embedding dimensions.
+
+Embeds every question and context of an evaluation dataset once at full size,
+then truncates the vectors to each candidate size (Matryoshka truncation,
+which is what the API's ``dimensions`` parameter returns for
+text-embedding-3) and runs exact cosine search over the pooled contexts.
+A sample's own contexts are its relevant documents.
+
+For each size it prints hit rate / MRR / recall / NDCG at k, the overlap of
+the top-k with the full-size top-k, and storage per vector.
+
+Usage:
+    python scripts/compare_embedding_dimensions.py \
+        [--dataset ../../data/evaluation/generated_test_set.json] \
+        [--dims 256 512 768 1024 1536] [--k 5]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add backend src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+DEFAULT_DATASET = Path(__file__).parents[3] / "data" / "evaluation" / "generated_test_set.json"
+
+
+def load_dataset(path: Path) -> tuple[list[str], list[str], list[list[str]]]:
+    """Questions, deduplicated context corpus and relevant corpus ids per question."""
+    samples = json.loads(path.read_text())["samples"]
+    corpus: dict[str, str] = {}
+    questions, relevant = [], []
+    for sample in samples:
+        ids = []
+        for context in sample.get("contexts") or []:
+            ids.append(corpus.setdefault(context, str(len(corpus))))
+        if ids:
+            questions.append(sample["question"])
+            relevant.append(ids)
+    return questions, list(corpus), relevant
+
+
+def top_k_ids(queries: np.ndarray, docs: np.ndarray, dims: int, k: int) -> list[list[str]]:
+    """Exact cosine top-k on the first ``dims`` components (re-normalized)."""
+
+    def head(matrix: np.ndarray) -> np.ndarray:
+        truncated = matrix[:, :dims]
+        return truncated / np.clip(np.linalg.norm(truncated, axis=1, keepdims=True), 1e-12, None)
+
+    scores = head(queries) @ head(docs).T
+    order = np.argsort(-scores, axis=1)[:, :k]
+    return [[str(i) for i in row] for row in order]
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dataset", type=Path, default=DEFAULT_DATASET)
+    parser.add_argument("--dims", type=int, nargs="+", default=[256, 512, 768, 1024, 1536])
+    parser.add_argument("--k", type=int, default=5)
+    args = parser.parse_args()
+
+    from research_agent.config import get_settings
+    from research_agent.infrastructure.embedding.openrouter import (
+        OpenAIEmbeddingService,
+        OpenRouterEmbeddingService,
+    )
+    from research_agent.infrastructure.evaluation.retrieval_metrics import RetrievalMetrics
+
+    settings = get_settings()
+    full_dims = max(args.dims)
+    if settings.openrouter_api_key:
+        service = OpenRouterEmbeddingService(
+            api_key=settings.openrouter_api_key,
+            model=settings.embedding_model,
+            dimensions=full_dims,
+        )
+    elif settings.openai_api_key:
+        service = OpenAIEmbeddingService(
+            api_key=settings.openai_api_key,
+            model=settings.embedding_model.split("/")[-1],
+            dimensions=full_dims,
+        )
+    else:
+        print("No API key configured (OPENROUTER_API_KEY or OPENAI_API_KEY)")
+        return 1
+
+    questions, corpus, relevant = load_dataset(args.dataset)
+    print(f"{args.dataset.name}: {len(questions)} questions, {len(corpus)} contexts")
+
+    queries = np.asarray(await service.embed_batch(questions), dtype=np.float32)
+    docs = np.asarray(await service.embed_batch(corpus), dtype=np.float32)
+    reference = top_k_ids(queries, docs, full_dims, args.k)
+
+    k = args.k
+    print(f"\n| dims | HR@{k} | MRR | recall@{k} | NDCG@{k} | overlap@{k} vs {full_dims} | bytes |")
+    print("|---|---|---|---|---|---|---|")
+    for dims in sorted(args.dims):
+        retrieved = top_k_ids(queries, docs, dims, k)
+        metrics = RetrievalMetrics.calculate_all_metrics(retrieved, relevant, k)
+        overlap = np.mean([len(set(a) & set(b)) / len(b) for a, b in zip(retrieved, reference)])
+        print(
+            f"| {dims} | {metrics.hit_rate:.3f} | {metrics.mrr:.3f} | {metrics.recall_at_k:.3f} "
+            f"| {metrics.ndcg_at_k:.3f} | {overlap:.3f} | {dims * 4} |"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Compare rerankers on ranking quality (NDCG) and latency.
+
+Embeds every question and context of an evaluation dataset, takes the top
+``--candidates`` contexts per question by exact cosine similarity (the
+"vector" baseline), then reranks them with each reranker exactly as the
+chat pipeline does: documents are sorted by score and those scoring below
+5/10 are dropped. A sample's own contexts are its relevant documents.
+
+Rerankers:
+    vector  retrieval order, no reranking
+    local   CPU feature reranker (RERANKER=local)
+    llm     LLM scoring with the configured RERANK_MODE (only with --llm)
+
+For each it prints hit rate / MRR / recall / NDCG at k and the mean and
+p95 rerank latency per question.
+
+Usage:
+    python scripts/evaluate_rerankers.py \
+        [--dataset ../../data/evaluation/generated_test_set.json] \
+        [--candidates 20] [--k 5] [--llm]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add backend src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+DEFAULT_DATASET = Path(__file__).parents[3] / "data" / "evaluation" / "generated_test_set.json"
+
+
+def load_dataset(path: Path) -> tuple[list[str], list[str], list[list[str]]]:
+    """Questions, deduplicated context corpus and relevant corpus ids per question."""
+    samples = json.loads(path.read_text())["samples"]
+    corpus: dict[str, str] = {}
+    questions, relevant = [], []
+    for sample in samples:
+        ids = []
+        for context in sample.get("contexts") or []:
+            ids.append(corpus.setdefault(context, str(len(corpus))))
+        if ids:
+            questions.append(sample["question"])
+            relevant.append(ids)
+    return questions, list(corpus), relevant
+
+
+def p95(values: list[float]) -> float:
+    return float(np.percentile(values, 95)) if values else 0.0
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dataset", type=Path, default=DEFAULT_DATASET)
+    parser.add_argument("--candidates", type=int, default=20)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--llm", action="store_true", help="Also evaluate the LLM reranker")
+    args = parser.parse_args()
+
+    from langchain_core.documents import Document
+
+    from research_agent.application.graphs.rag_graph import rerank
+    from research_agent.config import get_settings
+    from research_agent.infrastructure.embedding.openrouter import OpenRouterEmbeddingService
+    from research_agent.infrastructure.evaluation.retrieval_metrics import RetrievalMetrics
+    from research_agent.infrastructure.llm.openrouter import create_langchain_llm
+    from research_agent.infrastructure.rerank import LocalFeatureReranker
+
+    settings = get_settings()
+    if not settings.openrouter_api_key:
+        print("No API key configured (OPENROUTER_API_KEY)")
+        return 1
+    service = OpenRouterEmbeddingService(
+        api_key=settings.openrouter_api_key, model=settings.embedding_model
+    )
+
+    questions, corpus, relevant = load_dataset(args.dataset)
+    print(f"{args.dataset.name}: {len(questions)} questions, {len(corpus)} contexts")
+
+    queries = np.asarray(await service.embed_batch(questions), dtype=np.float32)
+    docs = np.asarray(await service.embed_batch(corpus), dtype=np.float32)
+    queries /= np.clip(np.linalg.norm(queries, axis=1, keepdims=True), 1e-12, None)
+    docs /= np.clip(np.linalg.norm(docs, axis=1, keepdims=True), 1e-12, None)
+    similarity = queries @ docs.T
+    order = np.argsort(-similarity, axis=1)[:, : args.candidates]
+
+    candidates = [
+        [
+            Document(
+                page_content=corpus[j],
+                metadata={"document_id": str(j), "similarity": float(similarity[q, j])},
+            )
+            for j in row
+        ]
+        for q, row in enumerate(order)
+    ]
+
+    local = LocalFeatureReranker()
+
+    async def rerank_local(question: str, documents: list[Document]) -> list[Document]:
+        scores = await local.score(question, documents)
+        ranked = sorted(zip(scores, documents), key=lambda pair: pair[0], reverse=True)
+        return [doc for score, doc in ranked if score >= 5.0]
+
+    rerankers = {
+        "vector": None,
+        "local": rerank_local,
+    }
+    if args.llm:
+        llm = create_langchain_llm(api_key=settings.openrouter_api_key, model=settings.llm_model)
+
+        async def rerank_llm(question: str, documents: list[Document]) -> list[Document]:
+            state = {"question": question, "documents": documents}
+            return (await rerank(state, llm, reranker="llm"))["reranked_documents"]
+
+        rerankers[f"llm ({settings.rerank_mode})"] = rerank_llm
+
+    k = args.k
+    print(f"\n| reranker | HR@{k} | MRR | recall@{k} | NDCG@{k} | mean ms | p95 ms |")
+    print("|---|---|---|---|---|---|---|")
+    for name, rerank_fn in rerankers.items():
+        retrieved, latencies = [], []
+        for question, documents in zip(questions, candidates):
+            started = time.perf_counter()
+            ranked = await rerank_fn(question, documents) if rerank_fn else documents
+            latencies.append((time.perf_counter() - started) * 1000)
+            retrieved.append([doc.metadata["document_id"] for doc in ranked])
+        metrics = RetrievalMetrics.calculate_all_metrics(retrieved, relevant, k)
+        print(
+            f"| {name} | {metrics.hit_rate:.3f} | {metrics.mrr:.3f} | {metrics.recall_at_k:.3f} "
+            f"| {metrics.ndcg_at_k:.3f} | {np.mean(latencies):.1f} | {p95(latencies):.1f} |"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -11,10 +11,7 @@ from research_agent.config import get_settings
 from research_agent.infrastructure.database.client.base import DatabaseClient
 from research_agent.infrastructure.database.client.factory import get_database_client
 from research_agent.infrastructure.database.session import async_session_maker
-from research_agent.infrastructure.embedding.openrouter import (
-    OpenAIEmbeddingService,
-    OpenRouterEmbeddingService,
-)
+from research_agent.infrastructure.embedding.factory import create_embedding_service
 from research_agent.infrastructure.llm.openrouter import OpenRouterLLMService
 from research_agent.shared.utils.logger import setup_logger
 
@@ -114,32 +111,10 @@ def get_embedding_service():
     OpenRouter DOES support embedding API!
     User confirmed it works with curl.
 
-    Uses OpenRouter by default since it's simpler (one API key).
-    Falls back to OpenAI if you prefer direct API access.
+    Backend selection lives in create_embedding_service; the API also
+    coalesces concurrent query embeds.
     """
-    # Prefer OpenRouter (simpler, one API key)
-    if settings.openrouter_api_key and settings.openrouter_api_key.strip():
-        logger.info(f"Using OpenRouter Embedding Service (model: {settings.embedding_model})")
-        return OpenRouterEmbeddingService(
-            api_key=settings.openrouter_api_key,
-            model=settings.embedding_model,
-        )
-    # Fallback to OpenAI if OpenRouter key not set
-    elif settings.openai_api_key and settings.openai_api_key.strip():
-        logger.info(f"Using OpenAI Embedding Service (model: {settings.embedding_model})")
-        # Extract model name without provider prefix
-        model_name = settings.embedding_model
-        if "/" in model_name:
-            model_name = model_name.split("/", 1)[1]  # Remove "openai/" prefix
-
-        return OpenAIEmbeddingService(
-            api_key=settings.openai_api_key,
-            model=model_name,
-        )
-    else:
-        logger.error("❌ No API key set! Please set OPENROUTER_API_KEY or OPENAI_API_KEY")
-        raise ValueError("No embedding API key configured")
-
+    return create_embedding_service(coalesce=True)
 
 
 # =============================================================================
@@ -130,6 +130,7 @@ async def stream_message(
                 user_id=user_id_str,
                 top_k=rag_config.retrieval.top_k,
                 use_hybrid_search=rag_config.retrieval.use_hybrid_search,
+                reranker=rag_config.retrieval.reranker.value,
                 use_intent_classification=rag_config.intent_classification.enabled,
                 rag_mode=rag_mode_str,
                 context_node_ids=request.context_node_ids,
@@ -160,6 +161,10 @@ async def stream_message(
                         for s in (event.sources or [])
                     ],
                 }
+            elif event.type == "reset":
+                data = {"type": "reset", "message": event.message}
+            elif event.type == "citations":
+                data = {"type": "citations", "citations": event.citations or []}
             elif event.type == "error":
                 data = {"type": "error", "content": event.content}
             else:
@@ -287,3 +287,36 @@ async def get_database_diagnostics(
         alembic_version=alembic_version,
         message=message,
     )
+
+
+class VectorIndexSyncResponse(BaseModel):
+    """Response model for per-project vector index sync."""
+
+    created: list[str]
+    dropped: list[str]
+    message: str
+
+
+@router.post("/vector-indexes/sync", response_model=VectorIndexSyncResponse)
+async def sync_vector_indexes() -> VectorIndexSyncResponse:
+    """
+    Build missing per-project HNSW indexes and drop those of deleted projects.
+
+    Indexes are normally built after ingest; this endpoint backfills existing
+    projects and cleans up after project deletion. Only applies to pgvector.
+    """
+    from research_agent.infrastructure.vector_store.ann_index import sync_project_ann_indexes
+
+    if settings.vector_store_provider != "pgvector":
+        return VectorIndexSyncResponse(
+            created=[],
+            dropped=[],
+            message=f"Skipped: vector store provider is '{settings.vector_store_provider}'",
+        )
+
+    result = await sync_project_ann_indexes()
+    return VectorIndexSyncResponse(
+        created=result["created"],
+        dropped=result["dropped"],
+        message=f"Created {len(result['created'])}, dropped {len(result['dropped'])} indexes",
+    )
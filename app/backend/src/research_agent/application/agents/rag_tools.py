@@ -1,5 +1,4 @@
 import asyncio
-import hashlib
 import time
 from typing import Any, Optional
 from uuid import UUID
@@ -11,15 +10,20 @@ from langchain_core.tools import StructuredTool
 from langchain_openai import ChatOpenAI
 from pydantic import BaseModel, Field
 
+from research_agent.config import get_settings
 from research_agent.domain.services.memory_service import MemoryService
+from research_agent.infrastructure.llm.listwise_rerank import score_listwise
 from research_agent.infrastructure.llm.prompts.rag_prompt import build_mega_prompt
+from research_agent.infrastructure.llm.result_cache import (
+    get_result_cache,
+    prompt_version,
+    result_cache_key,
+)
+from research_agent.infrastructure.rerank import get_reranker
 from research_agent.infrastructure.vector_store.langchain_pgvector import PGVectorRetriever
 from research_agent.shared.utils.logger import logger
 from research_agent.shared.utils.rag_trace import rag_log
 
-# Cache for query rewriting
-_rewrite_cache: dict[str, dict[str, str]] = {}
-
 
 class GradeDocumentsModel(BaseModel):
     """Binary score for relevance check."""
@@ -45,12 +49,14 @@ class RAGTools:
         retriever: PGVectorRetriever | None = None,
         llm: ChatOpenAI | None = None,
         embedding_service: Any = None,
+        reranker: str = "llm",
     ):
         self.project_id = project_id
         self.session = session
         self.retriever = retriever
         self.llm = llm
         self.embedding_service = embedding_service
+        self.reranker = get_reranker(reranker)
 
     def get_tools(self) -> list[StructuredTool]:
         """Get the list of bound tools."""
@@ -173,7 +179,7 @@ class RAGTools:
         if not documents:
             return []
 
-        if not self.llm:
+        if not self.llm and not self.reranker:
             logger.warning("LLM not initialized in RAGTools, skipping rerank")
             return documents
 
@@ -199,15 +205,35 @@ Output ONLY a single number between 0-10. No explanation."""
             ]
         )
 
-        chain = score_prompt | self.llm | StrOutputParser()
+        # Not needed (and no LLM required) when a local reranker scores everything
+        chain = score_prompt | self.llm | StrOutputParser() if self.llm else None
 
         max_concurrency = min(4, max(1, len(documents)))
         semaphore = asyncio.Semaphore(max_concurrency)
 
-        async def score_one(doc: Document) -> tuple[float, Document]:
+        # Local and listwise rerankers score all documents up front; pointwise
+        # scoring only runs for documents the listwise call could not score
+        mode = self.reranker.name if self.reranker else get_settings().rerank_mode
+        precomputed_scores: dict[int, float] = {}
+        llm_calls = 0
+        if self.reranker:
+            local_scores = await self.reranker.score(query, documents)
+            precomputed_scores = dict(enumerate(local_scores))
+        elif mode == "listwise":
+            texts = [doc.page_content for doc in documents]
+            listwise = await score_listwise(self.llm, query, texts)
+            llm_calls += len(listwise.call_latency_ms)
+            precomputed_scores = {
+                i: score for i, score in enumerate(listwise.scores) if score is not None
+            }
+
+        async def score_one(i: int, doc: Document) -> tuple[float, Document]:
+            nonlocal llm_calls
             doc_id = doc.metadata.get("document_id")
             if active_doc_id and doc_id == active_doc_id:
                 return 10.0, doc
+            if i in precomputed_scores:
+                return precomputed_scores[i], doc
 
             doc_content = (
                 doc.page_content[:2000] if len(doc.page_content) > 2000 else doc.page_content
@@ -215,6 +241,7 @@ Output ONLY a single number between 0-10. No explanation."""
 
             async with semaphore:
                 try:
+                    llm_calls += 1
                     result = await chain.ainvoke({"question": query, "document": doc_content})
                     try:
                         score = float(result.strip())
@@ -225,7 +252,7 @@ Output ONLY a single number between 0-10. No explanation."""
                     logger.warning(f"Rerank failed for doc: {e}")
                     return 0.0, doc
 
-        results = await asyncio.gather(*[score_one(doc) for doc in documents])
+        results = await asyncio.gather(*[score_one(i, doc) for i, doc in enumerate(documents)])
 
         results.sort(key=lambda x: x[0], reverse=True)
         # Keep documents with score > 0 (or all sorted)
@@ -235,6 +262,14 @@ Output ONLY a single number between 0-10. No explanation."""
             reranked_docs = [doc for score, doc in results[:3]]
 
         latency_ms = round((time.time() - start_time) * 1000, 2)
+        rag_log(
+            "RERANK",
+            mode=mode,
+            input_docs=len(documents),
+            output_docs=len(reranked_docs),
+            llm_calls=llm_calls,
+            latency_ms=latency_ms,
+        )
         logger.info(
             f"[Rerank] Reranked {len(documents)} -> {len(reranked_docs)} documents in {latency_ms}ms"
         )
@@ -314,21 +349,6 @@ Output ONLY a single number between 0-10. No explanation."""
         if not chat_history:
             return query
 
-        cache_key = None
-        if enable_cache:
-            try:
-                # Assuming chat_history is list of tuples or similar
-                # Just basic hashing for now
-                key_str = f"{query}|{len(chat_history)}"
-                cache_key = hashlib.md5(key_str.encode()).hexdigest()
-                if cache_key in _rewrite_cache:
-                    return _rewrite_cache[cache_key]["rewritten_question"]
-            except Exception:
-                pass
-
-        if not self.llm:
-            return query
-
         history_context = "\\n".join(
             [
                 f"Human: {human}\\nAssistant: {ai}"
@@ -345,6 +365,24 @@ Rules:
 4. Keep the question's original scope and openness
 5. Output ONLY the rewritten question"""
 
+        cache = get_result_cache("rewrite") if enable_cache else None
+        cache_key = None
+        if cache is not None:
+            cache_key = result_cache_key(
+                self.project_id,
+                getattr(self.llm, "model_name", None),
+                prompt_version(system_prompt),
+                query,
+                history_context,
+            )
+            cached = await cache.get(cache_key)
+            if cached is not None:
+                rag_log("TRANSFORM", cached=True, cache_hit_rate=cache.hit_rate())
+                return cached["rewritten_question"]
+
+        if not self.llm:
+            return query
+
         prompt = ChatPromptTemplate.from_messages(
             [
                 ("system", system_prompt),
@@ -358,8 +396,9 @@ Rules:
             rewritten = await chain.ainvoke({"history": history_context, "question": query})
             rewritten = rewritten.strip()
 
-            if enable_cache and cache_key:
-                _rewrite_cache[cache_key] = {"rewritten_question": rewritten}
+            if cache is not None:
+                await cache.set(cache_key, {"rewritten_question": rewritten})
+                rag_log("TRANSFORM", cached=False, cache_hit_rate=cache.hit_rate())
 
             logger.info(f"[Rewrite] '{query}' -> '{rewritten}'")
             return rewritten
@@ -14,18 +14,23 @@ from langchain_openai import ChatOpenAI
 from langgraph.graph import END, StateGraph
 from pydantic import BaseModel, Field
 
+from research_agent.application.graphs.speculative_generation import SpeculativeGeneration
+from research_agent.application.graphs.stage_pipeline import StagePipeline
+from research_agent.config import get_settings
 from research_agent.domain.services.conversation_context import ConversationContext
+from research_agent.infrastructure.embedding.request_scope import prefetch_embedding
+from research_agent.infrastructure.llm.listwise_rerank import judge_listwise, score_listwise
 from research_agent.infrastructure.llm.prompts import render_prompt
+from research_agent.infrastructure.llm.result_cache import (
+    get_result_cache,
+    prompt_version,
+    result_cache_key,
+)
+from research_agent.infrastructure.rerank import get_reranker
 from research_agent.infrastructure.vector_store.langchain_pgvector import PGVectorRetriever
 from research_agent.shared.utils.logger import logger
 from research_agent.shared.utils.rag_trace import rag_log
 
-# Query rewrite cache (in-memory, simple LRU could be added later)
-_rewrite_cache: dict[str, dict[str, str]] = {}
-
-# Intent classification cache
-_intent_cache: dict[str, dict[str, Any]] = {}
-
 
 # --- Intent Classification System ---
 
@@ -48,6 +53,7 @@ class RetrievalStrategy:
     top_k: int  # Number of documents to retrieve
     min_similarity: float  # Minimum similarity threshold
     use_hybrid_search: bool  # Use hybrid search (vector + keyword)
+    mmr_lambda: float = 1.0  # MMR relevance/diversity trade-off (1.0 = relevance only)
 
 
 @dataclass
@@ -67,7 +73,12 @@ from research_agent.infrastructure.llm.prompts.rag_prompt import (
 # We append CITATION_FORMAT_INSTRUCTIONS to each prompt to ensure the LLM always knows how to cite sources
 INTENT_STRATEGIES: dict[IntentType, tuple[RetrievalStrategy, GenerationStrategy]] = {
     IntentType.FACTUAL: (
-        RetrievalStrategy(top_k=3, min_similarity=0.7, use_hybrid_search=True),
+        RetrievalStrategy(
+            top_k=3,
+            min_similarity=0.7,
+            use_hybrid_search=True,
+            mmr_lambda=0.9,
+        ),
         GenerationStrategy(
             style="concise",
             max_length=150,
@@ -75,7 +86,12 @@ INTENT_STRATEGIES: dict[IntentType, tuple[RetrievalStrategy, GenerationStrategy]
         ),
     ),
     IntentType.CONCEPTUAL: (
-        RetrievalStrategy(top_k=8, min_similarity=0.5, use_hybrid_search=False),
+        RetrievalStrategy(
+            top_k=8,
+            min_similarity=0.5,
+            use_hybrid_search=False,
+            mmr_lambda=0.7,
+        ),
         GenerationStrategy(
             style="detailed",
             max_length=500,
@@ -83,7 +99,12 @@ INTENT_STRATEGIES: dict[IntentType, tuple[RetrievalStrategy, GenerationStrategy]
         ),
     ),
     IntentType.COMPARISON: (
-        RetrievalStrategy(top_k=10, min_similarity=0.6, use_hybrid_search=True),
+        RetrievalStrategy(
+            top_k=10,
+            min_similarity=0.6,
+            use_hybrid_search=True,
+            mmr_lambda=0.5,
+        ),
         GenerationStrategy(
             style="structured",
             max_length=400,
@@ -91,7 +112,12 @@ INTENT_STRATEGIES: dict[IntentType, tuple[RetrievalStrategy, GenerationStrategy]
         ),
     ),
     IntentType.HOWTO: (
-        RetrievalStrategy(top_k=5, min_similarity=0.6, use_hybrid_search=True),
+        RetrievalStrategy(
+            top_k=5,
+            min_similarity=0.6,
+            use_hybrid_search=True,
+            mmr_lambda=0.8,
+        ),
         GenerationStrategy(
             style="structured",
             max_length=400,
@@ -99,7 +125,12 @@ INTENT_STRATEGIES: dict[IntentType, tuple[RetrievalStrategy, GenerationStrategy]
         ),
     ),
     IntentType.SUMMARY: (
-        RetrievalStrategy(top_k=15, min_similarity=0.4, use_hybrid_search=False),
+        RetrievalStrategy(
+            top_k=15,
+            min_similarity=0.4,
+            use_hybrid_search=False,
+            mmr_lambda=0.5,
+        ),
         GenerationStrategy(
             style="structured",
             max_length=500,
@@ -107,7 +138,12 @@ INTENT_STRATEGIES: dict[IntentType, tuple[RetrievalStrategy, GenerationStrategy]
         ),
     ),
     IntentType.EXPLANATION: (
-        RetrievalStrategy(top_k=8, min_similarity=0.5, use_hybrid_search=False),
+        RetrievalStrategy(
+            top_k=8,
+            min_similarity=0.5,
+            use_hybrid_search=False,
+            mmr_lambda=0.7,
+        ),
         GenerationStrategy(
             style="detailed",
             max_length=500,
@@ -502,6 +538,7 @@ async def transform_query(
     enable_validation: bool = True,
     enable_cache: bool = True,
     max_expansion_ratio: float = 3.0,
+    project_id: Any = None,  # UUID
 ) -> GraphState:
     """
     Enhanced query rewriting with validation and optimization.
@@ -510,8 +547,9 @@ async def transform_query(
         state: Graph state containing question and chat_history
         llm: Language model for rewriting
         enable_validation: Validate rewrite quality before using
-        enable_cache: Cache rewrite results
+        enable_cache: Cache rewrite results (see result_cache)
         max_expansion_ratio: Maximum allowed expansion ratio (rewritten/original length)
+        project_id: Project UUID, scopes cached rewrites
     """
     question = state["question"]
     chat_history = state.get("chat_history", [])
@@ -526,16 +564,6 @@ async def transform_query(
         logger.info("Query doesn't need rewriting")
         return {"rewritten_question": question, "question": question}
 
-    # Check cache
-    cache_key = None
-    if enable_cache:
-        cache_key = get_cache_key(question, chat_history)
-        if cache_key in _rewrite_cache:
-            logger.info("Cache hit for query rewrite")
-            return _rewrite_cache[cache_key]
-
-    logger.info(f"Rewriting query with {len(chat_history)} history messages")
-
     # Resolve entity references using ConversationContext
     auth_ctx = ConversationContext(
         entities=state.get("active_entities"),
@@ -579,6 +607,34 @@ Question: "如何定义它？"
 Rewrite: "如何定义图谱模式？" ✓
 NOT: "如何通过配置文件定义图谱模式的Node对象？" ✗"""
 
+    # Check cache (after entity resolution: the hint is part of the question)
+    cache = get_result_cache("rewrite") if enable_cache else None
+    cache_key = None
+    if cache is not None:
+        cache_key = result_cache_key(
+            project_id,
+            getattr(llm, "model_name", None),
+            prompt_version(system_prompt),
+            get_cache_key(question, chat_history),
+            enable_validation,
+            max_expansion_ratio,
+        )
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            rewritten = cached["rewritten_question"]
+            rag_log(
+                "TRANSFORM",
+                original=question[:50],
+                rewritten=rewritten[:50],
+                changed=question != rewritten,
+                cached=True,
+                cache_hit_rate=cache.hit_rate(),
+            )
+            logger.info("Cache hit for query rewrite")
+            return {"rewritten_question": rewritten, "question": question, **extra_updates}
+
+    logger.info(f"Rewriting query with {len(chat_history)} history messages")
+
     prompt = ChatPromptTemplate.from_messages(
         [
             ("system", system_prompt),
@@ -589,7 +645,7 @@ NOT: "如何通过配置文件定义图谱模式的Node对象？" ✗"""
     chain = prompt | llm | StrOutputParser()
 
     try:
-        rewritten = chain.invoke(
+        rewritten = await chain.ainvoke(
             {"history": history_context, "question": question},
             config={"callbacks": get_callbacks()},
         )
@@ -607,20 +663,17 @@ NOT: "如何通过配置文件定义图谱模式的Node对象？" ✗"""
             rewritten=rewritten[:50],
             changed=question != rewritten,
             history_turns=len(chat_history),
+            cached=False,
+            cache_hit_rate=cache.hit_rate() if cache is not None else None,
         )
         logger.info(f"[Rewrite] '{question}' -> '{rewritten}'")
 
         result = {"rewritten_question": rewritten, "question": question}
         final_result = {**result, **extra_updates}
 
-        # Cache result
-        if enable_cache and cache_key:
-            _rewrite_cache[cache_key] = final_result
-            # Simple cache size limit (keep last 100 entries)
-            if len(_rewrite_cache) > 100:
-                # Remove oldest entry (simple FIFO)
-                oldest_key = next(iter(_rewrite_cache))
-                del _rewrite_cache[oldest_key]
+        # Cache the rewrite only; entity updates are recomputed per request
+        if cache is not None:
+            await cache.set(cache_key, {"rewritten_question": rewritten})
 
         return final_result
 
@@ -759,6 +812,7 @@ async def classify_intent(
     state: GraphState,
     llm: ChatOpenAI,
     enable_cache: bool = True,
+    project_id: Any = None,  # UUID
 ) -> GraphState:
     """
     Classify user question intent and select appropriate strategies.
@@ -766,7 +820,8 @@ async def classify_intent(
     Args:
         state: Graph state containing question
         llm: Language model for classification
-        enable_cache: Cache classification results
+        enable_cache: Cache classification results (see result_cache)
+        project_id: Project UUID, scopes cached classifications
 
     Returns:
         Updated state with intent_type, intent_confidence, and strategies
@@ -779,12 +834,26 @@ async def classify_intent(
     question = state.get("rewritten_question", state["question"])
 
     # Check cache
+    cache = get_result_cache("intent") if enable_cache else None
     cache_key = None
-    if enable_cache:
-        cache_key = hashlib.md5(question.encode()).hexdigest()
-        if cache_key in _intent_cache:
+    if cache is not None:
+        cache_key = result_cache_key(
+            project_id,
+            getattr(llm, "model_name", None),
+            prompt_version(INTENT_CLASSIFICATION_PROMPT),
+            question,
+        )
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            rag_log(
+                "INTENT",
+                intent_type=cached["intent_type"],
+                confidence=round(cached["intent_confidence"], 2),
+                cached=True,
+                cache_hit_rate=cache.hit_rate(),
+            )
             logger.info("[Intent] Cache hit for intent classification")
-            return _intent_cache[cache_key]
+            return cached
 
     logger.info(f"[Intent] Classifying intent for: {question[:50]}...")
 
@@ -800,7 +869,7 @@ async def classify_intent(
 
     try:
         # Get classification result
-        result = chain.invoke(
+        result = await chain.ainvoke(
             {"question": question},
             config={"callbacks": get_callbacks()},
         )
@@ -837,6 +906,8 @@ async def classify_intent(
             "INTENT",
             intent_type=intent_type.value,
             confidence=round(intent_confidence, 2),
+            cached=False,
+            cache_hit_rate=cache.hit_rate() if cache is not None else None,
         )
 
         # Get strategies for this intent
@@ -850,6 +921,7 @@ async def classify_intent(
                 "top_k": retrieval_strategy.top_k,
                 "min_similarity": retrieval_strategy.min_similarity,
                 "use_hybrid_search": retrieval_strategy.use_hybrid_search,
+                "mmr_lambda": retrieval_strategy.mmr_lambda,
             },
             "generation_strategy": {
                 "style": generation_strategy.style,
@@ -859,12 +931,8 @@ async def classify_intent(
         }
 
         # Cache result
-        if enable_cache and cache_key:
-            _intent_cache[cache_key] = result_state
-            # Simple cache size limit (keep last 100 entries)
-            if len(_intent_cache) > 100:
-                oldest_key = next(iter(_intent_cache))
-                del _intent_cache[oldest_key]
+        if cache is not None:
+            await cache.set(cache_key, result_state)
 
         return result_state
 
@@ -879,6 +947,7 @@ async def classify_intent(
                 "top_k": retrieval_strategy.top_k,
                 "min_similarity": retrieval_strategy.min_similarity,
                 "use_hybrid_search": retrieval_strategy.use_hybrid_search,
+                "mmr_lambda": retrieval_strategy.mmr_lambda,
             },
             "generation_strategy": {
                 "style": generation_strategy.style,
@@ -998,9 +1067,14 @@ async def retrieve_long_context(
         logger.info(f"[LongContext] Processing {len(retrieval_docs)} documents in retrieval mode")
         query = state.get("rewritten_question", state["question"])
 
-        # Use traditional retrieval for these documents
-        # Note: This is simplified - in practice, you might want to filter by document_id
-        retrieved = await retriever._aget_relevant_documents(query)
+        if retriever.use_hybrid_search or retriever.uses_mmr:
+            # Keyword fusion and MMR only exist on the regular retriever path
+            retrieved = await retriever._aget_relevant_documents(query)
+        else:
+            # Retrieve chunks only from these documents (one batched vector query)
+            retrieved = await retriever.aget_relevant_documents_by_document(
+                query, [doc.id for doc in retrieval_docs]
+            )
         all_documents.extend(retrieved)
 
     logger.info(
@@ -1031,15 +1105,22 @@ async def retrieve(state: GraphState, retriever: PGVectorRetriever) -> GraphStat
         # Apply dynamic retrieval parameters
         top_k = retrieval_strategy.get("top_k", retriever.k)
         use_hybrid = retrieval_strategy.get("use_hybrid_search", False)
+        mmr_lambda = (
+            retrieval_strategy.get("mmr_lambda")
+            if get_settings().retrieval_mmr_enabled
+            else None
+        )
 
         logger.info(
             f"[Retrieve] Using adaptive strategy: top_k={top_k}, hybrid={use_hybrid}, "
-            f"intent={state.get('intent_type', 'unknown')}"
+            f"mmr_lambda={mmr_lambda}, intent={state.get('intent_type', 'unknown')}"
         )
 
         # Update retriever parameters dynamically
         retriever.k = top_k
         retriever.use_hybrid_search = use_hybrid
+        # None (MMR disabled) turns diversification off; see uses_mmr
+        retriever.mmr_lambda = mmr_lambda
     else:
         logger.info(f"[Retrieve] Using default strategy: top_k={retriever.k}")
 
@@ -1083,11 +1164,102 @@ async def retrieve(state: GraphState, retriever: PGVectorRetriever) -> GraphStat
     return {"documents": documents}
 
 
-async def rerank(state: GraphState, llm: ChatOpenAI) -> GraphState:
+async def _retrieve_for_mode(
+    state: GraphState,
+    retriever: PGVectorRetriever,
+    rag_mode: str,
+    session: Any,  # AsyncSession
+    project_id: Any,  # UUID
+    embedding_service: Any,  # EmbeddingService
+) -> GraphState:
+    """Retrieve documents for the RAG mode, falling back to traditional retrieval.
+
+    The given state is a private snapshot; the returned updates are merged
+    by the caller.
+    """
+    state = dict(state)
+    if rag_mode in ("long_context", "auto") and session and project_id and embedding_service:
+        from research_agent.domain.services.document_selector import DocumentSelectorService
+        from research_agent.domain.services.token_estimator import TokenEstimator
+        from research_agent.infrastructure.llm.model_config import calculate_available_tokens
+
+        settings = get_settings()
+
+        # Calculate available tokens
+        max_tokens = calculate_available_tokens(
+            settings.llm_model, settings.long_context_safety_ratio
+        )
+        min_tokens = settings.long_context_min_tokens
+
+        logger.info(
+            f"[RAG Mode] Long context mode enabled - max_tokens={max_tokens}, "
+            f"min_tokens={min_tokens}, model={settings.llm_model}, "
+            f"safety_ratio={settings.long_context_safety_ratio}"
+        )
+
+        try:
+            # Create document selector
+            token_estimator = TokenEstimator()
+            doc_selector = DocumentSelectorService(
+                session=session,
+                embedding_service=embedding_service,
+                token_estimator=token_estimator,
+                vector_store=retriever.vector_store,
+            )
+
+            # Select documents for long context
+            query = state.get("rewritten_question", state["question"])
+            selection_result = await doc_selector.select_documents_for_query(
+                query=query,
+                project_id=project_id,
+                max_tokens=max_tokens,
+                min_tokens=min_tokens,
+            )
+
+            # Convert selection result to dict for state
+            document_selection = {
+                "long_context_docs": selection_result.long_context_docs,
+                "retrieval_docs": selection_result.retrieval_docs,
+                "strategy": selection_result.strategy,
+                "total_tokens": selection_result.total_tokens,
+                "reason": selection_result.reason,
+            }
+
+            logger.info(
+                f"[RAG Mode] Document selection result: strategy={selection_result.strategy}, "
+                f"long_context_docs={len(selection_result.long_context_docs)}, "
+                f"retrieval_docs={len(selection_result.retrieval_docs)}, "
+                f"total_tokens={selection_result.total_tokens}, "
+                f"reason={selection_result.reason}"
+            )
+
+            # Retrieve using long context mode
+            retrieve_result = await retrieve_long_context(
+                state, retriever, document_selection, session
+            )
+            # retrieve_long_context stores the formatted content on the state it is given
+            return {
+                **retrieve_result,
+                "long_context_content": state.get("long_context_content", ""),
+            }
+        except Exception as e:
+            logger.warning(
+                f"[Stream] Long context mode failed: {e}, falling back to traditional mode",
+                exc_info=True,
+            )
+            return await retrieve(state, retriever)
+    else:
+        logger.info("[RAG Mode] Using traditional retrieval mode")
+        return await retrieve(state, retriever)
+
+
+async def rerank(state: GraphState, llm: ChatOpenAI, reranker: str = "llm") -> GraphState:
     """
     Rerank retrieved documents using LLM-based relevance scoring.
     Takes top-k documents and reranks them for better precision.
     Bypasses reranking for documents matching the active_document_id.
+    With RERANK_MODE=listwise all documents are scored in one LLM call;
+    reranker="local" scores them on CPU without any LLM call.
     """
     import asyncio
     import time
@@ -1131,12 +1303,42 @@ Output ONLY a single number between 0-10. No explanation."""
     semaphore = asyncio.Semaphore(max_concurrency)
     per_doc_latency_ms: list[float] = []
 
+    # Local and listwise rerankers score all candidates up front; documents
+    # the listwise call fails to score fall through to the pointwise prompt below
+    local_reranker = get_reranker(reranker)
+    mode = local_reranker.name if local_reranker else get_settings().rerank_mode
+    precomputed_scores: dict[int, float] = {}
+    parse_failures = 0
+    candidates = [
+        i
+        for i, doc in enumerate(documents)
+        if not (active_doc_id and doc.metadata.get("document_id") == active_doc_id)
+    ]
+    if local_reranker:
+        local_scores = await local_reranker.score(question, [documents[i] for i in candidates])
+        precomputed_scores = dict(zip(candidates, local_scores))
+    elif mode == "listwise":
+        listwise = await score_listwise(
+            llm,
+            question,
+            [documents[i].page_content for i in candidates],
+            callbacks=get_callbacks(),
+        )
+        per_doc_latency_ms.extend(listwise.call_latency_ms)
+        parse_failures = listwise.parse_failures
+        precomputed_scores = {
+            i: score for i, score in zip(candidates, listwise.scores) if score is not None
+        }
+
     async def score_one(i: int, doc: Document) -> tuple[float, Document]:
         doc_id = doc.metadata.get("document_id")
         if active_doc_id and doc_id == active_doc_id:
             logger.debug(f"[Rerank] Auto-passing doc {i + 1} (matches active_doc_id)")
             return 10.0, doc
 
+        if i in precomputed_scores:
+            return precomputed_scores[i], doc
+
         doc_content = doc.page_content[:2000] if len(doc.page_content) > 2000 else doc.page_content
 
         async with semaphore:
@@ -1193,10 +1395,12 @@ Output ONLY a single number between 0-10. No explanation."""
     )
     rag_log(
         "RERANK",
+        mode=mode,
         input_docs=len(documents),
         output_docs=len(reranked),
         top_score=round(sorted_docs[0][0], 1) if sorted_docs else 0,
         llm_calls=len(per_doc_latency_ms_sorted),
+        parse_failures=parse_failures,
         llm_p95_ms=p95_ms,
         latency_ms=latency_ms,
     )
@@ -1319,6 +1523,85 @@ Reply with ONLY 'yes' or 'no'. Nothing else."""
     return {"filtered_documents": filtered_docs}
 
 
+async def assess_relevance(state: GraphState, llm: ChatOpenAI, reorder: bool = True) -> GraphState:
+    """
+    Fused rerank + grade: score and keep/drop every document in one batched pass.
+
+    Replaces ``rerank()`` followed by ``grade_documents()``, which each send the
+    same question and document text to the LLM. With ``reorder`` set, relevant
+    documents scoring >= 5 are kept, sorted by score; without it (no rerank)
+    the relevance decision alone keeps a document, in retrieval order.
+    Documents the model did not judge are kept, as grading does on failure.
+    Bypasses documents matching active_document_id.
+    """
+    import time
+
+    start_time = time.time()
+    question = state.get("rewritten_question", state.get("question", ""))
+    documents = state.get("documents", [])
+
+    if not documents:
+        logger.warning("No documents to assess")
+        return {"reranked_documents": [], "filtered_documents": []}
+
+    active_doc_id = state.get("active_document_id")
+    candidates = [
+        i
+        for i, doc in enumerate(documents)
+        if not (active_doc_id and doc.metadata.get("document_id") == active_doc_id)
+    ]
+    judged = await judge_listwise(
+        llm,
+        question,
+        [documents[i].page_content for i in candidates],
+        callbacks=get_callbacks(),
+    )
+
+    # (score, retrieval position, doc) of kept documents
+    scores = dict(zip(candidates, judged.scores))
+    decisions = dict(zip(candidates, judged.keep))
+    kept_scores: list[tuple[float, int, Document]] = []
+    for i, doc in enumerate(documents):
+        if i not in scores:
+            logger.debug(f"[Relevance] Auto-passing doc {i + 1} (matches active_doc_id)")
+            kept_scores.append((10.0, i, doc))
+        elif scores[i] is None:
+            kept_scores.append((5.0, i, doc))
+        elif decisions[i] and (scores[i] >= 5.0 or not reorder):
+            kept_scores.append((scores[i], i, doc))
+
+    if reorder:
+        kept_scores.sort(key=lambda x: x[0], reverse=True)
+    kept = [doc for _, _, doc in kept_scores]
+
+    # What rerank() + grade_documents() would have cost: one rerank call per
+    # candidate (or per listwise prompt), then one grading call per candidate
+    # that passed reranking
+    llm_calls = len(judged.call_latency_ms)
+    rerank_calls = 0
+    graded = len(candidates)
+    if reorder:
+        rerank_calls = llm_calls if get_settings().rerank_mode == "listwise" else len(candidates)
+        graded = sum(1 for score in judged.scores if score is None or score >= 5.0)
+
+    latency_ms = round((time.time() - start_time) * 1000, 2)
+    rag_log(
+        "RELEVANCE",
+        mode="fused",
+        input_docs=len(documents),
+        passed_docs=len(kept),
+        filtered_count=len(documents) - len(kept),
+        top_score=round(max((score for score, _, _ in kept_scores), default=0), 1),
+        llm_calls=llm_calls,
+        llm_calls_saved=max(0, rerank_calls + graded - llm_calls),
+        parse_failures=judged.parse_failures,
+        latency_ms=latency_ms,
+    )
+
+    logger.info(f"Relevance assessment complete: {len(kept)}/{len(documents)} docs kept")
+    return {"reranked_documents": kept, "filtered_documents": kept}
+
+
 def parse_citations(text: str) -> list[dict[str, Any]]:
     """
     Parse citations from generated text.
@@ -1683,6 +1966,7 @@ def create_rag_graph(
     enable_rewrite_cache: bool = True,
     enable_intent_cache: bool = True,
     max_expansion_ratio: float = 3.0,
+    fuse_relevance: bool = False,
 ) -> StateGraph:
     """
     Create the Enhanced Agentic RAG graph with intent-based strategies.
@@ -1693,6 +1977,7 @@ def create_rag_graph(
     3. Retrieve - Get documents from vector store (adaptive top_k and hybrid search)
     4. Rerank - LLM-based relevance scoring
     5. Grade Documents - Binary relevance check
+       (4+5 run as one Assess Relevance node with fuse_relevance)
     6. Generate - Create final answer (adaptive style and prompts)
 
     Args:
@@ -1706,6 +1991,7 @@ def create_rag_graph(
         enable_rewrite_cache: Cache rewrite results to avoid redundant LLM calls
         enable_intent_cache: Cache intent classification results
         max_expansion_ratio: Maximum allowed expansion ratio (rewritten/original length)
+        fuse_relevance: Score and grade in one batched LLM pass (requires use_grading)
     """
     workflow = StateGraph(GraphState)
 
@@ -1736,11 +2022,17 @@ def create_rag_graph(
 
     workflow.add_node("retrieve", lambda state: retrieve(state, retriever))
 
-    if use_rerank:
-        workflow.add_node("rerank", lambda state: rerank(state, llm))
+    fuse_relevance = fuse_relevance and use_grading
+    if fuse_relevance:
+        workflow.add_node(
+            "assess_relevance", lambda state: assess_relevance(state, llm, reorder=use_rerank)
+        )
+    else:
+        if use_rerank:
+            workflow.add_node("rerank", lambda state: rerank(state, llm))
 
-    if use_grading:
-        workflow.add_node("grade_documents", lambda state: grade_documents(state, llm))
+        if use_grading:
+            workflow.add_node("grade_documents", lambda state: grade_documents(state, llm))
 
     workflow.add_node("generate", lambda state: generate(state, llm))
 
@@ -1759,7 +2051,10 @@ def create_rag_graph(
         else:
             workflow.set_entry_point("retrieve")
 
-    if use_rerank:
+    if fuse_relevance:
+        workflow.add_edge("retrieve", "assess_relevance")
+        workflow.add_edge("assess_relevance", "generate")
+    elif use_rerank:
         workflow.add_edge("retrieve", "rerank")
         if use_grading:
             workflow.add_edge("rerank", "grade_documents")
@@ -1781,6 +2076,119 @@ def create_rag_graph(
 # --- Streaming Support ---
 
 
+def build_generation_context(state: GraphState, documents: list[Document]) -> tuple[str, str]:
+    """
+    Build the system prompt and context for traditional streaming generation.
+
+    Combines the retrieved chunks (with source headers for citations) with
+    conversation history, canvas context and memory.
+
+    Returns:
+        (system_prompt, context)
+    """
+    doc_sections: list[str] = []
+    for i, doc in enumerate(documents, 1):
+        doc_id = doc.metadata.get("document_id", "")
+        page_number = doc.metadata.get("page_number", "")
+        filename = doc.metadata.get("filename", "")
+        similarity = doc.metadata.get("similarity", None)
+
+        header_parts = [f"--- Retrieved Chunk {i} ---"]
+        if filename:
+            header_parts.append(f"filename={filename}")
+        if doc_id:
+            header_parts.append(f"document_id={doc_id}")
+        if page_number != "":
+            header_parts.append(f"page_number={page_number}")
+        if similarity is not None:
+            header_parts.append(f"similarity={round(float(similarity), 4)}")
+
+        header = " ".join(header_parts)
+        doc_sections.append(f"{header}\n{doc.page_content}")
+
+    doc_context = "\n\n".join(doc_sections)
+
+    # Build memory context (session summary + relevant past discussions)
+    memory_context = format_memory_for_context(state)
+    canvas_context = state.get("canvas_context", "")
+    history_context = state.get(
+        "history_context", ""
+    )  # NEW: Conversation history for pronoun resolution
+
+    # Combine document context with memory context, canvas context, and history
+    context_parts = []
+
+    # Add conversation history for pronoun resolution (rule-based rewrite mode)
+    if history_context:
+        context_parts.append(
+            f"## Recent Conversation (for context, use to resolve pronouns like 'it', 'that', 'this')\n{history_context}"
+        )
+        logger.info(
+            f"[Generate] Including history context for pronoun resolution: {len(history_context)} chars"
+        )
+
+    if canvas_context:
+        context_parts.append(
+            f"## User Specified Context (from Canvas)\nThe user has explicitly selected the following nodes as context. Prioritize this information:\n\n{canvas_context}"
+        )
+        logger.info(f"[Generate] Including canvas context: {len(canvas_context)} chars")
+
+    if memory_context:
+        context_parts.append(memory_context)
+        logger.info(f"[Generate] Including memory context: {len(memory_context)} chars")
+
+    if doc_context:
+        context_parts.append(f"## Retrieved Documents\n{doc_context}")
+
+    context = "\n\n".join(context_parts)
+
+    logger.debug(f"[Generate] Total context length: {len(context)} chars")
+
+    # Use intent-specific system prompt if available
+    generation_strategy = state.get("generation_strategy", {})
+    if generation_strategy and "system_prompt" in generation_strategy:
+        system_prompt = generation_strategy["system_prompt"]
+        logger.info(f"[Generate] Using intent-specific prompt for {state.get('intent_type')}")
+    else:
+        system_prompt = """You are an assistant for question-answering tasks.
+        Use the following pieces of retrieved context to answer the question.
+        The context may include:
+        - Recent Conversation: Previous Q&A for understanding pronoun references (it, that, this, etc.)
+        - User Specified Context: Information explicitly selected by the user (Highest Priority)
+        - Conversation Summary: A summary of earlier parts of the conversation
+        - Relevant Past Discussions: Similar questions and answers from previous sessions
+        - Retrieved Documents: Information from the knowledge base
+
+        IMPORTANT: If the question contains pronouns or references like "it", "that", "this", "them",
+        or references to previous topics, resolve them using the Recent Conversation context.
+
+        Source Reference Format:
+        - When you reference a specific location in a source, include a marker like: <SOURCE_ID, REF_LOC>
+        - For videos/audios: REF_LOC should be a timestamp like 00:55 or 1:23:45
+        - For documents: REF_LOC should be like Page 12 (use page_number from Retrieved Chunk headers when available)
+        - SOURCE_ID must be copied exactly from context lines like "Source ID: ..." or "document_id=..."
+
+        Use all available context to provide the most helpful answer.
+        If you don't know the answer, just say that you don't know.
+        Answer in the same language as the question."""
+
+    return system_prompt, context
+
+
+def build_generation_chain(llm: ChatOpenAI, system_prompt: str):
+    """Streaming question + context -> answer chain for traditional generation."""
+    prompt = ChatPromptTemplate.from_messages(
+        [
+            ("system", system_prompt),
+            ("human", "Question: {question}\n\nContext: {context}\n\nAnswer:"),
+        ]
+    )
+
+    # Create streaming LLM with callback (includes Langfuse if enabled)
+    streaming_llm = llm.with_config({"streaming": True, "callbacks": get_callbacks()})
+    return prompt | streaming_llm | StrOutputParser()
+
+
 async def stream_rag_response(
     question: str,
     retriever: PGVectorRetriever,
@@ -1795,6 +2203,7 @@ async def stream_rag_response(
     enable_rewrite_cache: bool = True,
     enable_intent_cache: bool = True,
     max_expansion_ratio: float = 3.0,
+    reranker: str = "llm",  # llm | local
     rag_mode: str = "traditional",
     project_id: Any = None,  # UUID
     session: Any = None,  # AsyncSession
@@ -1822,6 +2231,9 @@ async def stream_rag_response(
         enable_rewrite_cache: Cache rewrite results to avoid redundant LLM calls
         enable_intent_cache: Cache intent classification results
         max_expansion_ratio: Maximum allowed expansion ratio (rewritten/original length)
+        reranker: Reranker used when use_rerank is set (llm | local). With
+                  RELEVANCE_MODE=fused and the llm reranker, rerank and grading
+                  run as one batched pass (assess_relevance)
         rag_mode: RAG mode (traditional | long_context | auto)
         project_id: Project UUID
         session: Database session
@@ -1878,15 +2290,73 @@ async def stream_rag_response(
         if hint not in question:
             state["question"] = question + hint
 
-    # Step 1: Query rewriting / expansion (optional)
-    # Build history context for prompt-based resolution (used in generation step)
-    history_context_for_prompt = ""
-    if chat_history:
-        history_context_for_prompt = build_history_context_for_prompt(chat_history, max_turns=3)
-        state["history_context"] = history_context_for_prompt
+    # Steps 1-3 run as a dependency graph (see stage_pipeline): the session
+    # summary starts immediately, memory and intent start once the retrieval
+    # query is known, and retrieval starts once intent is known. Results are
+    # awaited in the original order so status events are unchanged.
+    pipeline = StagePipeline()
+    use_memory = bool(session and embedding_service and project_id)
+    query_embedding_service = getattr(retriever, "embedding_service", None) or embedding_service
 
-    if use_rewrite and chat_history:
-        if use_llm_rewrite:
+    async def run_retrieval(query_state: dict[str, Any]) -> dict[str, Any]:
+        if use_intent_classification:
+            query_state = {**query_state, **await pipeline.result("intent")}
+        async with pipeline.db_lock:
+            return await _retrieve_for_mode(
+                query_state, retriever, rag_mode, session, project_id, embedding_service
+            )
+
+    def start_query_stages(query_state: dict[str, Any]) -> None:
+        """Start every stage that depends on the retrieval query."""
+        # Memory lookup, intent classification and retrieval reuse the same
+        # per-turn query embedding
+        prefetch_embedding(query_embedding_service, query_state["rewritten_question"])
+
+        if use_memory:
+
+            async def run_memory() -> dict[str, Any]:
+                async with pipeline.db_lock:
+                    return await retrieve_memory(
+                        query_state,
+                        session=session,
+                        embedding_service=embedding_service,
+                        project_id=project_id,
+                        limit=5,
+                        min_similarity=0.6,
+                    )
+
+            pipeline.start("memory", run_memory, uses_db=True)
+        if use_intent_classification:
+            pipeline.start(
+                "intent",
+                lambda: classify_intent(
+                    query_state, llm, enable_cache=enable_intent_cache, project_id=project_id
+                ),
+            )
+        pipeline.start("retrieve", lambda: run_retrieval(query_state), uses_db=True)
+
+    try:
+        if use_memory:
+
+            async def run_summary() -> dict[str, Any]:
+                async with pipeline.db_lock:
+                    return await get_session_summary(
+                        dict(state),
+                        session=session,
+                        embedding_service=embedding_service,
+                        project_id=project_id,
+                    )
+
+            pipeline.start("summary", run_summary, uses_db=True)
+
+        # Step 1: Query rewriting / expansion (optional)
+        # Build history context for prompt-based resolution (used in generation step)
+        history_context_for_prompt = ""
+        if chat_history:
+            history_context_for_prompt = build_history_context_for_prompt(chat_history, max_turns=3)
+            state["history_context"] = history_context_for_prompt
+
+        if use_rewrite and chat_history and use_llm_rewrite:
             # LLM-based rewrite (more accurate but adds latency)
             if needs_rewriting(question, chat_history):
                 yield {
@@ -1895,167 +2365,160 @@ async def stream_rag_response(
                     "message": "Refining your question...",
                 }
             logger.info("[Stream] LLM-based query rewriting...")
-            rewrite_result = await transform_query(
-                state,
-                llm,
-                enable_validation=enable_rewrite_validation,
-                enable_cache=enable_rewrite_cache,
-                max_expansion_ratio=max_expansion_ratio,
+            rewrite_state = dict(state)
+            pipeline.start(
+                "transform",
+                lambda: transform_query(
+                    rewrite_state,
+                    llm,
+                    enable_validation=enable_rewrite_validation,
+                    enable_cache=enable_rewrite_cache,
+                    max_expansion_ratio=max_expansion_ratio,
+                    project_id=project_id,
+                ),
             )
-            state.update(rewrite_result)
+
+            # Speculate that the rewrite keeps the question: the rewrite is
+            # skipped or rejected often enough that starting memory, intent
+            # and retrieval now usually pays off
+            state["rewritten_question"] = state["question"]
+            speculative_key = (state["rewritten_question"], state.get("active_document_id"))
+            start_query_stages(dict(state))
+
+            state.update(await pipeline.result("transform"))
+            if (state["rewritten_question"], state.get("active_document_id")) == speculative_key:
+                pipeline.speculation = "hit"
+            else:
+                pipeline.speculation = "miss"
+                pipeline.discard("memory", "intent", "retrieve")
+                start_query_stages(dict(state))
         else:
-            # Rule-based expansion (faster, no LLM call)
-            # The actual pronoun resolution happens in the generation prompt
-            expanded_query = expand_query_with_history(question, chat_history)
-            state["rewritten_question"] = expanded_query
-            state["question"] = question  # Keep original for display
-            logger.info(f"[Stream] Rule-based expansion: '{question}' -> '{expanded_query}'")
-    else:
-        state["rewritten_question"] = question
+            if use_rewrite and chat_history:
+                # Rule-based expansion (faster, no LLM call)
+                # The actual pronoun resolution happens in the generation prompt
+                expanded_query = expand_query_with_history(question, chat_history)
+                state["rewritten_question"] = expanded_query
+                state["question"] = question  # Keep original for display
+                logger.info(f"[Stream] Rule-based expansion: '{question}' -> '{expanded_query}'")
+            else:
+                state["rewritten_question"] = question
+            start_query_stages(dict(state))
+
+        # Step 1.5: Memory retrieval (semantic history) - if session and embedding_service available
+        if use_memory:
+            yield {"type": "status", "step": "memory", "message": "Recalling context..."}
+            logger.info("[Stream] Retrieving relevant memories...")
+            try:
+                # Session summary (short-term working memory) and relevant past
+                # discussions (long-term episodic memory)
+                state.update(await pipeline.result("summary"))
+                state.update(await pipeline.result("memory"))
+
+                logger.info(
+                    f"[Stream] Memory context: summary={len(state.get('session_summary', ''))} chars, "
+                    f"memories={len(state.get('retrieved_memories', []))}"
+                )
+            except Exception as e:
+                logger.warning(f"[Stream] Memory retrieval failed: {e}")
+                state["session_summary"] = ""
+                state["retrieved_memories"] = []
 
-    # Step 1.5: Memory retrieval (semantic history) - if session and embedding_service available
-    if session and embedding_service and project_id:
-        yield {"type": "status", "step": "memory", "message": "Recalling context..."}
-        logger.info("[Stream] Retrieving relevant memories...")
-        try:
-            # Get session summary (short-term working memory)
-            summary_result = await get_session_summary(
-                state,
-                session=session,
-                embedding_service=embedding_service,
-                project_id=project_id,
+        # Step 2: Intent classification (optional)
+        if use_intent_classification:
+            yield {"type": "status", "step": "analyzing", "message": "Understanding your intent..."}
+            logger.info("[Stream] Classifying intent...")
+            state.update(await pipeline.result("intent"))  # Merge instead of replace
+            logger.info(
+                f"[Stream] Intent: {state.get('intent_type')} "
+                f"(confidence: {state.get('intent_confidence', 0):.2f})"
             )
-            state.update(summary_result)
 
-            # Retrieve relevant past discussions (long-term episodic memory)
-            memory_result = await retrieve_memory(
-                state,
-                session=session,
-                embedding_service=embedding_service,
-                project_id=project_id,
-                limit=5,
-                min_similarity=0.6,
-            )
-            state.update(memory_result)
+        # Step 3: Retrieve documents (with adaptive strategy or long context)
+        yield {"type": "status", "step": "retrieving", "message": "Searching knowledge base..."}
+        state.update(await pipeline.result("retrieve"))
+        pipeline.log()
+    finally:
+        await pipeline.aclose()
 
-            logger.info(
-                f"[Stream] Memory context: summary={len(state.get('session_summary', ''))} chars, "
-                f"memories={len(state.get('retrieved_memories', []))}"
-            )
-        except Exception as e:
-            logger.warning(f"[Stream] Memory retrieval failed: {e}")
-            state["session_summary"] = ""
-            state["retrieved_memories"] = []
+    yield {"type": "sources", "documents": state["documents"]}
 
-    # Step 2: Intent classification (optional)
-    if use_intent_classification:
-        yield {"type": "status", "step": "analyzing", "message": "Understanding your intent..."}
-        logger.info("[Stream] Classifying intent...")
-        intent_result = await classify_intent(
-            state,
-            llm,
-            enable_cache=enable_intent_cache,
-        )
-        state.update(intent_result)  # Merge instead of replace
-        logger.info(
-            f"[Stream] Intent: {state.get('intent_type')} "
-            f"(confidence: {state.get('intent_confidence', 0):.2f})"
-        )
+    # Steps 4-5: Fused rerank + grade in one batched LLM pass
+    fuse_relevance = (
+        use_grading
+        and get_settings().relevance_mode == "fused"
+        and (not use_rerank or get_reranker(reranker) is None)
+    )
 
-    # Step 3: Retrieve documents (with adaptive strategy or long context)
-    yield {"type": "status", "step": "retrieving", "message": "Searching knowledge base..."}
-    if rag_mode in ("long_context", "auto") and session and project_id and embedding_service:
-        from research_agent.config import get_settings
-        from research_agent.domain.services.document_selector import DocumentSelectorService
-        from research_agent.domain.services.token_estimator import TokenEstimator
-        from research_agent.infrastructure.llm.model_config import calculate_available_tokens
+    async def select_documents() -> list[Document]:
+        if fuse_relevance:
+            logger.info("[Stream] Assessing document relevance (fused rerank + grade)...")
+            state.update(await assess_relevance(state, llm, reorder=use_rerank))
+            return state.get("filtered_documents", [])
 
-        settings = get_settings()
+        # Step 4: Rerank (optional)
+        documents = state.get("documents", [])
+        if use_rerank:
+            logger.info("[Stream] Reranking documents...")
+            rerank_result = await rerank(state, llm, reranker=reranker)
+            state.update(rerank_result)  # Merge instead of replace
+            documents = state.get("reranked_documents", [])
 
-        # Calculate available tokens
-        max_tokens = calculate_available_tokens(
-            settings.llm_model, settings.long_context_safety_ratio
+        # Step 5: Grade documents (optional)
+        if use_grading:
+            logger.info("[Stream] Grading documents...")
+            state["reranked_documents"] = documents  # Pass to grading
+            logger.debug(f"[Stream] State keys before grading: {list(state.keys())}")
+            grade_result = await grade_documents(state, llm)
+            state.update(grade_result)  # Merge instead of replace
+            documents = state.get("filtered_documents", [])
+        return documents
+
+    # Speculative generation: draft an answer from the top retrieved chunks while
+    # rerank/grading runs; keep it if none of those chunks is dropped
+    settings = get_settings()
+    speculate = (
+        settings.speculative_generation
+        and (use_rerank or use_grading)
+        and bool(state["documents"])
+        and not (
+            state.get("rag_mode") in ("long_context", "hybrid")
+            and state.get("long_context_content")
         )
-        min_tokens = settings.long_context_min_tokens
+    )
+    if speculate:
+        yield {"type": "status", "step": "generating", "message": "Generating response..."}
+        draft_documents = state["documents"][: settings.speculative_generation_docs]
+        system_prompt, context = build_generation_context(state, draft_documents)
+        chain = build_generation_chain(llm, system_prompt)
+        logger.info(f"[Stream] Speculative draft from top {len(draft_documents)} documents")
+
+        speculation = SpeculativeGeneration(draft_documents, select_documents())
+        async for event in speculation.stream(
+            chain.astream({"question": question, "context": context})
+        ):
+            yield event
+        speculation.log()
+        documents = speculation.documents
+
+        if speculation.won:
+            logger.info(f"[Stream] Speculative draft kept: {speculation.draft_tokens} tokens")
+            yield {"type": "done"}
+            return
 
         logger.info(
-            f"[RAG Mode] Long context mode enabled - max_tokens={max_tokens}, "
-            f"min_tokens={min_tokens}, model={settings.llm_model}, "
-            f"safety_ratio={settings.long_context_safety_ratio}"
+            f"[Stream] Speculative draft discarded, {speculation.dropped_documents} "
+            f"draft documents dropped by grading"
         )
-
-        try:
-            # Create document selector
-            token_estimator = TokenEstimator()
-            doc_selector = DocumentSelectorService(
-                session=session,
-                embedding_service=embedding_service,
-                token_estimator=token_estimator,
-            )
-
-            # Select documents for long context
-            query = state.get("rewritten_question", state["question"])
-            selection_result = await doc_selector.select_documents_for_query(
-                query=query,
-                project_id=project_id,
-                max_tokens=max_tokens,
-                min_tokens=min_tokens,
-            )
-
-            # Convert selection result to dict for state
-            document_selection = {
-                "long_context_docs": selection_result.long_context_docs,
-                "retrieval_docs": selection_result.retrieval_docs,
-                "strategy": selection_result.strategy,
-                "total_tokens": selection_result.total_tokens,
-                "reason": selection_result.reason,
+        if speculation.draft_tokens:
+            yield {
+                "type": "reset",
+                "reason": "documents_changed",
+                "message": "Refining the answer with the most relevant sources...",
             }
-
-            logger.info(
-                f"[RAG Mode] Document selection result: strategy={selection_result.strategy}, "
-                f"long_context_docs={len(selection_result.long_context_docs)}, "
-                f"retrieval_docs={len(selection_result.retrieval_docs)}, "
-                f"total_tokens={selection_result.total_tokens}, "
-                f"reason={selection_result.reason}"
-            )
-
-            # Retrieve using long context mode
-            retrieve_result = await retrieve_long_context(
-                state, retriever, document_selection, session
-            )
-            state.update(retrieve_result)
-        except Exception as e:
-            logger.warning(
-                f"[Stream] Long context mode failed: {e}, falling back to traditional mode",
-                exc_info=True,
-            )
-            retrieve_result = await retrieve(state, retriever)
-            state.update(retrieve_result)
     else:
-        logger.info("[RAG Mode] Using traditional retrieval mode")
-        retrieve_result = await retrieve(state, retriever)
-        state.update(retrieve_result)
-
-    yield {"type": "sources", "documents": state["documents"]}
-
-    # Step 4: Rerank (optional)
-    if use_rerank:
-        yield {"type": "status", "step": "ranking", "message": "Ranking relevant content..."}
-        logger.info("[Stream] Reranking documents...")
-        rerank_result = await rerank(state, llm)
-        state.update(rerank_result)  # Merge instead of replace
-        documents = state.get("reranked_documents", [])
-    else:
-        documents = state.get("documents", [])
-
-    # Step 5: Grade documents (optional)
-    if use_grading:
-        logger.info("[Stream] Grading documents...")
-        state["reranked_documents"] = documents  # Pass to grading
-        logger.debug(f"[Stream] State keys before grading: {list(state.keys())}")
-        grade_result = await grade_documents(state, llm)
-        state.update(grade_result)  # Merge instead of replace
-        documents = state.get("filtered_documents", [])
+        if use_rerank or fuse_relevance:
+            yield {"type": "status", "step": "ranking", "message": "Ranking relevant content..."}
+        documents = await select_documents()
 
     filtered_count = len(documents)
     canvas_context = state.get("canvas_context", "")
@@ -2093,7 +2556,6 @@ async def stream_rag_response(
         logger.info(
             f"[RAG Mode] Using long context generation mode (content_length={len(long_context_content)} chars)"
         )
-        from research_agent.config import get_settings
         from research_agent.infrastructure.llm.prompts.rag_prompt import (
             LONG_CONTEXT_SYSTEM_PROMPT,
             build_long_context_prompt,
@@ -2101,7 +2563,6 @@ async def stream_rag_response(
             get_document_id_mapping,
         )
 
-        settings = get_settings()
         document_selection = state.get("document_selection", {})
         long_context_docs = document_selection.get("long_context_docs", [])
 
@@ -2251,105 +2712,10 @@ async def stream_rag_response(
         yield {"type": "done"}
         return
 
-    else:
-        # Use traditional generation
-        doc_sections: list[str] = []
-        for i, doc in enumerate(documents, 1):
-            doc_id = doc.metadata.get("document_id", "")
-            page_number = doc.metadata.get("page_number", "")
-            filename = doc.metadata.get("filename", "")
-            similarity = doc.metadata.get("similarity", None)
-
-            header_parts = [f"--- Retrieved Chunk {i} ---"]
-            if filename:
-                header_parts.append(f"filename={filename}")
-            if doc_id:
-                header_parts.append(f"document_id={doc_id}")
-            if page_number != "":
-                header_parts.append(f"page_number={page_number}")
-            if similarity is not None:
-                header_parts.append(f"similarity={round(float(similarity), 4)}")
-
-            header = " ".join(header_parts)
-            doc_sections.append(f"{header}\n{doc.page_content}")
-
-        doc_context = "\n\n".join(doc_sections)
-
-    # Build memory context (session summary + relevant past discussions)
-    memory_context = format_memory_for_context(state)
-    canvas_context = state.get("canvas_context", "")
-    history_context = state.get(
-        "history_context", ""
-    )  # NEW: Conversation history for pronoun resolution
-
-    # Combine document context with memory context, canvas context, and history
-    context_parts = []
-
-    # Add conversation history for pronoun resolution (rule-based rewrite mode)
-    if history_context:
-        context_parts.append(
-            f"## Recent Conversation (for context, use to resolve pronouns like 'it', 'that', 'this')\n{history_context}"
-        )
-        logger.info(
-            f"[Generate] Including history context for pronoun resolution: {len(history_context)} chars"
-        )
-
-    if canvas_context:
-        context_parts.append(
-            f"## User Specified Context (from Canvas)\nThe user has explicitly selected the following nodes as context. Prioritize this information:\n\n{canvas_context}"
-        )
-        logger.info(f"[Generate] Including canvas context: {len(canvas_context)} chars")
-
-    if memory_context:
-        context_parts.append(memory_context)
-        logger.info(f"[Generate] Including memory context: {len(memory_context)} chars")
-
-    if doc_context:
-        context_parts.append(f"## Retrieved Documents\n{doc_context}")
-
-    context = "\n\n".join(context_parts)
-
-    logger.debug(f"[Generate] Total context length: {len(context)} chars")
+    # Use traditional generation
+    system_prompt, context = build_generation_context(state, documents)
 
-    # Use intent-specific system prompt if available
-    generation_strategy = state.get("generation_strategy", {})
-    if generation_strategy and "system_prompt" in generation_strategy:
-        system_prompt = generation_strategy["system_prompt"]
-        logger.info(f"[Generate] Using intent-specific prompt for {state.get('intent_type')}")
-    else:
-        system_prompt = """You are an assistant for question-answering tasks.
-        Use the following pieces of retrieved context to answer the question.
-        The context may include:
-        - Recent Conversation: Previous Q&A for understanding pronoun references (it, that, this, etc.)
-        - User Specified Context: Information explicitly selected by the user (Highest Priority)
-        - Conversation Summary: A summary of earlier parts of the conversation
-        - Relevant Past Discussions: Similar questions and answers from previous sessions
-        - Retrieved Documents: Information from the knowledge base
-
-        IMPORTANT: If the question contains pronouns or references like "it", "that", "this", "them",
-        or references to previous topics, resolve them using the Recent Conversation context.
-
-        Source Reference Format:
-        - When you reference a specific location in a source, include a marker like: <SOURCE_ID, REF_LOC>
-        - For videos/audios: REF_LOC should be a timestamp like 00:55 or 1:23:45
-        - For documents: REF_LOC should be like Page 12 (use page_number from Retrieved Chunk headers when available)
-        - SOURCE_ID must be copied exactly from context lines like "Source ID: ..." or "document_id=..."
-
-        Use all available context to provide the most helpful answer.
-        If you don't know the answer, just say that you don't know.
-        Answer in the same language as the question."""
-
-    # Create prompt and chain (moved outside the else block to fix the bug)
-    prompt = ChatPromptTemplate.from_messages(
-        [
-            ("system", system_prompt),
-            ("human", "Question: {question}\n\nContext: {context}\n\nAnswer:"),
-        ]
-    )
-
-    # Create streaming LLM with callback (includes Langfuse if enabled)
-    streaming_llm = llm.with_config({"streaming": True, "callbacks": get_callbacks()})
-    chain = prompt | streaming_llm | StrOutputParser()
+    chain = build_generation_chain(llm, system_prompt)
 
     # Stream tokens
     token_count = 0
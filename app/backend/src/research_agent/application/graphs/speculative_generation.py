@@ -0,0 +1,154 @@
+"""Speculative generation overlapped with rerank/grading.
+
+Without speculation, ``stream_rag_response`` cannot emit a single answer
+token until rerank and grading have finished:
+
+    retrieve ──► rerank/grade ──► generate ──► first token
+
+With ``SPECULATIVE_GENERATION=true`` a draft answer is generated from the
+top retrieved chunks while document selection runs in parallel:
+
+    retrieve ──► rerank/grade ─────────────┐
+             └─► generate draft ──► tokens ├──► keep draft | reset + regenerate
+
+When selection finishes, the draft is checked against it. If every chunk
+the draft was conditioned on survived, the draft is the answer (a "win").
+Otherwise the draft is stopped and the caller emits a ``reset`` event so
+the client can clear it, then generates again from the selected documents.
+A draft whose LLM stream fails is handled the same way (a lost speculation).
+
+Usage:
+    speculation = SpeculativeGeneration(draft_documents, select_documents())
+    async for event in speculation.stream(chain.astream(inputs)):
+        yield event
+    if not speculation.won:
+        ...  # reset, regenerate from speculation.documents
+    speculation.log()
+"""
+
+import asyncio
+import time
+from typing import Any, AsyncIterator, Awaitable, Dict, List, Optional
+
+from langchain_core.documents import Document
+
+from research_agent.shared.utils.logger import logger
+from research_agent.shared.utils.rag_trace import rag_log
+
+# Per-process outcome counters, reported with every SPECULATE trace entry
+_stats: Dict[str, int] = {"attempts": 0, "wins": 0}
+
+
+def _document_key(doc: Document) -> tuple[Any, str]:
+    return doc.metadata.get("document_id"), doc.page_content
+
+
+class SpeculativeGeneration:
+    """Streams a draft answer while document selection runs, then validates it."""
+
+    def __init__(
+        self,
+        draft_documents: List[Document],
+        selection: Awaitable[List[Document]],
+    ):
+        """
+        Args:
+            draft_documents: Documents the draft is conditioned on
+            selection: Rerank/grading coroutine returning the selected documents
+        """
+        self.draft_documents = draft_documents
+        self.documents: List[Document] = []
+        self.won: Optional[bool] = None  # None until selection has finished
+        self.draft_tokens = 0
+        self.dropped_documents = 0
+        self._selection = asyncio.ensure_future(selection)
+        self._started = time.perf_counter()
+        self._first_token_ms: Optional[float] = None
+        self._selection_ms: Optional[float] = None
+
+    def _elapsed_ms(self) -> float:
+        return round((time.perf_counter() - self._started) * 1000, 2)
+
+    def _decide(self) -> None:
+        """Compare the selected documents with the draft's documents."""
+        self.documents = self._selection.result()
+        self._selection_ms = self._elapsed_ms()
+        kept = {_document_key(doc) for doc in self.documents}
+        self.dropped_documents = sum(
+            1 for doc in self.draft_documents if _document_key(doc) not in kept
+        )
+        self.won = self.dropped_documents == 0
+
+    async def stream(self, tokens: AsyncIterator[str]) -> AsyncIterator[dict[str, Any]]:
+        """Yield draft token events until the draft ends or is invalidated.
+
+        Returns once the draft is complete and validated, or as soon as
+        selection drops a draft document (the draft is closed then). If the
+        draft stream fails, waits for selection and returns with ``won``
+        False. Raises whatever the selection raised.
+        """
+        iterator = tokens.__aiter__()
+        next_token = asyncio.ensure_future(iterator.__anext__())
+        try:
+            while True:
+                waiting = {next_token} if self._selection.done() else {next_token, self._selection}
+                done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+
+                if self._selection in done and self.won is None:
+                    self._decide()
+                    if not self.won:
+                        return
+
+                if next_token in done:
+                    try:
+                        token = next_token.result()
+                    except StopAsyncIteration:
+                        break
+                    except Exception as e:
+                        logger.warning(f"[Speculate] Draft stream failed, regenerating: {e}")
+                        if self.won is None:
+                            await asyncio.wait({self._selection})
+                            self._decide()
+                        self.won = False
+                        return
+                    if self._first_token_ms is None:
+                        self._first_token_ms = self._elapsed_ms()
+                    self.draft_tokens += 1
+                    yield {"type": "token", "content": token}
+                    next_token = asyncio.ensure_future(iterator.__anext__())
+
+            # Draft complete before selection: it can only be kept once validated
+            if self.won is None:
+                await asyncio.wait({self._selection})
+                self._decide()
+        finally:
+            if not next_token.done():
+                next_token.cancel()
+                await asyncio.gather(next_token, return_exceptions=True)
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
+            if not self._selection.done():
+                self._selection.cancel()
+
+    def log(self) -> None:
+        """Log the outcome and the time-to-first-token it bought to the RAG trace.
+
+        Without speculation the first token arrives after selection plus the
+        LLM's first-token latency, so a win gains the whole selection time.
+        """
+        _stats["attempts"] += 1
+        if self.won:
+            _stats["wins"] += 1
+        rag_log(
+            "SPECULATE",
+            outcome="win" if self.won else "restart",
+            draft_docs=len(self.draft_documents),
+            dropped_docs=self.dropped_documents,
+            draft_tokens=self.draft_tokens,
+            wasted_tokens=0 if self.won else self.draft_tokens,
+            first_token_ms=self._first_token_ms,
+            selection_ms=self._selection_ms,
+            ttft_gain_ms=self._selection_ms if self.won else 0.0,
+            win_rate=round(_stats["wins"] / _stats["attempts"], 3),
+        )
@@ -0,0 +1,145 @@
+"""Concurrent stage runner for the pre-retrieval part of the RAG pipeline.
+
+``stream_rag_response`` used to run rewrite, session summary, memory lookup,
+intent classification and retrieval strictly one after another. The stages
+form a small dependency graph instead:
+
+    summary ─────────────────────────────┐
+    rewrite ──► memory                   ├──► generation
+            ──► intent ──► retrieval ────┘
+
+``StagePipeline`` starts each stage as a task as soon as its inputs are
+known, and the caller awaits results in the original order, so client
+status events are unchanged. Stages that touch the request's database
+session serialize on ``db_lock`` (an ``AsyncSession`` does not allow
+concurrent operations); LLM and embedding calls overlap freely.
+
+Speculative stages (started on the original question while an LLM rewrite
+is in flight) are discarded when the rewrite changes the query. Discarded
+LLM stages are cancelled; database stages are left to finish, because
+cancelling a query mid-flight leaves the session unusable.
+
+Usage:
+    pipeline = StagePipeline()
+    try:
+        pipeline.start("intent", lambda: classify_intent(state, llm))
+        ...
+        state.update(await pipeline.result("intent"))
+        pipeline.log()
+    finally:
+        await pipeline.aclose()
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from research_agent.shared.utils.rag_trace import rag_log
+
+
+class _Stage:
+    """A started stage and its timing."""
+
+    def __init__(self, task: asyncio.Task, uses_db: bool):
+        self.task = task
+        self.uses_db = uses_db
+        self.latency_ms: Optional[float] = None
+
+
+class StagePipeline:
+    """Runs independent pipeline stages concurrently with per-stage timing."""
+
+    def __init__(self):
+        self.db_lock = asyncio.Lock()
+        self.speculation: Optional[str] = None  # None | "hit" | "miss"
+        self._stages: Dict[str, _Stage] = {}
+        self._discarded: list[_Stage] = []
+        self._started = time.perf_counter()
+
+    def start(
+        self,
+        name: str,
+        run: Callable[[], Awaitable[Any]],
+        uses_db: bool = False,
+    ) -> asyncio.Task:
+        """Start a stage in the background.
+
+        Args:
+            name: Stage name, used by ``result`` and in the trace
+            run: Zero-argument coroutine factory for the stage
+            uses_db: The stage queries the shared database session and
+                must not be cancelled once started
+        """
+        if name in self._stages:
+            self.discard(name)
+
+        async def timed() -> Any:
+            started = time.perf_counter()
+            try:
+                return await run()
+            finally:
+                stage.latency_ms = round((time.perf_counter() - started) * 1000, 2)
+
+        task = asyncio.ensure_future(timed())
+        # Failures surface to the awaiting caller; don't warn for discarded stages
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        stage = _Stage(task, uses_db)
+        self._stages[name] = stage
+        return task
+
+    def has(self, name: str) -> bool:
+        """Whether the stage was started."""
+        return name in self._stages
+
+    async def result(self, name: str) -> Any:
+        """Wait for a stage's result.
+
+        Shielded, so a cancelled waiter (e.g. a dependent stage being
+        discarded) does not cancel the stage it depends on.
+        """
+        return await asyncio.shield(self._stages[name].task)
+
+    def discard(self, *names: str) -> None:
+        """Drop started stages whose inputs turned out to be stale."""
+        for name in names:
+            stage = self._stages.pop(name, None)
+            if stage is None:
+                continue
+            if not stage.uses_db:
+                stage.task.cancel()
+            self._discarded.append(stage)
+
+    def timings(self) -> Dict[str, float]:
+        """Latency of each finished (non-discarded) stage in ms."""
+        return {
+            name: stage.latency_ms
+            for name, stage in self._stages.items()
+            if stage.latency_ms is not None
+        }
+
+    def log(self) -> None:
+        """Log per-stage latency and the overlap it bought to the RAG trace."""
+        timings = self.timings()
+        wall_ms = round((time.perf_counter() - self._started) * 1000, 2)
+        rag_log(
+            "PIPELINE",
+            **{f"{name}_ms": latency for name, latency in timings.items()},
+            stages_sum_ms=round(sum(timings.values()), 2),
+            pre_retrieval_ms=wall_ms,
+            discarded_stages=len(self._discarded),
+            speculation=self.speculation or "none",
+        )
+
+    async def aclose(self) -> None:
+        """Cancel unfinished LLM stages and wait for database stages.
+
+        The database session is shared with the rest of the request, so it
+        must be idle again before the caller continues or returns.
+        """
+        stages = list(self._stages.values()) + self._discarded
+        for stage in stages:
+            if not stage.uses_db and not stage.task.done():
+                stage.task.cancel()
+        pending = [stage.task for stage in stages if not stage.task.done()]
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
@@ -77,14 +77,14 @@ class StreamingRefInjector:
 class StreamEvent:
     """Streaming event."""
 
-    type: str  # "token" | "sources" | "done" | "error" | "citations" | "status"
+    type: str  # "token" | "sources" | "done" | "error" | "citations" | "status" | "reset"
     content: str | None = None
     sources: list[SourceRef] | None = None
     citations: list[dict[str, Any]] | None = None  # Citations from long context mode
     step: str | None = (
         None  # For status events: rewriting, memory, analyzing, retrieving, ranking, generating
     )
-    message: str | None = None  # Human-readable status message
+    message: str | None = None  # Human-readable status / reset message
 
 
 @dataclass
@@ -189,3 +189,6 @@ class StreamResult:
 
     current_focus: dict[str, Any] | None
     # Focus updated during processing
+
+    citations: list[dict[str, Any]] = field(default_factory=list)
+    # Citations emitted with the answer (long context mode)
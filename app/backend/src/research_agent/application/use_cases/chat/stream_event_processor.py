@@ -58,6 +58,7 @@ class StreamEventProcessor:
         self._full_response = ""
         self._token_count = 0
         self._response_sources: list[dict[str, Any]] = []
+        self._citations: list[dict[str, Any]] = []
         self._retrieved_contexts: list[str] = []
 
         # Entity state (may be updated during processing)
@@ -85,6 +86,10 @@ class StreamEventProcessor:
             return self._handle_status_event(event)
         elif event_type == "token":
             return self._handle_token_event(event)
+        elif event_type == "reset":
+            return self._handle_reset_event(event)
+        elif event_type == "citations":
+            return self._handle_citations_event(event)
         elif event_type == "done":
             return self._handle_done_event()
 
@@ -103,6 +108,7 @@ class StreamEventProcessor:
             token_count=self._token_count,
             active_entities=self._active_entities,
             current_focus=self._current_focus,
+            citations=self._citations,
         )
 
     # ========== Private Event Handlers ==========
@@ -183,6 +189,21 @@ class StreamEventProcessor:
             return StreamEvent(type="token", content=injected)
         return None
 
+    def _handle_reset_event(self, event: dict[str, Any]) -> StreamEvent:
+        """Handle reset event - discard the answer streamed so far."""
+        self._ref_injector.flush()
+        self._full_response = ""
+        self._token_count = 0
+        self._citations = []
+        self._trace.metrics["speculation_reset"] = True
+        return StreamEvent(type="reset", message=event.get("message"))
+
+    def _handle_citations_event(self, event: dict[str, Any]) -> StreamEvent:
+        """Handle citations event - all citations of the answer."""
+        self._citations = list(event.get("citations", []))
+        self._trace.metrics["citations_count"] = len(self._citations)
+        return StreamEvent(type="citations", citations=self._citations)
+
     def _handle_done_event(self) -> StreamEvent:
         """Handle done event - stream finished."""
         # Flush injector buffer
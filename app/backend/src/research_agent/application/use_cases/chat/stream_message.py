@@ -14,13 +14,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from research_agent.application.agents.rag_agent import RAGAgent
 from research_agent.application.agents.rag_memory import RAGAgentMemory
 from research_agent.application.agents.rag_tools import RAGTools
-from research_agent.application.graphs.rag_graph import stream_rag_response
+from research_agent.application.graphs.rag_graph import needs_rewriting, stream_rag_response
 
 # from research_agent.application.use_cases.chat.stream_event_processor import StreamEventProcessor
 from research_agent.application.use_cases.chat.models import (
     SourceRef,
     StreamEvent,
     StreamingRefInjector,
+    StreamResult,
 )
 from research_agent.config import get_settings
 from research_agent.domain.entities.chat import ChatMessage
@@ -29,11 +30,19 @@ from research_agent.infrastructure.database.repositories.sqlalchemy_chat_repo im
 )
 from research_agent.infrastructure.database.session import get_async_session
 from research_agent.infrastructure.embedding.base import EmbeddingService
+from research_agent.infrastructure.embedding.request_scope import EmbeddingScope, embed_query
 from research_agent.infrastructure.evaluation.evaluation_logger import EvaluationLogger
 from research_agent.infrastructure.evaluation.ragas_service import RagasEvaluationService
+from research_agent.infrastructure.llm.answer_cache import (
+    CachedAnswer,
+    answer_scope_key,
+    get_answer_cache,
+    get_answer_cache_stats,
+)
 from research_agent.infrastructure.llm.openrouter import create_langchain_llm
 from research_agent.infrastructure.vector_store.factory import get_vector_store
 from research_agent.infrastructure.vector_store.langchain_pgvector import create_pgvector_retriever
+from research_agent.infrastructure.vector_store.retrieval_cache import get_corpus_version
 from research_agent.shared.utils.logger import logger
 from research_agent.shared.utils.rag_trace import RAGTrace
 
@@ -60,6 +69,7 @@ class StreamMessageInput:
         default_factory=lambda: settings.intent_classification_enabled
     )  # Enable intent-based adaptive strategies
     use_rerank: bool = False  # Enable LLM-based reranking (expensive)
+    reranker: str = field(default_factory=lambda: settings.reranker)  # llm | local
     use_grading: bool = True  # Enable binary relevance grading
     rag_mode: str = field(
         default_factory=lambda: settings.rag_mode
@@ -119,7 +129,9 @@ class StreamMessageUseCase:
             },
         )
 
-        async with trace:
+        # Embedding scope: the question is embedded once per turn and shared by
+        # retriever, memory and document selection
+        async with trace, EmbeddingScope():
             try:
                 # Step 1: Get chat history
                 messages = await repo.get_history(
@@ -183,6 +195,32 @@ class StreamMessageUseCase:
                         and messages[i + 1].role == "ai"
                     ]
 
+                # Step 4b: Serve repeated questions from the answer cache
+                cache_scope = await self._answer_cache_scope(input, ctx, chat_history)
+                question_embedding: list[float] | None = None
+                if cache_scope:
+                    question_embedding = await embed_query(self._embedding_service, input.message)
+                    cached = await get_answer_cache().lookup(cache_scope, question_embedding)
+                    trace.log(
+                        "ANSWER_CACHE",
+                        hit=cached is not None,
+                        similarity=round(cached.similarity, 4) if cached else None,
+                        hit_rate=get_answer_cache_stats()["hit_rate"],
+                    )
+                    if cached:
+                        for event in self._cached_answer_events(cached):
+                            yield event
+                        await repo.save(
+                            ChatMessage(
+                                project_id=input.project_id,
+                                role="ai",
+                                content=cached.answer,
+                                sources=cached.sources,
+                                user_id=input.user_id,
+                            )
+                        )
+                        return
+
                 # Step 5: Create retriever and LLM
                 vector_store = get_vector_store(self._session)
                 retriever = create_pgvector_retriever(
@@ -219,6 +257,7 @@ class StreamMessageUseCase:
                     use_llm_rewrite=settings.use_llm_rewrite,
                     use_intent_classification=input.use_intent_classification,
                     use_rerank=input.use_rerank,
+                    reranker=input.reranker,
                     use_grading=input.use_grading,
                     enable_intent_cache=settings.intent_cache_enabled,
                     rag_mode=input.rag_mode,
@@ -259,6 +298,18 @@ class StreamMessageUseCase:
                     )
                     await repo.save(ai_message)
 
+                if cache_scope and self._is_cacheable(stream_result):
+                    await get_answer_cache().store(
+                        cache_scope,
+                        question_embedding,
+                        CachedAnswer(
+                            question=input.message,
+                            answer=stream_result.full_response,
+                            sources=stream_result.sources,
+                            citations=stream_result.citations,
+                        ),
+                    )
+
                 # Step 8: Background tasks
                 if (
                     self._should_evaluate()
@@ -320,6 +371,73 @@ class StreamMessageUseCase:
                 )
                 yield StreamEvent(type="error", content=f"{type(e).__name__}: {str(e)}")
 
+    async def _answer_cache_scope(
+        self,
+        input: StreamMessageInput,
+        ctx: Any,
+        chat_history: list[tuple[str, str]],
+    ) -> str | None:
+        """Answer cache scope for this turn, or None when it must not be cached.
+
+        Answers that depend on more than the question and the corpus
+        (canvas/URL context, follow-ups that need the chat history) are
+        never cached.
+        """
+        if not settings.answer_cache_enabled:
+            return None
+        if ctx.combined_context or needs_rewriting(input.message, chat_history):
+            return None
+
+        try:
+            corpus_version = await get_corpus_version(self._session, input.project_id)
+        except Exception as e:
+            logger.warning(f"[AnswerCache] Corpus version lookup failed, bypassing: {e}")
+            return None
+
+        return answer_scope_key(
+            input.project_id,
+            input.user_id,
+            input.rag_mode,
+            corpus_version,
+            model=self._model,
+            document_id=input.document_id,
+            top_k=input.top_k,
+            hybrid=input.use_hybrid_search,
+            rerank=input.use_rerank,
+            reranker=input.reranker,
+            grading=input.use_grading,
+        )
+
+    @staticmethod
+    def _cached_answer_events(cached: CachedAnswer) -> list[StreamEvent]:
+        """Replay a cached answer as the events a generated one produces."""
+        events = [
+            StreamEvent(
+                type="sources",
+                sources=[
+                    SourceRef(
+                        document_id=UUID(source["document_id"]),
+                        page_number=source["page_number"],
+                        snippet=source["snippet"],
+                        similarity=source["similarity"],
+                    )
+                    for source in cached.sources
+                ],
+            ),
+            StreamEvent(type="token", content=cached.answer),
+        ]
+        if cached.citations:
+            events.append(StreamEvent(type="citations", citations=cached.citations))
+        events.append(StreamEvent(type="done"))
+        return events
+
+    @staticmethod
+    def _is_cacheable(result: StreamResult) -> bool:
+        """Only complete answers grounded in retrieved sources are cached."""
+        return bool(
+            result.full_response and result.sources and "[Error:" not in result.full_response
+        )
+
     def _should_evaluate(self) -> bool:
         """Determine if evaluation should be triggered (based on sampling rate)."""
         if not self._evaluation_enabled:
@@ -473,6 +591,7 @@ class StreamMessageUseCase:
                 ),
                 llm=llm,
                 embedding_service=embedding_service,
+                reranker=input.reranker,
             )
 
             rag_memory = RAGAgentMemory(
@@ -27,6 +27,13 @@ class RetrievalStrategyType(str, Enum):
     HYDE = "hyde"  # Hypothetical Document Embedding
 
 
+class RerankerType(str, Enum):
+    """Available reranker implementations."""
+
+    LLM = "llm"  # LLM relevance scoring (pointwise or listwise)
+    LOCAL = "local"  # CPU feature scoring, no LLM calls
+
+
 class CitationFormat(str, Enum):
     """Citation format options."""
 
@@ -91,7 +98,17 @@ class RetrievalConfig(BaseModel):
     )
     use_hybrid_search: bool = Field(default=False, description="Enable hybrid (vector + keyword)")
     rerank_enabled: bool = Field(default=True, description="Enable LLM-based reranking")
+    reranker: RerankerType = Field(
+        default=RerankerType.LLM, description="Reranker used when reranking is enabled"
+    )
     grading_enabled: bool = Field(default=True, description="Enable relevance grading")
+    mmr_enabled: bool = Field(default=False, description="Enable MMR diversification")
+    mmr_lambda: float = Field(
+        default=1.0, ge=0.0, le=1.0, description="MMR relevance/diversity trade-off"
+    )
+    mmr_fetch_multiplier: int = Field(
+        default=3, ge=1, le=10, description="Candidates fetched per result for MMR"
+    )
 
     class Config:
         frozen = True
@@ -190,6 +207,7 @@ class RAGConfig(BaseModel):
                     top_k=3,
                     min_similarity=0.7,
                     use_hybrid_search=True,
+                    mmr_lambda=0.9,
                     strategy_type=RetrievalStrategyType.HYBRID,
                 ),
                 "generation": GenerationConfig(
@@ -203,6 +221,7 @@ class RAGConfig(BaseModel):
                     top_k=8,
                     min_similarity=0.5,
                     use_hybrid_search=False,
+                    mmr_lambda=0.7,
                     strategy_type=RetrievalStrategyType.VECTOR,
                 ),
                 "generation": GenerationConfig(
@@ -216,6 +235,7 @@ class RAGConfig(BaseModel):
                     top_k=10,
                     min_similarity=0.6,
                     use_hybrid_search=True,
+                    mmr_lambda=0.5,
                     strategy_type=RetrievalStrategyType.HYBRID,
                 ),
                 "generation": GenerationConfig(
@@ -229,6 +249,7 @@ class RAGConfig(BaseModel):
                     top_k=5,
                     min_similarity=0.6,
                     use_hybrid_search=True,
+                    mmr_lambda=0.8,
                     strategy_type=RetrievalStrategyType.HYBRID,
                 ),
                 "generation": GenerationConfig(
@@ -242,6 +263,7 @@ class RAGConfig(BaseModel):
                     top_k=15,
                     min_similarity=0.4,
                     use_hybrid_search=False,
+                    mmr_lambda=0.5,
                     strategy_type=RetrievalStrategyType.VECTOR,
                 ),
                 "generation": GenerationConfig(
@@ -255,6 +277,7 @@ class RAGConfig(BaseModel):
                     top_k=8,
                     min_similarity=0.5,
                     use_hybrid_search=False,
+                    mmr_lambda=0.7,
                     strategy_type=RetrievalStrategyType.VECTOR,
                 ),
                 "generation": GenerationConfig(
@@ -273,7 +296,12 @@ class RAGConfig(BaseModel):
                 mode=base_config.mode,
                 llm=base_config.llm,
                 embedding=base_config.embedding,
-                retrieval=strategy["retrieval"],
+                retrieval=strategy["retrieval"].model_copy(
+                    update={
+                        "mmr_enabled": base_config.retrieval.mmr_enabled,
+                        "mmr_fetch_multiplier": base_config.retrieval.mmr_fetch_multiplier,
+                    }
+                ),
                 generation=strategy["generation"],
                 intent_classification=base_config.intent_classification,
                 long_context=base_config.long_context,
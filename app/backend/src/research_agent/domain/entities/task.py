@@ -25,6 +25,7 @@ class TaskType(str, Enum):
     FILE_CLEANUP = "file_cleanup"  # Async cleanup of orphan files from storage
     GENERATE_THUMBNAIL = "thumbnail_generator"  # Generate PDF thumbnail image
     PROCESS_URL = "process_url"  # Extract content from URL
+    MAINTAIN_ANN_INDEX = "maintain_ann_index"  # Build a project's partial HNSW index
 
 
 @dataclass
@@ -22,12 +22,21 @@ from research_agent.domain.entities.config import (
     LongContextConfig,
     RAGConfig,
     RAGMode,
+    RerankerType,
     RetrievalConfig,
     RetrievalStrategyType,
 )
 from research_agent.shared.utils.logger import logger
 
 
+def _reranker_type(value: Any) -> RerankerType:
+    """Map a reranker setting to RerankerType; unknown values use the LLM reranker."""
+    try:
+        return RerankerType(value)
+    except ValueError:
+        return RerankerType.LLM
+
+
 class ConfigurationService:
     """
     Service for resolving RAG configuration.
@@ -146,6 +155,9 @@ class ConfigurationService:
                 top_k=settings.retrieval_top_k,
                 min_similarity=settings.retrieval_min_similarity,
                 use_hybrid_search=False,
+                mmr_enabled=settings.retrieval_mmr_enabled,
+                mmr_fetch_multiplier=settings.retrieval_mmr_fetch_multiplier,
+                reranker=_reranker_type(settings.reranker),
             ),
             generation=GenerationConfig(
                 citation_format=citation_format,
@@ -312,6 +324,9 @@ class AsyncConfigurationService:
                 top_k=settings.retrieval_top_k,
                 min_similarity=settings.retrieval_min_similarity,
                 use_hybrid_search=False,
+                mmr_enabled=settings.retrieval_mmr_enabled,
+                mmr_fetch_multiplier=settings.retrieval_mmr_fetch_multiplier,
+                reranker=_reranker_type(settings.reranker),
             ),
             generation=GenerationConfig(
                 citation_format=citation_format,
@@ -415,6 +430,8 @@ class AsyncConfigurationService:
                 # Legacy: use_hybrid_search overrides strategy_type to HYBRID
                 if settings["use_hybrid_search"] and "strategy_type" not in retrieval:
                     retrieval["strategy_type"] = RetrievalStrategyType.HYBRID
+            if "reranker" in settings:
+                retrieval["reranker"] = _reranker_type(settings["reranker"])
             if retrieval:
                 overrides["retrieval"] = retrieval
 
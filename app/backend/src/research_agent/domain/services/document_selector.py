@@ -11,6 +11,9 @@ from research_agent.domain.entities.document import DocumentStatus
 from research_agent.domain.services.token_estimator import TokenEstimator
 from research_agent.infrastructure.database.models import DocumentModel
 from research_agent.infrastructure.embedding.base import EmbeddingService
+from research_agent.infrastructure.embedding.request_scope import embed_query
+from research_agent.infrastructure.vector_store.base import VectorStore
+from research_agent.infrastructure.vector_store.factory import get_vector_store
 from research_agent.shared.utils.logger import logger
 
 
@@ -33,10 +36,12 @@ class DocumentSelectorService:
         session: AsyncSession,
         embedding_service: EmbeddingService,
         token_estimator: TokenEstimator,
+        vector_store: Optional[VectorStore] = None,
     ):
         self._session = session
         self._embedding_service = embedding_service
         self._token_estimator = token_estimator
+        self._vector_store = vector_store or get_vector_store(session)
 
     async def select_documents_for_query(
         self,
@@ -109,13 +114,16 @@ class DocumentSelectorService:
                 f"[DocumentSelector] Multiple documents ({len(documents)}) exceed context "
                 f"({total_available_tokens} > {max_tokens} tokens) - using embedding for selection"
             )
-            query_embedding = await self._embedding_service.embed(query)
-            doc_scores = []
+            query_embedding = await embed_query(self._embedding_service, query)
 
-            for doc, token_count in doc_token_counts:
-                # Get average similarity from document chunks
-                similarity = await self._get_document_similarity(doc.id, query_embedding)
-                doc_scores.append((doc, similarity, token_count))
+            # Average similarity of each document's top chunks, one batched search
+            similarities = await self._get_document_similarities(
+                [doc.id for doc, _ in doc_token_counts], project_id, query_embedding
+            )
+            doc_scores = [
+                (doc, similarity, token_count)
+                for (doc, token_count), similarity in zip(doc_token_counts, similarities)
+            ]
 
             # Sort by similarity (descending)
             doc_scores.sort(key=lambda x: x[1], reverse=True)
@@ -187,47 +195,32 @@ class DocumentSelectorService:
             reason=reason,
         )
 
-    async def _get_document_similarity(
-        self, document_id: UUID, query_embedding: list[float]
-    ) -> float:
+    async def _get_document_similarities(
+        self, document_ids: List[UUID], project_id: UUID, query_embedding: list[float]
+    ) -> List[float]:
         """
-        Get document similarity by averaging top chunk similarities.
+        Get each document's similarity by averaging its top chunk similarities.
 
         Args:
-            document_id: Document ID
+            document_ids: Document IDs
+            project_id: Project ID
             query_embedding: Query embedding vector
 
         Returns:
-            Average similarity score (0-1)
+            Average similarity score (0-1) per document, in input order
         """
-        from sqlalchemy import bindparam, text
-
-        # Use pgvector distance operator with resource_chunks table
-        embedding_str = "[" + ",".join(map(str, query_embedding)) + "]"
-
-        # Get top 5 chunks for this document and average their similarities
-        query = text("""
-            SELECT 
-                1 - (embedding <=> cast(:embedding as vector)) AS similarity
-            FROM resource_chunks
-            WHERE resource_id = cast(:document_id as uuid)
-                AND resource_type = 'document'
-                AND embedding IS NOT NULL
-            ORDER BY embedding <=> cast(:embedding as vector)
-            LIMIT 5
-        """).bindparams(
-            bindparam("embedding", value=embedding_str),
-            bindparam("document_id", value=str(document_id)),
+        # Top 5 chunks per document, all documents in one vector query
+        results = await self._vector_store.search_many(
+            query_embeddings=[query_embedding] * len(document_ids),
+            project_id=project_id,
+            limit=5,
+            document_ids=list(document_ids),
         )
 
-        result = await self._session.execute(query)
-        similarities = [float(row.similarity) for row in result.fetchall()]
-
-        if not similarities:
-            return 0.0
-
-        # Return average similarity
-        return sum(similarities) / len(similarities)
+        return [
+            sum(r.similarity for r in chunks) / len(chunks) if chunks else 0.0
+            for chunks in results
+        ]
 
     def calculate_total_context_size(self, documents: List[DocumentModel]) -> int:
         """
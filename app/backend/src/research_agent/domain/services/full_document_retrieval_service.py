@@ -17,6 +17,7 @@ from research_agent.config import get_settings
 from research_agent.domain.services.token_estimator import TokenEstimator
 from research_agent.infrastructure.database.models import DocumentModel
 from research_agent.infrastructure.embedding.base import EmbeddingService
+from research_agent.infrastructure.embedding.request_scope import embed_query
 from research_agent.infrastructure.vector_store.base import SearchResult, VectorStore
 from research_agent.shared.utils.logger import logger
 
@@ -202,7 +203,7 @@ class FullDocumentRetrievalService:
         """Search for relevant chunks using vector store."""
         try:
             # Generate query embedding
-            query_embedding = await self.embedding_service.embed(query)
+            query_embedding = await embed_query(self.embedding_service, query)
 
             # Search vector store
             results = await self.vector_store.search(
@@ -18,6 +18,7 @@ from research_agent.infrastructure.database.repositories.sqlalchemy_memory_repo
     SQLAlchemyMemoryRepository,
 )
 from research_agent.infrastructure.embedding.base import EmbeddingService
+from research_agent.infrastructure.embedding.request_scope import embed_query
 from research_agent.shared.utils.logger import logger
 
 # Configuration constants
@@ -99,7 +100,7 @@ class MemoryService:
         # Generate embedding for the Q&A pair
         # We embed the question primarily since that's what we'll search against
         try:
-            embedding = await self._embedding_service.embed(question)
+            embedding = await embed_query(self._embedding_service, question)
         except Exception as e:
             logger.error(f"[Memory] Failed to generate embedding: {e}")
             return
@@ -140,7 +141,7 @@ class MemoryService:
         """
         try:
             # Generate embedding for the query
-            query_embedding = await self._embedding_service.embed(query)
+            query_embedding = await embed_query(self._embedding_service, query)
 
             # Search memories
             memories = await self._memory_repo.search_memories(
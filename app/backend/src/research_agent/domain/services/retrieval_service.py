@@ -8,6 +8,7 @@ from research_agent.config import get_settings
 from research_agent.domain.entities.resource import ResourceType
 from research_agent.domain.repositories.chunk_repo import ChunkRepository, ChunkSearchResult
 from research_agent.infrastructure.embedding.base import EmbeddingService
+from research_agent.infrastructure.embedding.request_scope import embed_query
 from research_agent.infrastructure.vector_store.base import SearchResult, VectorStore
 
 
@@ -70,7 +71,7 @@ class RetrievalService:
             List of SearchResult sorted by similarity
         """
         # Get query embedding
-        query_embedding = await self.embedding_service.embed(query)
+        query_embedding = await embed_query(self.embedding_service, query)
 
         # Use resource_id if provided, otherwise fall back to document_id for compatibility
         effective_resource_id = resource_id or document_id
@@ -141,7 +142,7 @@ class UnifiedRetrievalService:
             List of ChunkSearchResult sorted by similarity
         """
         # Get query embedding
-        query_embedding = await self.embedding_service.embed(query)
+        query_embedding = await embed_query(self.embedding_service, query)
 
         # Search using chunk repository
         if self.config.use_hybrid_search:
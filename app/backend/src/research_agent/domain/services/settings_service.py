@@ -279,6 +279,30 @@ SETTING_METADATA = {
         "description": "Enable hybrid (vector + keyword) search",
         "default": False,
     },
+    "reranker": {
+        "category": SettingCategory.RAG_STRATEGY,
+        "description": "How retrieved documents are reranked when reranking is enabled",
+        "default": "llm",
+        "allowed_values": ["llm", "local"],
+        "options": [
+            {
+                "value": "llm",
+                "label": "LLM",
+                "description": "The LLM scores each document's relevance",
+                "cost": "medium",
+                "performance": "slow",
+                "best_for": "Nuanced questions, highest ranking quality",
+            },
+            {
+                "value": "local",
+                "label": "Local",
+                "description": "Keyword (BM25), similarity and phrase features scored on CPU",
+                "cost": "free",
+                "performance": "fastest",
+                "best_for": "High query volume, keyword-heavy questions",
+            },
+        ],
+    },
     "citation_format": {
         "category": SettingCategory.RAG_STRATEGY,
         "description": "Citation format in responses",
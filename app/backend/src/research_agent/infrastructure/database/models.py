@@ -6,11 +6,13 @@ from uuid import uuid4
 
 from pgvector.sqlalchemy import Vector
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     DateTime,
     Float,
     ForeignKey,
     Integer,
+    LargeBinary,
     String,
     Text,
     UniqueConstraint,
@@ -40,6 +42,10 @@ class ProjectModel(Base):
     )
     # User ownership for multi-tenant isolation
     user_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, index=True)
+    # Bumped on every chunk write/delete; keys the retrieval result cache
+    corpus_version: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0, server_default="0"
+    )
 
     # Relationships
     documents: Mapped[List["DocumentModel"]] = relationship(
@@ -142,7 +148,8 @@ class ResourceChunkModel(Base):
     user_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, index=True)
     chunk_index: Mapped[int] = mapped_column(Integer, nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
-    embedding: Mapped[Optional[List[float]]] = mapped_column(Vector(1536), nullable=True)
+    # Unconstrained: size is EMBEDDING_DIMENSIONS, enforced by the index expressions
+    embedding: Mapped[Optional[List[float]]] = mapped_column(Vector(), nullable=True)
     chunk_metadata: Mapped[Dict[str, Any]] = mapped_column(
         "metadata", JSONB, server_default="{}", nullable=False
     )
@@ -300,8 +307,8 @@ class ChatMemoryModel(Base):
     user_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, index=True)
     # The content stores the formatted Q&A pair: "User: <question>\nAssistant: <answer>"
     content: Mapped[str] = mapped_column(Text, nullable=False)
-    # Vector embedding for semantic search (1536 dimensions for OpenAI embeddings)
-    embedding: Mapped[Optional[List[float]]] = mapped_column(Vector(1536), nullable=True)
+    # Vector embedding for semantic search (EMBEDDING_DIMENSIONS, default 1536)
+    embedding: Mapped[Optional[List[float]]] = mapped_column(Vector(), nullable=True)
     # Metadata for filtering and context (named memory_metadata to avoid SQLAlchemy reserved name)
     memory_metadata: Mapped[Optional[Dict[str, Any]]] = mapped_column(
         JSONB, nullable=True, default=dict
@@ -768,3 +775,22 @@ class ApiKeyModel(Base):
     )
     last_used_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     revoked_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
+class EmbeddingCacheModel(Base):
+    """Content-addressed embedding cache (float16 vectors)."""
+
+    __tablename__ = "embedding_cache"
+
+    # sha256(model + normalized text)
+    key: Mapped[bytes] = mapped_column(LargeBinary(32), primary_key=True)
+    model: Mapped[str] = mapped_column(String(255), nullable=False)
+    dims: Mapped[int] = mapped_column(Integer, nullable=False)
+    embedding: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)  # float16 little-endian
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    # Touched at most hourly on hits; eviction drops the least recently used
+    last_used_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False, index=True
+    )
@@ -16,6 +16,7 @@ from research_agent.infrastructure.vector_store.qdrant import (
     ensure_collection_exists,
     get_qdrant_client,
 )
+from research_agent.infrastructure.vector_store.retrieval_cache import bump_corpus_version
 from research_agent.shared.utils.logger import logger
 
 
@@ -32,7 +33,7 @@ class QdrantChunkRepository(ChunkRepository):
         self._settings = get_settings()
         self._qdrant_store = QdrantVectorStore()
 
-    async def _ensure_collection(self, vector_size: int = 1536) -> None:
+    async def _ensure_collection(self, vector_size: int | None = None) -> None:
         """Ensure Qdrant collection exists with proper indexes."""
         client = await get_qdrant_client()
         await ensure_collection_exists(
@@ -47,7 +48,7 @@ class QdrantChunkRepository(ChunkRepository):
             return chunks
 
         # Determine vector size from first chunk with embedding
-        vector_size = 1536
+        vector_size = None
         for chunk in chunks:
             if chunk.embedding:
                 vector_size = len(chunk.embedding)
@@ -76,10 +77,7 @@ class QdrantChunkRepository(ChunkRepository):
 
         if chunks_data:
             try:
-                await self._qdrant_store.upsert_resource_chunks_batch(
-                    chunks_data=chunks_data,
-                    batch_size=100,  # Optimal batch size for Qdrant
-                )
+                await self._qdrant_store.upsert_resource_chunks_batch(chunks_data=chunks_data)
             except Exception as e:
                 logger.error(f"[QdrantChunkRepo] Failed to upsert batch: {e}")
                 raise
@@ -90,6 +88,7 @@ class QdrantChunkRepository(ChunkRepository):
         models = [self._to_model(chunk, include_embedding=False) for chunk in chunks]
         self._session.add_all(models)
         await self._session.flush()
+        await bump_corpus_version(self._session, {chunk.project_id for chunk in chunks})
 
         logger.info(f"[QdrantChunkRepo] Saved {len(chunks)} metadata to PostgreSQL")
         return chunks
@@ -115,12 +114,16 @@ class QdrantChunkRepository(ChunkRepository):
 
         # Delete from PostgreSQL
         result = await self._session.execute(
-            delete(ResourceChunkModel).where(ResourceChunkModel.resource_id == resource_id)
+            delete(ResourceChunkModel)
+            .where(ResourceChunkModel.resource_id == resource_id)
+            .returning(ResourceChunkModel.project_id)
         )
+        project_ids = result.scalars().all()
         await self._session.flush()
+        await bump_corpus_version(self._session, project_ids)
 
-        logger.info(f"[QdrantChunkRepo] Deleted {result.rowcount} from PostgreSQL")
-        return result.rowcount
+        logger.info(f"[QdrantChunkRepo] Deleted {len(project_ids)} from PostgreSQL")
+        return len(project_ids)
 
     async def search(
         self,
@@ -151,12 +154,15 @@ class QdrantChunkRepository(ChunkRepository):
         resource_type: Optional[ResourceType] = None,
         resource_id: Optional[UUID] = None,
     ) -> List[ChunkSearchResult]:
-        """Hybrid search - falls back to vector-only for Qdrant."""
-        logger.info("[QdrantChunkRepo] Hybrid search falling back to vector-only")
-        return await self.search(
+        """Hybrid search using Qdrant dense + BM25 sparse vectors fused with RRF."""
+        return await self._qdrant_store.hybrid_search_resource_chunks(
             query_embedding=query_embedding,
+            query_text=query_text,
             project_id=project_id,
             limit=limit,
+            vector_weight=vector_weight,
+            keyword_weight=keyword_weight,
+            k=limit * 3,  # Same fetch depth as SQLAlchemyChunkRepository
             resource_type=resource_type,
             resource_id=resource_id,
         )
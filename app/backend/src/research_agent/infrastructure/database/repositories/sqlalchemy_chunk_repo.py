@@ -10,6 +10,8 @@ from research_agent.domain.entities.resource import ResourceType
 from research_agent.domain.entities.resource_chunk import ResourceChunk
 from research_agent.domain.repositories.chunk_repo import ChunkRepository, ChunkSearchResult
 from research_agent.infrastructure.database.models import ResourceChunkModel
+from research_agent.infrastructure.vector_store.mmap_index import invalidate_project_vectors
+from research_agent.infrastructure.vector_store.retrieval_cache import bump_corpus_version
 from research_agent.shared.utils.logger import logger
 
 
@@ -31,6 +33,7 @@ class SQLAlchemyChunkRepository(ChunkRepository):
         models = [self._to_model(chunk) for chunk in chunks]
         self._session.add_all(models)
         await self._session.flush()
+        await bump_corpus_version(self._session, {chunk.project_id for chunk in chunks})
 
         logger.info(f"[SQLAlchemyChunkRepo] Saved {len(chunks)} chunks to PostgreSQL")
         return chunks
@@ -48,12 +51,20 @@ class SQLAlchemyChunkRepository(ChunkRepository):
     async def delete_by_resource(self, resource_id: UUID) -> int:
         """Delete all chunks for a resource."""
         result = await self._session.execute(
-            delete(ResourceChunkModel).where(ResourceChunkModel.resource_id == resource_id)
+            delete(ResourceChunkModel)
+            .where(ResourceChunkModel.resource_id == resource_id)
+            .returning(ResourceChunkModel.project_id)
         )
+        project_ids = result.scalars().all()
         await self._session.flush()
+        await bump_corpus_version(self._session, project_ids)
+
+        # Drop in-process vector snapshots that still contain these chunks
+        for project_id in set(project_ids):
+            invalidate_project_vectors(project_id)
 
-        logger.info(f"[SQLAlchemyChunkRepo] Deleted {result.rowcount} chunks for resource {resource_id}")
-        return result.rowcount
+        logger.info(f"[SQLAlchemyChunkRepo] Deleted {len(project_ids)} chunks for resource {resource_id}")
+        return len(project_ids)
 
     async def search(
         self,
@@ -9,6 +9,7 @@ from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from research_agent.infrastructure.database.models import ChatMemoryModel, ChatSummaryModel
+from research_agent.infrastructure.database.vector_params import vector_param
 from research_agent.shared.utils.logger import logger
 
 
@@ -114,7 +115,7 @@ class SQLAlchemyMemoryRepository:
 
         params = {
             "project_id": str(project_id),
-            "query_embedding": str(query_embedding),
+            "query_embedding": vector_param(query_embedding),
             "limit": limit,
             "min_similarity": min_similarity,
         }
@@ -7,12 +7,14 @@ import sys
 import threading
 import weakref
 from contextlib import asynccontextmanager
+from uuid import uuid4
 
 from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
 
 from research_agent.config import get_settings
+from research_agent.infrastructure.database.vector_params import install_vector_codecs
 from research_agent.shared.utils.logger import logger
 
 
@@ -134,9 +136,18 @@ if (
     ssl_context.verify_mode = ssl.CERT_NONE
     connect_args["ssl"] = ssl_context
 
-# For connection poolers, disable prepared statements
-if is_using_pooler:
+# Prepared statements: SQLAlchemy's asyncpg adapter prepares each statement once
+# per connection and reuses it (keyed by SQL text), so hot vector queries skip
+# parse/plan. Behind a transaction-mode pooler consecutive transactions can land
+# on different server connections, which only works if the pooler tracks
+# prepared statements itself (PgBouncer >= 1.21 with max_prepared_statements).
+if is_using_pooler and not settings.db_pooler_prepared_statements:
     connect_args["statement_cache_size"] = 0
+    connect_args["prepared_statement_cache_size"] = 0
+    # Unique names so a server connection never sees a duplicate statement name
+    connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4().hex}__"
+else:
+    connect_args["prepared_statement_cache_size"] = settings.db_prepared_statement_cache_size
 
 # ✅ Key: Connection timeout configuration
 # Adjusted for cloud databases with potential network latency (e.g., Supabase from China)
@@ -155,7 +166,10 @@ logger.info(
 
 # Create async engine (use async_database_url to ensure asyncpg driver)
 logger.info(f"Creating async engine with URL: {_mask_password(settings.async_database_url)}")
-logger.info(f"Connect args: { {k: v for k, v in connect_args.items() if k != 'ssl'} }")
+logger.info(
+    "Connect args: "
+    f"{ {k: v for k, v in connect_args.items() if k not in ('ssl', 'prepared_statement_name_func')} }"
+)
 
 # For pooler connections, we need additional configuration
 engine_kwargs: dict = {
@@ -190,6 +204,9 @@ engine = create_async_engine(
     **engine_kwargs,
 )
 
+# Send and receive pgvector values in binary instead of text literals
+install_vector_codecs(engine)
+
 
 # ============================================================================
 # Connection Pool Monitoring
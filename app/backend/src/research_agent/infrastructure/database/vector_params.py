@@ -0,0 +1,94 @@
+"""Binary wire format for pgvector parameters and results.
+
+By default asyncpg has no codec for ``vector``: embeddings are sent as text
+literals (``"[0.0123,...]"``, ~20 KB for 1536 dims) that PostgreSQL parses
+back on every query, and returned vectors are parsed from text in Python.
+Registering a binary codec on each new connection sends 4 bytes per
+dimension and skips both text conversions.
+
+The codec is client-side only, so it works unchanged behind transaction-mode
+poolers (Supavisor/PgBouncer). Query embeddings should be bound with
+``vector_param``; the encoder still accepts text literals, which is what the
+``pgvector.sqlalchemy.Vector`` column type produces for ORM writes.
+
+If a connection could not register the codecs (pgvector not installed yet),
+``vector_param`` switches to text literals for the rest of the process:
+they work on connections with and without the codec.
+"""
+
+from typing import Any, Sequence
+
+import numpy as np
+from pgvector import HalfVector, Vector
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from research_agent.shared.utils.logger import logger
+
+# Set once any pooled connection is left without the binary codec
+_text_params = False
+
+
+def vector_param(embedding: Sequence[float] | np.ndarray) -> np.ndarray | str:
+    """Bind value for a ``cast(:param as vector)`` query parameter."""
+    vector = np.asarray(embedding, dtype=np.float32)
+    if _text_params:
+        return Vector(vector).to_text()
+    return vector
+
+
+def vector_result(value: Any) -> np.ndarray:
+    """Convert a selected ``vector`` column value (binary or text) to float32."""
+    if isinstance(value, Vector):
+        return value.to_numpy()
+    if isinstance(value, str):
+        return Vector.from_text(value).to_numpy()
+    return np.asarray(value, dtype=np.float32)
+
+
+def _encode_vector(value: Any) -> bytes:
+    if isinstance(value, str):
+        value = Vector.from_text(value)
+    elif not isinstance(value, Vector):
+        value = Vector(value)
+    return value.to_binary()
+
+
+def _encode_halfvec(value: Any) -> bytes:
+    if isinstance(value, str):
+        value = HalfVector.from_text(value)
+    elif not isinstance(value, HalfVector):
+        value = HalfVector(value)
+    return value.to_binary()
+
+
+async def register_vector_codecs(conn: Any) -> None:
+    """Register binary ``vector``/``halfvec`` codecs on an asyncpg connection."""
+    global _text_params
+    try:
+        await conn.set_type_codec(
+            "vector",
+            encoder=_encode_vector,
+            decoder=Vector.from_binary,
+            format="binary",
+        )
+        await conn.set_type_codec(
+            "halfvec",
+            encoder=_encode_halfvec,
+            decoder=HalfVector.from_binary,
+            format="binary",
+        )
+    except ValueError as e:
+        # Extension not created yet (fresh database before migrations)
+        if not str(e).startswith("unknown type"):
+            raise
+        logger.warning(f"[VectorCodec] pgvector types not found, using text format: {e}")
+        _text_params = True
+
+
+def install_vector_codecs(engine: AsyncEngine) -> None:
+    """Register the binary codecs on every new pooled connection."""
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_conn, connection_record):
+        dbapi_conn.run_async(register_vector_codecs)
@@ -0,0 +1,298 @@
+"""Move stored embeddings to EMBEDDING_DIMENSIONS.
+
+Two modes:
+
+- ``truncate``: keep the first N components of each stored vector and
+  re-normalize. No provider calls; only valid when the stored vectors come
+  from a Matryoshka model (text-embedding-3) and N is smaller.
+- ``reembed``: embed the chunk text again with the configured service
+  (which requests N dimensions). Needed for other models or to grow N.
+
+pgvector rows are rewritten in place in short batches, paged by primary key
+(``id > last id``) so each row is read once. The old-size HNSW
+indexes are dropped first (their ``embedding::vector(1536)`` expression
+rejects other sizes) and rebuilt at the new size afterwards, so vector
+search runs on exact scans while the backfill is in progress; run it in a
+maintenance window. Qdrant collections cannot change their vector size, so
+points are copied into a new collection that QDRANT_COLLECTION_NAME should
+be switched to once the copy is done.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+from uuid import UUID
+
+from sqlalchemy import text
+
+from research_agent.config import get_settings
+from research_agent.infrastructure.database.vector_params import vector_param
+from research_agent.infrastructure.embedding.base import EmbeddingService
+from research_agent.infrastructure.embedding.dimensions import (
+    get_embedding_dimensions,
+    truncate_embedding,
+)
+from research_agent.shared.utils.logger import logger
+
+BACKFILL_MODES = ("truncate", "reembed")
+
+# Tables with an ``embedding`` and a ``content`` column
+EMBEDDING_TABLES = ("resource_chunks", "chat_memories")
+
+
+@dataclass
+class BackfillReport:
+    """Rows rewritten per table and indexes touched."""
+
+    dimensions: int
+    mode: str
+    rows: Dict[str, int] = field(default_factory=dict)
+    dropped_indexes: List[str] = field(default_factory=list)
+    created_indexes: List[str] = field(default_factory=list)
+
+
+def _check_mode(mode: str) -> None:
+    if mode not in BACKFILL_MODES:
+        raise ValueError(f"Unknown backfill mode '{mode}', expected one of {BACKFILL_MODES}")
+
+
+async def _drop_stale_indexes(conn, dimensions: int) -> List[str]:
+    """Drop HNSW indexes built for another vector size."""
+    result = await conn.execute(
+        text("""
+            SELECT indexname FROM pg_indexes
+            WHERE tablename = ANY(:tables)
+              AND indexdef ILIKE '%USING hnsw%'
+              AND indexdef NOT LIKE :sized
+        """),
+        {"tables": list(EMBEDDING_TABLES), "sized": f"%({dimensions})%"},
+    )
+    dropped = [row.indexname for row in result]
+    for index_name in dropped:
+        logger.info(f"[EmbeddingBackfill] Dropping index {index_name}")
+        await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}"))
+    return dropped
+
+
+async def _truncate_table(conn, table: str, dimensions: int, batch_size: int) -> int:
+    total = 0
+    last_id = UUID(int=0)
+    while True:
+        result = await conn.execute(
+            text(f"""
+                UPDATE {table}
+                SET embedding = l2_normalize(subvector(embedding, 1, :dims))
+                WHERE id IN (
+                    SELECT id FROM {table}
+                    WHERE id > :last_id
+                      AND embedding IS NOT NULL AND vector_dims(embedding) > :dims
+                    ORDER BY id
+                    LIMIT :batch
+                )
+                RETURNING id
+            """),
+            {"dims": dimensions, "batch": batch_size, "last_id": last_id},
+        )
+        ids = result.scalars().all()
+        if not ids:
+            return total
+        last_id = max(ids)
+        total += len(ids)
+        logger.info(f"[EmbeddingBackfill] {table}: {total} rows truncated")
+
+
+async def _reembed_table(
+    conn, table: str, dimensions: int, batch_size: int, service: EmbeddingService
+) -> int:
+    total = 0
+    last_id = UUID(int=0)
+    while True:
+        result = await conn.execute(
+            text(f"""
+                SELECT id, content FROM {table}
+                WHERE id > :last_id
+                  AND embedding IS NOT NULL AND vector_dims(embedding) != :dims
+                ORDER BY id
+                LIMIT :batch
+            """),
+            {"dims": dimensions, "batch": batch_size, "last_id": last_id},
+        )
+        rows = result.all()
+        if not rows:
+            return total
+        last_id = rows[-1].id
+
+        embeddings = await service.embed_batch([row.content for row in rows])
+        for row, embedding in zip(rows, embeddings):
+            if len(embedding) != dimensions:
+                raise ValueError(
+                    f"Embedding service returned {len(embedding)} dimensions, expected {dimensions}"
+                )
+        await conn.execute(
+            text(f"UPDATE {table} SET embedding = cast(:embedding as vector) WHERE id = :id"),
+            [
+                {"id": row.id, "embedding": vector_param(embedding)}
+                for row, embedding in zip(rows, embeddings)
+            ],
+        )
+        total += len(rows)
+        logger.info(f"[EmbeddingBackfill] {table}: {total} rows re-embedded")
+
+
+async def backfill_pgvector(
+    mode: str,
+    service: EmbeddingService | None = None,
+    batch_size: int = 500,
+) -> BackfillReport:
+    """Rewrite resource_chunks/chat_memories embeddings at EMBEDDING_DIMENSIONS.
+
+    Args:
+        mode: "truncate" or "reembed"
+        service: Embedding service for "reembed"
+        batch_size: Rows per UPDATE (each batch commits on its own)
+    """
+    from research_agent.infrastructure.database.session import engine
+    from research_agent.infrastructure.vector_store.ann_index import (
+        INDEX_DIMS_SUFFIX,
+        sync_project_ann_indexes,
+    )
+    from research_agent.infrastructure.vector_store.mmap_index import (
+        invalidate_project_vectors,
+    )
+
+    _check_mode(mode)
+    if mode == "reembed" and service is None:
+        raise ValueError("reembed mode needs an embedding service")
+
+    dimensions = get_embedding_dimensions()
+    report = BackfillReport(dimensions=dimensions, mode=mode)
+
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        if mode == "truncate":
+            for table in EMBEDDING_TABLES:
+                result = await conn.execute(
+                    text(
+                        f"SELECT count(*) FROM {table} "
+                        "WHERE embedding IS NOT NULL AND vector_dims(embedding) < :dims"
+                    ),
+                    {"dims": dimensions},
+                )
+                if result.scalar():
+                    raise ValueError(
+                        f"{table} has embeddings smaller than {dimensions} dimensions; "
+                        "truncation cannot grow vectors, use reembed mode"
+                    )
+
+        report.dropped_indexes = await _drop_stale_indexes(conn, dimensions)
+
+        for table in EMBEDDING_TABLES:
+            if mode == "truncate":
+                report.rows[table] = await _truncate_table(conn, table, dimensions, batch_size)
+            else:
+                report.rows[table] = await _reembed_table(
+                    conn, table, dimensions, batch_size, service
+                )
+
+        memory_index = f"ix_chat_memories_embedding_hnsw{INDEX_DIMS_SUFFIX}"
+        await conn.execute(
+            text(f"""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS {memory_index}
+                ON chat_memories
+                USING hnsw ((embedding::vector({dimensions})) vector_cosine_ops)
+                WITH (m = 16, ef_construction = 64)
+            """)
+        )
+        report.created_indexes.append(memory_index)
+
+        # Cached retrievals and mmap snapshots hold the old vectors
+        projects = await conn.execute(text("SELECT id FROM projects"))
+        project_ids = [row.id for row in projects]
+        await conn.execute(text("UPDATE projects SET corpus_version = corpus_version + 1"))
+
+    for project_id in project_ids:
+        invalidate_project_vectors(project_id)
+
+    synced = await sync_project_ann_indexes()
+    report.created_indexes.extend(synced["created"])
+    report.dropped_indexes.extend(synced["dropped"])
+    logger.info(
+        f"[EmbeddingBackfill] pgvector done: dims={dimensions} mode={mode} rows={report.rows}"
+    )
+    return report
+
+
+async def backfill_qdrant(
+    mode: str,
+    target_collection: str,
+    service: EmbeddingService | None = None,
+    batch_size: int = 256,
+) -> BackfillReport:
+    """Copy the configured Qdrant collection into ``target_collection`` at N dims.
+
+    Payloads and BM25 sparse vectors are copied unchanged; dense vectors are
+    truncated or re-embedded from the ``content`` payload.
+    """
+    from qdrant_client.models import PointStruct
+
+    from research_agent.infrastructure.vector_store.qdrant import (
+        ensure_collection_exists,
+        get_qdrant_client,
+    )
+
+    _check_mode(mode)
+    if mode == "reembed" and service is None:
+        raise ValueError("reembed mode needs an embedding service")
+
+    source = get_settings().qdrant_collection_name
+    if source == target_collection:
+        raise ValueError("Target collection must differ from QDRANT_COLLECTION_NAME")
+
+    dimensions = get_embedding_dimensions()
+    client = await get_qdrant_client()
+    await ensure_collection_exists(client, target_collection, vector_size=dimensions)
+
+    copied = 0
+    offset: Any = None
+    while True:
+        records, offset = await client.scroll(
+            collection_name=source,
+            limit=batch_size,
+            offset=offset,
+            with_payload=True,
+            with_vectors=True,
+        )
+        if not records:
+            break
+
+        if mode == "reembed":
+            dense = await service.embed_batch(
+                [(record.payload or {}).get("content", "") for record in records]
+            )
+        else:
+            dense = [
+                truncate_embedding(
+                    record.vector.get("") if isinstance(record.vector, dict) else record.vector,
+                    dimensions,
+                )
+                for record in records
+            ]
+
+        points = []
+        for record, embedding in zip(records, dense):
+            vector: Any = embedding
+            if isinstance(record.vector, dict):
+                # Keep named (sparse) vectors, replace the unnamed dense one
+                vector = {**record.vector, "": embedding}
+            points.append(PointStruct(id=record.id, vector=vector, payload=record.payload))
+        await client.upsert(collection_name=target_collection, points=points, wait=True)
+
+        copied += len(points)
+        logger.info(f"[EmbeddingBackfill] Qdrant: {copied} points copied to {target_collection}")
+        if offset is None:
+            break
+
+    logger.info(
+        f"[EmbeddingBackfill] Qdrant done: {source} -> {target_collection} "
+        f"({copied} points, dims={dimensions}); set QDRANT_COLLECTION_NAME={target_collection}"
+    )
+    return BackfillReport(dimensions=dimensions, mode=mode, rows={target_collection: copied})
@@ -1,7 +1,7 @@
 """Embedding service abstract interface."""
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import AsyncIterator, List, Tuple
 
 
 class EmbeddingService(ABC):
@@ -17,3 +17,16 @@ class EmbeddingService(ABC):
         """Get embeddings for multiple texts."""
         pass
 
+    async def embed_batch_stream(
+        self, texts: List[str]
+    ) -> AsyncIterator[Tuple[int, int, List[List[float]]]]:
+        """Yield ``(start, end, embeddings)`` for consecutive slices as they complete.
+
+        Lets callers persist results incrementally instead of holding every
+        embedding of a large input; see ``batching.stream_in_windows``.
+        """
+        # batching -> domain.services -> base would be circular at module level
+        from research_agent.infrastructure.embedding.batching import stream_in_windows
+
+        async for window in stream_in_windows(texts, self.embed_batch):
+            yield window
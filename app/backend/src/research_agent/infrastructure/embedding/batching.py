@@ -0,0 +1,215 @@
+"""Token-aware batch planning for embedding requests.
+
+Providers limit each request by item count *and* total tokens, and each
+input by its own token limit. Fixed-size batches either overflow the token
+limit (long chunks) or waste round trips (short transcript chunks), so
+``plan_batches`` packs consecutive texts greedily by estimated tokens.
+
+Inputs longer than the per-input limit are split deterministically into
+pieces (at whitespace where possible); the piece embeddings are combined
+into one vector by a token-weighted mean, re-normalized to unit length.
+Output order always matches input order.
+
+``stream_in_windows`` is the incremental variant used by ingest: it embeds
+consecutive windows of texts with a bounded number in flight and yields each
+window's embeddings, in order, as soon as it is ready.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Awaitable, Callable, List, Tuple
+
+import numpy as np
+
+from research_agent.config import get_settings
+from research_agent.domain.services.token_estimator import TokenEstimator
+from research_agent.shared.utils.logger import logger
+
+TokenCounter = Callable[[str], int]
+
+
+@dataclass
+class BatchPlan:
+    """Provider inputs grouped into requests."""
+
+    inputs: List[str] = field(default_factory=list)
+    # Index of the original text each input belongs to
+    owners: List[int] = field(default_factory=list)
+    tokens: List[int] = field(default_factory=list)
+    # Contiguous [start, end) slices of ``inputs``, one per request
+    batches: List[tuple[int, int]] = field(default_factory=list)
+
+
+def split_text(text: str, max_tokens: int, count_tokens: TokenCounter) -> List[str]:
+    """Split text into consecutive pieces of at most ``max_tokens`` (estimated)."""
+    pieces = []
+    rest = text
+    while (tokens := count_tokens(rest)) > max_tokens:
+        chars_per_token = len(rest) / tokens
+        cut = max(1, int(max_tokens * chars_per_token))
+        # Token density varies along the text; shrink until the piece fits
+        while cut > 1 and count_tokens(rest[:cut]) > max_tokens:
+            cut = int(cut * 0.9)
+        # Prefer a whitespace boundary in the second half of the window
+        boundary = rest.rfind(" ", cut // 2, cut)
+        if boundary == -1:
+            boundary = rest.rfind("\n", cut // 2, cut)
+        if boundary > 0:
+            cut = boundary
+        pieces.append(rest[:cut])
+        rest = rest[cut:]
+    pieces.append(rest)
+    return pieces
+
+
+def plan_batches(
+    texts: List[str],
+    max_items: int,
+    max_tokens: int,
+    max_input_tokens: int,
+    count_tokens: TokenCounter = TokenEstimator.estimate_tokens,
+) -> BatchPlan:
+    """Pack texts (in order) into requests bounded by items and tokens."""
+    plan = BatchPlan()
+    for owner, text in enumerate(texts):
+        tokens = count_tokens(text)
+        pieces = (
+            split_text(text, max_input_tokens, count_tokens)
+            if tokens > max_input_tokens
+            else [text]
+        )
+        for piece in pieces:
+            plan.inputs.append(piece)
+            plan.owners.append(owner)
+            plan.tokens.append(max(1, tokens if len(pieces) == 1 else count_tokens(piece)))
+
+    start = 0
+    batch_tokens = 0
+    for i, tokens in enumerate(plan.tokens):
+        if i > start and (i - start >= max_items or batch_tokens + tokens > max_tokens):
+            plan.batches.append((start, i))
+            start, batch_tokens = i, 0
+        batch_tokens += tokens
+    if plan.inputs:
+        plan.batches.append((start, len(plan.inputs)))
+    return plan
+
+
+def merge_embeddings(plan: BatchPlan, embeddings: List[List[float]], count: int) -> List[List[float]]:
+    """One embedding per original text; split texts are averaged by tokens."""
+    merged: List[List[float] | None] = [None] * count
+    pieces: dict[int, list[int]] = {}
+    for i, owner in enumerate(plan.owners):
+        pieces.setdefault(owner, []).append(i)
+
+    for owner, indexes in pieces.items():
+        if len(indexes) == 1:
+            merged[owner] = embeddings[indexes[0]]
+            continue
+        vectors = np.asarray([embeddings[i] for i in indexes], dtype=np.float32)
+        weights = np.asarray([plan.tokens[i] for i in indexes], dtype=np.float32)
+        mean = weights @ vectors / weights.sum()
+        norm = np.linalg.norm(mean)
+        merged[owner] = (mean / norm if norm else mean).tolist()
+    return merged
+
+
+async def embed_in_batches(
+    texts: List[str],
+    request: Callable[[List[str]], Awaitable[List[List[float]]]],
+    max_items: int | None = None,
+    max_tokens: int | None = None,
+    max_input_tokens: int | None = None,
+    max_concurrency: int | None = None,
+) -> List[List[float]]:
+    """Embed texts with token-packed requests issued concurrently (bounded).
+
+    Args:
+        texts: Texts to embed
+        request: Sends one batch to the provider, returns its embeddings in order
+        max_items: Items per request (default: EMBEDDING_BATCH_MAX_ITEMS)
+        max_tokens: Estimated tokens per request (default: EMBEDDING_BATCH_MAX_TOKENS)
+        max_input_tokens: Tokens per input before splitting
+            (default: EMBEDDING_INPUT_MAX_TOKENS)
+        max_concurrency: Requests in flight at once
+            (default: EMBEDDING_CONCURRENCY_MAX); providers may limit further
+
+    Returns:
+        One embedding per text, in input order
+    """
+    if not texts:
+        return []
+
+    settings = get_settings()
+    plan = plan_batches(
+        texts,
+        max_items=max_items or settings.embedding_batch_max_items,
+        max_tokens=max_tokens or settings.embedding_batch_max_tokens,
+        max_input_tokens=max_input_tokens or settings.embedding_input_max_tokens,
+    )
+    split = len(plan.inputs) - len(texts)
+    logger.info(
+        f"[EmbeddingBatching] {len(texts)} texts -> {len(plan.batches)} requests "
+        f"(~{sum(plan.tokens)} tokens, {split} extra pieces from oversize inputs)"
+    )
+
+    semaphore = asyncio.Semaphore(max_concurrency or settings.embedding_concurrency_max)
+
+    async def run(start: int, end: int) -> List[List[float]]:
+        async with semaphore:
+            result = await request(plan.inputs[start:end])
+        if len(result) != end - start:
+            raise ValueError(f"Expected {end - start} embeddings, got {len(result)}")
+        return result
+
+    results = await asyncio.gather(*[run(start, end) for start, end in plan.batches])
+    embeddings = [embedding for batch in results for embedding in batch]
+    return merge_embeddings(plan, embeddings, len(texts))
+
+
+EmbeddedWindow = Tuple[int, int, List[List[float]]]
+
+
+async def stream_in_windows(
+    texts: List[str],
+    embed: Callable[[List[str]], Awaitable[List[List[float]]]],
+    window: int | None = None,
+    max_in_flight: int | None = None,
+) -> AsyncIterator[EmbeddedWindow]:
+    """Embed texts window by window, yielding ``(start, end, embeddings)`` in order.
+
+    Up to ``max_in_flight`` windows are embedded concurrently; a window is
+    yielded once it and every earlier window are done, so callers can write
+    results incrementally while at most ``window * max_in_flight`` embeddings
+    are held. Closing the iterator early cancels windows still in flight.
+
+    Args:
+        texts: Texts to embed
+        embed: Embeds one window (e.g. a service's ``embed_batch``)
+        window: Texts per window (default: EMBEDDING_STREAM_WINDOW)
+        max_in_flight: Concurrent windows (default: EMBEDDING_STREAM_MAX_IN_FLIGHT)
+    """
+    settings = get_settings()
+    window = window or settings.embedding_stream_window
+    max_in_flight = max_in_flight or settings.embedding_stream_max_in_flight
+
+    async def run(start: int, end: int) -> List[List[float]]:
+        result = await embed(texts[start:end])
+        if len(result) != end - start:
+            raise ValueError(f"Expected {end - start} embeddings, got {len(result)}")
+        return result
+
+    ranges = [(start, min(start + window, len(texts))) for start in range(0, len(texts), window)]
+    pending: List[Tuple[int, int, asyncio.Task]] = []
+    next_range = 0
+    try:
+        while pending or next_range < len(ranges):
+            while next_range < len(ranges) and len(pending) < max_in_flight:
+                start, end = ranges[next_range]
+                pending.append((start, end, asyncio.ensure_future(run(start, end))))
+                next_range += 1
+            start, end, task = pending.pop(0)
+            yield start, end, await task
+    finally:
+        for _, _, task in pending:
+            task.cancel()
@@ -0,0 +1,223 @@
+"""Persistent content-addressed embedding cache.
+
+``CachedEmbeddingService`` wraps any EmbeddingService. Each text is keyed by
+sha256(model + normalized text); a whole batch is looked up in one query and
+only the misses (deduplicated) are sent to the provider. Vectors are stored
+as float16 blobs in the ``embedding_cache`` table, so re-processing a
+document, uploading the same PDF to another project or re-extracting a URL
+reuses earlier embeddings across API and worker processes.
+
+Single-text ``embed()`` calls (chat queries) bypass the table: they sit on
+the time-to-first-token path, where a lookup, a recency update and an insert
+on a miss cost more than they save. Repeated queries within a request are
+covered by request_scope instead.
+
+The table is bounded by EMBEDDING_CACHE_MAX_ENTRIES: hits refresh
+``last_used_at`` (at most hourly) and every few thousand inserts the least
+recently used rows beyond the limit are deleted. Cache failures never fail
+embedding; they degrade to calling the provider.
+"""
+
+import hashlib
+import re
+import unicodedata
+from typing import Any, Dict, List
+
+import numpy as np
+from sqlalchemy import text
+
+from research_agent.config import get_settings
+from research_agent.infrastructure.embedding.base import EmbeddingService
+from research_agent.shared.utils.logger import logger
+
+# Inserts (per process) between eviction passes
+EVICT_EVERY_INSERTS = 2000
+
+_WHITESPACE = re.compile(r"\s+")
+
+# Per-process counters (see get_embedding_cache_stats)
+_stats = {"hits": 0, "misses": 0, "errors": 0, "evicted": 0}
+_inserted_since_evict = 0
+
+
+def normalize_text(value: str) -> str:
+    """Canonical form used for cache keys (NFC, collapsed whitespace)."""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", value)).strip()
+
+
+def cache_key(model: str, value: str) -> bytes:
+    """Content address of an embedding."""
+    return hashlib.sha256(f"{model}\n{normalize_text(value)}".encode()).digest()
+
+
+def get_embedding_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters for this process."""
+    lookups = _stats["hits"] + _stats["misses"]
+    return {
+        **_stats,
+        "lookups": lookups,
+        "hit_rate": round(_stats["hits"] / lookups, 4) if lookups else 0.0,
+    }
+
+
+class EmbeddingCacheStore:
+    """PostgreSQL storage for cached embeddings (short-lived sessions)."""
+
+    def __init__(self, max_entries: int | None = None):
+        self._max_entries = max_entries or get_settings().embedding_cache_max_entries
+
+    async def get_many(self, keys: List[bytes]) -> Dict[bytes, List[float]]:
+        """Load cached vectors for keys; refresh recency of stale hits."""
+        from research_agent.infrastructure.database.session import async_session_maker
+
+        async with async_session_maker() as session:
+            result = await session.execute(
+                text("""
+                    WITH hits AS (
+                        SELECT key, embedding, last_used_at
+                        FROM embedding_cache
+                        WHERE key = ANY(cast(:keys as bytea[]))
+                    ), touched AS (
+                        UPDATE embedding_cache e
+                        SET last_used_at = now()
+                        FROM hits h
+                        WHERE e.key = h.key AND h.last_used_at < now() - interval '1 hour'
+                    )
+                    SELECT key, embedding FROM hits
+                """),
+                {"keys": keys},
+            )
+            rows = result.fetchall()
+            await session.commit()
+
+        return {
+            bytes(row.key): np.frombuffer(row.embedding, dtype="<f2").astype(np.float32).tolist()
+            for row in rows
+        }
+
+    async def put_many(self, model: str, vectors: Dict[bytes, List[float]]) -> None:
+        """Insert new vectors (existing keys are left as they are)."""
+        global _inserted_since_evict
+        from research_agent.infrastructure.database.session import async_session_maker
+
+        rows = [
+            {
+                "key": key,
+                "model": model,
+                "dims": len(vector),
+                "embedding": np.asarray(vector, dtype="<f2").tobytes(),
+            }
+            for key, vector in vectors.items()
+        ]
+        async with async_session_maker() as session:
+            await session.execute(
+                text("""
+                    INSERT INTO embedding_cache (key, model, dims, embedding)
+                    VALUES (:key, :model, :dims, :embedding)
+                    ON CONFLICT (key) DO NOTHING
+                """),
+                rows,
+            )
+            _inserted_since_evict += len(rows)
+            if _inserted_since_evict >= EVICT_EVERY_INSERTS:
+                _inserted_since_evict = 0
+                await self._evict(session)
+            await session.commit()
+
+    async def _evict(self, session) -> None:
+        """Delete least recently used rows beyond the size limit."""
+        result = await session.execute(
+            text("""
+                DELETE FROM embedding_cache
+                WHERE last_used_at < (
+                    SELECT last_used_at FROM embedding_cache
+                    ORDER BY last_used_at DESC
+                    OFFSET :max_entries LIMIT 1
+                )
+            """),
+            {"max_entries": self._max_entries},
+        )
+        if result.rowcount:
+            _stats["evicted"] += result.rowcount
+            logger.info(f"[EmbeddingCache] Evicted {result.rowcount} least recently used entries")
+
+
+class CachedEmbeddingService(EmbeddingService):
+    """EmbeddingService decorator that only sends cache misses to the provider."""
+
+    def __init__(
+        self,
+        inner: EmbeddingService,
+        model: str,
+        store: EmbeddingCacheStore | None = None,
+    ):
+        """Initialize cached embedding service.
+
+        Args:
+            inner: Service that computes embeddings on a miss
+            model: Model identifier (part of the cache key)
+            store: Cache storage (defaults to the embedding_cache table)
+        """
+        self._inner = inner
+        self._model = model
+        self._store = store or EmbeddingCacheStore()
+
+    async def embed(self, text: str) -> List[float]:
+        """Get embedding for a single text (not cached, see module docstring)."""
+        return await self._inner.embed(text)
+
+    async def embed_batch(self, texts: List[str], **kwargs: Any) -> List[List[float]]:
+        """Get embeddings for multiple texts; only misses reach the provider."""
+        if not texts:
+            return []
+        return await self._embed_cached(
+            texts, lambda misses: self._inner.embed_batch(misses, **kwargs)
+        )
+
+    async def _embed_cached(self, texts: List[str], compute) -> List[List[float]]:
+        keys = [cache_key(self._model, value) for value in texts]
+        unique_keys = list(dict.fromkeys(keys))
+
+        try:
+            cached = await self._store.get_many(unique_keys)
+        except Exception as e:
+            _stats["errors"] += 1
+            logger.warning(f"[EmbeddingCache] Lookup failed, embedding without cache: {e}")
+            cached = {}
+
+        # One provider input per distinct missing key
+        missing: Dict[bytes, str] = {}
+        for key, value in zip(keys, texts):
+            if key not in cached and key not in missing:
+                missing[key] = value
+
+        _stats["hits"] += len(unique_keys) - len(missing)
+        _stats["misses"] += len(missing)
+
+        if missing:
+            computed = await compute(list(missing.values()))
+            fresh = dict(zip(missing.keys(), computed))
+            try:
+                await self._store.put_many(self._model, fresh)
+            except Exception as e:
+                _stats["errors"] += 1
+                logger.warning(f"[EmbeddingCache] Store failed: {e}")
+            cached = {**cached, **fresh}
+
+        logger.debug(
+            f"[EmbeddingCache] texts={len(texts)} unique={len(unique_keys)} "
+            f"misses={len(missing)}"
+        )
+        return [cached[key] for key in keys]
+
+
+def with_embedding_cache(service: EmbeddingService, model: str) -> EmbeddingService:
+    """Wrap a service with the persistent cache when EMBEDDING_CACHE_ENABLED."""
+    settings = get_settings()
+    if not settings.embedding_cache_enabled:
+        return service
+    # Reduced-dimension vectors get their own key space; full-size entries
+    # written before EMBEDDING_DIMENSIONS existed keep their plain model key
+    if settings.embedding_dimensions != 1536:
+        model = f"{model}@{settings.embedding_dimensions}"
+    return CachedEmbeddingService(service, model)
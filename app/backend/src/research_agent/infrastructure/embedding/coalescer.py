@@ -0,0 +1,182 @@
+"""Cross-request micro-batching for single-text embed() calls.
+
+Under concurrent chat load every request embeds one question, so the
+provider sees many 1-item requests. ``CoalescingEmbeddingService`` parks
+each ``embed()`` call in a per-model queue; the queue is flushed as one
+``embed_batch`` when it reaches EMBEDDING_COALESCE_MAX_ITEMS or
+EMBEDDING_COALESCE_WINDOW_MS after its first item, whichever comes first,
+so no caller waits longer than the window plus one provider round trip.
+Each caller receives its own vector; identical texts in a batch are sent
+once.
+
+Queues are per process, event loop and model. Batch sizes and queue waits
+are recorded for ``get_coalescer_stats``.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from research_agent.config import get_settings
+from research_agent.infrastructure.embedding.base import EmbeddingService
+from research_agent.shared.utils.logger import logger
+
+# Upper bounds of the batch-size histogram buckets
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64)
+
+_queues: Dict[Tuple[str, asyncio.AbstractEventLoop], "_ModelQueue"] = {}
+_stats: Dict[str, Dict[str, Any]] = {}
+
+
+def _model_stats(model: str) -> Dict[str, Any]:
+    stats = _stats.get(model)
+    if stats is None:
+        stats = {
+            "batches": 0,
+            "items": 0,
+            "max_wait_ms": 0.0,
+            "total_wait_ms": 0.0,
+            "batch_sizes": {f"le_{b}": 0 for b in BATCH_SIZE_BUCKETS} | {"gt_64": 0},
+        }
+        _stats[model] = stats
+    return stats
+
+
+def get_coalescer_stats() -> Dict[str, Dict[str, Any]]:
+    """Per-model batch-size distribution and queue wait for this process."""
+    return {
+        model: {
+            "batches": stats["batches"],
+            "items": stats["items"],
+            "mean_batch_size": round(stats["items"] / stats["batches"], 2)
+            if stats["batches"]
+            else 0.0,
+            "mean_wait_ms": round(stats["total_wait_ms"] / stats["items"], 2)
+            if stats["items"]
+            else 0.0,
+            "max_wait_ms": round(stats["max_wait_ms"], 2),
+            "batch_sizes": dict(stats["batch_sizes"]),
+        }
+        for model, stats in _stats.items()
+    }
+
+
+def reset_coalescer() -> None:
+    """Drop queues and counters (tests)."""
+    _queues.clear()
+    _stats.clear()
+
+
+class _ModelQueue:
+    """Pending embed() calls for one model."""
+
+    def __init__(self, model: str, window_ms: float, max_items: int):
+        self._model = model
+        self._window = window_ms / 1000
+        self._max_items = max_items
+        self._pending: List[Tuple[str, asyncio.Future, float]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._service: Optional[EmbeddingService] = None
+        self._flushes: set[asyncio.Task] = set()
+
+    def submit(self, service: EmbeddingService, text: str) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future, time.perf_counter()))
+        self._service = service
+
+        if len(self._pending) >= self._max_items:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window, self._flush)
+        return future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._run(self._service, batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _run(
+        self, service: EmbeddingService, batch: List[Tuple[str, asyncio.Future, float]]
+    ) -> None:
+        flushed = time.perf_counter()
+        self._record(batch, flushed)
+
+        texts = list(dict.fromkeys(text for text, _, _ in batch))
+        try:
+            embeddings = await service.embed_batch(texts)
+            if len(embeddings) != len(texts):
+                raise ValueError(f"Expected {len(texts)} embeddings, got {len(embeddings)}")
+        except Exception as e:
+            logger.warning(f"[EmbeddingCoalescer] Batch of {len(texts)} failed: {e}")
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        by_text = dict(zip(texts, embeddings))
+        for text, future, _ in batch:
+            if not future.done():
+                future.set_result(by_text[text])
+
+    def _record(self, batch: List[Tuple[str, asyncio.Future, float]], flushed: float) -> None:
+        stats = _model_stats(self._model)
+        size = len(batch)
+        stats["batches"] += 1
+        stats["items"] += size
+        bucket = next((f"le_{b}" for b in BATCH_SIZE_BUCKETS if size <= b), "gt_64")
+        stats["batch_sizes"][bucket] += 1
+        for _, _, enqueued in batch:
+            wait_ms = (flushed - enqueued) * 1000
+            stats["total_wait_ms"] += wait_ms
+            stats["max_wait_ms"] = max(stats["max_wait_ms"], wait_ms)
+
+
+def _get_queue(model: str) -> _ModelQueue:
+    key = (model, asyncio.get_running_loop())
+    queue = _queues.get(key)
+    if queue is None:
+        settings = get_settings()
+        queue = _ModelQueue(
+            model,
+            window_ms=settings.embedding_coalesce_window_ms,
+            max_items=settings.embedding_coalesce_max_items,
+        )
+        _queues[key] = queue
+    return queue
+
+
+class CoalescingEmbeddingService(EmbeddingService):
+    """EmbeddingService decorator that merges concurrent embed() calls."""
+
+    def __init__(self, inner: EmbeddingService, model: str):
+        """Initialize coalescing embedding service.
+
+        Args:
+            inner: Service whose embed_batch sends merged requests
+            model: Model identifier (queues are per model)
+        """
+        self._inner = inner
+        self._model = model
+
+    async def embed(self, text: str) -> List[float]:
+        """Get embedding for a single text via the shared per-model queue."""
+        future = _get_queue(self._model).submit(self._inner, text)
+        return await future
+
+    async def embed_batch(self, texts: List[str], **kwargs: Any) -> List[List[float]]:
+        """Multi-text calls bypass the queue."""
+        return await self._inner.embed_batch(texts, **kwargs)
+
+
+def with_embed_coalescing(service: EmbeddingService, model: str) -> EmbeddingService:
+    """Wrap a service with the coalescer when EMBEDDING_COALESCE_ENABLED."""
+    if not get_settings().embedding_coalesce_enabled:
+        return service
+    return CoalescingEmbeddingService(service, model)
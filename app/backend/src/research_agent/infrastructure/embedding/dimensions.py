@@ -0,0 +1,39 @@
+"""Embedding dimension handling (Matryoshka truncation).
+
+text-embedding-3 models are trained so that a prefix of the vector is itself
+a usable embedding: the API's ``dimensions`` parameter returns the first N
+components re-normalized to unit length. EMBEDDING_DIMENSIONS sets N for the
+whole deployment: embedding services request it, the vector columns and
+HNSW index expressions are sized by it, and stored full-size vectors can be
+shrunk with ``truncate_embedding`` instead of being re-embedded.
+"""
+
+from typing import List, Sequence
+
+import numpy as np
+
+from research_agent.config import get_settings
+
+# Models whose API accepts the ``dimensions`` parameter
+DIMENSIONS_PARAM_MODELS = ("text-embedding-3-small", "text-embedding-3-large")
+
+
+def get_embedding_dimensions() -> int:
+    """Configured embedding dimension for this deployment."""
+    return get_settings().embedding_dimensions
+
+
+def supports_dimensions_param(model: str) -> bool:
+    """Whether the provider can shorten embeddings of ``model`` server-side."""
+    return model.split("/")[-1] in DIMENSIONS_PARAM_MODELS
+
+
+def truncate_embedding(vector: Sequence[float], dimensions: int) -> List[float]:
+    """First ``dimensions`` components, re-normalized (Matryoshka truncation)."""
+    if len(vector) < dimensions:
+        raise ValueError(
+            f"Cannot truncate a {len(vector)}-dim embedding to {dimensions} dimensions"
+        )
+    head = np.asarray(vector[:dimensions], dtype=np.float32)
+    norm = np.linalg.norm(head)
+    return (head / norm if norm else head).tolist()
@@ -0,0 +1,61 @@
+"""Factory for the configured embedding service (API and worker)."""
+
+from research_agent.config import get_settings
+from research_agent.infrastructure.embedding.base import EmbeddingService
+from research_agent.infrastructure.embedding.cache import with_embedding_cache
+from research_agent.infrastructure.embedding.coalescer import with_embed_coalescing
+from research_agent.shared.utils.logger import logger
+
+
+def create_embedding_service(coalesce: bool = False) -> EmbeddingService:
+    """
+    Create the embedding service selected by configuration.
+
+    EMBEDDING_BACKEND=local runs an ONNX model on the local CPU. Otherwise
+    OpenRouter is used when OPENROUTER_API_KEY is set (one API key for LLM
+    and embeddings), falling back to OpenAI with OPENAI_API_KEY.
+    The service is wrapped with the persistent embedding cache.
+
+    Args:
+        coalesce: Also merge concurrent single-text embeds into batches
+            (query path; see coalescer)
+
+    Returns:
+        EmbeddingService instance
+
+    Raises:
+        ValueError: If no embedding API key is configured
+    """
+    settings = get_settings()
+
+    if settings.embedding_backend == "local":
+        from research_agent.infrastructure.embedding.local_onnx import (
+            LocalOnnxEmbeddingService,
+            local_embedding_model_id,
+        )
+
+        model_id = local_embedding_model_id()
+        logger.info(f"Using local ONNX Embedding Service (model: {model_id})")
+        service: EmbeddingService = LocalOnnxEmbeddingService()
+    elif settings.openrouter_api_key and settings.openrouter_api_key.strip():
+        from research_agent.infrastructure.embedding.openrouter import (
+            OpenRouterEmbeddingService,
+        )
+
+        model_id = settings.embedding_model
+        logger.info(f"Using OpenRouter Embedding Service (model: {model_id})")
+        service = OpenRouterEmbeddingService(api_key=settings.openrouter_api_key, model=model_id)
+    elif settings.openai_api_key and settings.openai_api_key.strip():
+        from research_agent.infrastructure.embedding.openrouter import OpenAIEmbeddingService
+
+        # Model name without provider prefix ("openai/...")
+        model_id = settings.embedding_model.split("/", 1)[-1]
+        logger.info(f"Using OpenAI Embedding Service (model: {model_id})")
+        service = OpenAIEmbeddingService(api_key=settings.openai_api_key, model=model_id)
+    else:
+        logger.error("❌ No API key set! Please set OPENROUTER_API_KEY or OPENAI_API_KEY")
+        raise ValueError("No embedding API key configured")
+
+    if coalesce:
+        service = with_embed_coalescing(service, model_id)
+    return with_embedding_cache(service, model_id)
@@ -0,0 +1,204 @@
+"""Local CPU embedding service (ONNX Runtime).
+
+Runs an ONNX-exported sentence-embedding model (e.g. a quantized
+bge-small / all-MiniLM export) in-process instead of calling a remote API.
+The model directory must contain ``model.onnx`` and a Hugging Face
+``tokenizer.json``.
+
+Inference is CPU-bound and releases the GIL inside ONNX Runtime, so batches
+are split into sub-batches of LOCAL_EMBEDDING_BATCH_SIZE and run on a
+shared thread pool of LOCAL_EMBEDDING_WORKERS threads; the event loop is
+never blocked. Token embeddings are mean-pooled (or CLS) over the attention
+mask and L2-normalized. Outputs wider than EMBEDDING_DIMENSIONS are
+truncated and re-normalized, which only preserves quality for
+Matryoshka-trained models.
+
+Requires the optional extra: pip install 'research-agent-rag[local-embedding]'
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from research_agent.config import get_settings
+from research_agent.infrastructure.embedding.base import EmbeddingService
+from research_agent.shared.utils.logger import logger
+
+POOLING_MODES = ("mean", "cls")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_models: Dict[str, "_OnnxModel"] = {}
+_models_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=get_settings().local_embedding_workers,
+            thread_name_prefix="local-embedding",
+        )
+    return _executor
+
+
+def pool_embeddings(hidden: np.ndarray, attention_mask: np.ndarray, pooling: str) -> np.ndarray:
+    """Pool token embeddings [batch, tokens, dims] into unit vectors [batch, dims]."""
+    if pooling == "cls":
+        pooled = hidden[:, 0]
+    elif pooling == "mean":
+        mask = attention_mask[..., None].astype(np.float32)
+        pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+    else:
+        raise ValueError(f"Unknown pooling mode '{pooling}', expected one of {POOLING_MODES}")
+    norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+    return (pooled / np.clip(norms, 1e-12, None)).astype(np.float32)
+
+
+class _OnnxModel:
+    """Loaded ONNX session and tokenizer (shared by all service instances)."""
+
+    def __init__(self, model_dir: Path, max_length: int, threads: int):
+        try:
+            import onnxruntime as ort
+            from tokenizers import Tokenizer
+        except ImportError as e:
+            raise ImportError(
+                "Local embeddings require onnxruntime and tokenizers. "
+                "Install with: pip install 'research-agent-rag[local-embedding]'"
+            ) from e
+
+        model_path = model_dir / "model.onnx"
+        tokenizer_path = model_dir / "tokenizer.json"
+        for path in (model_path, tokenizer_path):
+            if not path.exists():
+                raise FileNotFoundError(f"Local embedding model file not found: {path}")
+
+        options = ort.SessionOptions()
+        if threads:
+            options.intra_op_num_threads = threads
+        self.session = ort.InferenceSession(
+            str(model_path), sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {i.name for i in self.session.get_inputs()}
+
+        self.tokenizer = Tokenizer.from_file(str(tokenizer_path))
+        self.tokenizer.enable_truncation(max_length=max_length)
+        self.tokenizer.enable_padding()
+        logger.info(f"[LocalEmbedding] Loaded {model_path} (inputs={sorted(self.input_names)})")
+
+    def encode(self, texts: List[str], pooling: str) -> np.ndarray:
+        encodings = self.tokenizer.encode_batch(texts)
+        input_ids = np.asarray([e.ids for e in encodings], dtype=np.int64)
+        attention_mask = np.asarray([e.attention_mask for e in encodings], dtype=np.int64)
+
+        feeds: Dict[str, Any] = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self.input_names:
+            feeds["token_type_ids"] = np.zeros_like(input_ids)
+        feeds = {name: value for name, value in feeds.items() if name in self.input_names}
+
+        hidden = self.session.run(None, feeds)[0]
+        if hidden.ndim == 2:
+            # Model already returns pooled sentence embeddings
+            norms = np.linalg.norm(hidden, axis=1, keepdims=True)
+            return (hidden / np.clip(norms, 1e-12, None)).astype(np.float32)
+        return pool_embeddings(hidden, attention_mask, pooling)
+
+
+def _load_model(model_dir: Path, max_length: int, threads: int) -> _OnnxModel:
+    key = f"{model_dir.resolve()}:{max_length}"
+    with _models_lock:
+        model = _models.get(key)
+        if model is None:
+            model = _OnnxModel(model_dir, max_length, threads)
+            _models[key] = model
+    return model
+
+
+class LocalOnnxEmbeddingService(EmbeddingService):
+    """Embedding service running an ONNX model on the local CPU."""
+
+    def __init__(
+        self,
+        model_path: str | None = None,
+        pooling: str | None = None,
+        max_length: int | None = None,
+        batch_size: int | None = None,
+        dimensions: int | None = None,
+    ):
+        """Initialize local embedding service.
+
+        Args:
+            model_path: Directory with model.onnx and tokenizer.json
+                (default: LOCAL_EMBEDDING_MODEL_PATH)
+            pooling: "mean" or "cls" (default: LOCAL_EMBEDDING_POOLING)
+            max_length: Token truncation length (default: LOCAL_EMBEDDING_MAX_LENGTH)
+            batch_size: Texts per inference call (default: LOCAL_EMBEDDING_BATCH_SIZE)
+            dimensions: Output size; wider model outputs are truncated
+                (default: EMBEDDING_DIMENSIONS)
+        """
+        settings = get_settings()
+        self._model_dir = Path(model_path or settings.local_embedding_model_path)
+        self._pooling = pooling or settings.local_embedding_pooling
+        if self._pooling not in POOLING_MODES:
+            raise ValueError(
+                f"Unknown pooling mode '{self._pooling}', expected one of {POOLING_MODES}"
+            )
+        self._max_length = max_length or settings.local_embedding_max_length
+        self._batch_size = batch_size or settings.local_embedding_batch_size
+        self._threads = settings.local_embedding_threads
+        self._dimensions = dimensions or settings.embedding_dimensions
+
+    @property
+    def model(self) -> _OnnxModel:
+        return _load_model(self._model_dir, self._max_length, self._threads)
+
+    def _encode_sync(self, texts: List[str]) -> List[List[float]]:
+        vectors = self.model.encode(texts, self._pooling)
+        dims = vectors.shape[1]
+        if dims < self._dimensions:
+            raise ValueError(
+                f"Local model returns {dims}-dim embeddings but EMBEDDING_DIMENSIONS="
+                f"{self._dimensions}; set EMBEDDING_DIMENSIONS={dims}"
+            )
+        if dims > self._dimensions:
+            # Matryoshka truncation (only meaningful for MRL-trained models)
+            vectors = vectors[:, : self._dimensions]
+            vectors /= np.clip(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12, None)
+        return vectors.tolist()
+
+    async def embed(self, text: str) -> List[float]:
+        """Get embedding for a single text."""
+        return (await self.embed_batch([text]))[0]
+
+    async def embed_batch(self, texts: List[str], **kwargs: Any) -> List[List[float]]:
+        """Get embeddings for multiple texts (sub-batches run on the thread pool)."""
+        if not texts:
+            return []
+
+        loop = asyncio.get_running_loop()
+        executor = _get_executor()
+        # Sort by length so each sub-batch pads to similar lengths
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        chunks = [order[i : i + self._batch_size] for i in range(0, len(order), self._batch_size)]
+
+        results = await asyncio.gather(
+            *[
+                loop.run_in_executor(executor, self._encode_sync, [texts[i] for i in chunk])
+                for chunk in chunks
+            ]
+        )
+
+        embeddings: List[List[float] | None] = [None] * len(texts)
+        for chunk, vectors in zip(chunks, results):
+            for i, vector in zip(chunk, vectors):
+                embeddings[i] = vector
+        return embeddings
+
+
+def local_embedding_model_id() -> str:
+    """Identifier of the configured local model (embedding cache key prefix)."""
+    return f"local/{Path(get_settings().local_embedding_model_path).name}"
@@ -1,45 +1,76 @@
 """Embedding service implementations."""
 
+import asyncio
 from typing import List
 
 import httpx
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, RateLimitError
 
+from research_agent.config import get_settings
 from research_agent.infrastructure.embedding.base import EmbeddingService
+from research_agent.infrastructure.embedding.batching import embed_in_batches
+from research_agent.infrastructure.embedding.dimensions import (
+    get_embedding_dimensions,
+    supports_dimensions_param,
+)
+from research_agent.infrastructure.embedding.transport import (
+    RETRYABLE_STATUS,
+    THROTTLE_STATUS,
+    get_http_client,
+    get_rate_limiter,
+    parse_retry_after,
+    retry_delay,
+)
 from research_agent.shared.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
 class OpenAIEmbeddingService(EmbeddingService):
-    """OpenAI embedding service (direct, not via OpenRouter)."""
+    """OpenAI embedding service (direct, not via OpenRouter).
+
+    Requests go through the shared AIMD limiter (``openai:<model>``), so a
+    large embed_batch cannot fan out more than EMBEDDING_CONCURRENCY_MAX
+    concurrent requests; retries are left to the OpenAI SDK.
+    """
 
     def __init__(
         self,
         api_key: str,
         model: str = "text-embedding-3-small",
+        dimensions: int | None = None,
     ):
         self._model = model
         self._client = AsyncOpenAI(api_key=api_key)
+        self._dimensions = dimensions or get_embedding_dimensions()
+        # Only text-embedding-3 accepts ``dimensions``; others keep native size
+        self._extra = {"dimensions": self._dimensions} if supports_dimensions_param(model) else {}
+
+    async def _create(self, input_data: str | List[str]) -> List[List[float]]:
+        """One embeddings request under the shared concurrency limiter."""
+        limiter = get_rate_limiter(f"openai:{self._model}")
+        async with limiter:
+            try:
+                response = await self._client.embeddings.create(
+                    model=self._model,
+                    input=input_data,
+                    **self._extra,
+                )
+            except RateLimitError as e:
+                limiter.on_throttle(parse_retry_after(e.response.headers))
+                raise
+        limiter.on_success()
+        return [item.embedding for item in response.data]
 
     async def embed(self, text: str) -> List[float]:
         """Get embedding for a single text."""
-        response = await self._client.embeddings.create(
-            model=self._model,
-            input=text,
-        )
-        return response.data[0].embedding
+        return (await self._create(text))[0]
 
     async def embed_batch(self, texts: List[str]) -> List[List[float]]:
-        """Get embeddings for multiple texts."""
+        """Get embeddings for multiple texts (token-packed requests)."""
         if not texts:
             return []
-
-        response = await self._client.embeddings.create(
-            model=self._model,
-            input=texts,
-        )
-        return [item.embedding for item in response.data]
+        return await embed_in_batches(texts, self._create)
 
 
 class OpenRouterEmbeddingService(EmbeddingService):
@@ -57,9 +88,53 @@ class OpenRouterEmbeddingService(EmbeddingService):
         self,
         api_key: str,
         model: str = "openai/text-embedding-3-small",
+        dimensions: int | None = None,
     ):
         self._model = model
         self._api_key = api_key
+        self._dimensions = dimensions or get_embedding_dimensions()
+
+    async def _post_with_retry(self, url: str, headers: dict, payload: dict) -> httpx.Response:
+        """POST through the pooled client, adapting concurrency to rate limits.
+
+        Throttling responses (429/503) shrink the shared concurrency window and
+        are retried after the provider's Retry-After; other transient failures
+        back off exponentially with jitter. The last response is returned once
+        retries are exhausted.
+        """
+        client = get_http_client()
+        limiter = get_rate_limiter(f"openrouter:{self._model}")
+        max_retries = get_settings().embedding_max_retries
+
+        for attempt in range(max_retries + 1):
+            async with limiter:
+                try:
+                    response = await client.post(url, headers=headers, json=payload)
+                except (httpx.TimeoutException, httpx.NetworkError) as e:
+                    if attempt >= max_retries:
+                        raise
+                    logger.warning(f"[OpenRouter Embedding] {e!r}, retry {attempt + 1}")
+                    response = None
+
+            if response is not None:
+                if response.status_code not in RETRYABLE_STATUS:
+                    limiter.on_success()
+                    return response
+                retry_after = parse_retry_after(response.headers)
+                if response.status_code in THROTTLE_STATUS:
+                    limiter.on_throttle(retry_after)
+                if attempt >= max_retries:
+                    return response
+                logger.warning(
+                    f"[OpenRouter Embedding] status={response.status_code}, "
+                    f"retry {attempt + 1}/{max_retries} (retry_after={retry_after})"
+                )
+            else:
+                retry_after = None
+
+            await asyncio.sleep(retry_delay(attempt, retry_after))
+
+        raise AssertionError("unreachable")
 
     async def _call_api(self, input_data: str | List[str]) -> dict:
         """Call OpenRouter embeddings API directly."""
@@ -73,140 +148,132 @@ class OpenRouterEmbeddingService(EmbeddingService):
         )
         logger.debug(f"[OpenRouter Embedding] Request URL: {url}")
 
-        # Explicitly disable proxy to avoid SOCKS proxy issues
-        # trust_env=False disables reading proxy settings from environment variables
-        async with httpx.AsyncClient(
-            timeout=60.0,
-            trust_env=True,  # 允许使用系统代理环境变量（如 https_proxy）
-        ) as client:
-            request_payload = {
-                "model": self._model,
-                "input": input_data,
-                "encoding_format": "float",
-            }
-            logger.debug(
-                f"[OpenRouter Embedding] Request payload keys: {list(request_payload.keys())}"
-            )
-            if is_batch:
-                logger.debug(f"[OpenRouter Embedding] Batch size: {len(input_data)}")
-                # Log first item preview for debugging
-                if input_data:
-                    first_item_preview = (
-                        input_data[0][:100] + "..." if len(input_data[0]) > 100 else input_data[0]
-                    )
-                    logger.debug(f"[OpenRouter Embedding] First item preview: {first_item_preview}")
-
-            try:
-                # Log request details for debugging
-                api_key_preview = (
-                    f"{self._api_key[:10]}...{self._api_key[-4:]}"
-                    if len(self._api_key) > 14
-                    else "***"
-                )
-                logger.info(f"[OpenRouter Embedding] API Key preview: {api_key_preview}")
-                logger.info(f"[OpenRouter Embedding] Request URL: {url}")
-                logger.info(f"[OpenRouter Embedding] Request model: {request_payload['model']}")
-                logger.info(
-                    f"[OpenRouter Embedding] Request encoding_format: {request_payload.get('encoding_format')}"
+        request_payload = {
+            "model": self._model,
+            "input": input_data,
+            "encoding_format": "float",
+        }
+        if supports_dimensions_param(self._model):
+            request_payload["dimensions"] = self._dimensions
+        logger.debug(
+            f"[OpenRouter Embedding] Request payload keys: {list(request_payload.keys())}"
+        )
+        if is_batch:
+            logger.debug(f"[OpenRouter Embedding] Batch size: {len(input_data)}")
+            # Log first item preview for debugging
+            if input_data:
+                first_item_preview = (
+                    input_data[0][:100] + "..." if len(input_data[0]) > 100 else input_data[0]
                 )
+                logger.debug(f"[OpenRouter Embedding] First item preview: {first_item_preview}")
+
+        try:
+            # Log request details for debugging
+            api_key_preview = (
+                f"{self._api_key[:10]}...{self._api_key[-4:]}"
+                if len(self._api_key) > 14
+                else "***"
+            )
+            logger.info(f"[OpenRouter Embedding] API Key preview: {api_key_preview}")
+            logger.info(f"[OpenRouter Embedding] Request URL: {url}")
+            logger.info(f"[OpenRouter Embedding] Request model: {request_payload['model']}")
+            logger.info(
+                f"[OpenRouter Embedding] Request encoding_format: {request_payload.get('encoding_format')}"
+            )
+            logger.info(
+                f"[OpenRouter Embedding] Request input type: {type(request_payload['input'])}"
+            )
+            if isinstance(request_payload["input"], list):
                 logger.info(
-                    f"[OpenRouter Embedding] Request input type: {type(request_payload['input'])}"
+                    f"[OpenRouter Embedding] Request input length: {len(request_payload['input'])}"
                 )
-                if isinstance(request_payload["input"], list):
-                    logger.info(
-                        f"[OpenRouter Embedding] Request input length: {len(request_payload['input'])}"
-                    )
 
-                # OpenRouter requires specific headers for embeddings
-                # See: https://openrouter.ai/docs/api-reference/embeddings
-                headers = {
-                    "Authorization": f"Bearer {self._api_key}",
-                    "Content-Type": "application/json",
-                    "HTTP-Referer": "https://github.com/research-agent-rag",  # Required for OpenRouter
-                    "X-Title": "Research Agent RAG",  # Optional but recommended
-                }
-                logger.info(f"[OpenRouter Embedding] Request headers: {list(headers.keys())}")
-
-                response = await client.post(
-                    url,
-                    headers=headers,
-                    json=request_payload,
-                )
+            # OpenRouter requires specific headers for embeddings
+            # See: https://openrouter.ai/docs/api-reference/embeddings
+            headers = {
+                "Authorization": f"Bearer {self._api_key}",
+                "Content-Type": "application/json",
+                "HTTP-Referer": "https://github.com/research-agent-rag",  # Required for OpenRouter
+                "X-Title": "Research Agent RAG",  # Optional but recommended
+            }
+            logger.info(f"[OpenRouter Embedding] Request headers: {list(headers.keys())}")
 
-                logger.info(f"[OpenRouter Embedding] Response status: {response.status_code}")
-                logger.info(f"[OpenRouter Embedding] Response headers: {dict(response.headers)}")
+            response = await self._post_with_retry(url, headers, request_payload)
 
-                # Get full response text for debugging
-                response_text = response.text
-                logger.info(
-                    f"[OpenRouter Embedding] Response body (first 1000 chars): {response_text[:1000]}"
-                )
+            logger.info(f"[OpenRouter Embedding] Response status: {response.status_code}")
+            logger.info(f"[OpenRouter Embedding] Response headers: {dict(response.headers)}")
 
-                response.raise_for_status()
-                result = response.json()
+            # Get full response text for debugging
+            response_text = response.text
+            logger.info(
+                f"[OpenRouter Embedding] Response body (first 1000 chars): {response_text[:1000]}"
+            )
 
-                # Log full response structure
-                logger.info(f"[OpenRouter Embedding] Response JSON keys: {list(result.keys())}")
-                if "error" in result:
-                    logger.error(f"[OpenRouter Embedding] Full error response: {result['error']}")
-
-                logger.debug(f"[OpenRouter Embedding] Response keys: {list(result.keys())}")
-                if "data" in result:
-                    logger.info(f"[OpenRouter Embedding] Received {len(result['data'])} embeddings")
-                else:
-                    logger.warning(
-                        f"[OpenRouter Embedding] Response missing 'data' key: {list(result.keys())}"
-                    )
+            response.raise_for_status()
+            result = response.json()
 
-                # Log response structure for debugging
-                if "data" not in result:
-                    logger.error(
-                        f"[OpenRouter Embedding] Response missing 'data' key. "
-                        f"Response keys: {list(result.keys())}, "
-                        f"Full response: {result}"
-                    )
-                    # Check for error in response
-                    if "error" in result:
-                        error_msg = result.get("error", {})
-                        if isinstance(error_msg, dict):
-                            error_detail = error_msg.get("message", str(error_msg))
-                            error_type = error_msg.get("type", "unknown")
-                            logger.error(
-                                f"[OpenRouter Embedding] API error: type={error_type}, "
-                                f"message={error_detail}"
-                            )
-                        else:
-                            error_detail = str(error_msg)
-                            logger.error(f"[OpenRouter Embedding] API error: {error_detail}")
-                        raise ValueError(
-                            f"OpenRouter API error: {error_detail}. " f"Full response: {result}"
+            # Log full response structure
+            logger.info(f"[OpenRouter Embedding] Response JSON keys: {list(result.keys())}")
+            if "error" in result:
+                logger.error(f"[OpenRouter Embedding] Full error response: {result['error']}")
+
+            logger.debug(f"[OpenRouter Embedding] Response keys: {list(result.keys())}")
+            if "data" in result:
+                logger.info(f"[OpenRouter Embedding] Received {len(result['data'])} embeddings")
+            else:
+                logger.warning(
+                    f"[OpenRouter Embedding] Response missing 'data' key: {list(result.keys())}"
+                )
+
+            # Log response structure for debugging
+            if "data" not in result:
+                logger.error(
+                    f"[OpenRouter Embedding] Response missing 'data' key. "
+                    f"Response keys: {list(result.keys())}, "
+                    f"Full response: {result}"
+                )
+                # Check for error in response
+                if "error" in result:
+                    error_msg = result.get("error", {})
+                    if isinstance(error_msg, dict):
+                        error_detail = error_msg.get("message", str(error_msg))
+                        error_type = error_msg.get("type", "unknown")
+                        logger.error(
+                            f"[OpenRouter Embedding] API error: type={error_type}, "
+                            f"message={error_detail}"
                         )
+                    else:
+                        error_detail = str(error_msg)
+                        logger.error(f"[OpenRouter Embedding] API error: {error_detail}")
                     raise ValueError(
-                        f"Unexpected OpenRouter API response format. "
-                        f"Expected 'data' key but got: {list(result.keys())}. "
-                        f"Response: {result}"
+                        f"OpenRouter API error: {error_detail}. " f"Full response: {result}"
                     )
-
-                return result
-
-            except httpx.ProxyError as e:
-                logger.error(f"[OpenRouter Embedding] Proxy error: {e}")
                 raise ValueError(
-                    f"Proxy configuration error: {e}. "
-                    f"Please check HTTP_PROXY/HTTPS_PROXY environment variables or install socksio: pip install httpx[socks]"
+                    f"Unexpected OpenRouter API response format. "
+                    f"Expected 'data' key but got: {list(result.keys())}. "
+                    f"Response: {result}"
                 )
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    f"[OpenRouter Embedding] HTTP error: status={e.response.status_code}, "
-                    f"response={e.response.text[:500]}"
-                )
-                raise
-            except httpx.RequestError as e:
-                logger.error(f"[OpenRouter Embedding] Request error: {e}")
-                raise ValueError(f"Request failed: {e}")
-            except Exception as e:
-                logger.error(f"[OpenRouter Embedding] Unexpected error: {e}", exc_info=True)
-                raise
+
+            return result
+
+        except httpx.ProxyError as e:
+            logger.error(f"[OpenRouter Embedding] Proxy error: {e}")
+            raise ValueError(
+                f"Proxy configuration error: {e}. "
+                f"Please check HTTP_PROXY/HTTPS_PROXY environment variables or install socksio: pip install httpx[socks]"
+            )
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                f"[OpenRouter Embedding] HTTP error: status={e.response.status_code}, "
+                f"response={e.response.text[:500]}"
+            )
+            raise
+        except httpx.RequestError as e:
+            logger.error(f"[OpenRouter Embedding] Request error: {e}")
+            raise ValueError(f"Request failed: {e}")
+        except Exception as e:
+            logger.error(f"[OpenRouter Embedding] Unexpected error: {e}", exc_info=True)
+            raise
 
     async def embed(self, text: str) -> List[float]:
         """Get embedding for a single text."""
@@ -243,81 +310,48 @@ class OpenRouterEmbeddingService(EmbeddingService):
         logger.debug(f"[OpenRouter Embedding] Generated embedding (dimension: {len(embedding)})")
         return embedding
 
-    async def embed_batch(self, texts: List[str], batch_size: int = 256) -> List[List[float]]:
+    async def embed_batch(
+        self, texts: List[str], batch_size: int | None = None
+    ) -> List[List[float]]:
         """Get embeddings for multiple texts.
 
+        Texts are packed into requests by estimated token count (see
+        ``embed_in_batches``); requests run concurrently under the shared
+        rate limiter.
+
         Args:
             texts: List of texts to embed
-            batch_size: Maximum number of texts per API call (default: 256)
-                       OpenRouter/OpenAI has limits on batch size
+            batch_size: Maximum number of texts per API call
+                       (default: EMBEDDING_BATCH_MAX_ITEMS)
 
         Returns:
             List of embeddings
         """
-        import asyncio
-
         if not texts:
             logger.debug("[OpenRouter Embedding] Empty batch, returning empty list")
             return []
 
-        total_texts = len(texts)
-        logger.info(
-            f"[OpenRouter Embedding] Processing {total_texts} texts in batches of {batch_size} "
-            f"(concurrently)"
-        )
-
-        batches = []
-        for i in range(0, total_texts, batch_size):
-            batch = texts[i : i + batch_size]
-            batch_num = (i // batch_size) + 1
-            total_batches = (total_texts + batch_size - 1) // batch_size
-            batches.append((batch_num, total_batches, i, batch))
-
-        # Limit concurrency to avoid rate limits
-        semaphore = asyncio.Semaphore(10)
-
-        async def process_batch(batch_info):
-            batch_num, total_batches, start_index, batch = batch_info
-            async with semaphore:
-                logger.info(
-                    f"[OpenRouter Embedding] Processing batch {batch_num}/{total_batches} "
-                    f"(texts {start_index+1}-{min(start_index+batch_size, total_texts)})"
-                )
-                try:
-                    result = await self._call_api(batch)
-
-                    if "data" not in result:
-                        raise ValueError(f"Missing 'data' in response for batch {batch_num}")
-
-                    data = result["data"]
-                    if not data:
-                        raise ValueError(f"Empty 'data' for batch {batch_num}")
-
-                    # Store results mapped by original index
-                    batch_embeddings = []
-                    for j, item in enumerate(data):
-                        if "embedding" not in item:
-                            raise ValueError(f"Item {j} in batch {batch_num} missing embedding")
-                        batch_embeddings.append(item["embedding"])
-
-                    return start_index, batch_embeddings
+        async def request(batch: List[str]) -> List[List[float]]:
+            try:
+                result = await self._call_api(batch)
 
-                except Exception as e:
-                    logger.error(f"[OpenRouter Embedding] Batch {batch_num} failed: {e}")
-                    raise
+                data = result["data"]
+                if not data:
+                    raise ValueError("Empty 'data' in embedding response")
 
-        # Run batches concurrently
-        results = await asyncio.gather(*[process_batch(b) for b in batches])
+                batch_embeddings = []
+                for j, item in enumerate(data):
+                    if "embedding" not in item:
+                        raise ValueError(f"Item {j} in batch missing embedding")
+                    batch_embeddings.append(item["embedding"])
+                return batch_embeddings
 
-        # Reconstruct ordered list
-        final_embeddings = [None] * total_texts
-        for start_index, batch_embeddings in results:
-            for i, embedding in enumerate(batch_embeddings):
-                if start_index + i < total_texts:
-                    final_embeddings[start_index + i] = embedding
+            except Exception as e:
+                logger.error(f"[OpenRouter Embedding] Batch of {len(batch)} failed: {e}")
+                raise
 
-        completed_count = sum(1 for e in final_embeddings if e is not None)
+        embeddings = await embed_in_batches(texts, request, max_items=batch_size)
         logger.info(
-            f"[OpenRouter Embedding] All batches completed: {completed_count} total embeddings"
+            f"[OpenRouter Embedding] All batches completed: {len(embeddings)} total embeddings"
         )
-        return final_embeddings
+        return embeddings
@@ -0,0 +1,116 @@
+"""Request-scoped query embedding memoization.
+
+Within one chat turn the retriever, memory service and document selector
+all embed the same (rewritten) question. Inside an ``EmbeddingScope`` each
+distinct (service, text) pair is embedded once; later callers await the
+same task. ``prefetch_embedding`` starts the request early so it overlaps
+with other pre-retrieval work (memory lookup, intent classification).
+
+Usage:
+    async with EmbeddingScope():
+        prefetch_embedding(service, query)
+        ...
+        vector = await embed_query(service, query)  # any component
+
+Outside a scope ``embed_query`` simply calls ``service.embed``. On exit the
+scope logs requests, provider calls and saved latency to the RAG trace.
+"""
+
+import asyncio
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+from research_agent.infrastructure.embedding.base import EmbeddingService
+from research_agent.shared.utils.rag_trace import rag_log
+
+_current_scope: ContextVar[Optional["EmbeddingScope"]] = ContextVar(
+    "embedding_scope", default=None
+)
+
+
+class EmbeddingScope:
+    """Per-turn memo of query embeddings."""
+
+    def __init__(self):
+        self._tasks: Dict[Tuple[int, str], asyncio.Task] = {}
+        self._latency_ms: Dict[Tuple[int, str], float] = {}
+        self._closed = False
+        self.requests = 0
+        self.computed = 0
+        self.saved_ms = 0.0
+
+    async def __aenter__(self) -> "EmbeddingScope":
+        _current_scope.set(self)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self._closed = True
+        for task in self._tasks.values():
+            if not task.done():
+                task.cancel()
+        if self.requests:
+            rag_log(
+                "EMBED",
+                embed_requests=self.requests,
+                embed_computed=self.computed,
+                embed_saved_ms=round(self.saved_ms, 2),
+            )
+        _current_scope.set(None)
+        return False
+
+    def start(self, service: EmbeddingService, text: str) -> Optional[asyncio.Task]:
+        """Start (or reuse) the embedding task for text."""
+        key = (id(service), text)
+        task = self._tasks.get(key)
+        if task is not None and not (task.done() and (task.cancelled() or task.exception())):
+            return task
+        if self._closed:
+            return None
+
+        async def compute() -> List[float]:
+            started = time.perf_counter()
+            embedding = await service.embed(text)
+            self._latency_ms[key] = (time.perf_counter() - started) * 1000
+            return embedding
+
+        task = asyncio.ensure_future(compute())
+        # Failures surface to the awaiting caller; don't warn for unawaited prefetches
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._tasks[key] = task
+        self.computed += 1
+        return task
+
+    async def embed(self, service: EmbeddingService, text: str) -> List[float]:
+        """Embedding for text, computed at most once per scope."""
+        task = self.start(service, text)
+        if task is None:
+            return await service.embed(text)
+
+        self.requests += 1
+        started = time.perf_counter()
+        # Shield so one cancelled caller doesn't cancel the shared request
+        embedding = await asyncio.shield(task)
+        waited_ms = (time.perf_counter() - started) * 1000
+        self.saved_ms += max(0.0, self._latency_ms.get((id(service), text), 0.0) - waited_ms)
+        return embedding
+
+
+def get_embedding_scope() -> Optional[EmbeddingScope]:
+    """Current per-turn scope, if any."""
+    return _current_scope.get()
+
+
+async def embed_query(service: EmbeddingService, text: str) -> List[float]:
+    """Embed a query, reusing the per-turn result when inside a scope."""
+    scope = _current_scope.get()
+    if scope is None:
+        return await service.embed(text)
+    return await scope.embed(service, text)
+
+
+def prefetch_embedding(service: EmbeddingService, text: str) -> None:
+    """Start embedding text in the background (no-op outside a scope)."""
+    scope = _current_scope.get()
+    if scope is not None and service is not None and text:
+        scope.start(service, text)
@@ -0,0 +1,201 @@
+"""Shared HTTP transport and adaptive concurrency for embedding providers.
+
+- ``get_http_client``: one long-lived ``httpx.AsyncClient`` per process (and
+  event loop) with keep-alive and HTTP/2, so batches reuse connections
+  instead of paying TCP+TLS setup per request.
+- ``AIMDLimiter``: additive-increase / multiplicative-decrease concurrency.
+  Every successful request grows the window by ~1 per round of requests;
+  a throttling response (429/503) halves it (at most once per cooldown) and
+  pauses new requests for the provider's Retry-After. Ingestion therefore
+  converges to the provider quota instead of a fixed guess.
+- ``retry_delay``: provider reset headers when present, otherwise
+  exponential backoff with full jitter.
+"""
+
+import asyncio
+import email.utils
+import random
+import time
+from typing import Dict, Optional
+
+import httpx
+
+from research_agent.config import get_settings
+from research_agent.shared.utils.logger import logger
+
+# Status codes that mean "slow down" (shrink the window) vs. transient errors
+THROTTLE_STATUS = {429, 503}
+RETRYABLE_STATUS = THROTTLE_STATUS | {500, 502, 504}
+
+# Minimum seconds between two window decreases (one RTT worth of 429s
+# from requests already in flight should only count once)
+DECREASE_COOLDOWN_SECONDS = 1.0
+
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 30.0
+
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_limiters: Dict[tuple, "AIMDLimiter"] = {}
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Process-wide pooled client for embedding API calls."""
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        settings = get_settings()
+        http2 = settings.embedding_http2 and _http2_available()
+        _http_client = httpx.AsyncClient(
+            timeout=60.0,
+            trust_env=True,  # 允许使用系统代理环境变量（如 https_proxy）
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=settings.embedding_max_connections,
+                max_keepalive_connections=settings.embedding_max_connections,
+                keepalive_expiry=60.0,
+            ),
+        )
+        _http_client_loop = loop
+        logger.info(f"[EmbeddingTransport] Created pooled HTTP client (http2={http2})")
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the pooled client (application shutdown)."""
+    global _http_client
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
+
+
+def parse_retry_after(headers: httpx.Headers) -> Optional[float]:
+    """Seconds to wait according to provider rate-limit headers, if any."""
+    value = headers.get("retry-after-ms")
+    if value:
+        try:
+            return max(0.0, float(value) / 1000)
+        except ValueError:
+            pass
+
+    value = headers.get("retry-after")
+    if value:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            try:
+                parsed = email.utils.parsedate_to_datetime(value)
+                return max(0.0, parsed.timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+
+    # OpenRouter: X-RateLimit-Reset is an epoch timestamp in milliseconds
+    value = headers.get("x-ratelimit-reset")
+    if value:
+        try:
+            reset = float(value)
+            if reset > 1e12:
+                reset /= 1000
+            if reset > 1e9:
+                return max(0.0, reset - time.time())
+            return max(0.0, reset)
+        except ValueError:
+            pass
+    return None
+
+
+def retry_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """Delay before retry ``attempt`` (0-based)."""
+    if retry_after is not None:
+        # Honour the provider, plus a little jitter so callers don't stampede
+        return retry_after + random.uniform(0, 0.1 * max(retry_after, 1.0))
+    cap = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2**attempt))
+    return random.uniform(0, cap)
+
+
+class AIMDLimiter:
+    """Adaptive concurrency window (additive increase, multiplicative decrease)."""
+
+    def __init__(self, name: str, initial: int, minimum: int = 1, maximum: int = 32):
+        self._name = name
+        self._min = minimum
+        self._max = maximum
+        self._limit = float(min(max(initial, minimum), maximum))
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._condition = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def acquire(self) -> None:
+        while True:
+            pause = self._paused_until - time.monotonic()
+            if pause > 0:
+                await asyncio.sleep(pause)
+                continue
+            async with self._condition:
+                if self._in_flight < self.limit:
+                    self._in_flight += 1
+                    return
+                await self._condition.wait()
+
+    async def release(self) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    async def __aenter__(self) -> "AIMDLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.release()
+
+    def on_success(self) -> None:
+        """Grow the window by one per full window of successes."""
+        self._limit = min(self._max, self._limit + 1 / self._limit)
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        """Halve the window and pause new requests for Retry-After."""
+        now = time.monotonic()
+        if retry_after:
+            self._paused_until = max(self._paused_until, now + retry_after)
+        if now - self._last_decrease < DECREASE_COOLDOWN_SECONDS:
+            return
+        self._last_decrease = now
+        previous = self.limit
+        self._limit = max(self._min, self._limit / 2)
+        logger.warning(
+            f"[EmbeddingTransport] {self._name} throttled: concurrency {previous} -> "
+            f"{self.limit}, retry_after={retry_after}"
+        )
+
+
+def get_rate_limiter(name: str) -> AIMDLimiter:
+    """Per-process limiter shared by all callers of one provider/model."""
+    key = (name, asyncio.get_running_loop())
+    limiter = _limiters.get(key)
+    if limiter is None:
+        settings = get_settings()
+        limiter = AIMDLimiter(
+            name,
+            initial=settings.embedding_concurrency_initial,
+            maximum=settings.embedding_concurrency_max,
+        )
+        _limiters[key] = limiter
+    return limiter
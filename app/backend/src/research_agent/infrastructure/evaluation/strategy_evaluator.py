@@ -151,6 +151,8 @@ class StrategyEvaluator:
                 ):
                     if event["type"] == "token":
                         answer += event.get("content", "")
+                    elif event["type"] == "reset":
+                        answer = ""
 
                 # Evaluate with Ragas
                 if answer and retrieved_contexts:
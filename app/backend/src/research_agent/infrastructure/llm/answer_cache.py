@@ -0,0 +1,295 @@
+"""Semantic cache of complete chat answers.
+
+Teams in one project ask the same question over and over, and every time
+the full pipeline (rewrite, retrieval, rerank, grading, generation) runs
+again. ``SemanticAnswerCache`` stores finished answers with their sources
+and citations and serves them for later questions whose embedding is
+within ``ANSWER_CACHE_SIMILARITY_THRESHOLD`` (cosine) of a stored one.
+
+Entries are partitioned by a scope key (``answer_scope_key``) covering:
+
+- project, user (retrieval is isolated per user) and document filter
+- rag_mode, model and the retrieval options that shape the answer
+- the project's corpus version
+
+The corpus version is bumped with every chunk write/delete (see
+``retrieval_cache.bump_corpus_version``), so adding or removing a document
+makes every cached answer of the project unreachable; they age out of the
+LRU/TTL.
+
+Entries live in a per-process LRU and, when ANSWER_CACHE_REDIS is on, in a
+Redis list per scope (REDIS_URL) so API replicas share hits; the Redis
+client and the counters come from ``tiered_cache``. Similarity is always
+computed in-process over the scope's entries. Redis errors degrade to the
+local tier. Counters are exposed via ``get_answer_cache_stats``.
+"""
+
+import base64
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from typing import Any
+from uuid import UUID
+
+import numpy as np
+
+from research_agent.config import get_settings
+from research_agent.infrastructure.tiered_cache import (
+    cache_counters,
+    cache_stats,
+    get_redis_client,
+    reset_cache_counters,
+)
+from research_agent.shared.utils.logger import logger
+
+REDIS_KEY_PREFIX = "weaver:answer:"
+# Entries kept per scope in Redis (newest first)
+REDIS_ENTRIES_PER_SCOPE = 64
+
+# Counter name (see tiered_cache.cache_stats)
+CACHE_NAME = "answer"
+
+
+def _counters() -> dict[str, int]:
+    return cache_counters(CACHE_NAME, extra=("stores",))
+
+
+@dataclass
+class CachedAnswer:
+    """A finished answer with what the client needs to replay it."""
+
+    question: str
+    answer: str
+    sources: list[dict[str, Any]] = field(default_factory=list)
+    citations: list[dict[str, Any]] = field(default_factory=list)
+    created_at: float = field(default_factory=time.time)
+    similarity: float = 1.0  # Set on lookup
+
+
+def answer_scope_key(
+    project_id: UUID,
+    user_id: str | None,
+    rag_mode: str,
+    corpus_version: int,
+    **options: Any,
+) -> str:
+    """Hash of everything besides the question that determines an answer.
+
+    ``options`` are further answer-shaping parameters (model, top_k,
+    document filter, ...); values must be JSON-serializable.
+    """
+    raw = json.dumps(
+        {
+            "project_id": str(project_id),
+            "user_id": user_id,
+            "rag_mode": rag_mode,
+            "version": corpus_version,
+            **options,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _normalize(embedding: list[float] | np.ndarray) -> np.ndarray:
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = float(np.linalg.norm(vector))
+    return vector / norm if norm > 0 else vector
+
+
+def _best_match(
+    query: np.ndarray,
+    embeddings: list[np.ndarray],
+    threshold: float,
+) -> tuple[int, float] | None:
+    """Index and cosine similarity of the closest entry at or above threshold."""
+    candidates = [i for i, emb in enumerate(embeddings) if emb.shape == query.shape]
+    if not candidates:
+        return None
+    similarities = np.stack([embeddings[i] for i in candidates]) @ query
+    best = int(np.argmax(similarities))
+    similarity = float(similarities[best])
+    return (candidates[best], similarity) if similarity >= threshold else None
+
+
+def _encode(embedding: np.ndarray, entry: CachedAnswer) -> str:
+    payload = asdict(entry)
+    payload.pop("similarity")
+    payload["embedding"] = base64.b64encode(embedding.astype(np.float16).tobytes()).decode()
+    return json.dumps(payload)
+
+
+def _decode(payload: str | bytes) -> tuple[np.ndarray, CachedAnswer]:
+    data = json.loads(payload)
+    embedding = np.frombuffer(base64.b64decode(data.pop("embedding")), dtype=np.float16)
+    return embedding.astype(np.float32), CachedAnswer(**data)
+
+
+class _LocalAnswers:
+    """In-process entries grouped by scope; LRU over scopes, bounded in total."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._scopes: OrderedDict[str, list[tuple[np.ndarray, CachedAnswer]]] = OrderedDict()
+        self._count = 0
+
+    def _live(self, scope: str) -> list[tuple[np.ndarray, CachedAnswer]]:
+        entries = self._scopes.get(scope)
+        if not entries:
+            return []
+        cutoff = time.time() - self._ttl_seconds
+        live = [item for item in entries if item[1].created_at >= cutoff]
+        self._count -= len(entries) - len(live)
+        if live:
+            self._scopes[scope] = live
+            self._scopes.move_to_end(scope)
+        else:
+            del self._scopes[scope]
+        return live
+
+    def get(self, scope: str, query: np.ndarray, threshold: float) -> CachedAnswer | None:
+        entries = self._live(scope)
+        match = _best_match(query, [emb for emb, _ in entries], threshold)
+        if match is None:
+            return None
+        index, similarity = match
+        entry = entries[index][1]
+        return CachedAnswer(**{**asdict(entry), "similarity": similarity})
+
+    def add(self, scope: str, embedding: np.ndarray, entry: CachedAnswer) -> None:
+        self._scopes.setdefault(scope, []).append((embedding, entry))
+        self._scopes.move_to_end(scope)
+        self._count += 1
+        while self._count > self._max_entries:
+            oldest_scope = next(iter(self._scopes))
+            entries = self._scopes[oldest_scope]
+            entries.pop(0)
+            self._count -= 1
+            if not entries:
+                del self._scopes[oldest_scope]
+
+    def __len__(self) -> int:
+        return self._count
+
+
+class SemanticAnswerCache:
+    """Answers keyed by scope + question embedding similarity."""
+
+    def __init__(
+        self,
+        similarity_threshold: float,
+        max_entries: int,
+        ttl_seconds: int,
+        redis: Any = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            similarity_threshold: Minimum cosine similarity for a hit
+            max_entries: Per-process entry limit
+            ttl_seconds: Entry lifetime
+            redis: Optional async Redis client for the shared tier
+        """
+        self.similarity_threshold = similarity_threshold
+        self._ttl_seconds = ttl_seconds
+        self._local = _LocalAnswers(max_entries, ttl_seconds)
+        self._redis = redis
+
+    async def lookup(self, scope: str, embedding: list[float]) -> CachedAnswer | None:
+        """Closest cached answer in scope, or None."""
+        query = _normalize(embedding)
+
+        hit = self._local.get(scope, query, self.similarity_threshold)
+        if hit is not None:
+            _counters()["local_hits"] += 1
+            return hit
+
+        if self._redis is not None:
+            try:
+                payloads = await self._redis.lrange(REDIS_KEY_PREFIX + scope, 0, -1)
+            except Exception as e:
+                _counters()["errors"] += 1
+                logger.warning(f"[AnswerCache] Redis lookup failed: {e}")
+                payloads = []
+            cutoff = time.time() - self._ttl_seconds
+            decoded = []
+            for payload in payloads:
+                try:
+                    item = _decode(payload)
+                    if item[0].shape != query.shape:
+                        raise ValueError(f"embedding dimension {item[0].shape[0]}")
+                except Exception as e:
+                    # Written by another version or embedding model: skip it
+                    _counters()["errors"] += 1
+                    logger.warning(f"[AnswerCache] Skipping unreadable Redis entry: {e}")
+                    continue
+                if item[1].created_at >= cutoff:
+                    decoded.append(item)
+            match = _best_match(query, [emb for emb, _ in decoded], self.similarity_threshold)
+            if match is not None:
+                index, similarity = match
+                cached_embedding, entry = decoded[index]
+                self._local.add(scope, cached_embedding, entry)
+                _counters()["redis_hits"] += 1
+                return CachedAnswer(**{**asdict(entry), "similarity": similarity})
+
+        _counters()["misses"] += 1
+        return None
+
+    async def store(self, scope: str, embedding: list[float], entry: CachedAnswer) -> None:
+        """Remember an answer for later similar questions in scope."""
+        vector = _normalize(embedding)
+        self._local.add(scope, vector, entry)
+        _counters()["stores"] += 1
+
+        if self._redis is not None:
+            key = REDIS_KEY_PREFIX + scope
+            try:
+                async with self._redis.pipeline(transaction=False) as pipe:
+                    pipe.lpush(key, _encode(vector, entry))
+                    pipe.ltrim(key, 0, REDIS_ENTRIES_PER_SCOPE - 1)
+                    pipe.expire(key, self._ttl_seconds)
+                    await pipe.execute()
+            except Exception as e:
+                _counters()["errors"] += 1
+                logger.warning(f"[AnswerCache] Redis store failed: {e}")
+
+    def __len__(self) -> int:
+        return len(self._local)
+
+
+_answer_cache: SemanticAnswerCache | None = None
+
+
+def get_answer_cache() -> SemanticAnswerCache:
+    """Process-wide answer cache configured from settings."""
+    global _answer_cache
+    if _answer_cache is None:
+        settings = get_settings()
+        _answer_cache = SemanticAnswerCache(
+            similarity_threshold=settings.answer_cache_similarity_threshold,
+            max_entries=settings.answer_cache_max_entries,
+            ttl_seconds=settings.answer_cache_ttl_seconds,
+            redis=get_redis_client(settings.answer_cache_redis),
+        )
+    return _answer_cache
+
+
+def reset_answer_cache() -> None:
+    """Drop local entries and counters (tests, settings changes)."""
+    global _answer_cache
+    _answer_cache = None
+    reset_cache_counters(CACHE_NAME)
+
+
+def get_answer_cache_stats() -> dict[str, Any]:
+    """Hit/miss counters for this process."""
+    _counters()
+    return {
+        **cache_stats(CACHE_NAME),
+        "local_entries": len(_answer_cache) if _answer_cache is not None else 0,
+    }
@@ -0,0 +1,355 @@
+"""Listwise LLM relevance scoring for reranking.
+
+Pointwise reranking sends one prompt per candidate, so 20 candidates cost 20
+LLM calls in several waves. Listwise scoring puts all candidates, truncated
+and numbered, into one prompt and asks for a JSON list of 0-10 scores. The
+candidates are split into a few parallel calls only when their estimated
+size exceeds the prompt budget derived from the model's context window.
+
+Scores are on the same 0-10 scale as the pointwise reranker. A candidate the
+model did not score (unparseable output, failed call, missing id) gets
+``None`` so the caller can fall back to pointwise scoring for just those.
+
+``judge_listwise`` is the fused rerank + grade variant: the same batched
+prompt also asks for a relevant/irrelevant decision per document, so one
+pass replaces both the rerank scores and the yes/no grading calls.
+"""
+
+import asyncio
+import json
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Optional, Sequence
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.prompts import ChatPromptTemplate
+
+from research_agent.config import get_settings
+from research_agent.domain.services.token_estimator import TokenEstimator
+from research_agent.infrastructure.llm.model_config import calculate_available_tokens
+from research_agent.shared.utils.logger import logger
+
+LISTWISE_SYSTEM_PROMPT = """You are a document relevance scorer. Rate how relevant each numbered
+document is to answering the user's question on a scale of 0-10.
+
+0 = Completely irrelevant
+5 = Somewhat relevant
+10 = Highly relevant and directly answers the question
+
+Score every document independently. Output ONLY JSON of the form
+{{"scores": [{{"id": 1, "score": 7}}, {{"id": 2, "score": 0}}]}}
+with one entry per document id. No explanation."""
+
+FUSED_SYSTEM_PROMPT = """You are a document relevance judge. For each numbered document, rate
+how relevant it is to answering the user's question on a scale of 0-10 and
+decide whether it should be used to answer the question.
+
+0 = Completely irrelevant
+5 = Somewhat relevant
+10 = Highly relevant and directly answers the question
+
+A document is relevant if it contains keyword(s) or semantic meaning related
+to the question. Judge every document independently. Output ONLY JSON of the form
+{{"results": [{{"id": 1, "score": 7, "relevant": true}}, {{"id": 2, "score": 0, "relevant": false}}]}}
+with one entry per document id. No explanation."""
+
+# Prompt overhead besides the candidates (system prompt, question, JSON answer)
+_PROMPT_OVERHEAD_TOKENS = 300
+# Answer tokens per candidate ({"id": 12, "score": 7},)
+_ANSWER_TOKENS_PER_DOC = 12
+# ... and with the decision ({"id": 12, "score": 7, "relevant": false},)
+_JUDGEMENT_TOKENS_PER_DOC = 20
+
+_CODE_FENCE = re.compile(r"```(?:json)?\s*([\s\S]*?)\s*```")
+_SCORE_PAIR = re.compile(r'"?id"?\s*:\s*(\d+)\s*,\s*"?score"?\s*:\s*(-?\d+(?:\.\d+)?)')
+_JUDGEMENT = re.compile(
+    r'"?id"?\s*:\s*(\d+)\s*,\s*"?score"?\s*:\s*(-?\d+(?:\.\d+)?)'
+    r'(?:\s*,\s*"?relevant"?\s*:\s*"?(true|false|yes|no)"?)?',
+    re.IGNORECASE,
+)
+
+
+@dataclass
+class ListwiseResult:
+    """Scores aligned with the input candidates, plus call statistics."""
+
+    scores: List[Optional[float]]
+    call_latency_ms: List[float] = field(default_factory=list)
+    parse_failures: int = 0
+    # Keep/drop decisions (judge_listwise only)
+    keep: List[Optional[bool]] = field(default_factory=list)
+
+
+def truncate_document(text: str, max_chars: int) -> str:
+    """Truncate candidate text for the prompt."""
+    return text[:max_chars] if len(text) > max_chars else text
+
+
+def plan_listwise_batches(
+    texts: Sequence[str],
+    max_prompt_tokens: int,
+    question: str = "",
+    answer_tokens_per_doc: int = _ANSWER_TOKENS_PER_DOC,
+) -> List[List[int]]:
+    """Group candidate indices into prompts that fit ``max_prompt_tokens``.
+
+    Candidates stay in retrieval order; a new group starts only when the
+    next candidate would overflow the budget. Returns one group when
+    everything fits.
+    """
+    overhead = _PROMPT_OVERHEAD_TOKENS + TokenEstimator.estimate_tokens(question)
+    budget = max(1, max_prompt_tokens - overhead)
+    batches: List[List[int]] = []
+    current: List[int] = []
+    used = 0
+    for index, text in enumerate(texts):
+        cost = TokenEstimator.estimate_tokens(text) + answer_tokens_per_doc
+        if current and used + cost > budget:
+            batches.append(current)
+            current, used = [], 0
+        current.append(index)
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _strip_code_fence(output: str) -> str:
+    text = output.strip()
+    match = _CODE_FENCE.search(text)
+    return match.group(1).strip() if match else text
+
+
+def _as_decision(value: Any) -> Optional[bool]:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip().lower() in ("true", "yes", "false", "no"):
+        return value.strip().lower() in ("true", "yes")
+    return None
+
+
+def parse_listwise_scores(output: str, count: int) -> List[Optional[float]]:
+    """Parse ``count`` 0-10 scores (ids 1..count) from model output.
+
+    Accepts ``{"scores": [{"id", "score"}]}``, a bare list of such objects,
+    an ``{"1": 7, ...}`` mapping or a bare list of numbers in id order. If
+    the JSON is malformed, id/score pairs are recovered with a regex.
+    Unscored ids are ``None``.
+    """
+    scores: List[Optional[float]] = [None] * count
+
+    def assign(doc_id: Any, score: Any) -> None:
+        try:
+            position = int(doc_id) - 1
+            value = float(score)
+        except (TypeError, ValueError):
+            return
+        if 0 <= position < count:
+            scores[position] = max(0.0, min(10.0, value))
+
+    text = _strip_code_fence(output)
+    try:
+        data = json.loads(text)
+    except (ValueError, TypeError):
+        for doc_id, score in _SCORE_PAIR.findall(text):
+            assign(doc_id, score)
+        return scores
+
+    if isinstance(data, dict) and "scores" in data:
+        data = data["scores"]
+    if isinstance(data, dict):
+        for doc_id, score in data.items():
+            assign(doc_id, score)
+    elif isinstance(data, list):
+        for position, item in enumerate(data, 1):
+            if isinstance(item, dict):
+                assign(item.get("id"), item.get("score"))
+            else:
+                assign(position, item)
+    return scores
+
+
+def parse_listwise_judgements(output: str, count: int) -> List[Optional[tuple[float, bool]]]:
+    """Parse ``count`` (score, keep) pairs (ids 1..count) from model output.
+
+    Accepts ``{"results": [{"id", "score", "relevant"}]}`` or a bare list of
+    such objects, recovering them with a regex if the JSON is malformed. A
+    missing ``relevant`` falls back to ``score >= 5``. Unjudged ids are ``None``.
+    """
+    judgements: List[Optional[tuple[float, bool]]] = [None] * count
+
+    def assign(doc_id: Any, score: Any, relevant: Any) -> None:
+        try:
+            position = int(doc_id) - 1
+            value = max(0.0, min(10.0, float(score)))
+        except (TypeError, ValueError):
+            return
+        if 0 <= position < count:
+            keep = _as_decision(relevant)
+            judgements[position] = (value, value >= 5.0 if keep is None else keep)
+
+    text = _strip_code_fence(output)
+    try:
+        data = json.loads(text)
+    except (ValueError, TypeError):
+        for doc_id, score, relevant in _JUDGEMENT.findall(text):
+            assign(doc_id, score, relevant or None)
+        return judgements
+
+    if isinstance(data, dict):
+        data = data.get("results", data.get("scores", []))
+    if isinstance(data, list):
+        for item in data:
+            if isinstance(item, dict):
+                assign(item.get("id"), item.get("score"), item.get("relevant"))
+    return judgements
+
+
+async def _run_listwise(
+    llm: BaseChatModel,
+    question: str,
+    texts: Sequence[str],
+    system_prompt: str,
+    answer_label: str,
+    parse: Callable[[str, int], List[Any]],
+    answer_tokens_per_doc: int,
+    callbacks: Optional[list],
+    max_doc_chars: Optional[int],
+    max_prompt_tokens: Optional[int],
+) -> tuple[List[Any], ListwiseResult]:
+    """Batch candidates into prompts, call the LLM in parallel, parse per batch.
+
+    Returns the parsed values aligned with ``texts`` (``None`` when unparsed)
+    and a result carrying the call statistics.
+    """
+    settings = get_settings()
+    if max_doc_chars is None:
+        max_doc_chars = settings.rerank_listwise_doc_chars
+    if max_prompt_tokens is None:
+        max_prompt_tokens = calculate_available_tokens(
+            settings.llm_model, settings.rerank_listwise_context_ratio
+        )
+
+    truncated = [truncate_document(text, max_doc_chars) for text in texts]
+    batches = plan_listwise_batches(truncated, max_prompt_tokens, question, answer_tokens_per_doc)
+
+    prompt = ChatPromptTemplate.from_messages(
+        [
+            ("system", system_prompt),
+            (
+                "human",
+                "Question: {question}\n\nDocuments:\n\n{documents}\n\n" + answer_label + ":",
+            ),
+        ]
+    )
+    chain = prompt | llm | StrOutputParser()
+    values: List[Any] = [None] * len(texts)
+    result = ListwiseResult(scores=[None] * len(texts))
+
+    async def run_batch(indices: List[int]) -> None:
+        documents = "\n\n".join(
+            f"[{number}] {truncated[index]}" for number, index in enumerate(indices, 1)
+        )
+        started = time.perf_counter()
+        try:
+            output = await chain.ainvoke(
+                {"question": question, "documents": documents},
+                config={"callbacks": callbacks or []},
+            )
+        except Exception as e:
+            logger.warning(f"[Rerank] Listwise call failed for {len(indices)} docs: {e}")
+            result.parse_failures += 1
+            return
+        finally:
+            result.call_latency_ms.append(round((time.perf_counter() - started) * 1000, 2))
+
+        parsed = parse(str(output), len(indices))
+        if any(value is None for value in parsed):
+            missing = sum(value is None for value in parsed)
+            logger.warning(
+                f"[Rerank] Listwise output missing {missing}/{len(indices)} scores: "
+                f"'{str(output)[:200]}'"
+            )
+            result.parse_failures += 1
+        for index, value in zip(indices, parsed):
+            values[index] = value
+
+    await asyncio.gather(*[run_batch(indices) for indices in batches])
+    logger.info(
+        f"[Rerank] Listwise scored {len(texts)} docs in {len(batches)} call(s), "
+        f"{values.count(None)} unscored"
+    )
+    return values, result
+
+
+async def score_listwise(
+    llm: BaseChatModel,
+    question: str,
+    texts: Sequence[str],
+    callbacks: Optional[list] = None,
+    max_doc_chars: Optional[int] = None,
+    max_prompt_tokens: Optional[int] = None,
+) -> ListwiseResult:
+    """Score candidates with one LLM call per prompt-sized group.
+
+    Args:
+        llm: Chat model used for scoring
+        question: Retrieval question
+        texts: Candidate texts, in retrieval order
+        callbacks: LangChain callbacks for tracing
+        max_doc_chars: Per-candidate truncation (default: settings)
+        max_prompt_tokens: Prompt budget (default: model context window
+            times ``rerank_listwise_context_ratio``)
+    """
+    if not texts:
+        return ListwiseResult(scores=[])
+
+    scores, result = await _run_listwise(
+        llm,
+        question,
+        texts,
+        LISTWISE_SYSTEM_PROMPT,
+        "Scores (JSON)",
+        parse_listwise_scores,
+        _ANSWER_TOKENS_PER_DOC,
+        callbacks,
+        max_doc_chars,
+        max_prompt_tokens,
+    )
+    result.scores = scores
+    return result
+
+
+async def judge_listwise(
+    llm: BaseChatModel,
+    question: str,
+    texts: Sequence[str],
+    callbacks: Optional[list] = None,
+    max_doc_chars: Optional[int] = None,
+    max_prompt_tokens: Optional[int] = None,
+) -> ListwiseResult:
+    """Score candidates and decide keep/drop in one pass.
+
+    Same batching and arguments as ``score_listwise``; the result also
+    carries ``keep``, aligned with ``scores``.
+    """
+    if not texts:
+        return ListwiseResult(scores=[])
+
+    judgements, result = await _run_listwise(
+        llm,
+        question,
+        texts,
+        FUSED_SYSTEM_PROMPT,
+        "Judgements (JSON)",
+        parse_listwise_judgements,
+        _JUDGEMENT_TOKENS_PER_DOC,
+        callbacks,
+        max_doc_chars,
+        max_prompt_tokens,
+    )
+    result.scores = [judgement[0] if judgement else None for judgement in judgements]
+    result.keep = [judgement[1] if judgement else None for judgement in judgements]
+    return result
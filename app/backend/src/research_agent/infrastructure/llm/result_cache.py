@@ -0,0 +1,164 @@
+"""Shared cache for small LLM results (query rewrites, intent labels).
+
+Query rewriting and intent classification are short LLM calls whose output
+depends only on the prompt, the model and a few inputs, so a repeated
+question can reuse an earlier result. ``LLMResultCache`` stores such results
+under a namespace ("rewrite", "intent", ...) with keys built by
+``result_cache_key`` from:
+
+- the project (results never leak between projects)
+- the model and a fingerprint of the prompt (``prompt_version``), so
+  switching models or editing a prompt makes old entries unreachable
+- the call's inputs (question, recent history, ...)
+
+Entries live in a per-process LRU with a TTL and, when LLM_RESULT_CACHE_REDIS
+is on, in Redis (REDIS_URL) so uvicorn workers and API replicas share hits;
+both tiers and the counters come from ``tiered_cache``. Values must be
+JSON-serializable. Redis errors degrade to the local tier. Per-namespace
+counters are exposed via ``get_result_cache_stats`` and ``hit_rate``.
+"""
+
+import hashlib
+import json
+from typing import Any
+
+from research_agent.config import get_settings
+from research_agent.infrastructure import tiered_cache
+from research_agent.infrastructure.tiered_cache import (
+    LRUCache,
+    cache_counters,
+    cache_names,
+    cache_stats,
+    get_redis_client,
+    reset_cache_counters,
+)
+from research_agent.shared.utils.logger import logger
+
+REDIS_KEY_PREFIX = "weaver:llm:"
+
+# Counter names are "llm:<namespace>" (see tiered_cache.cache_stats)
+CACHE_NAME_PREFIX = "llm:"
+
+
+def prompt_version(*templates: str) -> str:
+    """Short fingerprint of the prompt text a result was produced with."""
+    return hashlib.sha256("\x00".join(templates).encode()).hexdigest()[:12]
+
+
+def result_cache_key(project_id: Any, model: str | None, version: str, *parts: Any) -> str:
+    """Cache key for one call: project, model, prompt version and inputs."""
+    raw = json.dumps(
+        [str(project_id) if project_id else None, model, version, *parts],
+        default=str,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class LLMResultCache:
+    """Namespaced JSON results with a local LRU+TTL tier and optional Redis tier."""
+
+    def __init__(
+        self,
+        namespace: str,
+        max_entries: int,
+        ttl_seconds: int,
+        redis: Any = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            namespace: Result kind; separates keys and counters
+            max_entries: Per-process entry limit
+            ttl_seconds: Entry lifetime
+            redis: Optional async Redis client for the shared tier
+        """
+        self.namespace = namespace
+        self._ttl_seconds = ttl_seconds
+        self._local = LRUCache(max_entries, ttl_seconds)
+        self._redis = redis
+        self._counters = cache_counters(CACHE_NAME_PREFIX + namespace)
+
+    def _redis_key(self, key: str) -> str:
+        return f"{REDIS_KEY_PREFIX}{self.namespace}:{key}"
+
+    async def get(self, key: str) -> Any | None:
+        """Cached value for key, or None."""
+        value = self._local.get(key)
+        if value is not None:
+            self._counters["local_hits"] += 1
+            return value
+
+        if self._redis is not None:
+            try:
+                payload = await self._redis.get(self._redis_key(key))
+            except Exception as e:
+                self._counters["errors"] += 1
+                logger.warning(f"[ResultCache] Redis get failed ({self.namespace}): {e}")
+                payload = None
+            if payload is not None:
+                value = json.loads(payload)
+                self._local.set(key, value)
+                self._counters["redis_hits"] += 1
+                return value
+
+        self._counters["misses"] += 1
+        return None
+
+    async def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value under key."""
+        self._local.set(key, value)
+        if self._redis is not None:
+            try:
+                await self._redis.set(self._redis_key(key), json.dumps(value), ex=self._ttl_seconds)
+            except Exception as e:
+                self._counters["errors"] += 1
+                logger.warning(f"[ResultCache] Redis set failed ({self.namespace}): {e}")
+
+    def hit_rate(self) -> float:
+        """Share of lookups in this process served from either tier."""
+        return hit_rate(self.namespace)
+
+    def __len__(self) -> int:
+        return len(self._local)
+
+
+_caches: dict[str, LLMResultCache] = {}
+
+
+def get_result_cache(namespace: str) -> LLMResultCache:
+    """Process-wide cache for a namespace, configured from settings."""
+    cache = _caches.get(namespace)
+    if cache is None:
+        settings = get_settings()
+        cache = LLMResultCache(
+            namespace,
+            max_entries=settings.llm_result_cache_max_entries,
+            ttl_seconds=settings.llm_result_cache_ttl_seconds,
+            redis=get_redis_client(settings.llm_result_cache_redis),
+        )
+        _caches[namespace] = cache
+    return cache
+
+
+def reset_result_caches() -> None:
+    """Drop local entries and counters (tests, settings changes)."""
+    _caches.clear()
+    reset_cache_counters(CACHE_NAME_PREFIX)
+
+
+def hit_rate(namespace: str) -> float:
+    """Hit rate of a namespace in this process (0.0 before any lookup)."""
+    return tiered_cache.hit_rate(CACHE_NAME_PREFIX + namespace)
+
+
+def get_result_cache_stats() -> dict[str, Any]:
+    """Hit/miss counters per namespace for this process."""
+    stats = {}
+    for name in cache_names(CACHE_NAME_PREFIX):
+        namespace = name.removeprefix(CACHE_NAME_PREFIX)
+        stats[namespace] = {
+            **cache_stats(name),
+            "local_entries": len(_caches[namespace]) if namespace in _caches else 0,
+        }
+    return stats
@@ -0,0 +1,20 @@
+"""Non-LLM rerankers."""
+
+from typing import Optional
+
+from research_agent.infrastructure.rerank.base import Reranker
+from research_agent.infrastructure.rerank.local_features import LocalFeatureReranker
+
+# Setting value -> implementation; "llm" (not listed) keeps LLM scoring
+RERANKERS = {
+    LocalFeatureReranker.name: LocalFeatureReranker,
+}
+
+
+def get_reranker(name: Optional[str]) -> Optional[Reranker]:
+    """Reranker for a ``reranker`` setting value, or None for LLM scoring."""
+    reranker_cls = RERANKERS.get(name or "")
+    return reranker_cls() if reranker_cls else None
+
+
+__all__ = ["LocalFeatureReranker", "RERANKERS", "Reranker", "get_reranker"]
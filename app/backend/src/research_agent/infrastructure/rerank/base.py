@@ -0,0 +1,21 @@
+"""Reranker abstract interface."""
+
+from abc import ABC, abstractmethod
+from typing import List, Sequence
+
+from langchain_core.documents import Document
+
+
+class Reranker(ABC):
+    """Scores retrieved documents against a question without an LLM call.
+
+    Scores use the LLM reranker's 0-10 scale (5 = somewhat relevant), so the
+    pipeline's keep threshold applies unchanged.
+    """
+
+    name: str = "base"
+
+    @abstractmethod
+    async def score(self, question: str, documents: Sequence[Document]) -> List[float]:
+        """Relevance score (0-10) of each document, in input order."""
+        pass
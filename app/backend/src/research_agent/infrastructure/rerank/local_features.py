@@ -0,0 +1,165 @@
+"""CPU-only feature reranker.
+
+Scores the retrieved candidates with cheap lexical and retrieval features
+instead of one LLM call per document:
+
+- BM25 of the question over the candidate set (IDF from the candidates)
+- vector similarity reported by retrieval (``metadata["similarity"]``)
+- query term coverage and query bigram (phrase) overlap
+- a position prior from the retrieval order
+
+BM25 and similarity are relative to the best candidate; coverage, phrase
+overlap and position are absolute. The weighted sum is scaled to the LLM
+reranker's 0-10 range. Lexical features only help when the question shares
+words with the candidates: their weight moves to vector similarity in
+proportion to how little the best candidate covers the question, so a
+paraphrased or cross-language question can still reach the keep threshold
+(5) on a strong vector match. All features are computed as numpy arrays over the
+candidates, so a 20-document rerank takes well under a millisecond.
+
+Tokenization lowercases Latin words and splits CJK text into characters,
+so bigrams approximate CJK words.
+"""
+
+import re
+from collections import Counter
+from typing import List, Sequence
+
+import numpy as np
+from langchain_core.documents import Document
+
+from research_agent.infrastructure.rerank.base import Reranker
+
+_TOKEN = re.compile(r"[a-z0-9]+|[\u3400-\u4dbf\u4e00-\u9fff]")
+
+# Feature columns of bm25, coverage and phrase
+_LEXICAL = [0, 2, 3]
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens; CJK characters are single tokens."""
+    return _TOKEN.findall(text.lower())
+
+
+def bigrams(tokens: Sequence[str]) -> set[tuple[str, str]]:
+    """Adjacent token pairs."""
+    return set(zip(tokens, tokens[1:]))
+
+
+def bm25_scores(
+    query_terms: Sequence[str],
+    documents: Sequence[Sequence[str]],
+    k1: float = 1.2,
+    b: float = 0.75,
+) -> np.ndarray:
+    """BM25 of the query against each tokenized document.
+
+    Args:
+        query_terms: Distinct query terms
+        documents: Tokenized documents
+        k1: Term frequency saturation
+        b: Length normalization
+
+    Returns:
+        Scores, shape (n_documents,)
+    """
+    if not documents or not query_terms:
+        return np.zeros(len(documents), dtype=np.float32)
+
+    counts = [Counter(tokens) for tokens in documents]
+    tf = np.array(
+        [[count[term] for term in query_terms] for count in counts], dtype=np.float32
+    )
+    lengths = np.array([len(tokens) for tokens in documents], dtype=np.float32)
+    avg_length = max(float(lengths.mean()), 1.0)
+
+    n = len(documents)
+    df = (tf > 0).sum(axis=0)
+    idf = np.log1p((n - df + 0.5) / (df + 0.5))
+
+    norm = k1 * (1 - b + b * lengths / avg_length)
+    return ((tf * (k1 + 1)) / (tf + norm[:, None]) * idf).sum(axis=1)
+
+
+def _relative(values: np.ndarray) -> np.ndarray:
+    """Scale so the best candidate is 1 (all zero stays zero)."""
+    top = float(values.max()) if len(values) else 0.0
+    return values / top if top > 0 else np.zeros_like(values)
+
+
+class LocalFeatureReranker(Reranker):
+    """Weighted lexical + retrieval features, no model required."""
+
+    name = "local"
+
+    def __init__(
+        self,
+        bm25_weight: float = 0.3,
+        similarity_weight: float = 0.3,
+        coverage_weight: float = 0.15,
+        phrase_weight: float = 0.15,
+        position_weight: float = 0.1,
+        max_doc_chars: int = 2000,
+    ):
+        self.weights = np.array(
+            [bm25_weight, similarity_weight, coverage_weight, phrase_weight, position_weight],
+            dtype=np.float32,
+        )
+        self.max_doc_chars = max_doc_chars
+
+    def features(self, question: str, documents: Sequence[Document]) -> np.ndarray:
+        """Feature matrix (n_documents, 5), each column in [0, 1].
+
+        Columns: bm25, similarity, coverage, phrase, position. The similarity
+        column is NaN when retrieval did not report a similarity.
+        """
+        query_tokens = tokenize(question)
+        query_terms = list(dict.fromkeys(query_tokens))
+        query_bigrams = bigrams(query_tokens)
+        doc_tokens = [tokenize(doc.page_content[: self.max_doc_chars]) for doc in documents]
+
+        bm25 = _relative(bm25_scores(query_terms, doc_tokens))
+
+        similarity = np.array(
+            [doc.metadata.get("similarity", np.nan) for doc in documents], dtype=np.float32
+        )
+        if not np.isnan(similarity).all():
+            present = np.nan_to_num(similarity, nan=float(np.nanmin(similarity)))
+            similarity = _relative(np.clip(present, 0.0, None))
+
+        coverage = np.zeros(len(documents), dtype=np.float32)
+        phrase = np.zeros(len(documents), dtype=np.float32)
+        for i, tokens in enumerate(doc_tokens):
+            if query_terms:
+                coverage[i] = len(set(query_terms).intersection(tokens)) / len(query_terms)
+            if query_bigrams:
+                phrase[i] = len(query_bigrams & bigrams(tokens)) / len(query_bigrams)
+            else:
+                phrase[i] = coverage[i]
+
+        position = 1.0 / np.log2(np.arange(len(documents), dtype=np.float32) + 2.0)
+
+        return np.stack([bm25, similarity, coverage, phrase, position], axis=1)
+
+    async def score(self, question: str, documents: Sequence[Document]) -> List[float]:
+        """Weighted feature sum scaled to 0-10."""
+        if not documents:
+            return []
+
+        features = self.features(question, documents)
+        weights = self.weights.copy()
+        if np.isnan(features[:, 1]).all():
+            # No retrieval similarity: spread its weight over the other features
+            weights[1] = 0.0
+            features[:, 1] = 0.0
+        else:
+            # No word overlap (paraphrase, other language): lexical features
+            # carry no signal, so similarity takes over their weight
+            missing = 1.0 - float(features[:, 2].max())
+            shifted = weights[_LEXICAL] * missing
+            weights[_LEXICAL] -= shifted
+            weights[1] += shifted.sum()
+        weights = weights / weights.sum()
+
+        scores = np.clip(features @ weights, 0.0, 1.0) * 10.0
+        return [round(float(score), 2) for score in scores]
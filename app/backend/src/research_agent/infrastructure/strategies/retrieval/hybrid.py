@@ -12,7 +12,9 @@ from langchain_core.documents import Document
 from research_agent.domain.entities.config import RetrievalConfig
 from research_agent.domain.strategies.base import IRetrievalStrategy, RetrievalResult
 from research_agent.infrastructure.embedding.base import EmbeddingService
+from research_agent.infrastructure.embedding.request_scope import embed_query
 from research_agent.infrastructure.vector_store.base import VectorStore
+from research_agent.infrastructure.vector_store.mmr import diversify_results
 from research_agent.shared.utils.logger import logger
 
 
@@ -78,19 +80,33 @@ class HybridRetrievalStrategy(IRetrievalStrategy):
         )
 
         # Get query embedding
-        query_embedding = await self._embedding_service.embed(query)
+        query_embedding = await embed_query(self._embedding_service, query)
+
+        # Over-fetch candidates when MMR will re-select the top-k
+        use_mmr = config.mmr_enabled and config.mmr_lambda < 1.0
+        limit = config.top_k * config.mmr_fetch_multiplier if use_mmr else config.top_k
 
         # Perform hybrid search
         results = await self._vector_store.hybrid_search(
             query_embedding=query_embedding,
             query_text=query,
             project_id=project_id,
-            limit=config.top_k,
+            limit=limit,
             vector_weight=vector_weight,
             keyword_weight=keyword_weight,
-            k=config.top_k * 4,  # Retrieve more for better fusion
+            k=limit * 4,  # Retrieve more for better fusion
         )
 
+        if use_mmr:
+            results = await diversify_results(
+                self._vector_store,
+                query_embedding,
+                results,
+                config.top_k,
+                config.mmr_lambda,
+                fused=True,
+            )
+
         # Filter by minimum similarity if configured
         if config.min_similarity > 0:
             results = [r for r in results if r.similarity >= config.min_similarity]
@@ -118,6 +134,7 @@ class HybridRetrievalStrategy(IRetrievalStrategy):
                 "query": query,
                 "top_k": config.top_k,
                 "min_similarity": config.min_similarity,
+                "mmr_lambda": config.mmr_lambda if use_mmr else None,
                 "vector_weight": vector_weight,
                 "keyword_weight": keyword_weight,
             },
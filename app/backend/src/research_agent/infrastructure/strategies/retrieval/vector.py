@@ -12,7 +12,9 @@ from langchain_core.documents import Document
 from research_agent.domain.entities.config import RetrievalConfig
 from research_agent.domain.strategies.base import IRetrievalStrategy, RetrievalResult
 from research_agent.infrastructure.embedding.base import EmbeddingService
+from research_agent.infrastructure.embedding.request_scope import embed_query
 from research_agent.infrastructure.vector_store.base import VectorStore
+from research_agent.infrastructure.vector_store.mmr import diversify_results
 from research_agent.shared.utils.logger import logger
 
 
@@ -68,15 +70,24 @@ class VectorRetrievalStrategy(IRetrievalStrategy):
         )
 
         # Get query embedding
-        query_embedding = await self._embedding_service.embed(query)
+        query_embedding = await embed_query(self._embedding_service, query)
+
+        # Over-fetch candidates when MMR will re-select the top-k
+        use_mmr = config.mmr_enabled and config.mmr_lambda < 1.0
+        limit = config.top_k * config.mmr_fetch_multiplier if use_mmr else config.top_k
 
         # Search vector store
         results = await self._vector_store.search(
             query_embedding=query_embedding,
             project_id=project_id,
-            limit=config.top_k,
+            limit=limit,
         )
 
+        if use_mmr:
+            results = await diversify_results(
+                self._vector_store, query_embedding, results, config.top_k, config.mmr_lambda
+            )
+
         # Filter by minimum similarity if configured
         if config.min_similarity > 0:
             results = [r for r in results if r.similarity >= config.min_similarity]
@@ -103,6 +114,7 @@ class VectorRetrievalStrategy(IRetrievalStrategy):
                 "query": query,
                 "top_k": config.top_k,
                 "min_similarity": config.min_similarity,
+                "mmr_lambda": config.mmr_lambda if use_mmr else None,
             },
             strategy_name=self.name,
         )
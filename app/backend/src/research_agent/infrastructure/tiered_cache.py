@@ -0,0 +1,106 @@
+"""Building blocks shared by the two-tier (process + Redis) caches.
+
+The retrieval cache (vector_store.retrieval_cache), the answer cache
+(llm.answer_cache) and the LLM result cache (llm.result_cache) all keep a
+per-process tier and, when enabled, a Redis tier shared by API replicas:
+
+- ``LRUCache``: in-process LRU with per-entry TTL
+- ``get_redis_client``: one lazily created async Redis client (REDIS_URL)
+- ``cache_counters`` / ``cache_stats``: per-process hit/miss counters by
+  cache name, reported on the cache stats endpoint
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any
+
+from research_agent.config import get_settings
+
+COUNTERS = ("local_hits", "redis_hits", "misses", "errors")
+
+# cache name -> counters (per process)
+_counters: dict[str, dict[str, int]] = {}
+_redis_client: Any = None
+
+
+class LRUCache:
+    """Small in-process LRU with per-entry TTL."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self._ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def get_redis_client(enabled: bool) -> Any:
+    """Shared async Redis client, or None when the cache's Redis tier is off.
+
+    Args:
+        enabled: The cache's own *_REDIS setting
+    """
+    global _redis_client
+    settings = get_settings()
+    if not (enabled and settings.redis_url):
+        return None
+    if _redis_client is None:
+        import redis.asyncio as redis
+
+        _redis_client = redis.from_url(settings.redis_url)
+    return _redis_client
+
+
+def cache_counters(name: str, extra: tuple[str, ...] = ()) -> dict[str, int]:
+    """Mutable counters of a cache (created on first use)."""
+    return _counters.setdefault(name, dict.fromkeys((*COUNTERS, *extra), 0))
+
+
+def hit_rate(name: str) -> float:
+    """Share of lookups served from either tier (0.0 before any lookup)."""
+    counters = cache_counters(name)
+    hits = counters["local_hits"] + counters["redis_hits"]
+    lookups = hits + counters["misses"]
+    return round(hits / lookups, 4) if lookups else 0.0
+
+
+def cache_stats(name: str) -> dict[str, Any]:
+    """Counters of a cache plus lookups and hit rate."""
+    counters = cache_counters(name)
+    return {
+        **counters,
+        "lookups": counters["local_hits"] + counters["redis_hits"] + counters["misses"],
+        "hit_rate": hit_rate(name),
+    }
+
+
+def cache_names(prefix: str) -> list[str]:
+    """Names of the caches with counters that start with prefix."""
+    return [name for name in _counters if name.startswith(prefix)]
+
+
+def reset_cache_counters(prefix: str) -> None:
+    """Drop the counters of every cache whose name starts with prefix."""
+    for name in cache_names(prefix):
+        del _counters[name]
@@ -0,0 +1,509 @@
+"""Filter-aware ANN search for resource_chunks (pgvector).
+
+Every vector query is scoped to one project, but the global HNSW index knows
+nothing about projects: the planner either sequential-scans the project or
+walks the global graph and post-filters, returning too few rows for small
+projects. This module picks a per-query plan from the project's size:
+
+- small projects: exact search (scan on project_id + sort), which is both
+  exact and cheaper than a graph walk at that size. The ORDER BY expression
+  is deliberately not the indexed one, so no planner settings are needed
+- large projects: a per-project partial HNSW index
+  (``WHERE project_id = '<uuid>'``), built automatically once the project
+  crosses ``pgvector_partial_index_min_chunks``
+- everything in between (or while a partial index is being built): the global
+  index with ``hnsw.iterative_scan`` so post-filtering still fills ``limit``
+
+Indexes are built on the expression ``embedding::vector(N)`` with N =
+EMBEDDING_DIMENSIONS (1536 unless reduced-dimension embeddings are
+configured); queries must use ``VECTOR_EXPR`` for the planner to match them.
+Index names carry a ``_d<N>`` suffix for N != 1536, so after a dimension
+change ``sync_project_ann_indexes`` builds fresh indexes instead of finding
+the old ones.
+
+With ``pgvector_quantization`` set to ``halfvec`` or ``binary``, the
+index-backed stage runs on a compact expression index
+(``embedding::halfvec(N)`` or ``binary_quantize(embedding)::bit(N)``),
+oversamples ``limit * pgvector_quantized_oversample`` candidates and re-ranks
+them exactly against the full-precision vectors.
+
+Index plans apply their ``hnsw.*`` settings with one ``set_config`` call per
+transaction (``apply_planner_settings``). They are transaction-local and
+only read by HNSW scans, each of which applies its own values first, so they
+are not reset after the query.
+"""
+
+import time
+from dataclasses import dataclass, replace
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from research_agent.config import get_settings
+from research_agent.shared.utils.logger import logger
+
+EMBEDDING_DIMENSIONS = get_settings().embedding_dimensions
+
+# Index names predate configurable dimensions; only reduced sizes are tagged
+INDEX_DIMS_SUFFIX = "" if EMBEDDING_DIMENSIONS == 1536 else f"_d{EMBEDDING_DIMENSIONS}"
+
+# Expression the HNSW indexes are built on (see initial schema migration)
+VECTOR_EXPR = f"embedding::vector({EMBEDDING_DIMENSIONS})"
+
+QUANTIZATION_MODES = ("none", "halfvec", "binary")
+
+# Indexed expression and operator class per storage mode
+INDEX_EXPRESSIONS = {
+    "none": (VECTOR_EXPR, "vector_cosine_ops"),
+    "halfvec": (f"embedding::halfvec({EMBEDDING_DIMENSIONS})", "halfvec_cosine_ops"),
+    "binary": (f"binary_quantize(embedding)::bit({EMBEDDING_DIMENSIONS})", "bit_hamming_ops"),
+}
+
+# Global HNSW index per storage mode
+GLOBAL_INDEX_NAMES = {
+    "none": f"ix_resource_chunks_embedding_hnsw{INDEX_DIMS_SUFFIX}",
+    "halfvec": f"ix_resource_chunks_embedding_halfvec_hnsw{INDEX_DIMS_SUFFIX}",
+    "binary": f"ix_resource_chunks_embedding_bit_hnsw{INDEX_DIMS_SUFFIX}",
+}
+
+# Prefix for per-project partial indexes; full name stays under 63 chars
+PROJECT_INDEX_PREFIX = "ix_rc_hnsw"
+PROJECT_INDEX_PREFIXES = {
+    "none": f"{PROJECT_INDEX_PREFIX}{INDEX_DIMS_SUFFIX}_p_",
+    "halfvec": f"{PROJECT_INDEX_PREFIX}h{INDEX_DIMS_SUFFIX}_p_",
+    "binary": f"{PROJECT_INDEX_PREFIX}b{INDEX_DIMS_SUFFIX}_p_",
+}
+
+# pgvector upper bound for hnsw.ef_search
+MAX_EF_SEARCH = 1000
+
+# session.info key: (transaction, settings) last applied by apply_planner_settings
+_APPLIED_SETTINGS_KEY = "ann_planner_settings"
+
+# project_id -> (fetched_at, ProjectAnnStats)
+_stats_cache: dict[UUID, tuple[float, "ProjectAnnStats"]] = {}
+
+
+@dataclass
+class ProjectAnnStats:
+    """Size and index state of one project's chunks."""
+
+    chunk_count: int
+    has_partial_index: bool
+
+
+@dataclass
+class AnnSearchPlan:
+    """How a single vector query for a project should be executed."""
+
+    project_id: UUID
+    strategy: str  # exact | partial_index | global_index
+    ef_search: int
+    iterative_scan: str  # off | strict_order
+    quantization: str = "none"  # none | halfvec | binary
+    candidate_limit: int = 0  # Rows taken from the compact index before re-rank
+
+    def project_filter(self) -> tuple[str, dict[str, str]]:
+        """SQL fragment (and params) restricting rows to the project.
+
+        The partial index is only usable when the planner can prove the
+        predicate at plan time, so the project id is inlined as a literal
+        instead of a bind parameter. It comes from a UUID, so it is safe.
+        """
+        if self.strategy == "partial_index":
+            return f"project_id = '{UUID(str(self.project_id))}'::uuid", {}
+        return "project_id = cast(:project_id as uuid)", {"project_id": str(self.project_id)}
+
+    def stage_params(self) -> dict[str, int]:
+        """Bind params for the candidate stage of a quantized search."""
+        if self.quantization == "none":
+            return {}
+        return {"candidate_limit": self.candidate_limit}
+
+    def exact(self) -> "AnnSearchPlan":
+        """The same project filter with exact ordering (no index walk)."""
+        return replace(self, strategy="exact", quantization="none", candidate_limit=0)
+
+    def planner_settings(self) -> dict[str, str]:
+        """Transaction-local GUCs to apply before the query."""
+        if self.strategy == "exact":
+            # Exact plans order by an expression HNSW cannot serve (see
+            # nearest_neighbors_sql), so they need no settings.
+            return {}
+
+        planner_settings = {"hnsw.ef_search": str(self.ef_search)}
+        if self.iterative_scan != "off":
+            planner_settings["hnsw.iterative_scan"] = self.iterative_scan
+        return planner_settings
+
+
+def get_quantization_mode() -> str:
+    """Configured compact storage mode for the index-backed search stage."""
+    mode = get_settings().pgvector_quantization
+    if mode not in QUANTIZATION_MODES:
+        raise ValueError(
+            f"Unsupported pgvector quantization: {mode}. "
+            f"Supported modes: {', '.join(QUANTIZATION_MODES)}"
+        )
+    return mode
+
+
+def project_index_name(project_id: UUID, quantization: str | None = None) -> str:
+    """Name of the partial HNSW index for a project."""
+    mode = quantization or get_quantization_mode()
+    return f"{PROJECT_INDEX_PREFIXES[mode]}{project_id.hex}"
+
+
+def vector_distance_sql(query: str = ":embedding") -> str:
+    """Cosine distance expression that matches the HNSW index expression.
+
+    ``query`` is the SQL for the query vector: a bind parameter by default, or
+    a column reference (e.g. inside a LATERAL join).
+    """
+    return f"{VECTOR_EXPR} <=> cast({query} as vector({EMBEDDING_DIMENSIONS}))"
+
+
+def compact_distance_sql(quantization: str, query: str = ":embedding") -> str:
+    """Distance on the compact (quantized) index expression."""
+    if quantization == "halfvec":
+        # Cast via vector so the parameter has one type across the statement
+        return (
+            f"embedding::halfvec({EMBEDDING_DIMENSIONS}) "
+            f"<=> cast({query} as vector({EMBEDDING_DIMENSIONS}))::halfvec({EMBEDDING_DIMENSIONS})"
+        )
+    if quantization == "binary":
+        return (
+            f"binary_quantize(embedding)::bit({EMBEDDING_DIMENSIONS}) "
+            f"<~> binary_quantize(cast({query} as vector({EMBEDDING_DIMENSIONS})))"
+        )
+    return vector_distance_sql(query)
+
+
+def nearest_neighbors_sql(
+    plan: "AnnSearchPlan",
+    where_clause: str,
+    limit_param: str = "limit",
+    query: str = ":embedding",
+) -> str:
+    """SELECT (id, distance) of the nearest rows under the plan.
+
+    Without quantization this is a single index-ordered scan. With
+    quantization, candidates come from the compact index and are re-ranked
+    by exact cosine distance on the full-precision vectors. Exact plans sort
+    on ``distance + 0``: the HNSW index only serves ORDER BY on its own
+    expression, so the planner uses the project_id/resource_id indexes and
+    an exact sort instead.
+    """
+    if plan.strategy == "exact":
+        return f"""
+                SELECT id, {vector_distance_sql(query)} AS distance
+                FROM resource_chunks
+                WHERE {where_clause}
+                ORDER BY {vector_distance_sql(query)} + 0
+                LIMIT :{limit_param}"""
+
+    if plan.quantization == "none":
+        return f"""
+                SELECT id, {vector_distance_sql(query)} AS distance
+                FROM resource_chunks
+                WHERE {where_clause}
+                ORDER BY {vector_distance_sql(query)}
+                LIMIT :{limit_param}"""
+
+    return f"""
+                SELECT id, {vector_distance_sql(query)} AS distance
+                FROM (
+                    SELECT id, embedding
+                    FROM resource_chunks
+                    WHERE {where_clause}
+                    ORDER BY {compact_distance_sql(plan.quantization, query)}
+                    LIMIT :candidate_limit
+                ) candidates
+                ORDER BY distance
+                LIMIT :{limit_param}"""
+
+
+def ef_search_for(chunk_count: int, limit: int) -> int:
+    """Choose hnsw.ef_search from the number of chunks being searched."""
+    if chunk_count < 10_000:
+        ef_search = 40
+    elif chunk_count < 100_000:
+        ef_search = 64
+    elif chunk_count < 1_000_000:
+        ef_search = 128
+    else:
+        ef_search = 256
+    return min(MAX_EF_SEARCH, max(ef_search, limit * 2))
+
+
+def plan_search(stats: ProjectAnnStats, project_id: UUID, limit: int) -> AnnSearchPlan:
+    """Choose the ANN strategy and planner settings for a project query."""
+    settings = get_settings()
+
+    if stats.chunk_count <= settings.pgvector_exact_search_max_chunks:
+        strategy = "exact"
+    elif stats.has_partial_index:
+        strategy = "partial_index"
+    else:
+        strategy = "global_index"
+
+    # Exact search on small projects is already exact; only quantize index scans
+    quantization = "none" if strategy == "exact" else get_quantization_mode()
+    candidate_limit = limit * settings.pgvector_quantized_oversample if quantization != "none" else 0
+
+    return AnnSearchPlan(
+        project_id=project_id,
+        strategy=strategy,
+        ef_search=ef_search_for(stats.chunk_count, max(limit, candidate_limit)),
+        iterative_scan="strict_order" if settings.pgvector_iterative_scan else "off",
+        quantization=quantization,
+        candidate_limit=candidate_limit,
+    )
+
+
+def invalidate_project_stats(project_id: UUID) -> None:
+    """Drop cached stats for a project (after ingest or index changes)."""
+    _stats_cache.pop(project_id, None)
+
+
+async def get_project_stats(session: AsyncSession, project_id: UUID) -> ProjectAnnStats:
+    """Get chunk count and partial index state, cached for a short TTL."""
+    ttl = get_settings().pgvector_ann_stats_ttl
+    cached = _stats_cache.get(project_id)
+    if cached and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+
+    result = await session.execute(
+        text("""
+            SELECT
+                (SELECT count(*) FROM resource_chunks
+                 WHERE project_id = cast(:project_id as uuid) AND embedding IS NOT NULL)
+                    AS chunk_count,
+                EXISTS (
+                    SELECT 1 FROM pg_class c JOIN pg_index i ON i.indexrelid = c.oid
+                    WHERE c.relname = :index_name AND i.indisvalid
+                ) AS has_partial_index
+        """),
+        {"project_id": str(project_id), "index_name": project_index_name(project_id)},
+    )
+    row = result.one()
+    stats = ProjectAnnStats(
+        chunk_count=int(row.chunk_count),
+        has_partial_index=bool(row.has_partial_index),
+    )
+    _stats_cache[project_id] = (time.monotonic(), stats)
+    return stats
+
+
+async def plan_project_search(
+    session: AsyncSession, project_id: UUID, limit: int
+) -> AnnSearchPlan:
+    """Build the search plan for a project query."""
+    stats = await get_project_stats(session, project_id)
+    plan = plan_search(stats, project_id, limit)
+    logger.debug(
+        f"[ANN] project={project_id} chunks={stats.chunk_count} strategy={plan.strategy} "
+        f"ef_search={plan.ef_search} iterative_scan={plan.iterative_scan} "
+        f"quantization={plan.quantization} candidates={plan.candidate_limit}"
+    )
+    return plan
+
+
+async def apply_planner_settings(session: AsyncSession, plan: AnnSearchPlan) -> None:
+    """Apply the plan's GUCs for the current transaction (one round trip).
+
+    No-op for exact plans and when the same settings were already applied in
+    the session's current transaction.
+    """
+    planner_settings = plan.planner_settings()
+    if not planner_settings:
+        return
+    transaction = session.sync_session.get_transaction()
+    applied = session.info.get(_APPLIED_SETTINGS_KEY)
+    if transaction is not None and applied == (transaction, planner_settings):
+        return
+
+    calls = ", ".join(
+        f"set_config(:name_{i}, :value_{i}, true)" for i in range(len(planner_settings))
+    )
+    params: dict[str, str] = {}
+    for i, (name, value) in enumerate(planner_settings.items()):
+        params[f"name_{i}"] = name
+        params[f"value_{i}"] = value
+    await session.execute(text(f"SELECT {calls}"), params)
+    session.info[_APPLIED_SETTINGS_KEY] = (session.sync_session.get_transaction(), planner_settings)
+
+
+async def reset_planner_settings(session: AsyncSession, plan: AnnSearchPlan) -> None:
+    """Restore the plan's GUCs to their defaults for the rest of the transaction.
+
+    Searches do not need this (see module docstring); it is for tools that
+    compare plans side by side.
+    """
+    names = list(plan.planner_settings())
+    session.info.pop(_APPLIED_SETTINGS_KEY, None)
+    if not names:
+        return
+    await session.execute(
+        text("""
+            SELECT set_config(name, reset_val, true)
+            FROM pg_settings
+            WHERE name = ANY(:names)
+        """),
+        {"names": names},
+    )
+
+
+# =========================================================================
+# Index maintenance
+# =========================================================================
+
+
+async def ensure_project_ann_index(project_id: UUID) -> bool:
+    """Create the project's partial HNSW index once it is large enough.
+
+    Runs ``CREATE INDEX CONCURRENTLY`` on an autocommit connection so ingest
+    and search are not blocked. Called from the ANN index maintenance task,
+    never inline on the ingest path.
+
+    Returns:
+        True if the project has (or now has) a valid partial index
+    """
+    from research_agent.infrastructure.database.session import engine
+
+    settings = get_settings()
+    quantization = get_quantization_mode()
+    index_name = project_index_name(project_id, quantization)
+    expression, opclass = INDEX_EXPRESSIONS[quantization]
+
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        result = await conn.execute(
+            text("""
+                SELECT
+                    (SELECT count(*) FROM resource_chunks
+                     WHERE project_id = cast(:project_id as uuid) AND embedding IS NOT NULL)
+                        AS chunk_count,
+                    (SELECT i.indisvalid FROM pg_class c JOIN pg_index i ON i.indexrelid = c.oid
+                     WHERE c.relname = :index_name) AS index_valid
+            """),
+            {"project_id": str(project_id), "index_name": index_name},
+        )
+        row = result.one()
+
+        if row.index_valid:
+            return True
+        if row.chunk_count < settings.pgvector_partial_index_min_chunks:
+            return False
+
+        if row.index_valid is False:
+            # Leftover from an interrupted concurrent build
+            logger.warning(f"[ANN] Dropping invalid index {index_name}")
+            await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}"))
+
+        logger.info(
+            f"[ANN] Building partial HNSW index {index_name} "
+            f"for project {project_id} ({row.chunk_count} chunks)"
+        )
+        await conn.execute(
+            text(f"""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name}
+                ON resource_chunks
+                USING hnsw (({expression}) {opclass})
+                WITH (m = 16, ef_construction = 64)
+                WHERE project_id = '{UUID(str(project_id))}'::uuid
+            """)
+        )
+
+    invalidate_project_stats(project_id)
+    logger.info(f"[ANN] Partial index {index_name} ready")
+    return True
+
+
+async def maintain_project_ann_index(project_id: UUID) -> None:
+    """Maintenance task body: refresh cached stats and build the partial index if due.
+
+    Failures are logged, never raised; search falls back to the global index.
+    """
+    invalidate_project_stats(project_id)
+    if get_settings().vector_store_provider not in ("pgvector", "mmap"):
+        return
+    try:
+        await ensure_project_ann_index(project_id)
+    except Exception as e:
+        logger.warning(f"[ANN] Partial index maintenance failed for project {project_id}: {e}")
+
+
+async def sync_project_ann_indexes() -> dict[str, list[str]]:
+    """Build missing indexes and drop unused per-project ones.
+
+    Builds the global compact index for the configured quantization mode (if
+    missing) and per-project partial indexes for large projects; drops
+    partial indexes of deleted projects or of another quantization mode or
+    embedding dimension.
+
+    Returns:
+        Dict with "created" and "dropped" index names
+    """
+    from research_agent.infrastructure.database.session import engine
+
+    settings = get_settings()
+    quantization = get_quantization_mode()
+    created: list[str] = []
+    dropped: list[str] = []
+
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+
+        global_index = GLOBAL_INDEX_NAMES[quantization]
+        expression, opclass = INDEX_EXPRESSIONS[quantization]
+        exists = await conn.execute(
+            text("SELECT 1 FROM pg_indexes WHERE indexname = :name"), {"name": global_index}
+        )
+        if exists.first() is None:
+            logger.info(f"[ANN] Building global index {global_index}")
+            await conn.execute(
+                text(f"""
+                    CREATE INDEX CONCURRENTLY IF NOT EXISTS {global_index}
+                    ON resource_chunks
+                    USING hnsw (({expression}) {opclass})
+                    WITH (m = 16, ef_construction = 64)
+                """)
+            )
+            created.append(global_index)
+        large_projects = await conn.execute(
+            text("""
+                SELECT project_id FROM resource_chunks
+                WHERE embedding IS NOT NULL
+                GROUP BY project_id
+                HAVING count(*) >= :min_chunks
+            """),
+            {"min_chunks": settings.pgvector_partial_index_min_chunks},
+        )
+        project_ids = [row.project_id for row in large_projects]
+
+        existing = await conn.execute(
+            text("""
+                SELECT indexname FROM pg_indexes
+                WHERE tablename = 'resource_chunks' AND indexname LIKE :prefix
+            """),
+            {"prefix": f"{PROJECT_INDEX_PREFIX}%"},
+        )
+        existing_names = {row.indexname for row in existing}
+
+        live_projects = await conn.execute(text("SELECT id FROM projects"))
+        live_names = {project_index_name(row.id, quantization) for row in live_projects}
+
+        for index_name in sorted(existing_names - live_names):
+            await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}"))
+            dropped.append(index_name)
+
+    for project_id in project_ids:
+        if project_index_name(project_id, quantization) in existing_names:
+            continue
+        if await ensure_project_ann_index(project_id):
+            created.append(project_index_name(project_id, quantization))
+
+    logger.info(f"[ANN] Index sync: created={len(created)}, dropped={len(dropped)}")
+    return {"created": created, "dropped": dropped}
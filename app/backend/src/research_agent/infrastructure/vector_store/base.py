@@ -4,6 +4,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from uuid import UUID
 
+import numpy as np
+
 
 @dataclass
 class SearchResult:
@@ -42,6 +44,61 @@ class VectorStore(ABC):
         """
         pass
 
+    async def search_many(
+        self,
+        query_embeddings: list[list[float]],
+        project_id: UUID,
+        limit: int = 5,
+        document_id: UUID | None = None,
+        user_id: str | None = None,
+        document_ids: list[UUID | None] | None = None,
+    ) -> list[list[SearchResult]]:
+        """Search for several query embeddings at once.
+
+        Default implementation runs one search per query. Subclasses can
+        override to answer all queries in a single round trip.
+
+        Args:
+            query_embeddings: Vector embeddings, one per query
+            project_id: Project UUID to filter by
+            limit: Maximum number of results per query
+            document_id: Optional document UUID to filter all queries by
+            user_id: Optional user ID for data isolation
+            document_ids: Optional per-query document filter (same length as
+                         query_embeddings); overrides document_id
+
+        Returns:
+            One list of SearchResult per query, in query order
+        """
+        results = []
+        for query_embedding, query_document_id in zip(
+            query_embeddings, document_ids or [document_id] * len(query_embeddings)
+        ):
+            results.append(
+                await self.search(
+                    query_embedding=query_embedding,
+                    project_id=project_id,
+                    limit=limit,
+                    document_id=query_document_id,
+                    user_id=user_id,
+                )
+            )
+        return results
+
+    async def get_embeddings(self, chunk_ids: list[UUID]) -> dict[UUID, np.ndarray]:
+        """Load stored embeddings for chunks (e.g. for MMR diversification).
+
+        Default implementation returns nothing; callers must cope with
+        missing vectors.
+
+        Args:
+            chunk_ids: Chunk UUIDs
+
+        Returns:
+            Mapping of chunk UUID to its embedding (float32)
+        """
+        return {}
+
     async def hybrid_search(
         self,
         query_embedding: list[float],
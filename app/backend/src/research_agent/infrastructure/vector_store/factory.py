@@ -29,13 +29,23 @@ def get_vector_store(
     if provider == "qdrant":
         from research_agent.infrastructure.vector_store.qdrant import QdrantVectorStore
 
-        return QdrantVectorStore()
+        store: VectorStore = QdrantVectorStore()
     elif provider == "pgvector":
         from research_agent.infrastructure.vector_store.pgvector import PgVectorStore
 
-        return PgVectorStore(session)
+        store = PgVectorStore(session)
+    elif provider == "mmap":
+        from research_agent.infrastructure.vector_store.mmap_index import MmapVectorStore
+
+        store = MmapVectorStore(session)
     else:
         raise ValueError(
             f"Unsupported vector store provider: {provider}. "
-            "Supported providers: pgvector, qdrant"
+            "Supported providers: pgvector, qdrant, mmap"
         )
+
+    if settings.retrieval_cache_enabled:
+        from research_agent.infrastructure.vector_store.retrieval_cache import CachedVectorStore
+
+        store = CachedVectorStore(store, session)
+    return store
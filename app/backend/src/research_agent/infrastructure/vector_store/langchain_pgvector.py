@@ -9,7 +9,9 @@ from langchain_core.retrievers import BaseRetriever
 
 from research_agent.config import get_settings
 from research_agent.infrastructure.embedding.base import EmbeddingService
-from research_agent.infrastructure.vector_store.base import VectorStore
+from research_agent.infrastructure.embedding.request_scope import embed_query
+from research_agent.infrastructure.vector_store.base import SearchResult, VectorStore
+from research_agent.infrastructure.vector_store.mmr import diversify_results
 from research_agent.shared.utils.logger import logger
 
 settings = get_settings()
@@ -27,12 +29,18 @@ class PGVectorRetriever(BaseRetriever):
     keyword_weight: float = 0.3
     document_id: UUID | None = None  # Optional document filter
     user_id: str | None = None  # Optional user filter
+    mmr_lambda: float | None = None  # Enable MMR diversification (None = off)
 
     class Config:
         """Pydantic config."""
 
         arbitrary_types_allowed = True
 
+    @property
+    def uses_mmr(self) -> bool:
+        """Whether retrieval re-selects the top-k with MMR."""
+        return self.mmr_lambda is not None and self.mmr_lambda < 1.0
+
     def _get_relevant_documents(
         self,
         query: str,
@@ -50,7 +58,11 @@ class PGVectorRetriever(BaseRetriever):
     ) -> List[LangChainDocument]:
         """Retrieve relevant documents for a query using vector or hybrid search."""
         # Get query embedding
-        query_embedding = await self.embedding_service.embed(query)
+        query_embedding = await embed_query(self.embedding_service, query)
+
+        # Over-fetch candidates when MMR will re-select the top-k
+        use_mmr = self.uses_mmr
+        limit = self.k * settings.retrieval_mmr_fetch_multiplier if use_mmr else self.k
 
         # Choose search method
         if self.use_hybrid_search:
@@ -59,10 +71,10 @@ class PGVectorRetriever(BaseRetriever):
                 query_embedding=query_embedding,
                 query_text=query,
                 project_id=self.project_id,
-                limit=self.k,
+                limit=limit,
                 vector_weight=self.vector_weight,
                 keyword_weight=self.keyword_weight,
-                k=self.k * 4,  # Retrieve 4x more results for fusion
+                k=limit * 4,  # Retrieve 4x more results for fusion
                 document_id=self.document_id,
                 user_id=self.user_id,
             )
@@ -71,12 +83,60 @@ class PGVectorRetriever(BaseRetriever):
             results = await self.vector_store.search(
                 query_embedding=query_embedding,
                 project_id=self.project_id,
-                limit=self.k,
+                limit=limit,
                 document_id=self.document_id,
                 user_id=self.user_id,
             )
 
-        # Convert to LangChain documents
+        if use_mmr:
+            results = await diversify_results(
+                self.vector_store,
+                query_embedding,
+                results,
+                self.k,
+                self.mmr_lambda,
+                fused=self.use_hybrid_search,
+            )
+
+        return self._to_documents(results)
+
+    async def aget_relevant_documents_by_document(
+        self, query: str, document_ids: List[UUID]
+    ) -> List[LangChainDocument]:
+        """Retrieve the top-k chunks across the given documents (vector search).
+
+        Each document gets its own top-k in one batched search. The merged
+        list takes chunks in rounds: every document's best chunk, then every
+        document's second best, and so on until k, so small documents are
+        not crowded out by large ones. Results are ordered by similarity.
+        """
+        if not document_ids:
+            return []
+
+        query_embedding = await embed_query(self.embedding_service, query)
+        per_document = await self.vector_store.search_many(
+            query_embeddings=[query_embedding] * len(document_ids),
+            project_id=self.project_id,
+            limit=self.k,
+            user_id=self.user_id,
+            document_ids=list(document_ids),
+        )
+
+        by_round = sorted(
+            (
+                (rank, -result.similarity, result)
+                for results in per_document
+                for rank, result in enumerate(results)
+            ),
+            key=lambda item: item[:2],
+        )
+        selected = [result for _, _, result in by_round[: self.k]]
+        selected.sort(key=lambda result: result.similarity, reverse=True)
+        return self._to_documents(selected)
+
+    @staticmethod
+    def _to_documents(results: List[SearchResult]) -> List[LangChainDocument]:
+        """Convert search results to LangChain documents."""
         return [
             LangChainDocument(
                 page_content=result.content,
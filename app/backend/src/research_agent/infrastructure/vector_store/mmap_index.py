@@ -0,0 +1,438 @@
+"""In-process memory-mapped vector index for small and medium projects.
+
+Each project's chunk embeddings are snapshotted from PostgreSQL into a
+float16 ``.npy`` matrix (rows L2-normalized) plus a small metadata file, and
+searched exactly with NumPy dot products. The matrix is opened with
+``mmap_mode="r"`` so every worker process on the host shares the same page
+cache instead of holding its own copy.
+
+PostgreSQL stays the source of truth:
+
+- snapshots are built lazily on the first search of a project. Each records
+  the ``projects.corpus_version`` it was built at (the version is bumped in
+  the same transaction as every chunk write/delete); a search that finds a
+  different version rebuilds the snapshot, whichever host or process wrote
+  the chunks. ``invalidate_project_vectors`` additionally drops the snapshot
+  right away where the writer can reach the files.
+- chunk content is always read from ``resource_chunks`` by primary key, so a
+  chunk deleted after the snapshot was taken is never returned
+- projects above ``vector_mmap_max_chunks`` are searched in PostgreSQL
+
+Files live in ``vector_mmap_dir``. A ``<project>.current`` pointer names the
+active generation; rebuilding writes a new generation and swaps the pointer
+atomically, so processes that still map the old files are unaffected.
+A build reads the version before the chunks, so a write committed during
+the build leaves the snapshot one version behind and the next search
+rebuilds it.
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from research_agent.config import get_settings
+from research_agent.infrastructure.database.models import ResourceChunkModel
+from research_agent.infrastructure.vector_store.ann_index import (
+    EMBEDDING_DIMENSIONS,
+    get_project_stats,
+)
+from research_agent.infrastructure.vector_store.base import SearchResult, VectorStore
+from research_agent.infrastructure.vector_store.retrieval_cache import get_corpus_version
+from research_agent.shared.utils.logger import logger
+
+# Rows converted to float32 per matmul block (~24 MB of scratch at 1536 dims)
+SCAN_BLOCK_ROWS = 4096
+
+# Rows fetched per round trip while building a snapshot
+BUILD_FETCH_ROWS = 2000
+
+
+@dataclass
+class ProjectVectorIndex:
+    """Memory-mapped embeddings and row metadata for one project."""
+
+    generation: str
+    corpus_version: int  # projects.corpus_version the snapshot was built at
+    matrix: np.ndarray  # (n, dims) float16, rows L2-normalized, mmap
+    chunk_ids: np.ndarray  # (n,) str
+    document_ids: np.ndarray  # (n,) str
+    user_ids: np.ndarray  # (n,) str, "" when unset
+    page_numbers: np.ndarray  # (n,) int32
+
+    def __len__(self) -> int:
+        return int(self.matrix.shape[0])
+
+    def top_k(
+        self,
+        query_embedding: list[float],
+        limit: int,
+        document_id: UUID | None = None,
+        user_id: str | None = None,
+    ) -> list[tuple[int, float]]:
+        """Exact cosine top-k; returns (row, similarity) best first."""
+        if len(self) == 0 or limit <= 0:
+            return []
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(query))
+        if norm == 0.0:
+            return []
+        query /= norm
+
+        mask = None
+        if user_id:
+            mask = self.user_ids == user_id
+        if document_id:
+            doc_mask = self.document_ids == str(document_id)
+            mask = doc_mask if mask is None else mask & doc_mask
+
+        rows = np.arange(len(self)) if mask is None else np.flatnonzero(mask)
+        if rows.size == 0:
+            return []
+
+        scores = np.empty(rows.size, dtype=np.float32)
+        for start in range(0, rows.size, SCAN_BLOCK_ROWS):
+            block_rows = rows[start : start + SCAN_BLOCK_ROWS]
+            if mask is None:
+                block = self.matrix[block_rows[0] : block_rows[-1] + 1]
+            else:
+                block = self.matrix[block_rows]
+            scores[start : start + block_rows.size] = block.astype(np.float32) @ query
+
+        k = min(limit, rows.size)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(int(rows[i]), float(scores[i])) for i in top]
+
+
+# project_id -> loaded index (per process)
+_loaded: dict[UUID, ProjectVectorIndex] = {}
+_build_locks: dict[UUID, asyncio.Lock] = {}
+
+
+def _index_dir() -> Path:
+    return Path(get_settings().vector_mmap_dir)
+
+
+def _pointer_path(project_id: UUID) -> Path:
+    return _index_dir() / f"{project_id.hex}.current"
+
+
+def _matrix_path(project_id: UUID, generation: str) -> Path:
+    return _index_dir() / f"{project_id.hex}.{generation}.npy"
+
+
+def _meta_path(project_id: UUID, generation: str) -> Path:
+    return _index_dir() / f"{project_id.hex}.{generation}.meta.npz"
+
+
+def _current_generation(project_id: UUID) -> str | None:
+    try:
+        return _pointer_path(project_id).read_text().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def invalidate_project_vectors(project_id: UUID) -> None:
+    """Mark a project's snapshot stale after its chunks changed.
+
+    Removes the generation pointer; every process notices on its next search
+    and the snapshot is rebuilt from PostgreSQL.
+    """
+    _loaded.pop(project_id, None)
+    try:
+        _pointer_path(project_id).unlink()
+        logger.debug(f"[MmapIndex] Invalidated vectors for project {project_id}")
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"[MmapIndex] Failed to invalidate project {project_id}: {e}")
+
+
+def load_project_index(project_id: UUID) -> ProjectVectorIndex | None:
+    """Map the project's current snapshot, reusing it if already loaded."""
+    generation = _current_generation(project_id)
+    if generation is None:
+        _loaded.pop(project_id, None)
+        return None
+
+    cached = _loaded.get(project_id)
+    if cached and cached.generation == generation:
+        return cached
+
+    try:
+        matrix = np.load(_matrix_path(project_id, generation), mmap_mode="r")
+        with np.load(_meta_path(project_id, generation)) as meta:
+            index = ProjectVectorIndex(
+                generation=generation,
+                # Snapshots written before versions were recorded are always stale
+                corpus_version=int(meta["corpus_version"]) if "corpus_version" in meta else -1,
+                matrix=matrix,
+                chunk_ids=meta["chunk_ids"],
+                document_ids=meta["document_ids"],
+                user_ids=meta["user_ids"],
+                page_numbers=meta["page_numbers"],
+            )
+    except (FileNotFoundError, ValueError) as e:
+        # Pointer swapped or files removed between reads; rebuild
+        logger.warning(f"[MmapIndex] Snapshot {generation} for {project_id} unreadable: {e}")
+        return None
+
+    _loaded[project_id] = index
+    return index
+
+
+async def build_project_index(session: AsyncSession, project_id: UUID) -> ProjectVectorIndex | None:
+    """Snapshot a project's embeddings from PostgreSQL into a new generation.
+
+    Returns None if the new files were replaced before they could be loaded.
+    """
+    started = time.perf_counter()
+    version = await get_corpus_version(session, project_id)
+
+    chunk_ids: list[str] = []
+    document_ids: list[str] = []
+    user_ids: list[str] = []
+    page_numbers: list[int] = []
+    vectors: list[np.ndarray] = []
+
+    stream = await session.stream(
+        select(
+            ResourceChunkModel.id,
+            ResourceChunkModel.resource_id,
+            ResourceChunkModel.user_id,
+            ResourceChunkModel.chunk_metadata["page_number"].astext.label("page_number"),
+            ResourceChunkModel.embedding,
+        )
+        .where(ResourceChunkModel.project_id == project_id)
+        .where(ResourceChunkModel.embedding.isnot(None))
+        .execution_options(yield_per=BUILD_FETCH_ROWS)
+    )
+    async for rows in stream.partitions(BUILD_FETCH_ROWS):
+        for row in rows:
+            chunk_ids.append(str(row.id))
+            document_ids.append(str(row.resource_id))
+            user_ids.append(row.user_id or "")
+            page_numbers.append(int(row.page_number) if row.page_number else 0)
+            vectors.append(np.asarray(row.embedding, dtype=np.float32))
+
+    matrix = (
+        np.vstack(vectors)
+        if vectors
+        else np.empty((0, EMBEDDING_DIMENSIONS), dtype=np.float32)
+    )
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    matrix = (matrix / norms).astype(np.float16)
+
+    directory = _index_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    generation = f"{time.time_ns():x}{os.getpid():x}"
+    previous = _current_generation(project_id)
+
+    np.save(_matrix_path(project_id, generation), matrix)
+    np.savez(
+        _meta_path(project_id, generation),
+        chunk_ids=np.array(chunk_ids, dtype=str),
+        document_ids=np.array(document_ids, dtype=str),
+        user_ids=np.array(user_ids, dtype=str),
+        page_numbers=np.array(page_numbers, dtype=np.int32),
+        corpus_version=np.int64(version),
+    )
+
+    pointer_tmp = directory / f"{project_id.hex}.{generation}.tmp"
+    pointer_tmp.write_text(generation)
+    os.replace(pointer_tmp, _pointer_path(project_id))
+
+    # Old generation may still be mapped elsewhere; unlinking is safe on POSIX
+    if previous and previous != generation:
+        for path in (_matrix_path(project_id, previous), _meta_path(project_id, previous)):
+            path.unlink(missing_ok=True)
+
+    logger.info(
+        f"[MmapIndex] Built snapshot for project {project_id}: {len(chunk_ids)} chunks "
+        f"in {(time.perf_counter() - started) * 1000:.0f}ms"
+    )
+    return load_project_index(project_id)
+
+
+class MmapVectorStore(VectorStore):
+    """Exact in-process vector search over memory-mapped project snapshots.
+
+    Falls back to the wrapped PostgreSQL store for projects too large to
+    snapshot and for hybrid (keyword) search.
+    """
+
+    def __init__(self, session: AsyncSession, fallback: VectorStore | None = None):
+        """Initialize mmap store.
+
+        Args:
+            session: SQLAlchemy async session (snapshot builds and content reads)
+            fallback: Store used for large projects and hybrid search;
+                      defaults to PgVectorStore on the same session
+        """
+        if fallback is None:
+            from research_agent.infrastructure.vector_store.pgvector import PgVectorStore
+
+            fallback = PgVectorStore(session)
+        self._session = session
+        self._fallback = fallback
+
+    async def search(
+        self,
+        query_embedding: list[float],
+        project_id: UUID,
+        limit: int = 5,
+        document_id: UUID | None = None,
+        user_id: str | None = None,
+    ) -> list[SearchResult]:
+        """Exact search on the project's snapshot (PostgreSQL if too large)."""
+        index = await self._get_index(project_id)
+        if index is None:
+            return await self._fallback.search(
+                query_embedding=query_embedding,
+                project_id=project_id,
+                limit=limit,
+                document_id=document_id,
+                user_id=user_id,
+            )
+
+        if not user_id:
+            logger.warning(
+                "[VectorStore] Search called without user_id - results may include other users' data"
+            )
+
+        started = time.perf_counter()
+        hits = index.top_k(query_embedding, limit, document_id=document_id, user_id=user_id)
+        logger.debug(
+            f"[MmapIndex] project={project_id} rows={len(index)} hits={len(hits)} "
+            f"scan={(time.perf_counter() - started) * 1000:.2f}ms"
+        )
+        return (await self._to_results(index, [hits]))[0]
+
+    async def search_many(
+        self,
+        query_embeddings: list[list[float]],
+        project_id: UUID,
+        limit: int = 5,
+        document_id: UUID | None = None,
+        user_id: str | None = None,
+        document_ids: list[UUID | None] | None = None,
+    ) -> list[list[SearchResult]]:
+        """Exact search for several queries; one content read for all hits."""
+        index = await self._get_index(project_id)
+        if index is None:
+            return await self._fallback.search_many(
+                query_embeddings=query_embeddings,
+                project_id=project_id,
+                limit=limit,
+                document_id=document_id,
+                user_id=user_id,
+                document_ids=document_ids,
+            )
+
+        per_query_documents = document_ids or [document_id] * len(query_embeddings)
+        hits = [
+            index.top_k(query_embedding, limit, document_id=query_document_id, user_id=user_id)
+            for query_embedding, query_document_id in zip(query_embeddings, per_query_documents)
+        ]
+        return await self._to_results(index, hits)
+
+    async def get_embeddings(self, chunk_ids: list[UUID]) -> dict[UUID, np.ndarray]:
+        """Embeddings from the loaded snapshot, else from the fallback store."""
+        if not chunk_ids:
+            return {}
+
+        wanted = {str(chunk_id) for chunk_id in chunk_ids}
+        for index in _loaded.values():
+            rows = np.flatnonzero(np.isin(index.chunk_ids, list(wanted)))
+            if rows.size == len(wanted):
+                return {
+                    UUID(index.chunk_ids[row]): index.matrix[row].astype(np.float32)
+                    for row in rows
+                }
+        return await self._fallback.get_embeddings(chunk_ids)
+
+    async def hybrid_search(
+        self,
+        query_embedding: list[float],
+        query_text: str,
+        project_id: UUID,
+        limit: int = 5,
+        vector_weight: float = 0.7,
+        keyword_weight: float = 0.3,
+        k: int = 20,
+        document_id: UUID | None = None,
+        user_id: str | None = None,
+    ) -> list[SearchResult]:
+        """Keyword ranking needs PostgreSQL; delegate to the fallback store."""
+        return await self._fallback.hybrid_search(
+            query_embedding=query_embedding,
+            query_text=query_text,
+            project_id=project_id,
+            limit=limit,
+            vector_weight=vector_weight,
+            keyword_weight=keyword_weight,
+            k=k,
+            document_id=document_id,
+            user_id=user_id,
+        )
+
+    async def _get_index(self, project_id: UUID) -> ProjectVectorIndex | None:
+        """Load the project's snapshot, (re)building it if missing or stale and small enough."""
+        version = await get_corpus_version(self._session, project_id)
+        index = load_project_index(project_id)
+        if index is not None and index.corpus_version == version:
+            return index
+
+        stats = await get_project_stats(self._session, project_id)
+        if stats.chunk_count > get_settings().vector_mmap_max_chunks:
+            return None
+
+        lock = _build_locks.setdefault(project_id, asyncio.Lock())
+        async with lock:
+            index = load_project_index(project_id)
+            if index is None or index.corpus_version != version:
+                index = await build_project_index(self._session, project_id)
+        return index
+
+    async def _to_results(
+        self, index: ProjectVectorIndex, hits_per_query: list[list[tuple[int, float]]]
+    ) -> list[list[SearchResult]]:
+        """Attach content (read by primary key) to snapshot hits."""
+        chunk_ids = {index.chunk_ids[row] for hits in hits_per_query for row, _ in hits}
+        contents = await self._fetch_contents(list(chunk_ids)) if chunk_ids else {}
+
+        results: list[list[SearchResult]] = []
+        for hits in hits_per_query:
+            query_results = []
+            for row, similarity in hits:
+                chunk_id = index.chunk_ids[row]
+                if chunk_id not in contents:
+                    continue  # Deleted since the snapshot was built
+                query_results.append(
+                    SearchResult(
+                        chunk_id=UUID(chunk_id),
+                        document_id=UUID(index.document_ids[row]),
+                        content=contents[chunk_id],
+                        page_number=int(index.page_numbers[row]),
+                        similarity=similarity,
+                    )
+                )
+            results.append(query_results)
+        return results
+
+    async def _fetch_contents(self, chunk_ids: list[str]) -> dict[str, str]:
+        """Read chunk content for the hits by primary key."""
+        result = await self._session.execute(
+            text("SELECT id, content FROM resource_chunks WHERE id = ANY(cast(:ids as uuid[]))"),
+            {"ids": chunk_ids},
+        )
+        return {str(row.id): row.content for row in result}
@@ -0,0 +1,126 @@
+"""Maximal Marginal Relevance (MMR) diversification of search results.
+
+Chunks are cut with overlap, so neighbouring chunks of the same passage
+often fill the top-k together. MMR re-selects k results from a larger
+candidate pool, trading relevance to the query against similarity to the
+results already picked:
+
+    score(d) = lambda * sim(q, d) - (1 - lambda) * max_{s in selected} sim(d, s)
+
+``lambda = 1`` is plain relevance order; lower values favour diversity.
+For fused (hybrid) results, relevance is the fused score scaled to [0, 1]
+rather than the vector similarity, so MMR keeps the keyword signal.
+The candidate-candidate similarity matrix is computed once with a single
+matrix product, so selection is O(n * k) cheap vector updates.
+"""
+
+from typing import Sequence
+
+import numpy as np
+
+from research_agent.infrastructure.vector_store.base import SearchResult, VectorStore
+from research_agent.shared.utils.logger import logger
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def mmr_select(
+    query_embedding: Sequence[float] | np.ndarray,
+    candidate_embeddings: np.ndarray,
+    k: int,
+    lambda_mult: float,
+    relevance: Sequence[float] | np.ndarray | None = None,
+) -> list[int]:
+    """Pick k candidate indices by MMR.
+
+    Args:
+        query_embedding: Query vector (d,)
+        candidate_embeddings: Candidate vectors (n, d)
+        k: Number of results to select
+        lambda_mult: Relevance/diversity trade-off in [0, 1]
+        relevance: Relevance of each candidate in [0, 1] (n,); defaults to
+            cosine similarity to the query
+
+    Returns:
+        Selected candidate indices in selection order
+    """
+    n = len(candidate_embeddings)
+    if n == 0 or k <= 0:
+        return []
+
+    candidates = _normalize(np.asarray(candidate_embeddings, dtype=np.float32))
+    query = _normalize(np.asarray(query_embedding, dtype=np.float32))
+
+    relevance = candidates @ query if relevance is None else np.asarray(relevance, dtype=np.float32)
+    pairwise = candidates @ candidates.T
+
+    selected = [int(np.argmax(relevance))]
+    # Highest similarity of each candidate to anything selected so far
+    redundancy = pairwise[selected[0]].copy()
+    available = np.ones(n, dtype=bool)
+    available[selected[0]] = False
+
+    while len(selected) < min(k, n):
+        scores = lambda_mult * relevance - (1 - lambda_mult) * redundancy
+        scores[~available] = -np.inf
+        best = int(np.argmax(scores))
+        selected.append(best)
+        available[best] = False
+        np.maximum(redundancy, pairwise[best], out=redundancy)
+
+    return selected
+
+
+def _scaled_scores(results: list[SearchResult]) -> np.ndarray:
+    """Min-max scale result scores to [0, 1], comparable with cosine redundancy."""
+    scores = np.array([r.similarity for r in results], dtype=np.float32)
+    spread = scores.max() - scores.min()
+    if spread == 0:
+        return np.ones_like(scores)
+    return (scores - scores.min()) / spread
+
+
+async def diversify_results(
+    vector_store: VectorStore,
+    query_embedding: Sequence[float],
+    results: list[SearchResult],
+    k: int,
+    lambda_mult: float,
+    fused: bool = False,
+) -> list[SearchResult]:
+    """Re-select k of the over-fetched results with MMR.
+
+    With ``fused``, the results' own scores (e.g. RRF from hybrid search)
+    are the relevance term instead of cosine similarity to the query.
+    Results whose embedding cannot be loaded keep their original rank after
+    the diversified ones; if none can be loaded the top-k is returned as is.
+    """
+    if len(results) <= k:
+        return results
+
+    embeddings = await vector_store.get_embeddings([r.chunk_id for r in results])
+    with_vectors = [r for r in results if r.chunk_id in embeddings]
+    if not with_vectors:
+        logger.warning("[MMR] No candidate embeddings available, skipping diversification")
+        return results[:k]
+
+    order = mmr_select(
+        query_embedding,
+        np.vstack([embeddings[r.chunk_id] for r in with_vectors]),
+        k,
+        lambda_mult,
+        relevance=_scaled_scores(with_vectors) if fused else None,
+    )
+    diversified = [with_vectors[i] for i in order]
+    if len(diversified) < k:
+        picked = {r.chunk_id for r in diversified}
+        diversified += [r for r in results if r.chunk_id not in picked][: k - len(diversified)]
+
+    logger.debug(
+        f"[MMR] Selected {len(diversified)} of {len(results)} candidates (lambda={lambda_mult})"
+    )
+    return diversified
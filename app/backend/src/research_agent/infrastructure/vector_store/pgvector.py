@@ -1,6 +1,5 @@
 """pgvector implementation for vector search with hybrid search support."""
 
-import asyncio
 from typing import Any, Dict, List
 from uuid import UUID
 
@@ -8,15 +7,40 @@ from sqlalchemy import bindparam, text
 from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from research_agent.config import get_settings
+from research_agent.infrastructure.database.vector_params import vector_param, vector_result
+from research_agent.infrastructure.vector_store.ann_index import (
+    EMBEDDING_DIMENSIONS,
+    AnnSearchPlan,
+    apply_planner_settings,
+    nearest_neighbors_sql,
+    plan_project_search,
+)
 from research_agent.infrastructure.vector_store.base import SearchResult, VectorStore
 from research_agent.shared.utils.logger import logger
 
+HYBRID_FUSION_MODES = ("python", "sql")
+
 
 class PgVectorStore(VectorStore):
     """PostgreSQL pgvector implementation with hybrid search."""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, hybrid_fusion: str | None = None):
+        """Initialize pgvector store.
+
+        Args:
+            session: SQLAlchemy async session
+            hybrid_fusion: "python" (two queries + RRF in Python) or "sql"
+                          (single statement with RRF in SQL). Defaults to
+                          PGVECTOR_HYBRID_FUSION from config.
+        """
         self._session = session
+        self._hybrid_fusion = hybrid_fusion or get_settings().pgvector_hybrid_fusion
+        if self._hybrid_fusion not in HYBRID_FUSION_MODES:
+            raise ValueError(
+                f"Unsupported hybrid fusion mode: {self._hybrid_fusion}. "
+                f"Supported modes: {', '.join(HYBRID_FUSION_MODES)}"
+            )
 
     async def _ensure_clean_transaction(self) -> None:
         """
@@ -51,15 +75,22 @@ class PgVectorStore(VectorStore):
         # Ensure clean transaction state before executing query
         await self._ensure_clean_transaction()
 
-        # Convert embedding to pgvector format string
-        embedding_str = "[" + ",".join(map(str, query_embedding)) + "]"
+        embedding = vector_param(query_embedding)
+
+        # Pick exact / partial index / global index strategy for this project;
+        # one document is always searched exactly (see search_many)
+        plan = await plan_project_search(self._session, project_id, limit)
+        if document_id:
+            plan = plan.exact()
+        project_filter, project_params = plan.project_filter()
 
         # Build query
-        where_clause = "project_id = cast(:project_id as uuid) AND embedding IS NOT NULL"
+        where_clause = f"{project_filter} AND embedding IS NOT NULL"
         params = {
-            "embedding": embedding_str,
-            "project_id": str(project_id),
+            "embedding": embedding,
             "limit": limit,
+            **project_params,
+            **plan.stage_params(),
         }
 
         if user_id:
@@ -74,7 +105,7 @@ class PgVectorStore(VectorStore):
         debug_params = params.copy()
         debug_params["embedding"] = "..."  # Truncate for logging
         logger.info(
-            f"[VectorStore] Search Params: project_id={project_id}, document_id={document_id}, user_id={user_id}, limit={limit}"
+            f"[VectorStore] Search Params: project_id={project_id}, document_id={document_id}, user_id={user_id}, limit={limit}, ann={plan.strategy}, quantization={plan.quantization}"
         )
 
         if document_id:
@@ -83,29 +114,20 @@ class PgVectorStore(VectorStore):
 
         # Use explicit parameter binding for asyncpg compatibility
         query = text(f"""
-            SELECT 
-                id,
-                resource_id as document_id,
-                content,
-                (metadata->>'page_number')::int as page_number,
-                1 - (embedding <=> cast(:embedding as vector)) AS similarity
-            FROM resource_chunks
-            WHERE {where_clause}
-            ORDER BY embedding <=> cast(:embedding as vector)
-            LIMIT :limit
+            WITH nearest AS ({nearest_neighbors_sql(plan, where_clause)}
+            )
+            SELECT
+                c.id,
+                c.resource_id as document_id,
+                c.content,
+                (c.metadata->>'page_number')::int as page_number,
+                1 - n.distance AS similarity
+            FROM nearest n
+            JOIN resource_chunks c ON c.id = n.id
+            ORDER BY n.distance
         """).bindparams(*[bindparam(k, value=v) for k, v in params.items()])
 
-        try:
-            result = await self._session.execute(query)
-        except DBAPIError as e:
-            if "InFailedSQLTransactionError" in str(e) or "current transaction is aborted" in str(
-                e
-            ):
-                logger.warning("Transaction failed during search, rolling back and retrying...")
-                await self._session.rollback()
-                result = await self._session.execute(query)
-            else:
-                raise
+        result = await self._execute_planned(query, plan, "search")
 
         rows = result.fetchall()
         return [
@@ -119,6 +141,149 @@ class PgVectorStore(VectorStore):
             for row in rows
         ]
 
+    async def search_many(
+        self,
+        query_embeddings: List[List[float]],
+        project_id: UUID,
+        limit: int = 5,
+        document_id: UUID | None = None,
+        user_id: str | None = None,
+        document_ids: List[UUID | None] | None = None,
+    ) -> List[List[SearchResult]]:
+        """
+        Top-k search for several query embeddings in one statement.
+
+        Each query becomes a row of a VALUES list that is LATERAL-joined to
+        the same nearest-neighbour subquery used by search(), so every query
+        keeps its own top-k and the batch costs a single round trip.
+
+        Queries scoped to a document run as a second statement with exact
+        ordering: an HNSW walk post-filtered to one document can come back
+        short (or empty) once the iterative scan gives up.
+        """
+        if not query_embeddings:
+            return []
+
+        await self._ensure_clean_transaction()
+
+        plan = await plan_project_search(self._session, project_id, limit)
+
+        if document_ids is None and document_id:
+            document_ids = [document_id] * len(query_embeddings)
+        scoped = [i for i in range(len(query_embeddings)) if document_ids and document_ids[i]]
+        unscoped = sorted(set(range(len(query_embeddings))) - set(scoped))
+
+        if not user_id:
+            logger.warning(
+                "[VectorStore] Search called without user_id - results may include other users' data"
+            )
+
+        grouped: List[List[SearchResult]] = [[] for _ in query_embeddings]
+        groups = (
+            (unscoped, None, plan),
+            (scoped, [document_ids[i] for i in scoped] if scoped else None, plan.exact()),
+        )
+        for indices, group_document_ids, group_plan in groups:
+            if not indices:
+                continue
+            results = await self._search_group(
+                [query_embeddings[i] for i in indices],
+                group_document_ids,
+                group_plan,
+                limit,
+                user_id,
+            )
+            for i, group_results in zip(indices, results):
+                grouped[i] = group_results
+        return grouped
+
+    async def _search_group(
+        self,
+        query_embeddings: List[List[float]],
+        document_ids: List[UUID] | None,
+        plan: AnnSearchPlan,
+        limit: int,
+        user_id: str | None,
+    ) -> List[List[SearchResult]]:
+        """One batched statement for search_many (document_ids: one per query)."""
+        project_filter, project_params = plan.project_filter()
+
+        where_clause = f"{project_filter} AND embedding IS NOT NULL"
+        params: Dict[str, Any] = {
+            "limit": limit,
+            **project_params,
+            **plan.stage_params(),
+        }
+
+        if user_id:
+            where_clause += " AND user_id = :user_id"
+            params["user_id"] = user_id
+        if document_ids is not None:
+            where_clause += " AND resource_id = q.query_document_id"
+
+        # One VALUES row per query; each vector is its own (binary) parameter
+        values = []
+        for i, query_embedding in enumerate(query_embeddings):
+            params[f"embedding_{i}"] = vector_param(query_embedding)
+            params[f"document_id_{i}"] = str(document_ids[i]) if document_ids is not None else None
+            values.append(
+                f"({i}, cast(:embedding_{i} as vector({EMBEDDING_DIMENSIONS})), "
+                f"cast(:document_id_{i} as uuid))"
+            )
+
+        logger.info(
+            f"[VectorStore] Batched search: project_id={plan.project_id}, queries={len(values)}, "
+            f"user_id={user_id}, limit={limit}, ann={plan.strategy}, quantization={plan.quantization}"
+        )
+
+        query = text(f"""
+            WITH q (query_index, query_vector, query_document_id) AS (
+                VALUES {", ".join(values)}
+            )
+            SELECT
+                q.query_index,
+                c.id,
+                c.resource_id as document_id,
+                c.content,
+                (c.metadata->>'page_number')::int as page_number,
+                1 - n.distance AS similarity
+            FROM q
+            CROSS JOIN LATERAL ({nearest_neighbors_sql(plan, where_clause, query="q.query_vector")}
+            ) n
+            JOIN resource_chunks c ON c.id = n.id
+            ORDER BY q.query_index, n.distance
+        """).bindparams(*[bindparam(k, value=v) for k, v in params.items()])
+
+        result = await self._execute_planned(query, plan, "batched search")
+
+        grouped: List[List[SearchResult]] = [[] for _ in query_embeddings]
+        for row in result.fetchall():
+            grouped[row.query_index].append(
+                SearchResult(
+                    chunk_id=row.id,
+                    document_id=row.document_id,
+                    content=row.content,
+                    page_number=row.page_number or 0,
+                    similarity=float(row.similarity),
+                )
+            )
+        return grouped
+
+    async def get_embeddings(self, chunk_ids: List[UUID]) -> Dict[UUID, Any]:
+        """Load stored embeddings for chunks by primary key."""
+        if not chunk_ids:
+            return {}
+
+        result = await self._session.execute(
+            text("""
+                SELECT id, embedding
+                FROM resource_chunks
+                WHERE id = ANY(cast(:ids as uuid[])) AND embedding IS NOT NULL
+            """),
+            {"ids": [str(chunk_id) for chunk_id in chunk_ids]},
+        )
+        return {row.id: vector_result(row.embedding) for row in result.fetchall()}
+
     async def hybrid_search(
         self,
         query_embedding: List[float],
@@ -148,16 +313,34 @@ class PgVectorStore(VectorStore):
             List of SearchResult sorted by RRF score
         """
         logger.info(
-            f"Hybrid search: vector_weight={vector_weight}, keyword_weight={keyword_weight}, k={k}, user_id={user_id}"
+            f"Hybrid search: vector_weight={vector_weight}, keyword_weight={keyword_weight}, k={k}, user_id={user_id}, fusion={self._hybrid_fusion}"
         )
 
-        # Ensure clean transaction state before parallel searches
+        # Ensure clean transaction state before the searches
         await self._ensure_clean_transaction()
 
-        # Run both searches in parallel
-        vector_results, keyword_results = await asyncio.gather(
-            self._vector_search(query_embedding, project_id, k, document_id, user_id),
-            self._keyword_search(query_text, project_id, k, document_id, user_id),
+        if self._hybrid_fusion == "sql":
+            fused_results = await self._hybrid_search_sql(
+                query_embedding=query_embedding,
+                query_text=query_text,
+                project_id=project_id,
+                limit=limit,
+                vector_weight=vector_weight,
+                keyword_weight=keyword_weight,
+                k=k,
+                document_id=document_id,
+                user_id=user_id,
+            )
+            logger.info(f"Hybrid search (sql) returned {len(fused_results)} results")
+            return fused_results
+
+        # Sequential: both searches share one AsyncSession, which does not
+        # support concurrent operations
+        vector_results = await self._vector_search(
+            query_embedding, project_id, k, document_id, user_id
+        )
+        keyword_results = await self._keyword_search(
+            query_text, project_id, k, document_id, user_id
         )
 
         # Apply Reciprocal Rank Fusion (RRF)
@@ -181,13 +364,19 @@ class PgVectorStore(VectorStore):
         user_id: str | None = None,
     ) -> List[Dict[str, Any]]:
         """Vector similarity search returning raw results."""
-        embedding_str = "[" + ",".join(map(str, query_embedding)) + "]"
+        embedding = vector_param(query_embedding)
+
+        plan = await plan_project_search(self._session, project_id, limit)
+        if document_id:
+            plan = plan.exact()
+        project_filter, project_params = plan.project_filter()
 
-        where_clause = "project_id = cast(:project_id as uuid) AND embedding IS NOT NULL"
+        where_clause = f"{project_filter} AND embedding IS NOT NULL"
         params = {
-            "embedding": embedding_str,
-            "project_id": str(project_id),
+            "embedding": embedding,
             "limit": limit,
+            **project_params,
+            **plan.stage_params(),
         }
 
         if user_id:
@@ -199,31 +388,20 @@ class PgVectorStore(VectorStore):
             params["document_id"] = str(document_id)
 
         query = text(f"""
-            SELECT 
-                id,
-                resource_id as document_id,
-                content,
-                (metadata->>'page_number')::int as page_number,
-                1 - (embedding <=> cast(:embedding as vector)) AS score
-            FROM resource_chunks
-            WHERE {where_clause}
-            ORDER BY embedding <=> cast(:embedding as vector)
-            LIMIT :limit
+            WITH nearest AS ({nearest_neighbors_sql(plan, where_clause)}
+            )
+            SELECT
+                c.id,
+                c.resource_id as document_id,
+                c.content,
+                (c.metadata->>'page_number')::int as page_number,
+                1 - n.distance AS score
+            FROM nearest n
+            JOIN resource_chunks c ON c.id = n.id
+            ORDER BY n.distance
         """).bindparams(*[bindparam(k, value=v) for k, v in params.items()])
 
-        try:
-            result = await self._session.execute(query)
-        except DBAPIError as e:
-            if "InFailedSQLTransactionError" in str(e) or "current transaction is aborted" in str(
-                e
-            ):
-                logger.warning(
-                    "Transaction failed during vector search, rolling back and retrying..."
-                )
-                await self._session.rollback()
-                result = await self._session.execute(query)
-            else:
-                raise
+        result = await self._execute_planned(query, plan, "vector search")
 
         rows = result.fetchall()
 
@@ -306,6 +484,130 @@ class PgVectorStore(VectorStore):
             for row in rows
         ]
 
+    async def _hybrid_search_sql(
+        self,
+        query_embedding: List[float],
+        query_text: str,
+        project_id: UUID,
+        limit: int,
+        vector_weight: float,
+        keyword_weight: float,
+        k: int,
+        document_id: UUID | None = None,
+        user_id: str | None = None,
+        rrf_k: int = 60,  # RRF constant, same as _reciprocal_rank_fusion
+    ) -> List[SearchResult]:
+        """
+        Hybrid search with vector ranking, keyword ranking and weighted RRF
+        in a single SQL statement.
+
+        Produces the same ranking as _vector_search + _keyword_search +
+        _reciprocal_rank_fusion, but in one round trip and returning content
+        only for the final `limit` rows.
+        """
+        embedding = vector_param(query_embedding)
+
+        plan = await plan_project_search(self._session, project_id, k)
+        if document_id:
+            plan = plan.exact()
+        filter_clause, project_params = plan.project_filter()
+        params = {
+            "embedding": embedding,
+            "query": query_text.strip(),
+            **project_params,
+            **plan.stage_params(),
+            "k": k,
+            "limit": limit,
+            "vector_weight": vector_weight,
+            "keyword_weight": keyword_weight,
+            "rrf_k": rrf_k,
+        }
+
+        if user_id:
+            filter_clause += " AND user_id = :user_id"
+            params["user_id"] = user_id
+
+        if document_id:
+            filter_clause += " AND resource_id = cast(:document_id as uuid)"
+            params["document_id"] = str(document_id)
+
+        query = text(f"""
+            WITH vector_hits AS ({nearest_neighbors_sql(plan, f"{filter_clause} AND embedding IS NOT NULL", "k")}
+            ),
+            vector_ranked AS (
+                SELECT id, ROW_NUMBER() OVER (ORDER BY distance) AS rank
+                FROM vector_hits
+            ),
+            keyword_hits AS (
+                SELECT id, ts_rank_cd(content_tsvector, websearch_to_tsquery('english', :query)) AS score
+                FROM resource_chunks
+                WHERE {filter_clause}
+                    AND content_tsvector @@ websearch_to_tsquery('english', :query)
+                ORDER BY score DESC
+                LIMIT :k
+            ),
+            keyword_ranked AS (
+                SELECT id, ROW_NUMBER() OVER (ORDER BY score DESC) AS rank
+                FROM keyword_hits
+            ),
+            fused AS (
+                SELECT
+                    COALESCE(v.id, kw.id) AS id,
+                    COALESCE(cast(:vector_weight as double precision) / (:rrf_k + v.rank), 0)
+                        + COALESCE(cast(:keyword_weight as double precision) / (:rrf_k + kw.rank), 0)
+                        AS score
+                FROM vector_ranked v
+                FULL OUTER JOIN keyword_ranked kw ON v.id = kw.id
+                ORDER BY score DESC
+                LIMIT :limit
+            )
+            SELECT
+                c.id,
+                c.resource_id as document_id,
+                c.content,
+                (c.metadata->>'page_number')::int as page_number,
+                f.score
+            FROM fused f
+            JOIN resource_chunks c ON c.id = f.id
+            ORDER BY f.score DESC
+        """).bindparams(*[bindparam(k, value=v) for k, v in params.items()])
+
+        result = await self._execute_planned(query, plan, "hybrid search")
+
+        rows = result.fetchall()
+        return [
+            SearchResult(
+                chunk_id=row.id,
+                document_id=row.document_id,
+                content=row.content,
+                page_number=row.page_number or 0,
+                similarity=float(row.score),  # Use RRF score as similarity
+            )
+            for row in rows
+        ]
+
+    async def _execute_planned(self, query: Any, plan: AnnSearchPlan, operation: str) -> Any:
+        """Execute a vector query under the ANN plan's planner settings.
+
+        Settings are transaction-local and applied at most once per
+        transaction (see ann_index.apply_planner_settings).
+        """
+
+        async def run() -> Any:
+            await apply_planner_settings(self._session, plan)
+            return await self._session.execute(query)
+
+        try:
+            return await run()
+        except DBAPIError as e:
+            if "InFailedSQLTransactionError" in str(e) or "current transaction is aborted" in str(
+                e
+            ):
+                logger.warning(f"Transaction failed during {operation}, rolling back and retrying...")
+                await self._session.rollback()
+                return await run()
+            raise
+
     def _reciprocal_rank_fusion(
         self,
         vector_results: List[Dict[str, Any]],
@@ -1,28 +1,132 @@
 """Qdrant vector store implementation."""
 
+import asyncio
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
+import numpy as np
 from qdrant_client import AsyncQdrantClient
 from qdrant_client.models import (
     Distance,
     FieldCondition,
     Filter,
     MatchValue,
+    Modifier,
     PayloadSchemaType,
     PointStruct,
+    Prefetch,
+    QuantizationSearchParams,
+    QueryRequest,
+    Rrf,
+    RrfQuery,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    ScoredPoint,
+    SearchParams,
+    SparseVectorParams,
     VectorParams,
 )
 
 from research_agent.config import get_settings
 from research_agent.domain.entities.resource import ResourceType
 from research_agent.domain.repositories.chunk_repo import ChunkSearchResult
+from research_agent.infrastructure.embedding.dimensions import get_embedding_dimensions
 from research_agent.infrastructure.vector_store.base import SearchResult, VectorStore
+from research_agent.infrastructure.vector_store.sparse_encoder import BM25SparseEncoder
 from research_agent.shared.utils.logger import logger
 
+# Name of the sparse (BM25) vector stored next to the unnamed dense vector
+SPARSE_VECTOR_NAME = "bm25"
+
+# RRF constant, same as PgVectorStore._reciprocal_rank_fusion
+RRF_K = 60
+
 # Singleton client instance
 _qdrant_client: AsyncQdrantClient | None = None
 
+# Collection name -> whether it was created with the sparse vector config
+_sparse_support: Dict[str, bool] = {}
+
+# Payload fields used in search filters; each gets a keyword index
+PAYLOAD_INDEX_FIELDS = ("project_id", "user_id", "resource_id", "resource_type", "document_id")
+
+# QDRANT_QUANTIZATION modes
+QUANTIZATION_MODES = ("none", "int8")
+
+# Collections whose payload indexes/quantization were checked by this process
+_tuned_collections: set[str] = set()
+
+# Collections whose dense vector size was checked by this process
+_size_checked: set[str] = set()
+
+# Rough per-point request overhead (payload keys, ids, sparse vector), bytes
+POINT_OVERHEAD_BYTES = 1024
+
+
+def get_quantization_mode() -> str:
+    """Return the configured Qdrant quantization mode."""
+    mode = get_settings().qdrant_quantization
+    if mode not in QUANTIZATION_MODES:
+        raise ValueError(
+            f"Unsupported Qdrant quantization mode: {mode}. "
+            f"Supported modes: {', '.join(QUANTIZATION_MODES)}"
+        )
+    return mode
+
+
+def _quantization_config() -> ScalarQuantization | None:
+    """int8 scalar quantization kept in RAM, or None when disabled."""
+    if get_quantization_mode() == "none":
+        return None
+    return ScalarQuantization(
+        scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True)
+    )
+
+
+def dense_search_params() -> SearchParams | None:
+    """Search params for dense queries: rescore quantized hits with full vectors."""
+    if get_quantization_mode() == "none":
+        return None
+    settings = get_settings()
+    return SearchParams(
+        quantization=QuantizationSearchParams(
+            rescore=settings.qdrant_quantization_rescore,
+            oversampling=settings.qdrant_quantization_oversampling,
+        )
+    )
+
+
+async def ensure_collection_tuning(client: AsyncQdrantClient, collection_name: str) -> None:
+    """Idempotently add missing payload indexes and the configured quantization.
+
+    Runs once per collection per process; also upgrades collections created
+    before the indexes/quantization existed.
+    """
+    if collection_name in _tuned_collections:
+        return
+
+    info = await client.get_collection(collection_name)
+    payload_schema = info.payload_schema or {}
+    for field_name in PAYLOAD_INDEX_FIELDS:
+        if field_name not in payload_schema:
+            await client.create_payload_index(
+                collection_name=collection_name,
+                field_name=field_name,
+                field_schema=PayloadSchemaType.KEYWORD,
+            )
+            logger.info(f"[Qdrant] Created payload index '{field_name}' on '{collection_name}'")
+
+    quantization = _quantization_config()
+    if quantization is not None and info.config.quantization_config is None:
+        await client.update_collection(
+            collection_name=collection_name,
+            quantization_config=quantization,
+        )
+        logger.info(f"[Qdrant] Enabled int8 quantization on '{collection_name}'")
+
+    _tuned_collections.add(collection_name)
+
 
 async def get_qdrant_client() -> AsyncQdrantClient:
     """Get or create the singleton Qdrant client."""
@@ -40,15 +144,16 @@ async def get_qdrant_client() -> AsyncQdrantClient:
 async def ensure_collection_exists(
     client: AsyncQdrantClient,
     collection_name: str,
-    vector_size: int = 1536,
+    vector_size: int | None = None,
 ) -> None:
     """Create collection if it doesn't exist.
 
     Args:
         client: Qdrant async client
         collection_name: Name of the collection
-        vector_size: Dimension of vectors (default: 1536 for OpenAI embeddings)
+        vector_size: Dimension of vectors (default: EMBEDDING_DIMENSIONS)
     """
+    vector_size = vector_size or get_embedding_dimensions()
     try:
         collections = await client.get_collections()
         existing_names = [c.name for c in collections.collections]
@@ -60,38 +165,58 @@ async def ensure_collection_exists(
                 vectors_config=VectorParams(
                     size=vector_size,
                     distance=Distance.COSINE,
+                    # Full vectors on disk; the quantized copy stays in RAM
+                    on_disk=get_settings().qdrant_vectors_on_disk,
                 ),
+                sparse_vectors_config={
+                    SPARSE_VECTOR_NAME: SparseVectorParams(modifier=Modifier.IDF),
+                },
+                quantization_config=_quantization_config(),
             )
-            # Create payload indexes for efficient filtering
-            await client.create_payload_index(
-                collection_name=collection_name,
-                field_name="project_id",
-                field_schema=PayloadSchemaType.KEYWORD,
-            )
-            await client.create_payload_index(
-                collection_name=collection_name,
-                field_name="resource_id",
-                field_schema=PayloadSchemaType.KEYWORD,
-            )
-            await client.create_payload_index(
-                collection_name=collection_name,
-                field_name="resource_type",
-                field_schema=PayloadSchemaType.KEYWORD,
-            )
-            # Legacy index for backward compatibility
-            await client.create_payload_index(
-                collection_name=collection_name,
-                field_name="document_id",
-                field_schema=PayloadSchemaType.KEYWORD,
-            )
-            logger.info(f"[Qdrant] Collection '{collection_name}' created with payload indexes")
+            _sparse_support[collection_name] = True
+            logger.info(f"[Qdrant] Collection '{collection_name}' created")
         else:
             logger.info(f"[Qdrant] Collection '{collection_name}' already exists")
+            await collection_has_sparse_vectors(client, collection_name)
+            if collection_name not in _size_checked:
+                info = await client.get_collection(collection_name)
+                existing_size = getattr(info.config.params.vectors, "size", None)
+                if existing_size and existing_size != vector_size:
+                    logger.warning(
+                        f"[Qdrant] Collection '{collection_name}' stores {existing_size}-dim "
+                        f"vectors but {vector_size} were requested; run "
+                        "scripts/backfill_embedding_dimensions.py and point "
+                        "QDRANT_COLLECTION_NAME at the new collection"
+                    )
+                _size_checked.add(collection_name)
+
+        # Payload indexes for efficient filtering (legacy document_id included)
+        await ensure_collection_tuning(client, collection_name)
     except Exception as e:
         logger.error(f"[Qdrant] Failed to ensure collection exists: {e}")
         raise
 
 
+async def collection_has_sparse_vectors(client: AsyncQdrantClient, collection_name: str) -> bool:
+    """Check (once per process) whether a collection stores BM25 sparse vectors.
+
+    Collections created before hybrid search was added only have the dense
+    vector; they keep working but hybrid search degrades to vector-only until
+    the collection is recreated and re-indexed.
+    """
+    if collection_name not in _sparse_support:
+        info = await client.get_collection(collection_name)
+        sparse_vectors = info.config.params.sparse_vectors or {}
+        _sparse_support[collection_name] = SPARSE_VECTOR_NAME in sparse_vectors
+        if not _sparse_support[collection_name]:
+            logger.warning(
+                f"[Qdrant] Collection '{collection_name}' has no '{SPARSE_VECTOR_NAME}' sparse "
+                "vector; hybrid search will fall back to vector-only. Recreate the collection "
+                "and reprocess documents to enable keyword recall."
+            )
+    return _sparse_support[collection_name]
+
+
 class QdrantVectorStore(VectorStore):
     """Qdrant vector store implementation."""
 
@@ -105,6 +230,7 @@ class QdrantVectorStore(VectorStore):
         self._client = client
         self._settings = get_settings()
         self._collection_name = self._settings.qdrant_collection_name
+        self._sparse_encoder = BM25SparseEncoder()
 
     async def _get_client(self) -> AsyncQdrantClient:
         """Get the Qdrant client."""
@@ -134,30 +260,6 @@ class QdrantVectorStore(VectorStore):
         """
         client = await self._get_client()
 
-        # Build filter conditions
-        must_conditions = [
-            FieldCondition(
-                key="project_id",
-                match=MatchValue(value=str(project_id)),
-            )
-        ]
-
-        if document_id:
-            must_conditions.append(
-                FieldCondition(
-                    key="document_id",
-                    match=MatchValue(value=str(document_id)),
-                )
-            )
-
-        if user_id:
-            must_conditions.append(
-                FieldCondition(
-                    key="user_id",
-                    match=MatchValue(value=user_id),
-                )
-            )
-
         logger.info(
             f"[Qdrant] Search: project_id={project_id}, document_id={document_id}, user_id={user_id}, limit={limit}"
         )
@@ -166,23 +268,13 @@ class QdrantVectorStore(VectorStore):
             results = await client.query_points(
                 collection_name=self._collection_name,
                 query=query_embedding,
-                query_filter=Filter(must=must_conditions),
+                query_filter=self._build_filter(project_id, document_id, user_id),
+                search_params=dense_search_params(),
                 limit=limit,
                 with_payload=True,
             )
 
-            search_results = []
-            for point in results.points:
-                payload = point.payload or {}
-                search_results.append(
-                    SearchResult(
-                        chunk_id=UUID(payload.get("chunk_id", str(point.id))),
-                        document_id=UUID(payload.get("document_id", "")),
-                        content=payload.get("content", ""),
-                        page_number=payload.get("page_number", 0),
-                        similarity=point.score,
-                    )
-                )
+            search_results = [self._to_search_result(point) for point in results.points]
 
             logger.info(f"[Qdrant] Found {len(search_results)} results")
             return search_results
@@ -191,6 +283,75 @@ class QdrantVectorStore(VectorStore):
             logger.error(f"[Qdrant] Search failed: {e}")
             raise
 
+    async def search_many(
+        self,
+        query_embeddings: list[list[float]],
+        project_id: UUID,
+        limit: int = 5,
+        document_id: UUID | None = None,
+        user_id: str | None = None,
+        document_ids: list[UUID | None] | None = None,
+    ) -> list[list[SearchResult]]:
+        """Search several query embeddings with one ``query_batch_points`` call."""
+        if not query_embeddings:
+            return []
+
+        client = await self._get_client()
+        per_query_documents = document_ids or [document_id] * len(query_embeddings)
+
+        logger.info(
+            f"[Qdrant] Batched search: project_id={project_id}, queries={len(query_embeddings)}, "
+            f"user_id={user_id}, limit={limit}"
+        )
+
+        try:
+            responses = await client.query_batch_points(
+                collection_name=self._collection_name,
+                requests=[
+                    QueryRequest(
+                        query=query_embedding,
+                        filter=self._build_filter(project_id, query_document_id, user_id),
+                        params=dense_search_params(),
+                        limit=limit,
+                        with_payload=True,
+                    )
+                    for query_embedding, query_document_id in zip(
+                        query_embeddings, per_query_documents
+                    )
+                ],
+            )
+            return [
+                [self._to_search_result(point) for point in response.points]
+                for response in responses
+            ]
+
+        except Exception as e:
+            logger.error(f"[Qdrant] Batched search failed: {e}")
+            raise
+
+    async def get_embeddings(self, chunk_ids: list[UUID]) -> dict[UUID, np.ndarray]:
+        """Load dense vectors for chunks (point ids are chunk ids)."""
+        if not chunk_ids:
+            return {}
+
+        client = await self._get_client()
+        records = await client.retrieve(
+            collection_name=self._collection_name,
+            ids=[str(chunk_id) for chunk_id in chunk_ids],
+            with_payload=False,
+            with_vectors=True,
+        )
+
+        embeddings = {}
+        for record in records:
+            vector = record.vector
+            if isinstance(vector, dict):
+                # Collections with the sparse vector store dense as the unnamed vector
+                vector = vector.get("")
+            if vector is not None:
+                embeddings[UUID(str(record.id))] = np.asarray(vector, dtype=np.float32)
+        return embeddings
+
     async def hybrid_search(
         self,
         query_embedding: list[float],
@@ -203,34 +364,175 @@ class QdrantVectorStore(VectorStore):
         document_id: UUID | None = None,
         user_id: str | None = None,
     ) -> list[SearchResult]:
-        """Hybrid search combining vector similarity and keyword matching.
+        """Hybrid search combining dense vectors and BM25 sparse vectors.
 
-        Note: Initial implementation uses vector-only search.
-        True hybrid search with sparse vectors can be added later.
+        Both candidate lists are fetched as prefetches of a single
+        ``query_points`` call and fused server-side with weighted RRF, matching
+        ``PgVectorStore._reciprocal_rank_fusion``: score = Σ weight / (60 + rank).
 
         Args:
             query_embedding: Vector embedding of the query
-            query_text: Original query text (currently unused)
+            query_text: Original query text for keyword (sparse) search
             project_id: Project UUID to filter by
             limit: Maximum number of results to return
-            vector_weight: Weight for vector search (currently unused)
-            keyword_weight: Weight for keyword search (currently unused)
-            k: Number of results to retrieve (currently unused)
+            vector_weight: Weight for vector search (0-1)
+            keyword_weight: Weight for keyword search (0-1)
+            k: Number of results to retrieve from each method before fusion
             document_id: Optional document UUID to filter by
-            user_id: Optional user ID for data isolation (reserved for future use)
+            user_id: Optional user ID for data isolation
 
         Returns:
-            List of SearchResult sorted by similarity
+            List of SearchResult sorted by RRF score
         """
-        # TODO: Implement true hybrid search with sparse vectors
-        # For now, fall back to vector-only search
-        logger.info("[Qdrant] Hybrid search falling back to vector-only search")
-        return await self.search(
+        client = await self._get_client()
+        query_filter = self._build_filter(project_id, document_id, user_id)
+
+        points = await self._hybrid_query(
+            client=client,
             query_embedding=query_embedding,
-            project_id=project_id,
+            query_text=query_text,
+            query_filter=query_filter,
             limit=limit,
-            document_id=document_id,
-            user_id=user_id,
+            vector_weight=vector_weight,
+            keyword_weight=keyword_weight,
+            k=k,
+        )
+        if points is None:
+            return await self.search(
+                query_embedding=query_embedding,
+                project_id=project_id,
+                limit=limit,
+                document_id=document_id,
+                user_id=user_id,
+            )
+
+        search_results = [self._to_search_result(point) for point in points]
+        logger.info(f"[Qdrant] Hybrid search returned {len(search_results)} results")
+        return search_results
+
+    async def _hybrid_query(
+        self,
+        client: AsyncQdrantClient,
+        query_embedding: List[float],
+        query_text: str,
+        query_filter: Filter,
+        limit: int,
+        vector_weight: float,
+        keyword_weight: float,
+        k: int,
+    ) -> Optional[List[ScoredPoint]]:
+        """Run a dense+sparse prefetch query fused with weighted RRF.
+
+        Returns:
+            Fused points, or None if the collection has no sparse vectors
+            (caller should fall back to vector-only search)
+        """
+        if not await collection_has_sparse_vectors(client, self._collection_name):
+            logger.info("[Qdrant] Hybrid search falling back to vector-only search")
+            return None
+
+        sparse_query = self._sparse_encoder.encode_query(query_text)
+
+        prefetch = [
+            Prefetch(
+                query=query_embedding,
+                filter=query_filter,
+                params=dense_search_params(),
+                limit=k,
+            )
+        ]
+        weights = [vector_weight]
+        if sparse_query.indices:
+            prefetch.append(
+                Prefetch(
+                    query=sparse_query,
+                    using=SPARSE_VECTOR_NAME,
+                    filter=query_filter,
+                    limit=k,
+                )
+            )
+            weights.append(keyword_weight)
+
+        logger.info(
+            f"[Qdrant] Hybrid search: vector_weight={vector_weight}, "
+            f"keyword_weight={keyword_weight}, k={k}, terms={len(sparse_query.indices)}"
+        )
+
+        try:
+            results = await client.query_points(
+                collection_name=self._collection_name,
+                prefetch=prefetch,
+                query=RrfQuery(rrf=Rrf(k=RRF_K, weights=weights)),
+                query_filter=query_filter,
+                limit=limit,
+                with_payload=True,
+            )
+            return results.points
+        except Exception as e:
+            logger.error(f"[Qdrant] Hybrid search failed: {e}")
+            raise
+
+    async def _sparse_vectors_enabled(self, client: AsyncQdrantClient) -> bool:
+        """Whether points written to this collection should carry sparse vectors."""
+        try:
+            return await collection_has_sparse_vectors(client, self._collection_name)
+        except Exception as e:
+            logger.warning(f"[Qdrant] Could not inspect collection config: {e}")
+            return False
+
+    def _point_vector(
+        self, embedding: List[float], content: str, with_sparse: bool
+    ) -> List[float] | Dict[str, Any]:
+        """Build the point vector: dense only, or dense + BM25 sparse."""
+        if not with_sparse:
+            return embedding
+        return {
+            "": embedding,
+            SPARSE_VECTOR_NAME: self._sparse_encoder.encode_document(content),
+        }
+
+    @staticmethod
+    def _build_filter(
+        project_id: UUID,
+        document_id: UUID | None = None,
+        user_id: str | None = None,
+    ) -> Filter:
+        """Build the project/document/user filter shared by all searches."""
+        must_conditions = [
+            FieldCondition(
+                key="project_id",
+                match=MatchValue(value=str(project_id)),
+            )
+        ]
+
+        if document_id:
+            must_conditions.append(
+                FieldCondition(
+                    key="document_id",
+                    match=MatchValue(value=str(document_id)),
+                )
+            )
+
+        if user_id:
+            must_conditions.append(
+                FieldCondition(
+                    key="user_id",
+                    match=MatchValue(value=user_id),
+                )
+            )
+
+        return Filter(must=must_conditions)
+
+    @staticmethod
+    def _to_search_result(point: ScoredPoint) -> SearchResult:
+        """Convert a scored point to SearchResult."""
+        payload = point.payload or {}
+        return SearchResult(
+            chunk_id=UUID(payload.get("chunk_id", str(point.id))),
+            document_id=UUID(payload.get("document_id", "")),
+            content=payload.get("content", ""),
+            page_number=payload.get("page_number", 0),
+            similarity=point.score,
         )
 
     async def upsert(
@@ -253,10 +555,11 @@ class QdrantVectorStore(VectorStore):
             page_number: Page number in the source document
         """
         client = await self._get_client()
+        with_sparse = await self._sparse_vectors_enabled(client)
 
         point = PointStruct(
             id=str(chunk_id),
-            vector=embedding,
+            vector=self._point_vector(embedding, content, with_sparse),
             payload={
                 "chunk_id": str(chunk_id),
                 "document_id": str(document_id),
@@ -349,64 +652,98 @@ class QdrantVectorStore(VectorStore):
     async def upsert_resource_chunks_batch(
         self,
         chunks_data: List[Dict[str, Any]],
-        batch_size: int = 100,
+        batch_size: int | None = None,
     ) -> None:
-        """Upsert multiple resource chunks in batches.
+        """Upsert multiple resource chunks in parallel, size-bounded batches.
+
+        Batches close at ``batch_size`` points or QDRANT_UPSERT_MAX_BATCH_BYTES
+        (estimated), whichever comes first. At most QDRANT_UPSERT_CONCURRENCY
+        requests are in flight; building the next batch waits for a free
+        slot, so memory stays bounded on large ingests.
 
         Args:
             chunks_data: List of dictionaries containing chunk data
             batch_size: Maximum number of points per upsert call
+                       (defaults to QDRANT_UPSERT_BATCH_SIZE)
         """
         if not chunks_data:
             return
 
+        settings = self._settings
+        batch_size = batch_size or settings.qdrant_upsert_batch_size
+        max_batch_bytes = settings.qdrant_upsert_max_batch_bytes
+
         client = await self._get_client()
-        points = []
-
-        for data in chunks_data:
-            metadata = data["metadata"]
-
-            # Build unified payload
-            payload = {
-                "chunk_id": str(data["chunk_id"]),
-                "resource_id": str(data["resource_id"]),
-                "resource_type": data["resource_type"].value,
-                "project_id": str(data["project_id"]),
-                "chunk_index": data["chunk_index"],
-                "content": data["content"],
-                # Metadata fields
-                "title": metadata.get("title", ""),
-                "platform": metadata.get("platform", "local"),
-                "page_number": metadata.get("page_number"),
-                "start_time": metadata.get("start_time"),
-                "end_time": metadata.get("end_time"),
-                # Legacy compatibility
-                "document_id": str(data["resource_id"]),
-                # User isolation
-                "user_id": data.get("user_id"),
-            }
-
-            points.append(
-                PointStruct(
-                    id=str(data["chunk_id"]),
-                    vector=data["embedding"],
-                    payload=payload,
-                )
-            )
+        with_sparse = await self._sparse_vectors_enabled(client)
+        slots = asyncio.Semaphore(max(1, settings.qdrant_upsert_concurrency))
 
-        # Upsert in batches
-        total_points = len(points)
-        for i in range(0, total_points, batch_size):
-            batch = points[i : i + batch_size]
+        async def send(batch: List[PointStruct]) -> None:
             try:
                 await client.upsert(
                     collection_name=self._collection_name,
                     points=batch,
                 )
                 logger.debug(f"[Qdrant] Upserted batch of {len(batch)} chunks")
-            except Exception as e:
-                logger.error(f"[Qdrant] Batch upsert failed: {e}")
-                raise
+            finally:
+                slots.release()
+
+        try:
+            async with asyncio.TaskGroup() as tasks:
+                batch: List[PointStruct] = []
+                batch_bytes = 0
+                for data in chunks_data:
+                    point = self._resource_chunk_point(data, with_sparse)
+                    point_bytes = (
+                        4 * len(data["embedding"])
+                        + len(data["content"].encode())
+                        + POINT_OVERHEAD_BYTES
+                    )
+                    if batch and (
+                        len(batch) >= batch_size or batch_bytes + point_bytes > max_batch_bytes
+                    ):
+                        # Backpressure: wait for an in-flight batch to finish
+                        await slots.acquire()
+                        tasks.create_task(send(batch))
+                        batch, batch_bytes = [], 0
+                    batch.append(point)
+                    batch_bytes += point_bytes
+
+                if batch:
+                    await slots.acquire()
+                    tasks.create_task(send(batch))
+        except ExceptionGroup as e:
+            logger.error(f"[Qdrant] Batch upsert failed: {e.exceptions[0]}")
+            raise e.exceptions[0]
+
+    def _resource_chunk_point(self, data: Dict[str, Any], with_sparse: bool) -> PointStruct:
+        """Build the Qdrant point for one resource chunk."""
+        metadata = data["metadata"]
+
+        # Build unified payload
+        payload = {
+            "chunk_id": str(data["chunk_id"]),
+            "resource_id": str(data["resource_id"]),
+            "resource_type": data["resource_type"].value,
+            "project_id": str(data["project_id"]),
+            "chunk_index": data["chunk_index"],
+            "content": data["content"],
+            # Metadata fields
+            "title": metadata.get("title", ""),
+            "platform": metadata.get("platform", "local"),
+            "page_number": metadata.get("page_number"),
+            "start_time": metadata.get("start_time"),
+            "end_time": metadata.get("end_time"),
+            # Legacy compatibility
+            "document_id": str(data["resource_id"]),
+            # User isolation
+            "user_id": data.get("user_id"),
+        }
+
+        return PointStruct(
+            id=str(data["chunk_id"]),
+            vector=self._point_vector(data["embedding"], data["content"], with_sparse),
+            payload=payload,
+        )
 
     async def search_resource_chunks(
         self,
@@ -430,7 +767,89 @@ class QdrantVectorStore(VectorStore):
         """
         client = await self._get_client()
 
-        # Build filter conditions
+        logger.info(
+            f"[Qdrant] Resource search: project={project_id}, type={resource_type}, limit={limit}"
+        )
+
+        try:
+            results = await client.query_points(
+                collection_name=self._collection_name,
+                query=query_embedding,
+                query_filter=self._build_resource_filter(project_id, resource_type, resource_id),
+                search_params=dense_search_params(),
+                limit=limit,
+                with_payload=True,
+            )
+
+            search_results = [self._to_chunk_search_result(point) for point in results.points]
+
+            logger.info(f"[Qdrant] Found {len(search_results)} resource chunks")
+            return search_results
+
+        except Exception as e:
+            logger.error(f"[Qdrant] Resource search failed: {e}")
+            raise
+
+    async def hybrid_search_resource_chunks(
+        self,
+        query_embedding: List[float],
+        query_text: str,
+        project_id: UUID,
+        limit: int = 5,
+        vector_weight: float = 0.7,
+        keyword_weight: float = 0.3,
+        k: int = 20,
+        resource_type: Optional[ResourceType] = None,
+        resource_id: Optional[UUID] = None,
+    ) -> List[ChunkSearchResult]:
+        """Hybrid (dense + BM25 sparse) search over resource chunks.
+
+        Args:
+            query_embedding: Vector embedding of the query
+            query_text: Original query text for keyword (sparse) search
+            project_id: Project UUID to filter by
+            limit: Maximum number of results
+            vector_weight: Weight for vector search (0-1)
+            keyword_weight: Weight for keyword search (0-1)
+            k: Number of results to retrieve from each method before fusion
+            resource_type: Optional filter by resource type
+            resource_id: Optional filter by specific resource
+
+        Returns:
+            List of ChunkSearchResult sorted by RRF score
+        """
+        client = await self._get_client()
+
+        points = await self._hybrid_query(
+            client=client,
+            query_embedding=query_embedding,
+            query_text=query_text,
+            query_filter=self._build_resource_filter(project_id, resource_type, resource_id),
+            limit=limit,
+            vector_weight=vector_weight,
+            keyword_weight=keyword_weight,
+            k=k,
+        )
+        if points is None:
+            return await self.search_resource_chunks(
+                query_embedding=query_embedding,
+                project_id=project_id,
+                limit=limit,
+                resource_type=resource_type,
+                resource_id=resource_id,
+            )
+
+        search_results = [self._to_chunk_search_result(point) for point in points]
+        logger.info(f"[Qdrant] Hybrid resource search returned {len(search_results)} chunks")
+        return search_results
+
+    @staticmethod
+    def _build_resource_filter(
+        project_id: UUID,
+        resource_type: Optional[ResourceType] = None,
+        resource_id: Optional[UUID] = None,
+    ) -> Filter:
+        """Build the project/resource filter for resource chunk searches."""
         must_conditions = [
             FieldCondition(
                 key="project_id",
@@ -454,61 +873,40 @@ class QdrantVectorStore(VectorStore):
                 )
             )
 
-        logger.info(
-            f"[Qdrant] Resource search: project={project_id}, type={resource_type}, limit={limit}"
-        )
-
-        try:
-            results = await client.query_points(
-                collection_name=self._collection_name,
-                query=query_embedding,
-                query_filter=Filter(must=must_conditions),
-                limit=limit,
-                with_payload=True,
-            )
-
-            search_results = []
-            for point in results.points:
-                payload = point.payload or {}
-
-                # Determine resource type
-                rt_str = payload.get("resource_type", "document")
-                try:
-                    rt = ResourceType(rt_str)
-                except ValueError:
-                    rt = ResourceType.DOCUMENT
-
-                # Build metadata from payload
-                metadata = {
-                    "title": payload.get("title", ""),
-                    "platform": payload.get("platform", "local"),
-                }
-                if payload.get("page_number") is not None:
-                    metadata["page_number"] = payload["page_number"]
-                if payload.get("start_time") is not None:
-                    metadata["start_time"] = payload["start_time"]
-                if payload.get("end_time") is not None:
-                    metadata["end_time"] = payload["end_time"]
-
-                search_results.append(
-                    ChunkSearchResult(
-                        chunk_id=UUID(payload.get("chunk_id", str(point.id))),
-                        resource_id=UUID(
-                            payload.get("resource_id", payload.get("document_id", ""))
-                        ),
-                        resource_type=rt,
-                        content=payload.get("content", ""),
-                        similarity=point.score,
-                        metadata=metadata,
-                    )
-                )
+        return Filter(must=must_conditions)
 
-            logger.info(f"[Qdrant] Found {len(search_results)} resource chunks")
-            return search_results
+    @staticmethod
+    def _to_chunk_search_result(point: ScoredPoint) -> ChunkSearchResult:
+        """Convert a scored point to ChunkSearchResult."""
+        payload = point.payload or {}
 
-        except Exception as e:
-            logger.error(f"[Qdrant] Resource search failed: {e}")
-            raise
+        # Determine resource type
+        rt_str = payload.get("resource_type", "document")
+        try:
+            rt = ResourceType(rt_str)
+        except ValueError:
+            rt = ResourceType.DOCUMENT
+
+        # Build metadata from payload
+        metadata = {
+            "title": payload.get("title", ""),
+            "platform": payload.get("platform", "local"),
+        }
+        if payload.get("page_number") is not None:
+            metadata["page_number"] = payload["page_number"]
+        if payload.get("start_time") is not None:
+            metadata["start_time"] = payload["start_time"]
+        if payload.get("end_time") is not None:
+            metadata["end_time"] = payload["end_time"]
+
+        return ChunkSearchResult(
+            chunk_id=UUID(payload.get("chunk_id", str(point.id))),
+            resource_id=UUID(payload.get("resource_id", payload.get("document_id", ""))),
+            resource_type=rt,
+            content=payload.get("content", ""),
+            similarity=point.score,
+            metadata=metadata,
+        )
 
     async def delete_by_resource(self, resource_id: UUID) -> None:
         """Delete all chunks for a resource.
@@ -0,0 +1,303 @@
+"""Versioned cache for vector/hybrid search results.
+
+Repeated (and re-phrased-to-the-same-embedding) questions in a project
+re-run the same search. ``CachedVectorStore`` wraps any VectorStore and
+memoizes ``search``/``hybrid_search`` results keyed on:
+
+- project, user and document filter
+- a hash of the query embedding rounded to float16 (absorbs the tiny
+  nondeterminism of embedding APIs), plus the query text for hybrid search
+- the search parameters and wrapped store type
+- the project's corpus version
+
+The corpus version is ``projects.corpus_version``, bumped in the same
+transaction as every chunk write/delete (``bump_corpus_version``), so a
+cached entry can never outlive the chunks it was computed from: new writes
+simply make old keys unreachable and they age out of the LRU/TTL.
+
+Entries live in a per-process LRU and, when RETRIEVAL_CACHE_REDIS is on,
+in Redis (REDIS_URL) so API replicas share hits; both tiers and the counters
+come from ``tiered_cache``. Redis errors degrade to the local tier. Hit/miss
+counters are exposed via ``get_retrieval_cache_stats``.
+"""
+
+import hashlib
+import json
+from typing import Any, Iterable
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from research_agent.config import get_settings
+from research_agent.infrastructure.tiered_cache import (
+    LRUCache,
+    cache_counters,
+    cache_stats,
+    get_redis_client,
+    reset_cache_counters,
+)
+from research_agent.infrastructure.vector_store.base import SearchResult, VectorStore
+from research_agent.shared.utils.logger import logger
+
+REDIS_KEY_PREFIX = "weaver:retrieval:"
+
+# Counter name (see tiered_cache.cache_stats)
+CACHE_NAME = "retrieval"
+
+_local_cache: LRUCache | None = None
+
+
+def _get_local_cache() -> LRUCache:
+    global _local_cache
+    if _local_cache is None:
+        settings = get_settings()
+        _local_cache = LRUCache(
+            settings.retrieval_cache_max_entries, settings.retrieval_cache_ttl_seconds
+        )
+    return _local_cache
+
+
+def _get_redis() -> Any:
+    return get_redis_client(get_settings().retrieval_cache_redis)
+
+
+def reset_retrieval_cache() -> None:
+    """Drop local entries and counters (tests, settings changes)."""
+    global _local_cache
+    _local_cache = None
+    reset_cache_counters(CACHE_NAME)
+
+
+def get_retrieval_cache_stats() -> dict[str, Any]:
+    """Hit/miss counters for this process."""
+    return {
+        **cache_stats(CACHE_NAME),
+        "local_entries": len(_local_cache) if _local_cache is not None else 0,
+        "redis_enabled": _get_redis() is not None,
+    }
+
+
+async def get_corpus_version(session: AsyncSession, project_id: UUID) -> int:
+    """Current corpus version of a project (0 if unknown)."""
+    result = await session.execute(
+        text("SELECT corpus_version FROM projects WHERE id = cast(:project_id as uuid)"),
+        {"project_id": str(project_id)},
+    )
+    version = result.scalar()
+    return int(version or 0)
+
+
+async def bump_corpus_version(session: AsyncSession, project_ids: Iterable[UUID]) -> None:
+    """Invalidate cached retrievals of projects whose chunks changed.
+
+    Runs in the caller's transaction, so the new version becomes visible
+    exactly when the chunk changes commit.
+    """
+    ids = sorted({str(project_id) for project_id in project_ids if project_id})
+    if not ids:
+        return
+    await session.execute(
+        text(
+            "UPDATE projects SET corpus_version = corpus_version + 1 "
+            "WHERE id = ANY(cast(:ids as uuid[]))"
+        ),
+        {"ids": ids},
+    )
+
+
+def _embedding_digest(query_embedding: list[float]) -> str:
+    quantized = np.asarray(query_embedding, dtype=np.float32).astype(np.float16)
+    return hashlib.sha256(quantized.tobytes()).hexdigest()
+
+
+def _encode(results: list[SearchResult]) -> str:
+    return json.dumps(
+        [
+            [str(r.chunk_id), str(r.document_id), r.content, r.page_number, r.similarity]
+            for r in results
+        ]
+    )
+
+
+def _decode(payload: str | bytes) -> list[SearchResult]:
+    return [
+        SearchResult(
+            chunk_id=UUID(chunk_id),
+            document_id=UUID(document_id),
+            content=content,
+            page_number=page_number,
+            similarity=similarity,
+        )
+        for chunk_id, document_id, content, page_number, similarity in json.loads(payload)
+    ]
+
+
+class CachedVectorStore(VectorStore):
+    """VectorStore decorator that caches search results per corpus version."""
+
+    def __init__(self, inner: VectorStore, session: AsyncSession):
+        """Initialize cached store.
+
+        Args:
+            inner: Store that actually runs the searches
+            session: SQLAlchemy async session (corpus version lookups)
+        """
+        self._inner = inner
+        self._session = session
+
+    def __getattr__(self, name: str) -> Any:
+        # Provider-specific helpers (e.g. Qdrant delete_by_resource) pass through
+        if name == "_inner":
+            raise AttributeError(name)
+        return getattr(self._inner, name)
+
+    async def search(
+        self,
+        query_embedding: list[float],
+        project_id: UUID,
+        limit: int = 5,
+        document_id: UUID | None = None,
+        user_id: str | None = None,
+    ) -> list[SearchResult]:
+        """Cached vector search."""
+        return await self._cached(
+            project_id,
+            {
+                "op": "search",
+                "embedding": _embedding_digest(query_embedding),
+                "limit": limit,
+                "document_id": str(document_id) if document_id else None,
+                "user_id": user_id,
+            },
+            lambda: self._inner.search(
+                query_embedding=query_embedding,
+                project_id=project_id,
+                limit=limit,
+                document_id=document_id,
+                user_id=user_id,
+            ),
+        )
+
+    async def hybrid_search(
+        self,
+        query_embedding: list[float],
+        query_text: str,
+        project_id: UUID,
+        limit: int = 5,
+        vector_weight: float = 0.7,
+        keyword_weight: float = 0.3,
+        k: int = 20,
+        document_id: UUID | None = None,
+        user_id: str | None = None,
+    ) -> list[SearchResult]:
+        """Cached hybrid search."""
+        return await self._cached(
+            project_id,
+            {
+                "op": "hybrid",
+                "embedding": _embedding_digest(query_embedding),
+                "text": query_text,
+                "limit": limit,
+                "vector_weight": vector_weight,
+                "keyword_weight": keyword_weight,
+                "k": k,
+                "document_id": str(document_id) if document_id else None,
+                "user_id": user_id,
+            },
+            lambda: self._inner.hybrid_search(
+                query_embedding=query_embedding,
+                query_text=query_text,
+                project_id=project_id,
+                limit=limit,
+                vector_weight=vector_weight,
+                keyword_weight=keyword_weight,
+                k=k,
+                document_id=document_id,
+                user_id=user_id,
+            ),
+        )
+
+    async def search_many(
+        self,
+        query_embeddings: list[list[float]],
+        project_id: UUID,
+        limit: int = 5,
+        document_id: UUID | None = None,
+        user_id: str | None = None,
+        document_ids: list[UUID | None] | None = None,
+    ) -> list[list[SearchResult]]:
+        """Batched search is not cached (it is already one round trip)."""
+        return await self._inner.search_many(
+            query_embeddings=query_embeddings,
+            project_id=project_id,
+            limit=limit,
+            document_id=document_id,
+            user_id=user_id,
+            document_ids=document_ids,
+        )
+
+    async def get_embeddings(self, chunk_ids: list[UUID]) -> dict[UUID, np.ndarray]:
+        """Embeddings come straight from the wrapped store."""
+        return await self._inner.get_embeddings(chunk_ids)
+
+    async def _cached(self, project_id: UUID, params: dict[str, Any], run) -> list[SearchResult]:
+        counters = cache_counters(CACHE_NAME)
+        try:
+            version = await get_corpus_version(self._session, project_id)
+        except Exception as e:
+            counters["errors"] += 1
+            logger.warning(f"[RetrievalCache] Corpus version lookup failed, bypassing: {e}")
+            return await run()
+
+        key = self._key(project_id, version, params)
+        local = _get_local_cache()
+
+        results = local.get(key)
+        if results is not None:
+            counters["local_hits"] += 1
+            return list(results)
+
+        redis = _get_redis()
+        if redis is not None:
+            try:
+                payload = await redis.get(REDIS_KEY_PREFIX + key)
+            except Exception as e:
+                counters["errors"] += 1
+                logger.warning(f"[RetrievalCache] Redis get failed: {e}")
+                payload = None
+            if payload is not None:
+                counters["redis_hits"] += 1
+                results = _decode(payload)
+                local.set(key, results)
+                return list(results)
+
+        counters["misses"] += 1
+        results = await run()
+        local.set(key, results)
+
+        if redis is not None:
+            try:
+                await redis.set(
+                    REDIS_KEY_PREFIX + key,
+                    _encode(results),
+                    ex=get_settings().retrieval_cache_ttl_seconds,
+                )
+            except Exception as e:
+                counters["errors"] += 1
+                logger.warning(f"[RetrievalCache] Redis set failed: {e}")
+
+        return list(results)
+
+    def _key(self, project_id: UUID, version: int, params: dict[str, Any]) -> str:
+        raw = json.dumps(
+            {
+                "store": type(self._inner).__name__,
+                "project_id": str(project_id),
+                "version": version,
+                **params,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(raw.encode()).hexdigest()
@@ -0,0 +1,99 @@
+"""Local BM25-style sparse encoder for Qdrant hybrid search.
+
+Qdrant has no built-in tokenizer for sparse vectors, so term weights are
+computed here at ingest time and stored next to the dense embedding.
+Document vectors carry the BM25 term-frequency component; the IDF component
+is applied server-side by Qdrant (``Modifier.IDF``) from collection statistics,
+which keeps the encoder stateless.
+"""
+
+import re
+import zlib
+from collections import Counter
+
+from qdrant_client.models import SparseVector
+
+# Word tokens (latin, digits, underscore) and runs of CJK characters.
+_WORD_PATTERN = re.compile(r"[^\W\u3040-\u30ff\u3400-\u9fff\uac00-\ud7af]+", re.UNICODE)
+_CJK_PATTERN = re.compile(r"[\u3040-\u30ff\u3400-\u9fff\uac00-\ud7af]+")
+
+# Small English stopword list, roughly what PostgreSQL's 'english' config drops.
+_STOPWORDS = frozenset(
+    """
+    a an and are as at be been but by for from has have he her his i if in into is it
+    its me my no not of on or our she so such that the their them then there these they
+    this to was we were what when where which who will with you your
+    """.split()
+)
+
+
+class BM25SparseEncoder:
+    """Encode text into sparse lexical vectors with BM25 term weighting.
+
+    Tokens are hashed into the u32 index space Qdrant uses for sparse vectors,
+    so no vocabulary has to be stored or shared between processes.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, avg_doc_length: float = 256.0):
+        """Initialize encoder.
+
+        Args:
+            k1: Term frequency saturation parameter
+            b: Document length normalization parameter
+            avg_doc_length: Expected average chunk length in tokens
+        """
+        self.k1 = k1
+        self.b = b
+        self.avg_doc_length = avg_doc_length
+
+    def tokenize(self, text: str) -> list[str]:
+        """Split text into lowercase terms.
+
+        Latin-script words are kept whole (minus stopwords); CJK runs, which
+        have no word boundaries, are split into overlapping character bigrams.
+        """
+        text = text.lower()
+        tokens = [t for t in _WORD_PATTERN.findall(text) if t not in _STOPWORDS]
+
+        for run in _CJK_PATTERN.findall(text):
+            if len(run) == 1:
+                tokens.append(run)
+            else:
+                tokens.extend(run[i : i + 2] for i in range(len(run) - 1))
+
+        return tokens
+
+    @staticmethod
+    def token_index(token: str) -> int:
+        """Map a token to a stable sparse vector index."""
+        return zlib.crc32(token.encode("utf-8"))
+
+    def encode_document(self, text: str) -> SparseVector:
+        """Encode a chunk for storage.
+
+        Weight per term is the BM25 TF component:
+        tf * (k1 + 1) / (tf + k1 * (1 - b + b * dl / avgdl))
+        """
+        tokens = self.tokenize(text)
+        if not tokens:
+            return SparseVector(indices=[], values=[])
+
+        doc_length = len(tokens)
+        norm = self.k1 * (1 - self.b + self.b * doc_length / self.avg_doc_length)
+
+        weights: dict[int, float] = {}
+        for token, tf in Counter(tokens).items():
+            index = self.token_index(token)
+            weights[index] = weights.get(index, 0.0) + tf * (self.k1 + 1) / (tf + norm)
+
+        return self._to_sparse_vector(weights)
+
+    def encode_query(self, text: str) -> SparseVector:
+        """Encode a query; each distinct term contributes with weight 1."""
+        weights = {self.token_index(token): 1.0 for token in set(self.tokenize(text))}
+        return self._to_sparse_vector(weights)
+
+    @staticmethod
+    def _to_sparse_vector(weights: dict[int, float]) -> SparseVector:
+        indices = sorted(weights)
+        return SparseVector(indices=indices, values=[weights[i] for i in indices])
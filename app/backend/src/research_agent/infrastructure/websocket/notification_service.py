@@ -152,7 +152,54 @@ class DocumentNotificationService:
             error_message=error_message,
         )
 
-        message = update.to_dict()
+        notified_count = await self._send_to_subscribers(
+            project_id, document_id, update.to_dict()
+        )
+
+        logger.info(
+            f"[WebSocket] Notified {notified_count} clients - "
+            f"document_id={document_id}, status={status}"
+        )
+
+        return notified_count
+
+    async def notify_ingest_progress(
+        self,
+        project_id: str,
+        document_id: str,
+        processed: int,
+        total: int,
+        stage: str = "embedding",
+    ) -> int:
+        """
+        Send partial ingest progress (chunks embedded and saved so far).
+
+        Args:
+            project_id: Project ID
+            document_id: Document (or URL content) ID
+            processed: Chunks written so far
+            total: Total chunks
+            stage: Pipeline stage reporting progress
+
+        Returns:
+            Number of clients notified
+        """
+        return await self._send_to_subscribers(
+            project_id,
+            document_id,
+            {
+                "type": "ingest_progress",
+                "document_id": document_id,
+                "stage": stage,
+                "processed": processed,
+                "total": total,
+            },
+        )
+
+    async def _send_to_subscribers(
+        self, project_id: str, document_id: str, message: Dict[str, Any]
+    ) -> int:
+        """Send a message to project-level and document-level subscribers."""
         notified_count = 0
 
         # Collect all relevant connections
@@ -186,11 +233,6 @@ class DocumentNotificationService:
                     for conns in self._document_connections.values():
                         conns.discard(ws)
 
-        logger.info(
-            f"[WebSocket] Notified {notified_count} clients - "
-            f"document_id={document_id}, status={status}"
-        )
-
         return notified_count
 
     async def broadcast_to_project(
@@ -22,6 +22,7 @@ from research_agent.infrastructure.database.session import (
 from research_agent.shared.utils.logger import logger
 from research_agent.worker.dispatcher import TaskDispatcher
 from research_agent.worker.tasks import (
+    AnnIndexMaintenanceTask,
     CanvasCleanupTask,
     DocumentProcessorTask,
     URLProcessorTask,
@@ -44,6 +45,7 @@ def create_task_dispatcher() -> TaskDispatcher:
     dispatcher.register(TaskType.CLEANUP_CANVAS, CanvasCleanupTask)
     dispatcher.register(TaskType.FILE_CLEANUP, FileCleanupTask)
     dispatcher.register(TaskType.PROCESS_URL, URLProcessorTask)
+    dispatcher.register(TaskType.MAINTAIN_ANN_INDEX, AnnIndexMaintenanceTask)
 
     return dispatcher
 
@@ -171,6 +173,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         except Exception as e:
             logger.warning(f"Error stopping background worker: {e}")
 
+    # Close pooled embedding HTTP connections
+    try:
+        from research_agent.infrastructure.embedding.transport import close_http_client
+
+        await close_http_client()
+    except Exception as e:
+        logger.warning(f"Error closing embedding HTTP client: {e}")
+
     # Close database connections gracefully
     try:
         await asyncio.wait_for(close_db(), timeout=10.0)
@@ -313,6 +323,47 @@ def create_app() -> FastAPI:
                 "error": str(e),
             }
 
+    # Cache hit-rate endpoint
+    @app.get("/health/cache", tags=["health"])
+    async def cache_health() -> dict:
+        """Retrieval, embedding, answer and LLM result cache counters for this process."""
+        from research_agent.infrastructure.embedding.cache import get_embedding_cache_stats
+        from research_agent.infrastructure.llm.answer_cache import get_answer_cache_stats
+        from research_agent.infrastructure.llm.result_cache import get_result_cache_stats
+        from research_agent.infrastructure.vector_store.retrieval_cache import (
+            get_retrieval_cache_stats,
+        )
+
+        return {
+            "retrieval": {
+                "enabled": settings.retrieval_cache_enabled,
+                **get_retrieval_cache_stats(),
+            },
+            "embedding": {
+                "enabled": settings.embedding_cache_enabled,
+                **get_embedding_cache_stats(),
+            },
+            "answer": {
+                "enabled": settings.answer_cache_enabled,
+                **get_answer_cache_stats(),
+            },
+            # Per namespace: "rewrite", "intent"
+            "llm_results": get_result_cache_stats(),
+        }
+
+    # Embedding request coalescing
+    @app.get("/health/embedding", tags=["health"])
+    async def embedding_health() -> dict:
+        """Coalesced embed() batch-size distribution for this process."""
+        from research_agent.infrastructure.embedding.coalescer import get_coalescer_stats
+
+        return {
+            "coalescing": settings.embedding_coalesce_enabled,
+            "window_ms": settings.embedding_coalesce_window_ms,
+            "max_items": settings.embedding_coalesce_max_items,
+            "models": get_coalescer_stats(),
+        }
+
     # Root endpoint
     @app.get("/", tags=["root"])
     async def root() -> dict:
@@ -39,12 +39,17 @@ _current_trace: ContextVar[Optional["RAGTrace"]] = ContextVar("rag_trace", defau
 STAGE_ICONS = {
     "ENTRY": "🚀",
     "HISTORY": "📜",
+    "EMBED": "🔢",
     "CONTEXT": "📎",
+    "ANSWER_CACHE": "💾",
     "TRANSFORM": "📝",
     "INTENT": "🎯",
+    "PIPELINE": "🔀",
     "RETRIEVE": "🔍",
     "RERANK": "📊",
     "GRADE": "✓",
+    "RELEVANCE": "⚖️",
+    "SPECULATE": "🏃",
     "GENERATE": "💬",
     "STREAM": "⚡",
     "COMPLETE": "✅",
@@ -195,7 +200,7 @@ class RAGTrace:
 
         Args:
             stage: Stage name (ENTRY, HISTORY, CONTEXT, TRANSFORM, INTENT,
-                   RETRIEVE, RERANK, GRADE, GENERATE, COMPLETE, ERROR)
+                   RETRIEVE, RERANK, GRADE, RELEVANCE, GENERATE, COMPLETE, ERROR)
             **metrics: Stage-specific metrics (e.g., docs_count, latency_ms)
         """
         elapsed = round((time.time() - self.start_time) * 1000, 2)
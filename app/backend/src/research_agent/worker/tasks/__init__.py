@@ -1,5 +1,6 @@
 """Background task handlers."""
 
+from research_agent.worker.tasks.ann_index_maintenance import AnnIndexMaintenanceTask
 from research_agent.worker.tasks.base import BaseTask
 from research_agent.worker.tasks.canvas_cleanup import CanvasCleanupTask
 from research_agent.worker.tasks.document_processor import DocumentProcessorTask
@@ -7,6 +8,7 @@ from research_agent.worker.tasks.thumbnail_generator import ThumbnailGeneratorTa
 from research_agent.worker.tasks.url_processor import URLProcessorTask
 
 __all__ = [
+    "AnnIndexMaintenanceTask",
     "BaseTask",
     "DocumentProcessorTask",
     "CanvasCleanupTask",
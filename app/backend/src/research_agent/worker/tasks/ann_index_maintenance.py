@@ -0,0 +1,79 @@
+"""ANN index maintenance task - builds a project's partial HNSW index when due.
+
+``CREATE INDEX CONCURRENTLY`` on a large project takes minutes, so ingest
+only queues this task (``schedule_ann_index_maintenance``) instead of
+building the index inline. Until the index is valid, search uses the global
+index (see ann_index).
+"""
+
+from typing import Any, Dict
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from research_agent.config import get_settings
+from research_agent.domain.entities.task import TaskStatus, TaskType
+from research_agent.infrastructure.database.models import TaskQueueModel
+from research_agent.infrastructure.database.session import get_async_session
+from research_agent.infrastructure.vector_store.ann_index import maintain_project_ann_index
+from research_agent.shared.utils.logger import logger
+from research_agent.worker.tasks.base import BaseTask
+
+
+class AnnIndexMaintenanceTask(BaseTask):
+    """Background task for building per-project partial ANN indexes."""
+
+    @property
+    def task_type(self) -> str:
+        return TaskType.MAINTAIN_ANN_INDEX.value
+
+    async def execute(self, payload: Dict[str, Any], session: AsyncSession) -> None:
+        """
+        Execute the index maintenance task.
+
+        Args:
+            payload: Task payload containing:
+                - project_id: UUID of the project
+            session: Database session (unused; index builds need autocommit)
+        """
+        project_id_str = payload.get("project_id")
+        if not project_id_str:
+            raise ValueError("Missing project_id in payload")
+
+        await maintain_project_ann_index(UUID(project_id_str))
+
+
+async def schedule_ann_index_maintenance(project_id: UUID) -> None:
+    """Queue index maintenance for a project after ingest.
+
+    Skipped when the vector store does not use pgvector or a pending task for
+    the project already exists. Failures are logged, never raised.
+    """
+    from research_agent.worker.service import TaskQueueService
+
+    if get_settings().vector_store_provider not in ("pgvector", "mmap"):
+        return
+
+    try:
+        async with get_async_session() as session:
+            pending = await session.execute(
+                select(TaskQueueModel.id)
+                .where(
+                    TaskQueueModel.task_type == TaskType.MAINTAIN_ANN_INDEX.value,
+                    TaskQueueModel.status == TaskStatus.PENDING.value,
+                    TaskQueueModel.payload["project_id"].astext == str(project_id),
+                )
+                .limit(1)
+            )
+            if pending.first() is not None:
+                return
+
+            await TaskQueueService(session).push(
+                task_type=TaskType.MAINTAIN_ANN_INDEX,
+                payload={"project_id": str(project_id)},
+                priority=1,  # Below ingest; search works without the index
+            )
+            await session.commit()
+    except Exception as e:
+        logger.warning(f"[ANN] Failed to queue index maintenance for project {project_id}: {e}")
@@ -1,6 +1,7 @@
 """Document processor task - orchestrates the full document processing pipeline."""
 
 import asyncio
+from contextlib import aclosing
 from pathlib import Path
 from typing import Any
 from uuid import UUID
@@ -13,7 +14,8 @@ from research_agent.domain.entities.document import DocumentStatus
 from research_agent.domain.services.chunking_service import ChunkingService
 from research_agent.infrastructure.database.models import DocumentModel
 from research_agent.infrastructure.database.session import get_async_session
-from research_agent.infrastructure.embedding.openrouter import OpenRouterEmbeddingService
+from research_agent.infrastructure.embedding.base import EmbeddingService
+from research_agent.infrastructure.embedding.factory import create_embedding_service
 from research_agent.infrastructure.llm.base import ChatMessage
 from research_agent.infrastructure.llm.openrouter import OpenRouterLLMService
 from research_agent.infrastructure.parser.factory import ParserFactory
@@ -451,44 +453,19 @@ class DocumentProcessorTask(BaseTask):
                         f"model={settings.embedding_model}, rag_mode={settings.rag_mode}"
                     )
                     try:
-                        # OpenRouter DOES support embedding API!
-                        # The curl test confirmed it works.
-                        embedding_service = OpenRouterEmbeddingService(
-                            api_key=settings.openrouter_api_key,
-                            model=settings.embedding_model,
-                        )
+                        embedding_service = create_embedding_service()
 
-                        contents = [c["content"] for c in chunk_data]
                         logger.debug(
-                            f"First chunk preview: {contents[0][:100]}..."
-                            if contents
-                            else "No contents"
+                            f"First chunk preview: {chunk_data[0]['content'][:100]}..."
                         )
 
-                        try:
-                            # ✅ This is the long-running operation that was causing connection timeout
-                            embeddings = await embedding_service.embed_batch(contents)
-                            logger.info(
-                                f"✅ Step 4a completed: Generated {len(embeddings)} embeddings"
-                            )
-                        except Exception as e:
-                            logger.error(
-                                f"❌ Step 4a failed: Embedding generation error - "
-                                f"document_id={document_id}, chunk_count={len(contents)}, "
-                                f"model={settings.embedding_model}: {e}",
-                                exc_info=True,
-                            )
-                            raise
-
-                        # ✅ CRITICAL FIX: Save chunks with embeddings using FRESH session
-                        # The original session's connection may have timed out during embedding generation
-                        logger.debug(f"💾 Saving {len(chunk_data)} chunks to database in batches")
-
-                        await self._save_chunks_batch(
+                        # ✅ Embeddings are written window by window as they return (fresh
+                        # session per batch), so a large book never holds every vector at once
+                        await self._embed_and_save_chunks(
                             document_id=document_id,
                             project_id=project_id,
                             chunk_data=chunk_data,
-                            embeddings=embeddings,
+                            embedding_service=embedding_service,
                         )
 
                     except Exception as e:
@@ -638,19 +615,71 @@ class DocumentProcessorTask(BaseTask):
 
         Now uses ResourceChunk entity for unified storage across all resource types.
         """
-        from uuid import uuid4
-
-        from research_agent.domain.entities.resource import ResourceType
-        from research_agent.domain.entities.resource_chunk import ResourceChunk
-        from research_agent.infrastructure.database.repositories.chunk_repo_factory import (
-            get_chunk_repository,
+        doc_title, user_id = await self._get_chunk_owner(document_id)
+        await self._write_chunks(
+            document_id, project_id, chunk_data, embeddings, doc_title, user_id
         )
+        logger.info(f"✅ All {len(chunk_data)} chunks saved successfully")
 
-        batch_size = 50
+        if embeddings:
+            await self._refresh_vector_indexes(project_id)
+
+    async def _embed_and_save_chunks(
+        self,
+        document_id: UUID,
+        project_id: UUID,
+        chunk_data: list[dict[str, Any]],
+        embedding_service: EmbeddingService,
+    ) -> None:
+        """
+        Embed chunks and save each window as soon as its embeddings arrive.
+
+        Memory stays bounded by EMBEDDING_STREAM_WINDOW x EMBEDDING_STREAM_MAX_IN_FLIGHT
+        embeddings, and clients get ``ingest_progress`` notifications per window.
+        If embedding fails part-way, the chunks already written are deleted so a
+        retry starts from a clean document.
+        """
+        doc_title, user_id = await self._get_chunk_owner(document_id)
+        contents = [c["content"] for c in chunk_data]
         total_chunks = len(chunk_data)
         saved_count = 0
 
-        # Get document title and user_id for metadata
+        try:
+            # aclosing: a failed write cancels the windows still in flight
+            async with aclosing(embedding_service.embed_batch_stream(contents)) as windows:
+                async for start, end, embeddings in windows:
+                    await self._write_chunks(
+                        document_id,
+                        project_id,
+                        chunk_data[start:end],
+                        embeddings,
+                        doc_title,
+                        user_id,
+                    )
+                    saved_count += end - start
+                    logger.info(f"💾 Embedded and saved {saved_count}/{total_chunks} chunks")
+                    await document_notification_service.notify_ingest_progress(
+                        project_id=str(project_id),
+                        document_id=str(document_id),
+                        processed=saved_count,
+                        total=total_chunks,
+                    )
+        except Exception as e:
+            logger.error(
+                f"❌ Step 4a failed: Embedding or chunk write error - "
+                f"document_id={document_id}, chunk_count={total_chunks}, "
+                f"saved={saved_count}, model={settings.embedding_model}: {e}",
+                exc_info=True,
+            )
+            if saved_count:
+                await self._delete_chunks(document_id)
+            raise
+
+        logger.info(f"✅ Step 4a completed: Embedded and saved {saved_count} chunks")
+        await self._refresh_vector_indexes(project_id)
+
+    async def _get_chunk_owner(self, document_id: UUID) -> tuple[str, Any]:
+        """Document title and user_id stored on every chunk."""
         async with get_async_session() as title_session:
             doc_result = await title_session.execute(
                 select(DocumentModel).where(DocumentModel.id == document_id)
@@ -658,6 +687,29 @@ class DocumentProcessorTask(BaseTask):
             doc = doc_result.scalar_one_or_none()
             doc_title = doc.original_filename if doc else "Untitled"
             user_id = doc.user_id if doc else None
+        return doc_title, user_id
+
+    async def _write_chunks(
+        self,
+        document_id: UUID,
+        project_id: UUID,
+        chunk_data: list[dict[str, Any]],
+        embeddings: list[list[float]] | None,
+        doc_title: str,
+        user_id: Any,
+    ) -> None:
+        """Write chunks in batches of 50, each in a fresh session."""
+        from uuid import uuid4
+
+        from research_agent.domain.entities.resource import ResourceType
+        from research_agent.domain.entities.resource_chunk import ResourceChunk
+        from research_agent.infrastructure.database.repositories.chunk_repo_factory import (
+            get_chunk_repository,
+        )
+
+        batch_size = 50
+        total_chunks = len(chunk_data)
+        saved_count = 0
 
         for i in range(0, total_chunks, batch_size):
             batch_end = min(i + batch_size, total_chunks)
@@ -706,7 +758,37 @@ class DocumentProcessorTask(BaseTask):
             saved_count += len(batch_chunks)
             logger.debug(f"✅ Batch saved: {saved_count}/{total_chunks} chunks saved so far")
 
-        logger.info(f"✅ All {saved_count} chunks saved successfully")
+    async def _delete_chunks(self, document_id: UUID) -> None:
+        """Remove partially written chunks after a failed ingest."""
+        from research_agent.infrastructure.database.repositories.chunk_repo_factory import (
+            get_chunk_repository,
+        )
+
+        try:
+            async with get_async_session() as cleanup_session:
+                deleted = await get_chunk_repository(cleanup_session).delete_by_resource(
+                    document_id
+                )
+                await cleanup_session.commit()
+            logger.info(f"🧹 Deleted {deleted} partially saved chunks of {document_id}")
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to delete partial chunks of {document_id}: {e}")
+
+    async def _refresh_vector_indexes(self, project_id: UUID) -> None:
+        """Invalidate mmap snapshots and ANN stats; queue the partial index build."""
+        from research_agent.infrastructure.vector_store.ann_index import (
+            invalidate_project_stats,
+        )
+        from research_agent.infrastructure.vector_store.mmap_index import (
+            invalidate_project_vectors,
+        )
+        from research_agent.worker.tasks.ann_index_maintenance import (
+            schedule_ann_index_maintenance,
+        )
+
+        invalidate_project_vectors(project_id)
+        invalidate_project_stats(project_id)
+        await schedule_ann_index_maintenance(project_id)
 
     async def _generate_summary(self, llm: OpenRouterLLMService, text: str) -> str:
         """Generate a summary of the document text."""
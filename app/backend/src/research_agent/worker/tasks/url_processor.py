@@ -1,12 +1,12 @@
 """URL content extraction task for ARQ worker."""
 
+from contextlib import aclosing
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import UUID, uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from research_agent.config import get_settings
 from research_agent.domain.entities.resource import ResourceType
 from research_agent.domain.entities.resource_chunk import ResourceChunk
 from research_agent.infrastructure.database.models import UrlContentModel
@@ -17,8 +17,11 @@ from research_agent.infrastructure.database.repositories.sqlalchemy_url_content_
     SQLAlchemyUrlContentRepository,
 )
 from research_agent.infrastructure.database.session import get_async_session
-from research_agent.infrastructure.embedding.openrouter import OpenRouterEmbeddingService
+from research_agent.infrastructure.embedding.factory import create_embedding_service
 from research_agent.infrastructure.url_extractor import URLExtractorFactory
+from research_agent.infrastructure.websocket.notification_service import (
+    document_notification_service,
+)
 from research_agent.shared.utils.logger import logger
 from research_agent.worker.tasks.base import BaseTask
 
@@ -83,19 +86,17 @@ class URLProcessorTask(BaseTask):
                         **url_content.meta_data,
                         **result.metadata,
                     }
-                    url_content.status = "completed"
                     url_content.extracted_at = datetime.utcnow()
                     url_content.error_message = None
 
-                    await session.commit()
-                    await session.refresh(url_content)
-
                     # Get project_id from url_content if not provided in payload
                     effective_project_id = project_id or url_content.project_id
 
                     # Generate chunks and embeddings if we have content and project
+                    embedded = False
                     if result.content and effective_project_id:
-                        await self._process_chunks_and_embeddings(
+                        embedded = await self._process_chunks_and_embeddings(
+                            session=session,
                             url_content_id=url_content_id,
                             project_id=effective_project_id,
                             content=result.content,
@@ -105,6 +106,14 @@ class URLProcessorTask(BaseTask):
                             metadata=result.metadata,
                         )
 
+                    # Chunks commit with the final status: a URL is never
+                    # searchable half-ingested
+                    url_content.status = "completed"
+                    await session.commit()
+
+                    if embedded:
+                        await self._refresh_vector_indexes(effective_project_id)
+
                 logger.info(
                     f"✅ URL extraction completed - url_content_id={url_content_id}, "
                     f"title='{result.title}', content_length={len(result.content or '')}"
@@ -131,6 +140,7 @@ class URLProcessorTask(BaseTask):
 
             # Update status to failed
             try:
+                await session.rollback()
                 await repo.update_status(
                     url_content_id,
                     status="failed",
@@ -144,6 +154,7 @@ class URLProcessorTask(BaseTask):
 
     async def _process_chunks_and_embeddings(
         self,
+        session: AsyncSession,
         url_content_id: UUID,
         project_id: UUID,
         content: str,
@@ -151,11 +162,17 @@ class URLProcessorTask(BaseTask):
         platform: str,
         content_type: str,
         metadata: Dict[str, Any],
-    ) -> None:
+    ) -> bool:
         """
         Chunk URL content and generate embeddings.
-        
+
+        Chunks are written in the caller's transaction, window by window as
+        embeddings arrive; the caller commits them with the final status.
+        If embedding fails, the chunks are saved without embeddings instead.
+        Write errors propagate.
+
         Args:
+            session: Session of the task; not committed here
             url_content_id: UUID of the URL content record
             project_id: Project ID for chunk association
             content: Extracted text content
@@ -163,9 +180,10 @@ class URLProcessorTask(BaseTask):
             platform: Platform (youtube, bilibili, web, etc.)
             content_type: Content type (video, article, etc.)
             metadata: Additional metadata from extraction
-        """
-        settings = get_settings()
 
+        Returns:
+            True if the chunks were saved with embeddings
+        """
         # Determine resource type based on content_type
         resource_type = self._get_resource_type(content_type)
 
@@ -187,33 +205,61 @@ class URLProcessorTask(BaseTask):
 
         if not chunks:
             logger.warning(f"⚠️ No chunks generated for URL content {url_content_id}")
-            return
+            return False
 
         logger.info(f"📦 Generated {len(chunks)} chunks for URL content {url_content_id}")
 
-        # Generate embeddings
+        # Embed and save window by window: only the windows in flight hold vectors
+        contents = [chunk.content for chunk in chunks]
+        saved_count = 0
+        embedding_error: Exception | None = None
+        savepoint = await session.begin_nested()
         try:
-            embedding_service = OpenRouterEmbeddingService(
-                api_key=settings.openrouter_api_key,
-                model=settings.embedding_model,
-            )
-
-            contents = [chunk.content for chunk in chunks]
-            embeddings = await embedding_service.embed_batch(contents)
-
-            # Set embeddings on chunks
-            for chunk, embedding in zip(chunks, embeddings):
-                chunk.set_embedding(embedding)
-
-            logger.info(f"✅ Generated {len(embeddings)} embeddings for URL content")
-
-        except Exception as e:
-            logger.error(f"❌ Embedding generation failed for URL content: {e}")
-            # Continue without embeddings - chunks can still be saved for reference
-            pass
+            embedding_service = create_embedding_service()
+        except ValueError as e:
+            # No embedding backend configured
+            embedding_error = e
+        else:
+            async with aclosing(embedding_service.embed_batch_stream(contents)) as windows:
+                while True:
+                    # Only failures of the stream itself fall back; write errors propagate
+                    try:
+                        start, end, embeddings = await anext(windows)
+                    except StopAsyncIteration:
+                        break
+                    except Exception as e:
+                        embedding_error = e
+                        break
+
+                    window = chunks[start:end]
+                    for chunk, embedding in zip(window, embeddings):
+                        chunk.set_embedding(embedding)
+                    await self._save_chunks(session, window)
+                    # Written; release the vectors
+                    for chunk in window:
+                        chunk.embedding = None
+                    saved_count += len(window)
+                    await document_notification_service.notify_ingest_progress(
+                        project_id=str(project_id),
+                        document_id=str(url_content_id),
+                        processed=saved_count,
+                        total=len(chunks),
+                    )
 
-        # Save chunks using repository
-        await self._save_chunks(chunks)
+        if embedding_error is None:
+            await savepoint.commit()
+            logger.info(f"✅ Embedded and saved {saved_count} chunks for URL content")
+            return True
+
+        logger.error(f"❌ Embedding generation failed for URL content: {embedding_error}")
+        await savepoint.rollback()
+        if saved_count:
+            await self._delete_chunks(url_content_id)
+        # Continue without embeddings - chunks can still be saved for reference
+        for chunk in chunks:
+            chunk.embedding = None
+        await self._save_chunks(session, chunks)
+        return False
 
     def _get_resource_type(self, content_type: str) -> ResourceType:
         """Map content_type to ResourceType."""
@@ -347,25 +393,46 @@ class URLProcessorTask(BaseTask):
 
         return chunks
 
-    async def _save_chunks(self, chunks: List[ResourceChunk]) -> None:
-        """Save chunks using the chunk repository."""
+    async def _save_chunks(self, session: AsyncSession, chunks: List[ResourceChunk]) -> None:
+        """Write chunks in the given session (flushed, not committed)."""
         if not chunks:
             return
 
         batch_size = 50
         total_chunks = len(chunks)
         saved_count = 0
+        chunk_repo = get_chunk_repository(session)
 
         for i in range(0, total_chunks, batch_size):
             batch = chunks[i : i + batch_size]
-
-            async with get_async_session() as batch_session:
-                chunk_repo = get_chunk_repository(batch_session)
-                await chunk_repo.save_batch(batch)
-                await batch_session.commit()
-
+            await chunk_repo.save_batch(batch)
             saved_count += len(batch)
             logger.debug(f"✅ Saved {saved_count}/{total_chunks} URL content chunks")
 
-        logger.info(f"✅ All {saved_count} URL content chunks saved successfully")
+        logger.info(f"✅ {saved_count} URL content chunks saved")
+
+    async def _delete_chunks(self, url_content_id: UUID) -> None:
+        """Remove vectors of rolled-back chunks from stores outside PostgreSQL (Qdrant)."""
+        try:
+            async with get_async_session() as cleanup_session:
+                await get_chunk_repository(cleanup_session).delete_by_resource(url_content_id)
+                await cleanup_session.commit()
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to clean up partial chunks of {url_content_id}: {e}")
+
+    async def _refresh_vector_indexes(self, project_id: UUID) -> None:
+        """Invalidate mmap snapshots and ANN stats; queue the partial index build."""
+        from research_agent.infrastructure.vector_store.ann_index import (
+            invalidate_project_stats,
+        )
+        from research_agent.infrastructure.vector_store.mmap_index import (
+            invalidate_project_vectors,
+        )
+        from research_agent.worker.tasks.ann_index_maintenance import (
+            schedule_ann_index_maintenance,
+        )
+
+        invalidate_project_vectors(project_id)
+        invalidate_project_stats(project_id)
+        await schedule_ann_index_maintenance(project_id)
 
@@ -0,0 +1,150 @@
+"""Unit tests for the semantic answer cache."""
+
+import json
+import time
+from uuid import uuid4
+
+import pytest
+from research_agent.infrastructure.llm.answer_cache import (
+    REDIS_KEY_PREFIX,
+    CachedAnswer,
+    SemanticAnswerCache,
+    answer_scope_key,
+    get_answer_cache_stats,
+    reset_answer_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_counters():
+    reset_answer_cache()
+    yield
+    reset_answer_cache()
+
+
+def _cache(**kwargs) -> SemanticAnswerCache:
+    options = {"similarity_threshold": 0.95, "max_entries": 10, "ttl_seconds": 60, **kwargs}
+    return SemanticAnswerCache(**options)
+
+
+def _answer(text: str = "The main conclusion is X.") -> CachedAnswer:
+    return CachedAnswer(
+        question="what is the main conclusion",
+        answer=text,
+        sources=[
+            {"document_id": str(uuid4()), "page_number": 1, "snippet": "...", "similarity": 0.8}
+        ],
+    )
+
+
+class FakeRedis:
+    """Just enough of redis.asyncio for the shared tier (lists only)."""
+
+    def __init__(self):
+        self.lists = {}
+
+    async def lrange(self, key, start, end):
+        return list(self.lists.get(key, []))
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def lpush(self, key, value):
+        self._redis.lists.setdefault(key, []).insert(0, value)
+
+    def ltrim(self, key, start, end):
+        pass
+
+    def expire(self, key, seconds):
+        pass
+
+    async def execute(self):
+        pass
+
+
+class TestAnswerScopeKey:
+    """Test what separates cache scopes."""
+
+    def test_corpus_version_and_user_change_the_scope(self):
+        project_id = uuid4()
+        base = answer_scope_key(project_id, "user-1", "traditional", 3, model="m")
+
+        assert base == answer_scope_key(project_id, "user-1", "traditional", 3, model="m")
+        assert base != answer_scope_key(project_id, "user-1", "traditional", 4, model="m")
+        assert base != answer_scope_key(project_id, "user-2", "traditional", 3, model="m")
+        assert base != answer_scope_key(project_id, "user-1", "long_context", 3, model="m")
+
+
+class TestSemanticAnswerCache:
+    """Test similarity hits, scoping and bounds."""
+
+    @pytest.mark.asyncio
+    async def test_similar_question_hits(self):
+        cache = _cache()
+        await cache.store("scope", [1.0, 0.0, 0.0], _answer())
+
+        hit = await cache.lookup("scope", [0.99, 0.05, 0.0])
+
+        assert hit is not None
+        assert hit.answer == "The main conclusion is X."
+        assert hit.similarity > 0.95
+        assert len(hit.sources) == 1
+
+    @pytest.mark.asyncio
+    async def test_dissimilar_question_or_other_scope_misses(self):
+        cache = _cache()
+        await cache.store("scope", [1.0, 0.0, 0.0], _answer())
+
+        assert await cache.lookup("scope", [0.0, 1.0, 0.0]) is None
+        assert await cache.lookup("other-scope", [1.0, 0.0, 0.0]) is None
+        assert get_answer_cache_stats()["misses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_best_match_wins(self):
+        cache = _cache(similarity_threshold=0.5)
+        await cache.store("scope", [1.0, 0.0], _answer("first"))
+        await cache.store("scope", [0.0, 1.0], _answer("second"))
+
+        hit = await cache.lookup("scope", [0.2, 0.9])
+
+        assert hit.answer == "second"
+
+    @pytest.mark.asyncio
+    async def test_entries_are_bounded_and_expire(self):
+        cache = _cache(max_entries=2)
+        for i in range(3):
+            await cache.store("scope", [1.0, float(i)], _answer(str(i)))
+
+        assert len(cache) == 2
+        assert await cache.lookup("scope", [1.0, 0.0]) is None
+
+        expired = _answer()
+        expired.created_at = time.time() - 120
+        await cache.store("old", [1.0, 0.0], expired)
+        assert await cache.lookup("old", [1.0, 0.0]) is None
+
+    @pytest.mark.asyncio
+    async def test_unreadable_redis_entries_are_skipped(self):
+        redis = FakeRedis()
+        await _cache(redis=redis).store("scope", [1.0, 0.0, 0.0], _answer())
+        redis.lists[REDIS_KEY_PREFIX + "scope"][:0] = [b"not json", json.dumps({"embedding": ""})]
+        await _cache(redis=redis).store("scope", [1.0, 0.0], _answer("other model"))
+
+        hit = await _cache(redis=redis).lookup("scope", [1.0, 0.0, 0.0])
+
+        assert hit is not None
+        assert hit.answer == "The main conclusion is X."
+        stats = get_answer_cache_stats()
+        assert stats["redis_hits"] == 1
+        assert stats["errors"] == 3
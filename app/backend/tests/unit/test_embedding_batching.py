@@ -0,0 +1,130 @@
+"""Unit tests for token-aware embedding batch packing."""
+
+import asyncio
+
+import numpy as np
+import pytest
+from research_agent.infrastructure.embedding.batching import (
+    embed_in_batches,
+    plan_batches,
+    split_text,
+    stream_in_windows,
+)
+
+
+def _words(text: str) -> int:
+    return len(text.split())
+
+
+class TestPlanBatches:
+    """Test packing by items and tokens."""
+
+    def test_packs_by_tokens_and_items_in_order(self):
+        texts = ["a " * 60, "b " * 50, "c", "d", "e", "f " * 90]
+
+        plan = plan_batches(
+            texts, max_items=3, max_tokens=100, max_input_tokens=100, count_tokens=_words
+        )
+
+        assert plan.batches == [(0, 1), (1, 4), (4, 6)]
+        assert plan.inputs == texts
+
+    def test_oversize_input_split_deterministically(self):
+        text = " ".join(f"w{i}" for i in range(250))
+
+        pieces = split_text(text, 100, _words)
+
+        assert pieces == split_text(text, 100, _words)
+        assert "".join(pieces) == text
+        assert all(_words(piece) <= 100 for piece in pieces)
+        assert len(pieces) == 3
+
+
+class TestEmbedInBatches:
+    """Test ordering and merging of split inputs."""
+
+    @pytest.mark.asyncio
+    async def test_order_preserved_and_pieces_averaged(self):
+        sent = []
+
+        async def request(batch):
+            sent.append(list(batch))
+            return [[1.0, 0.0] if item.startswith("x") else [0.0, 1.0] for item in batch]
+
+        # ~20 estimated tokens -> three pieces of at most 8
+        long_text = "x" * 40 + " " + "y" * 40
+        result = await embed_in_batches(
+            ["x", long_text, "y"], request, max_items=2, max_tokens=50, max_input_tokens=8
+        )
+
+        assert [len(batch) for batch in sent] == [2, 2, 1]
+        assert result[0] == [1.0, 0.0] and result[2] == [0.0, 1.0]
+        assert np.linalg.norm(result[1]) == pytest.approx(1.0)
+        assert result[1][0] > 0 and result[1][1] > 0
+
+    @pytest.mark.asyncio
+    async def test_requests_in_flight_are_bounded(self):
+        active = 0
+        peak = 0
+
+        async def request(batch):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.005)
+            active -= 1
+            return [[1.0] for _ in batch]
+
+        result = await embed_in_batches(
+            [str(i) for i in range(20)], request, max_items=1, max_concurrency=3
+        )
+
+        assert len(result) == 20
+        assert peak == 3
+
+
+class TestStreamInWindows:
+    """Test incremental, bounded embedding of windows."""
+
+    @pytest.mark.asyncio
+    async def test_yields_windows_in_order_with_bounded_concurrency(self):
+        active = 0
+        peak = 0
+
+        async def embed(batch):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            # Later windows finish first
+            await asyncio.sleep(0.01 / (1 + int(batch[0])))
+            active -= 1
+            return [[float(item)] for item in batch]
+
+        texts = [str(i) for i in range(10)]
+        windows = [w async for w in stream_in_windows(texts, embed, window=3, max_in_flight=2)]
+
+        assert [(start, end) for start, end, _ in windows] == [(0, 3), (3, 6), (6, 9), (9, 10)]
+        assert [e[0] for _, _, embeddings in windows for e in embeddings] == list(range(10))
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_closing_early_cancels_in_flight_windows(self):
+        started = []
+        cancelled = []
+
+        async def embed(batch):
+            started.append(batch[0])
+            try:
+                await asyncio.sleep(0 if batch[0] == "0" else 10)
+            except asyncio.CancelledError:
+                cancelled.append(batch[0])
+                raise
+            return [[0.0]] * len(batch)
+
+        stream = stream_in_windows([str(i) for i in range(6)], embed, window=2, max_in_flight=3)
+        await stream.__anext__()
+        await stream.aclose()
+        await asyncio.sleep(0)
+
+        assert started == ["0", "2", "4"]
+        assert sorted(cancelled) == ["2", "4"]
@@ -0,0 +1,84 @@
+"""Unit tests for the content-addressed embedding cache."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+from research_agent.infrastructure.embedding.cache import (
+    CachedEmbeddingService,
+    cache_key,
+    normalize_text,
+)
+
+
+def _service(cached: dict):
+    inner = MagicMock()
+    inner.embed = AsyncMock(return_value=[0.5, 0.5])
+    inner.embed_batch = AsyncMock(
+        side_effect=lambda texts, **kwargs: [[float(len(t)), 0.0] for t in texts]
+    )
+    store = MagicMock()
+    store.get_many = AsyncMock(return_value=dict(cached))
+    store.put_many = AsyncMock()
+    return CachedEmbeddingService(inner, "test-model", store=store), inner, store
+
+
+class TestCacheKey:
+    """Test content addressing."""
+
+    def test_whitespace_and_unicode_normalized(self):
+        assert normalize_text("  café  \n au lait ") == "café au lait"
+        assert cache_key("m", "a  b") == cache_key("m", "a b\n")
+
+    def test_model_is_part_of_key(self):
+        assert cache_key("m1", "text") != cache_key("m2", "text")
+
+
+class TestCachedEmbeddingService:
+    """Test that only distinct misses reach the provider."""
+
+    @pytest.mark.asyncio
+    async def test_only_misses_are_sent_in_order(self):
+        hit = cache_key("test-model", "cached")
+        service, inner, store = _service({hit: [9.0, 9.0]})
+
+        result = await service.embed_batch(["new", "cached", "other", "new"], batch_size=8)
+
+        inner.embed_batch.assert_awaited_once_with(["new", "other"], batch_size=8)
+        assert result == [[3.0, 0.0], [9.0, 9.0], [5.0, 0.0], [3.0, 0.0]]
+        stored = store.put_many.await_args.args[1]
+        assert set(stored) == {cache_key("test-model", "new"), cache_key("test-model", "other")}
+
+    @pytest.mark.asyncio
+    async def test_full_hit_skips_provider(self):
+        service, inner, _ = _service({cache_key("test-model", "q"): [1.0, 2.0]})
+
+        assert await service.embed_batch(["q"]) == [[1.0, 2.0]]
+        inner.embed_batch.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_single_embed_bypasses_store(self):
+        service, inner, store = _service({cache_key("test-model", "q"): [1.0, 2.0]})
+
+        assert await service.embed("q") == [0.5, 0.5]
+        inner.embed.assert_awaited_once_with("q")
+        store.get_many.assert_not_awaited()
+        store.put_many.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_store_failure_falls_back_to_provider(self):
+        service, inner, store = _service({})
+        store.get_many = AsyncMock(side_effect=RuntimeError("db down"))
+        store.put_many = AsyncMock(side_effect=RuntimeError("db down"))
+
+        assert await service.embed_batch(["q"]) == [[1.0, 0.0]]
+        inner.embed_batch.assert_awaited_once_with(["q"])
+
+    def test_float16_blob_roundtrip_precision(self):
+        vector = np.random.default_rng(0).uniform(-0.1, 0.1, 1536)
+        blob = np.asarray(vector, dtype="<f2").tobytes()
+        restored = np.frombuffer(blob, dtype="<f2").astype(np.float32)
+
+        assert len(blob) == 1536 * 2
+        cosine = restored @ vector / (np.linalg.norm(restored) * np.linalg.norm(vector))
+        assert cosine > 0.9999
@@ -0,0 +1,78 @@
+"""Unit tests for the embed() micro-batching coalescer."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from research_agent.config import get_settings
+from research_agent.infrastructure.embedding.coalescer import (
+    CoalescingEmbeddingService,
+    get_coalescer_stats,
+    reset_coalescer,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_coalescer(monkeypatch):
+    reset_coalescer()
+    monkeypatch.setattr(get_settings(), "embedding_coalesce_window_ms", 20.0)
+    monkeypatch.setattr(get_settings(), "embedding_coalesce_max_items", 3)
+    yield
+    reset_coalescer()
+
+
+def _inner():
+    inner = MagicMock()
+    inner.embed_batch = AsyncMock(side_effect=lambda texts: [[float(len(t))] for t in texts])
+    return inner
+
+
+class TestCoalescingEmbeddingService:
+    """Test merging, size bound and per-model queues."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_merged_and_resolved_individually(self):
+        inner = _inner()
+        service = CoalescingEmbeddingService(inner, "m")
+
+        results = await asyncio.gather(service.embed("a"), service.embed("bb"), service.embed("a"))
+
+        assert results == [[1.0], [2.0], [1.0]]
+        inner.embed_batch.assert_awaited_once_with(["a", "bb"])
+        assert get_coalescer_stats()["m"]["batch_sizes"]["le_4"] == 1
+
+    @pytest.mark.asyncio
+    async def test_max_items_flushes_without_waiting_for_window(self, monkeypatch):
+        monkeypatch.setattr(get_settings(), "embedding_coalesce_window_ms", 10_000.0)
+        inner = _inner()
+        service = CoalescingEmbeddingService(inner, "m")
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*[service.embed(t) for t in ("a", "b", "c")]), timeout=1.0
+        )
+
+        assert len(results) == 3
+
+    @pytest.mark.asyncio
+    async def test_models_use_separate_queues(self):
+        inner = _inner()
+
+        await asyncio.gather(
+            CoalescingEmbeddingService(inner, "m1").embed("a"),
+            CoalescingEmbeddingService(inner, "m2").embed("b"),
+        )
+
+        assert inner.embed_batch.await_count == 2
+        assert set(get_coalescer_stats()) == {"m1", "m2"}
+
+    @pytest.mark.asyncio
+    async def test_failure_propagates_to_every_caller(self):
+        inner = _inner()
+        inner.embed_batch = AsyncMock(side_effect=RuntimeError("provider down"))
+        service = CoalescingEmbeddingService(inner, "m")
+
+        results = await asyncio.gather(
+            service.embed("a"), service.embed("b"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
@@ -0,0 +1,61 @@
+"""Unit tests for reduced-dimension (Matryoshka) embeddings."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+from research_agent.infrastructure.embedding.dimensions import (
+    supports_dimensions_param,
+    truncate_embedding,
+)
+from research_agent.infrastructure.embedding.openrouter import OpenAIEmbeddingService
+
+
+class TestTruncateEmbedding:
+    """Test prefix truncation and re-normalization."""
+
+    def test_truncates_and_renormalizes(self):
+        vector = [3.0, 4.0, 12.0]
+
+        truncated = truncate_embedding(vector, 2)
+
+        np.testing.assert_allclose(truncated, [0.6, 0.8], rtol=1e-6)
+
+    def test_rejects_growing(self):
+        with pytest.raises(ValueError):
+            truncate_embedding([1.0, 0.0], 4)
+
+    def test_dimensions_param_support(self):
+        assert supports_dimensions_param("openai/text-embedding-3-small")
+        assert supports_dimensions_param("text-embedding-3-large")
+        assert not supports_dimensions_param("text-embedding-ada-002")
+
+
+class TestDimensionsRequest:
+    """Test that services request the configured size."""
+
+    @pytest.mark.asyncio
+    async def test_openai_passes_dimensions(self):
+        service = OpenAIEmbeddingService(
+            api_key="test", model="text-embedding-3-small", dimensions=512
+        )
+        response = MagicMock()
+        response.data = [MagicMock(embedding=[0.1] * 512)]
+        service._client.embeddings.create = AsyncMock(return_value=response)
+
+        await service.embed("hello")
+
+        assert service._client.embeddings.create.call_args.kwargs["dimensions"] == 512
+
+    @pytest.mark.asyncio
+    async def test_openai_omits_dimensions_for_other_models(self):
+        service = OpenAIEmbeddingService(
+            api_key="test", model="text-embedding-ada-002", dimensions=512
+        )
+        response = MagicMock()
+        response.data = [MagicMock(embedding=[0.1] * 1536)]
+        service._client.embeddings.create = AsyncMock(return_value=response)
+
+        await service.embed("hello")
+
+        assert "dimensions" not in service._client.embeddings.create.call_args.kwargs
@@ -0,0 +1,44 @@
+"""Unit tests for embedding backend selection."""
+
+import pytest
+from research_agent.config import get_settings
+from research_agent.infrastructure.embedding.factory import create_embedding_service
+from research_agent.infrastructure.embedding.openrouter import (
+    OpenAIEmbeddingService,
+    OpenRouterEmbeddingService,
+)
+
+
+@pytest.fixture
+def settings(monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "embedding_backend", "openrouter")
+    monkeypatch.setattr(settings, "embedding_cache_enabled", False)
+    monkeypatch.setattr(settings, "embedding_model", "openai/text-embedding-3-small")
+    return settings
+
+
+class TestCreateEmbeddingService:
+    """Test the shared API/worker factory."""
+
+    def test_prefers_openrouter(self, settings, monkeypatch):
+        monkeypatch.setattr(settings, "openrouter_api_key", "or-key")
+        monkeypatch.setattr(settings, "openai_api_key", "sk-key")
+
+        assert isinstance(create_embedding_service(), OpenRouterEmbeddingService)
+
+    def test_falls_back_to_openai_without_provider_prefix(self, settings, monkeypatch):
+        monkeypatch.setattr(settings, "openrouter_api_key", " ")
+        monkeypatch.setattr(settings, "openai_api_key", "sk-key")
+
+        service = create_embedding_service()
+
+        assert isinstance(service, OpenAIEmbeddingService)
+        assert service._model == "text-embedding-3-small"
+
+    def test_no_key_raises(self, settings, monkeypatch):
+        monkeypatch.setattr(settings, "openrouter_api_key", "")
+        monkeypatch.setattr(settings, "openai_api_key", "")
+
+        with pytest.raises(ValueError):
+            create_embedding_service()
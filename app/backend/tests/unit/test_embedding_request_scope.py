@@ -0,0 +1,71 @@
+"""Unit tests for per-turn query embedding memoization."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from research_agent.infrastructure.embedding.request_scope import (
+    EmbeddingScope,
+    embed_query,
+    prefetch_embedding,
+)
+
+
+def _service(delay: float = 0.0):
+    async def embed(text):
+        await asyncio.sleep(delay)
+        return [float(len(text))]
+
+    service = MagicMock()
+    service.embed = AsyncMock(side_effect=embed)
+    return service
+
+
+class TestEmbeddingScope:
+    """Test that each distinct text is embedded once per turn."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_request(self):
+        service = _service(delay=0.01)
+
+        async with EmbeddingScope() as scope:
+            results = await asyncio.gather(
+                embed_query(service, "question"),
+                embed_query(service, "question"),
+                embed_query(service, "other"),
+            )
+
+        assert results == [[8.0], [8.0], [5.0]]
+        assert service.embed.await_count == 2
+        assert scope.requests == 3 and scope.computed == 2
+
+    @pytest.mark.asyncio
+    async def test_prefetch_saves_latency(self):
+        service = _service(delay=0.02)
+
+        async with EmbeddingScope() as scope:
+            prefetch_embedding(service, "question")
+            await asyncio.sleep(0.03)
+            assert await embed_query(service, "question") == [8.0]
+
+        service.embed.assert_awaited_once_with("question")
+        assert scope.saved_ms > 10
+
+    @pytest.mark.asyncio
+    async def test_failure_is_not_memoized(self):
+        service = _service()
+        service.embed.side_effect = [RuntimeError("provider down"), [1.0]]
+
+        async with EmbeddingScope():
+            with pytest.raises(RuntimeError):
+                await embed_query(service, "q")
+            assert await embed_query(service, "q") == [1.0]
+
+    @pytest.mark.asyncio
+    async def test_without_scope_calls_service(self):
+        service = _service()
+
+        await embed_query(service, "q")
+        await embed_query(service, "q")
+
+        assert service.embed.await_count == 2
@@ -0,0 +1,92 @@
+"""Unit tests for the pooled embedding transport and AIMD limiter."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from research_agent.config import get_settings
+from research_agent.infrastructure.embedding import openrouter as openrouter_module
+from research_agent.infrastructure.embedding import transport
+from research_agent.infrastructure.embedding.openrouter import OpenRouterEmbeddingService
+from research_agent.infrastructure.embedding.transport import (
+    AIMDLimiter,
+    parse_retry_after,
+    retry_delay,
+)
+
+
+class TestRetryAfter:
+    """Test provider rate-limit header parsing."""
+
+    def test_seconds_and_milliseconds(self):
+        assert parse_retry_after(httpx.Headers({"retry-after": "3"})) == 3.0
+        assert parse_retry_after(httpx.Headers({"retry-after-ms": "250"})) == 0.25
+
+    def test_missing_headers(self):
+        assert parse_retry_after(httpx.Headers({})) is None
+
+    def test_unparseable_retry_after_is_ignored(self):
+        assert parse_retry_after(httpx.Headers({"retry-after": "soon"})) is None
+        assert parse_retry_after(httpx.Headers({"retry-after": ""})) is None
+        past = "Wed, 21 Oct 2015 07:28:00 GMT"
+        assert parse_retry_after(httpx.Headers({"retry-after": past})) == 0.0
+
+    def test_backoff_is_jittered_and_capped(self):
+        assert all(0 <= retry_delay(20) <= transport.BACKOFF_MAX_SECONDS for _ in range(50))
+        assert 2.0 <= retry_delay(0, retry_after=2.0) <= 2.2
+
+
+class TestAIMDLimiter:
+    """Test additive increase / multiplicative decrease."""
+
+    def test_increase_and_decrease(self):
+        limiter = AIMDLimiter("test", initial=4, maximum=8)
+        # ~1 per window of successes: 4 -> 5 after five
+        for _ in range(5):
+            limiter.on_success()
+        assert limiter.limit == 5
+
+        limiter.on_throttle()
+        assert limiter.limit == 2
+        # Throttles within the cooldown count once
+        limiter.on_throttle()
+        assert limiter.limit == 2
+
+    @pytest.mark.asyncio
+    async def test_window_bounds_in_flight(self):
+        limiter = AIMDLimiter("test", initial=1)
+        await limiter.acquire()
+        assert limiter.in_flight == 1
+        await limiter.release()
+        async with limiter:
+            assert limiter.in_flight == 1
+        assert limiter.in_flight == 0
+
+
+class TestOpenRouterRetry:
+    """Test that throttled requests are retried and shrink the window."""
+
+    @pytest.mark.asyncio
+    async def test_retries_429_with_retry_after(self, monkeypatch):
+        monkeypatch.setattr(get_settings(), "embedding_max_retries", 2)
+        monkeypatch.setattr(transport, "_limiters", {})
+        sleep = AsyncMock()
+        monkeypatch.setattr(openrouter_module.asyncio, "sleep", sleep)
+
+        request = httpx.Request("POST", "https://example.test/embeddings")
+        client = MagicMock()
+        client.post = AsyncMock(
+            side_effect=[
+                httpx.Response(429, headers={"retry-after": "1"}, request=request),
+                httpx.Response(200, json={"data": [{"embedding": [0.1]}]}, request=request),
+            ]
+        )
+        monkeypatch.setattr(openrouter_module, "get_http_client", lambda: client)
+
+        service = OpenRouterEmbeddingService(api_key="key", model="m")
+        assert await service.embed("q") == [0.1]
+
+        assert client.post.await_count == 2
+        assert max(call.args[0] for call in sleep.await_args_list) >= 1.0
+        limiter = transport.get_rate_limiter("openrouter:m")
+        assert limiter.limit == get_settings().embedding_concurrency_initial // 2
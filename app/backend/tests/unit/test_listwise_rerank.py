@@ -0,0 +1,145 @@
+"""Unit tests for listwise LLM rerank scoring."""
+
+import pytest
+from langchain_core.documents import Document
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from research_agent.application.graphs.rag_graph import assess_relevance
+from research_agent.infrastructure.llm.listwise_rerank import (
+    judge_listwise,
+    parse_listwise_judgements,
+    parse_listwise_scores,
+    plan_listwise_batches,
+    score_listwise,
+)
+
+
+class TestParseListwiseScores:
+    """Test tolerant parsing of the JSON score list."""
+
+    def test_scores_object(self):
+        output = '{"scores": [{"id": 2, "score": 3}, {"id": 1, "score": 9}]}'
+        assert parse_listwise_scores(output, 2) == [9.0, 3.0]
+
+    def test_code_fence_and_clamping(self):
+        output = '```json\n{"scores": [{"id": 1, "score": 14}, {"id": 2, "score": -1}]}\n```'
+        assert parse_listwise_scores(output, 2) == [10.0, 0.0]
+
+    def test_mapping_and_bare_list(self):
+        assert parse_listwise_scores('{"1": 4, "2": 6}', 2) == [4.0, 6.0]
+        assert parse_listwise_scores("[7, 2, 5]", 3) == [7.0, 2.0, 5.0]
+
+    def test_malformed_json_recovers_pairs(self):
+        output = '{"scores": [{"id": 1, "score": 8}, {"id": 3, "score": 2}'
+        assert parse_listwise_scores(output, 3) == [8.0, None, 2.0]
+
+    def test_unparseable_output_scores_nothing(self):
+        assert parse_listwise_scores("I cannot help with that.", 2) == [None, None]
+
+
+class TestParseListwiseJudgements:
+    """Test parsing fused score + keep/drop output."""
+
+    def test_results_object(self):
+        output = (
+            '{"results": [{"id": 1, "score": 8, "relevant": true},'
+            ' {"id": 2, "score": 6, "relevant": false}]}'
+        )
+        assert parse_listwise_judgements(output, 2) == [(8.0, True), (6.0, False)]
+
+    def test_missing_decision_falls_back_to_score(self):
+        output = '[{"id": 1, "score": 7}, {"id": 2, "score": 3}]'
+        assert parse_listwise_judgements(output, 2) == [(7.0, True), (3.0, False)]
+
+    def test_malformed_json_recovers_judgements(self):
+        output = '{"results": [{"id": 2, "score": 9, "relevant": "yes"}, {"id": 1, "sc'
+        assert parse_listwise_judgements(output, 2) == [None, (9.0, True)]
+
+
+class TestPlanListwiseBatches:
+    """Test splitting candidates by prompt budget."""
+
+    def test_everything_fits_in_one_prompt(self):
+        assert plan_listwise_batches(["short text"] * 20, max_prompt_tokens=10_000) == [
+            list(range(20))
+        ]
+
+    def test_splits_in_order_when_over_budget(self):
+        texts = ["word " * 400] * 4
+        batches = plan_listwise_batches(texts, max_prompt_tokens=1200)
+
+        assert len(batches) > 1
+        assert [i for batch in batches for i in batch] == [0, 1, 2, 3]
+
+
+class TestScoreListwise:
+    """Test one call per prompt and graceful failure."""
+
+    @pytest.mark.asyncio
+    async def test_single_call_for_all_candidates(self):
+        llm = FakeListChatModel(
+            responses=['{"scores": [{"id": 1, "score": 2}, {"id": 2, "score": 9}]}']
+        )
+
+        result = await score_listwise(
+            llm, "question", ["doc a", "doc b"], max_doc_chars=100, max_prompt_tokens=10_000
+        )
+
+        assert result.scores == [2.0, 9.0]
+        assert len(result.call_latency_ms) == 1
+        assert result.parse_failures == 0
+
+    @pytest.mark.asyncio
+    async def test_parse_failure_leaves_candidates_unscored(self):
+        llm = FakeListChatModel(responses=["not json"])
+
+        result = await score_listwise(
+            llm, "question", ["doc a", "doc b"], max_doc_chars=100, max_prompt_tokens=10_000
+        )
+
+        assert result.scores == [None, None]
+        assert result.parse_failures == 1
+
+
+class TestJudgeListwise:
+    """Test the fused rerank + grade pass."""
+
+    @pytest.mark.asyncio
+    async def test_scores_and_decisions_from_one_call(self):
+        llm = FakeListChatModel(
+            responses=[
+                '{"results": [{"id": 1, "score": 2, "relevant": false},'
+                ' {"id": 2, "score": 9, "relevant": true}]}'
+            ]
+        )
+
+        result = await judge_listwise(
+            llm, "question", ["doc a", "doc b"], max_doc_chars=100, max_prompt_tokens=10_000
+        )
+
+        assert result.scores == [2.0, 9.0]
+        assert result.keep == [False, True]
+        assert len(result.call_latency_ms) == 1
+
+
+class TestAssessRelevance:
+    """Test keep/drop decisions of the fused pass."""
+
+    JUDGEMENTS = (
+        '{"results": [{"id": 1, "score": 3, "relevant": true},'
+        ' {"id": 2, "score": 9, "relevant": true},'
+        ' {"id": 3, "score": 8, "relevant": false}]}'
+    )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("reorder", "expected"), [(True, ["b"]), (False, ["a", "b"])])
+    async def test_low_score_only_drops_when_reranking(self, reorder, expected):
+        state = {
+            "question": "question",
+            "documents": [Document(page_content=text) for text in ("a", "b", "c")],
+        }
+
+        result = await assess_relevance(
+            state, FakeListChatModel(responses=[self.JUDGEMENTS]), reorder=reorder
+        )
+
+        assert [doc.page_content for doc in result["filtered_documents"]] == expected
@@ -0,0 +1,118 @@
+"""Unit tests for the local ONNX embedding service (tiny offline model)."""
+
+import numpy as np
+import pytest
+from research_agent.infrastructure.embedding.local_onnx import (
+    LocalOnnxEmbeddingService,
+    pool_embeddings,
+)
+
+WORDS = ["hello", "world", "cats", "dogs"]
+
+
+@pytest.fixture(scope="module")
+def tiny_model(tmp_path_factory):
+    """8-dim embedding-table model with a word-level tokenizer, built offline."""
+    onnx = pytest.importorskip("onnx")
+    pytest.importorskip("onnxruntime")
+    tokenizers = pytest.importorskip("tokenizers")
+    from onnx import TensorProto, helper, numpy_helper
+
+    directory = tmp_path_factory.mktemp("tiny-embedding")
+    vocab = {"[PAD]": 0, "[UNK]": 1, **{w: i + 2 for i, w in enumerate(WORDS)}}
+    tokenizer = tokenizers.Tokenizer(tokenizers.models.WordLevel(vocab, unk_token="[UNK]"))
+    tokenizer.pre_tokenizer = tokenizers.pre_tokenizers.Whitespace()
+    tokenizer.save(str(directory / "tokenizer.json"))
+
+    table = np.random.default_rng(0).standard_normal((len(vocab), 8)).astype(np.float32)
+    graph = helper.make_graph(
+        [
+            helper.make_node("Gather", ["table", "input_ids"], ["tokens"]),
+            helper.make_node("Cast", ["attention_mask"], ["mask"], to=TensorProto.FLOAT),
+            helper.make_node("Unsqueeze", ["mask", "axis"], ["mask_3d"]),
+            helper.make_node("Mul", ["tokens", "mask_3d"], ["last_hidden_state"]),
+        ],
+        "tiny",
+        [
+            helper.make_tensor_value_info("input_ids", TensorProto.INT64, ["batch", "seq"]),
+            helper.make_tensor_value_info("attention_mask", TensorProto.INT64, ["batch", "seq"]),
+        ],
+        [helper.make_tensor_value_info("last_hidden_state", TensorProto.FLOAT, ["batch", "seq", 8])],
+        initializer=[
+            numpy_helper.from_array(table, "table"),
+            numpy_helper.from_array(np.array([-1], dtype=np.int64), "axis"),
+        ],
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 13)])
+    model.ir_version = 8
+    onnx.save(model, str(directory / "model.onnx"))
+    return directory, table, vocab
+
+
+class TestPooling:
+    """Test masked pooling and normalization."""
+
+    def test_mean_pooling_ignores_padding(self):
+        hidden = np.array([[[1.0, 0.0], [0.0, 1.0], [9.0, 9.0]]], dtype=np.float32)
+        mask = np.array([[1, 1, 0]])
+
+        pooled = pool_embeddings(hidden, mask, "mean")
+
+        np.testing.assert_allclose(pooled[0], [2**-0.5, 2**-0.5], rtol=1e-6)
+
+    def test_unknown_pooling(self):
+        with pytest.raises(ValueError):
+            LocalOnnxEmbeddingService(model_path=".", pooling="max")
+
+
+class TestLocalOnnxEmbeddingService:
+    """Test inference with the tiny model."""
+
+    @pytest.mark.asyncio
+    async def test_batch_matches_reference_and_keeps_order(self, tiny_model):
+        directory, table, vocab = tiny_model
+        service = LocalOnnxEmbeddingService(model_path=str(directory), batch_size=2, dimensions=8)
+        texts = ["hello world cats", "dogs", "hello", "world dogs"]
+
+        embeddings = await service.embed_batch(texts)
+
+        for text, embedding in zip(texts, embeddings):
+            expected = table[[vocab[w] for w in text.split()]].mean(axis=0)
+            expected /= np.linalg.norm(expected)
+            np.testing.assert_allclose(embedding, expected, rtol=1e-5, atol=1e-6)
+
+    @pytest.mark.asyncio
+    async def test_single_embed_equals_batch(self, tiny_model):
+        directory, _, _ = tiny_model
+        service = LocalOnnxEmbeddingService(model_path=str(directory), dimensions=8)
+
+        single = await service.embed("cats dogs")
+        batch = await service.embed_batch(["hello", "cats dogs"])
+
+        np.testing.assert_allclose(single, batch[1], rtol=1e-6)
+
+    @pytest.mark.asyncio
+    async def test_truncates_to_configured_dimensions(self, tiny_model):
+        directory, table, vocab = tiny_model
+        service = LocalOnnxEmbeddingService(model_path=str(directory), dimensions=4)
+
+        embedding = await service.embed("cats")
+
+        expected = table[vocab["cats"], :4] / np.linalg.norm(table[vocab["cats"], :4])
+        np.testing.assert_allclose(embedding, expected, rtol=1e-5, atol=1e-6)
+
+    @pytest.mark.asyncio
+    async def test_rejects_narrower_model(self, tiny_model):
+        directory, _, _ = tiny_model
+        service = LocalOnnxEmbeddingService(model_path=str(directory), dimensions=16)
+
+        with pytest.raises(ValueError):
+            await service.embed("cats")
+
+    @pytest.mark.asyncio
+    async def test_missing_model_directory(self, tmp_path):
+        pytest.importorskip("onnxruntime")
+        service = LocalOnnxEmbeddingService(model_path=str(tmp_path / "missing"))
+
+        with pytest.raises(FileNotFoundError):
+            await service.embed("hello")
@@ -0,0 +1,74 @@
+"""Unit tests for the CPU feature reranker."""
+
+import numpy as np
+import pytest
+from langchain_core.documents import Document
+from research_agent.infrastructure.rerank import LocalFeatureReranker, get_reranker
+from research_agent.infrastructure.rerank.local_features import bm25_scores, tokenize
+
+DOCUMENTS = [
+    Document(page_content="Bananas are a yellow fruit.", metadata={"similarity": 0.31}),
+    Document(
+        page_content="Graph mode defines how the knowledge graph is built.",
+        metadata={"similarity": 0.52},
+    ),
+    Document(page_content="See the graph mode config.", metadata={"similarity": 0.45}),
+]
+
+
+class TestFeatures:
+    """Test tokenization and BM25."""
+
+    def test_tokenize_splits_cjk_characters(self):
+        assert tokenize("What is 图谱 Mode?") == ["what", "is", "图", "谱", "mode"]
+
+    def test_bm25_prefers_documents_with_rare_terms(self):
+        docs = [["graph", "mode"], ["graph", "other"], ["unrelated", "text"]]
+
+        scores = bm25_scores(["graph", "mode"], docs)
+
+        assert scores[0] > scores[1] > scores[2] == 0.0
+
+
+class TestLocalFeatureReranker:
+    """Test scoring scale and ordering."""
+
+    @pytest.mark.asyncio
+    async def test_relevant_documents_score_higher_on_0_10_scale(self):
+        scores = await LocalFeatureReranker().score("what is graph mode", DOCUMENTS)
+
+        assert all(0.0 <= score <= 10.0 for score in scores)
+        assert int(np.argmax(scores)) == 1
+        assert scores[0] < 5.0 <= scores[2]
+
+    @pytest.mark.asyncio
+    async def test_works_without_retrieval_similarity(self):
+        documents = [Document(page_content=doc.page_content) for doc in DOCUMENTS]
+
+        scores = await LocalFeatureReranker().score("what is graph mode", documents)
+
+        assert scores[0] < scores[2] and scores[0] < scores[1]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "question",
+        ["which setting controls concept network construction", "图谱模式是如何构建的"],
+    )
+    async def test_strong_vector_match_passes_without_word_overlap(self, question):
+        documents = [
+            Document(page_content=DOCUMENTS[1].page_content, metadata={"similarity": 0.61}),
+            Document(page_content=DOCUMENTS[0].page_content, metadata={"similarity": 0.22}),
+        ]
+
+        scores = await LocalFeatureReranker().score(question, documents)
+
+        assert scores[0] >= 5.0
+        assert scores[1] < 5.0
+
+    @pytest.mark.asyncio
+    async def test_empty_input(self):
+        assert await LocalFeatureReranker().score("question", []) == []
+
+    def test_get_reranker(self):
+        assert isinstance(get_reranker("local"), LocalFeatureReranker)
+        assert get_reranker("llm") is None
@@ -0,0 +1,125 @@
+"""Unit tests for the shared rewrite/intent result cache."""
+
+from uuid import uuid4
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from research_agent.application.graphs.rag_graph import classify_intent
+from research_agent.infrastructure.llm.result_cache import (
+    LLMResultCache,
+    get_result_cache_stats,
+    hit_rate,
+    prompt_version,
+    reset_result_caches,
+    result_cache_key,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches():
+    reset_result_caches()
+    yield
+    reset_result_caches()
+
+
+class FakeRedis:
+    """Just enough of redis.asyncio for the shared tier."""
+
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+
+
+class BrokenRedis:
+    async def get(self, key):
+        raise ConnectionError("down")
+
+    async def set(self, key, value, ex=None):
+        raise ConnectionError("down")
+
+
+class TestResultCacheKey:
+    """Test what separates cache entries."""
+
+    def test_project_model_and_prompt_change_the_key(self):
+        project_id = uuid4()
+        version = prompt_version("Rewrite the question.")
+        base = result_cache_key(project_id, "model-a", version, "what is it")
+
+        assert base == result_cache_key(project_id, "model-a", version, "what is it")
+        assert base != result_cache_key(uuid4(), "model-a", version, "what is it")
+        assert base != result_cache_key(project_id, "model-b", version, "what is it")
+        assert base != result_cache_key(
+            project_id, "model-a", prompt_version("Rewrite it."), "what is it"
+        )
+
+
+class TestLLMResultCache:
+    """Test tiers, bounds and counters."""
+
+    @pytest.mark.asyncio
+    async def test_entries_are_bounded_and_counted(self):
+        cache = LLMResultCache("rewrite", max_entries=2, ttl_seconds=60)
+        for i in range(3):
+            await cache.set(str(i), {"rewritten_question": str(i)})
+
+        assert len(cache) == 2
+        assert await cache.get("0") is None
+        assert await cache.get("2") == {"rewritten_question": "2"}
+        assert hit_rate("rewrite") == 0.5
+        assert get_result_cache_stats()["rewrite"]["lookups"] == 2
+
+    @pytest.mark.asyncio
+    async def test_entries_expire(self):
+        cache = LLMResultCache("intent", max_entries=10, ttl_seconds=-1)
+        await cache.set("key", {"intent_type": "factual"})
+
+        assert await cache.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_redis_tier_shares_entries_between_processes(self):
+        redis = FakeRedis()
+        await LLMResultCache("intent", 10, 60, redis=redis).set("key", {"intent_type": "factual"})
+
+        other_worker = LLMResultCache("intent", 10, 60, redis=redis)
+
+        assert await other_worker.get("key") == {"intent_type": "factual"}
+        assert get_result_cache_stats()["intent"]["redis_hits"] == 1
+        assert len(other_worker) == 1
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_degrade_to_local_tier(self):
+        cache = LLMResultCache("rewrite", 10, 60, redis=BrokenRedis())
+        await cache.set("key", {"rewritten_question": "q"})
+
+        assert await cache.get("key") == {"rewritten_question": "q"}
+        assert await cache.get("missing") is None
+        assert get_result_cache_stats()["rewrite"]["errors"] == 2
+
+
+class TestClassifyIntentCache:
+    """Test intent results are reused per project."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_question_skips_the_llm_within_a_project(self):
+        llm = FakeListChatModel(
+            responses=[
+                '{"intent": "comparison", "confidence": 0.9}',
+                '{"intent": "factual", "confidence": 0.7}',
+            ]
+        )
+        state = {"question": "compare A and B"}
+        project_id = uuid4()
+
+        first = await classify_intent(state, llm, project_id=project_id)
+        second = await classify_intent(state, llm, project_id=project_id)
+        other_project = await classify_intent(state, llm, project_id=uuid4())
+
+        assert first["intent_type"] == second["intent_type"] == "comparison"
+        assert other_project["intent_type"] == "factual"
+        assert get_result_cache_stats()["intent"]["local_hits"] == 1
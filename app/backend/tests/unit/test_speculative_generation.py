@@ -0,0 +1,86 @@
+"""Unit tests for speculative generation overlapped with grading."""
+
+import asyncio
+
+import pytest
+from langchain_core.documents import Document
+from research_agent.application.graphs.speculative_generation import SpeculativeGeneration
+
+DOCS = [
+    Document(page_content="chunk a", metadata={"document_id": "d1"}),
+    Document(page_content="chunk b", metadata={"document_id": "d1"}),
+    Document(page_content="chunk c", metadata={"document_id": "d2"}),
+]
+
+
+async def _tokens(count: int, delay: float = 0.0):
+    for i in range(count):
+        await asyncio.sleep(delay)
+        yield f"t{i} "
+
+
+async def _select(documents, delay: float = 0.0):
+    await asyncio.sleep(delay)
+    return documents
+
+
+async def _collect(speculation, tokens):
+    return [event["content"] async for event in speculation.stream(tokens)]
+
+
+class TestSpeculativeGeneration:
+    """Test keeping, discarding and measuring the draft."""
+
+    @pytest.mark.asyncio
+    async def test_draft_kept_when_its_documents_survive(self):
+        speculation = SpeculativeGeneration(DOCS[:2], _select([DOCS[1], DOCS[0]], delay=0.01))
+
+        tokens = await _collect(speculation, _tokens(5, delay=0.005))
+
+        assert speculation.won is True
+        assert tokens == ["t0 ", "t1 ", "t2 ", "t3 ", "t4 "]
+        assert speculation.documents == [DOCS[1], DOCS[0]]
+
+    @pytest.mark.asyncio
+    async def test_draft_stops_when_grading_drops_a_draft_document(self):
+        speculation = SpeculativeGeneration(DOCS[:2], _select([DOCS[0], DOCS[2]], delay=0.02))
+
+        tokens = await _collect(speculation, _tokens(100, delay=0.005))
+
+        assert speculation.won is False
+        assert speculation.dropped_documents == 1
+        assert 0 < len(tokens) < 100
+        assert speculation.documents == [DOCS[0], DOCS[2]]
+
+    @pytest.mark.asyncio
+    async def test_finished_draft_waits_for_validation(self):
+        speculation = SpeculativeGeneration(DOCS[:1], _select([DOCS[2]], delay=0.02))
+
+        tokens = await _collect(speculation, _tokens(3))
+
+        assert len(tokens) == 3
+        assert speculation.won is False
+
+    @pytest.mark.asyncio
+    async def test_selection_error_propagates(self):
+        async def failing_selection():
+            raise RuntimeError("grading failed")
+
+        speculation = SpeculativeGeneration(DOCS[:1], failing_selection())
+
+        with pytest.raises(RuntimeError):
+            await _collect(speculation, _tokens(100, delay=0.005))
+
+    @pytest.mark.asyncio
+    async def test_failed_draft_stream_falls_back_to_regeneration(self):
+        async def failing_tokens():
+            yield "t0 "
+            raise ConnectionError("stream dropped")
+
+        speculation = SpeculativeGeneration(DOCS[:2], _select(DOCS[:2], delay=0.01))
+
+        tokens = await _collect(speculation, failing_tokens())
+
+        assert tokens == ["t0 "]
+        assert speculation.won is False
+        assert speculation.documents == DOCS[:2]
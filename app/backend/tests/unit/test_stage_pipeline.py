@@ -0,0 +1,87 @@
+"""Unit tests for the concurrent pre-retrieval stage runner."""
+
+import asyncio
+import time
+
+import pytest
+from research_agent.application.graphs.stage_pipeline import StagePipeline
+
+
+def _stage(value, delay: float = 0.0):
+    async def run():
+        await asyncio.sleep(delay)
+        return value
+
+    return run
+
+
+class TestStagePipeline:
+    """Test stage concurrency, discarding and timing."""
+
+    @pytest.mark.asyncio
+    async def test_independent_stages_overlap(self):
+        pipeline = StagePipeline()
+        started = time.perf_counter()
+        try:
+            pipeline.start("intent", _stage({"intent_type": "factual"}, delay=0.05))
+            pipeline.start("memory", _stage({"retrieved_memories": []}, delay=0.05))
+            assert await pipeline.result("intent") == {"intent_type": "factual"}
+            assert await pipeline.result("memory") == {"retrieved_memories": []}
+        finally:
+            await pipeline.aclose()
+
+        assert time.perf_counter() - started < 0.09
+        assert set(pipeline.timings()) == {"intent", "memory"}
+
+    @pytest.mark.asyncio
+    async def test_db_stages_serialize_on_lock(self):
+        pipeline = StagePipeline()
+        active = []
+        overlapped = False
+
+        async def db_stage():
+            nonlocal overlapped
+            async with pipeline.db_lock:
+                active.append(1)
+                overlapped = overlapped or len(active) > 1
+                await asyncio.sleep(0.01)
+                active.pop()
+            return {}
+
+        try:
+            pipeline.start("summary", db_stage, uses_db=True)
+            pipeline.start("memory", db_stage, uses_db=True)
+            await pipeline.result("summary")
+            await pipeline.result("memory")
+        finally:
+            await pipeline.aclose()
+
+        assert not overlapped
+
+    @pytest.mark.asyncio
+    async def test_discard_cancels_llm_stage_but_not_db_stage(self):
+        pipeline = StagePipeline()
+        intent = pipeline.start("intent", _stage({}, delay=1.0))
+        retrieve = pipeline.start("retrieve", _stage({"documents": []}, delay=0.01), uses_db=True)
+
+        pipeline.discard("intent", "retrieve")
+        await pipeline.aclose()
+
+        assert intent.cancelled()
+        assert retrieve.result() == {"documents": []}
+        assert not pipeline.has("intent")
+
+    @pytest.mark.asyncio
+    async def test_dependent_waiter_cancellation_does_not_cancel_dependency(self):
+        pipeline = StagePipeline()
+        pipeline.start("intent", _stage({"intent_type": "summary"}, delay=0.02))
+
+        async def retrieval():
+            return await pipeline.result("intent")
+
+        waiter = pipeline.start("retrieve", retrieval)
+        await asyncio.sleep(0)
+        waiter.cancel()
+
+        assert await pipeline.result("intent") == {"intent_type": "summary"}
+        await pipeline.aclose()
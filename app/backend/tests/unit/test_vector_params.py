@@ -0,0 +1,47 @@
+"""Unit tests for the binary pgvector parameter codec."""
+
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+from pgvector import Vector
+from research_agent.infrastructure.database import vector_params
+from research_agent.infrastructure.database.vector_params import (
+    _encode_vector,
+    register_vector_codecs,
+    vector_param,
+)
+
+
+class TestVectorCodec:
+    """Test encoding of query embeddings and ORM text literals."""
+
+    def test_binary_encoding_round_trips(self):
+        embedding = [0.25, -0.5, 1.0]
+
+        encoded = _encode_vector(vector_param(embedding))
+
+        assert len(encoded) == 4 + 4 * len(embedding)
+        assert Vector.from_binary(encoded).to_list() == embedding
+
+    def test_text_literal_from_orm_is_accepted(self):
+        # pgvector.sqlalchemy.Vector binds ORM values as text literals
+        assert _encode_vector("[0.25,-0.5,1.0]") == _encode_vector([0.25, -0.5, 1.0])
+
+    def test_vector_param_is_float32_array(self):
+        param = vector_param([1, 2, 3])
+
+        assert isinstance(param, np.ndarray) and param.dtype == np.float32
+
+    @pytest.mark.asyncio
+    async def test_missing_extension_keeps_text_format(self, monkeypatch):
+        monkeypatch.setattr(vector_params, "_text_params", False)
+        conn = AsyncMock()
+        conn.set_type_codec.side_effect = ValueError("unknown type: public.vector")
+
+        await register_vector_codecs(conn)
+
+        conn.set_type_codec.assert_awaited_once()
+        # Text literals also encode on connections that do have the codec
+        assert vector_param([0.25, -0.5, 1.0]) == "[0.25,-0.5,1.0]"
+        assert _encode_vector(vector_param([0.25, -0.5, 1.0])) == _encode_vector([0.25, -0.5, 1.0])
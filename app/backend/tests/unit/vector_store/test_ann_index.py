@@ -0,0 +1,124 @@
+"""Unit tests for filter-aware ANN planning."""
+
+from uuid import uuid4
+
+import pytest
+from research_agent.config import get_settings
+from research_agent.infrastructure.vector_store.ann_index import (
+    INDEX_EXPRESSIONS,
+    MAX_EF_SEARCH,
+    VECTOR_EXPR,
+    ProjectAnnStats,
+    ef_search_for,
+    nearest_neighbors_sql,
+    plan_search,
+    project_index_name,
+    vector_distance_sql,
+)
+
+
+class TestAnnPlanning:
+    """Test strategy and planner setting selection."""
+
+    def test_small_project_uses_exact_search(self):
+        plan = plan_search(ProjectAnnStats(chunk_count=100, has_partial_index=False), uuid4(), 5)
+
+        assert plan.strategy == "exact"
+        assert plan.planner_settings() == {}
+
+    def test_exact_search_orders_on_an_expression_the_index_cannot_serve(self):
+        plan = plan_search(ProjectAnnStats(chunk_count=100, has_partial_index=False), uuid4(), 5)
+
+        sql = nearest_neighbors_sql(plan, "project_id = cast(:project_id as uuid)")
+
+        assert f"ORDER BY {vector_distance_sql()} + 0" in sql
+
+    def test_exact_variant_of_an_index_plan(self, monkeypatch):
+        monkeypatch.setattr(get_settings(), "pgvector_quantization", "halfvec")
+        plan = plan_search(
+            ProjectAnnStats(chunk_count=50_000, has_partial_index=True), uuid4(), 5
+        ).exact()
+
+        assert plan.strategy == "exact"
+        assert plan.quantization == "none"
+        assert plan.planner_settings() == {}
+
+    def test_large_project_with_index_inlines_project_literal(self):
+        project_id = uuid4()
+        plan = plan_search(
+            ProjectAnnStats(chunk_count=50_000, has_partial_index=True), project_id, 5
+        )
+
+        clause, params = plan.project_filter()
+
+        assert plan.strategy == "partial_index"
+        assert str(project_id) in clause
+        assert params == {}
+        assert plan.planner_settings()["hnsw.ef_search"] == "64"
+
+    def test_large_project_without_index_uses_iterative_scan(self):
+        plan = plan_search(
+            ProjectAnnStats(chunk_count=50_000, has_partial_index=False), uuid4(), 5
+        )
+
+        clause, params = plan.project_filter()
+
+        assert plan.strategy == "global_index"
+        assert ":project_id" in clause and "project_id" in params
+        assert plan.planner_settings()["hnsw.iterative_scan"] == "strict_order"
+
+    def test_ef_search_scales_with_size_and_limit(self):
+        assert ef_search_for(1_000, 5) == 40
+        assert ef_search_for(500_000, 5) == 128
+        assert ef_search_for(1_000, 100) == 200
+        assert ef_search_for(1_000, 5_000) == MAX_EF_SEARCH
+
+    def test_distance_expression_matches_index_expression(self):
+        assert vector_distance_sql().startswith(f"{VECTOR_EXPR} <=>")
+
+    def test_index_name_fits_postgres_identifier_limit(self):
+        assert len(project_index_name(uuid4())) <= 63
+
+
+class TestQuantizedSearch:
+    """Test the compact-index candidate stage and exact re-rank."""
+
+    @pytest.fixture
+    def binary_mode(self, monkeypatch):
+        settings = get_settings()
+        monkeypatch.setattr(settings, "pgvector_quantization", "binary")
+        monkeypatch.setattr(settings, "pgvector_quantized_oversample", 10)
+
+    def test_large_project_oversamples_on_compact_index(self, binary_mode):
+        plan = plan_search(
+            ProjectAnnStats(chunk_count=50_000, has_partial_index=False), uuid4(), 5
+        )
+
+        sql = nearest_neighbors_sql(plan, "project_id = cast(:project_id as uuid)")
+
+        assert plan.quantization == "binary"
+        assert plan.stage_params() == {"candidate_limit": 50}
+        assert plan.ef_search >= 100
+        # Candidates ordered by Hamming distance, final order by exact cosine
+        assert INDEX_EXPRESSIONS["binary"][0] in sql and "<~>" in sql
+        assert sql.index("LIMIT :candidate_limit") < sql.index("ORDER BY distance")
+
+    def test_small_project_stays_exact(self, binary_mode):
+        plan = plan_search(ProjectAnnStats(chunk_count=100, has_partial_index=False), uuid4(), 5)
+
+        sql = nearest_neighbors_sql(plan, "project_id = cast(:project_id as uuid)")
+
+        assert plan.quantization == "none"
+        assert plan.stage_params() == {}
+        assert ":candidate_limit" not in sql
+
+    def test_partial_index_name_is_per_mode(self):
+        project_id = uuid4()
+
+        assert project_index_name(project_id, "none") != project_index_name(project_id, "binary")
+
+    def test_unknown_mode_raises(self, monkeypatch):
+        monkeypatch.setattr(get_settings(), "pgvector_quantization", "pq")
+
+        with pytest.raises(ValueError):
+            plan_search(ProjectAnnStats(chunk_count=50_000, has_partial_index=False), uuid4(), 5)
@@ -0,0 +1,167 @@
+"""Unit tests for the memory-mapped in-process vector store."""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import numpy as np
+import pytest
+from research_agent.config import get_settings
+from research_agent.infrastructure.vector_store import mmap_index
+from research_agent.infrastructure.vector_store.mmap_index import (
+    MmapVectorStore,
+    ProjectVectorIndex,
+    invalidate_project_vectors,
+    load_project_index,
+)
+
+DIMS = 8
+
+
+def write_snapshot(project_id, rows, user_ids, document_ids, generation="g1", corpus_version=0):
+    """Write a snapshot the way build_project_index lays it out."""
+    matrix = np.asarray(rows, dtype=np.float32)
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+    chunk_ids = [str(uuid4()) for _ in rows]
+    np.save(mmap_index._matrix_path(project_id, generation), matrix.astype(np.float16))
+    np.savez(
+        mmap_index._meta_path(project_id, generation),
+        chunk_ids=np.array(chunk_ids, dtype=str),
+        document_ids=np.array(document_ids, dtype=str),
+        user_ids=np.array(user_ids, dtype=str),
+        page_numbers=np.arange(len(rows), dtype=np.int32),
+        corpus_version=np.int64(corpus_version),
+    )
+    mmap_index._pointer_path(project_id).write_text(generation)
+    return chunk_ids
+
+
+@pytest.fixture(autouse=True)
+def corpus_version(monkeypatch):
+    version = AsyncMock(return_value=0)
+    monkeypatch.setattr(mmap_index, "get_corpus_version", version)
+    return version
+
+
+@pytest.fixture(autouse=True)
+def index_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(get_settings(), "vector_mmap_dir", str(tmp_path))
+    mmap_index._loaded.clear()
+    yield tmp_path
+    mmap_index._loaded.clear()
+
+
+def unit(i):
+    vector = np.zeros(DIMS, dtype=np.float32)
+    vector[i] = 1.0
+    return vector
+
+
+class TestProjectVectorIndex:
+    """Test exact top-k over the float16 matrix."""
+
+    def test_top_k_orders_by_cosine_and_applies_filters(self):
+        project_id = uuid4()
+        doc_a, doc_b = str(uuid4()), str(uuid4())
+        rows = [unit(0), unit(0) + 0.5 * unit(1), unit(1), unit(0) + 0.1 * unit(2)]
+        write_snapshot(project_id, rows, ["u1", "u1", "u1", "u2"], [doc_a, doc_a, doc_b, doc_a])
+
+        index = load_project_index(project_id)
+
+        assert [row for row, _ in index.top_k(unit(0).tolist(), 3)] == [0, 3, 1]
+        assert [row for row, _ in index.top_k(unit(0).tolist(), 3, user_id="u1")] == [0, 1, 2]
+        filtered = index.top_k(unit(0).tolist(), 3, document_id=doc_b, user_id="u1")
+        assert [row for row, _ in filtered] == [2]
+        assert index.top_k(unit(0).tolist(), 3, user_id="nobody") == []
+
+    def test_invalidate_forces_reload(self):
+        project_id = uuid4()
+        write_snapshot(project_id, [unit(0)], ["u1"], [str(uuid4())])
+        assert isinstance(load_project_index(project_id), ProjectVectorIndex)
+
+        invalidate_project_vectors(project_id)
+
+        assert load_project_index(project_id) is None
+
+    def test_new_generation_replaces_loaded_snapshot(self):
+        project_id = uuid4()
+        write_snapshot(project_id, [unit(0)], ["u1"], [str(uuid4())], generation="g1")
+        assert len(load_project_index(project_id)) == 1
+
+        write_snapshot(project_id, [unit(0), unit(1)], ["u1", "u1"], [str(uuid4())] * 2, "g2")
+
+        assert len(load_project_index(project_id)) == 2
+
+    @pytest.mark.asyncio
+    async def test_build_records_corpus_version_read_before_chunks(self, corpus_version):
+        corpus_version.return_value = 3
+        row = MagicMock(id=uuid4(), resource_id=uuid4(), user_id="u1", page_number="1")
+        row.embedding = unit(0).tolist()
+
+        async def partitions(size):
+            yield [row]
+
+        session = AsyncMock()
+        session.stream.return_value = MagicMock(partitions=partitions)
+        project_id = uuid4()
+
+        index = await mmap_index.build_project_index(session, project_id)
+
+        assert index.corpus_version == 3
+        assert load_project_index(project_id).corpus_version == 3
+
+
+class TestMmapVectorStore:
+    """Test search over snapshots with PostgreSQL as source of truth."""
+
+    @pytest.mark.asyncio
+    async def test_search_skips_chunks_deleted_since_snapshot(self):
+        project_id = uuid4()
+        chunk_ids = write_snapshot(
+            project_id, [unit(0), unit(0) + unit(1)], ["u1", "u1"], [str(uuid4())] * 2
+        )
+        session = AsyncMock()
+        session.execute.return_value = [MagicMock(id=chunk_ids[1], content="still here")]
+        fallback = AsyncMock()
+        store = MmapVectorStore(session, fallback=fallback)
+
+        results = await store.search(unit(0).tolist(), project_id, limit=2, user_id="u1")
+
+        assert [str(r.chunk_id) for r in results] == [chunk_ids[1]]
+        assert results[0].content == "still here"
+        fallback.search.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_snapshot_behind_corpus_version_is_rebuilt(self, corpus_version, monkeypatch):
+        # Chunks written elsewhere (another host, a writer that never invalidates)
+        project_id = uuid4()
+        write_snapshot(project_id, [unit(0)], ["u1"], [str(uuid4())], corpus_version=1)
+        corpus_version.return_value = 2
+        monkeypatch.setattr(
+            mmap_index, "get_project_stats", AsyncMock(return_value=MagicMock(chunk_count=2))
+        )
+        rebuilt = MagicMock(corpus_version=2)
+        build = AsyncMock(return_value=rebuilt)
+        monkeypatch.setattr(mmap_index, "build_project_index", build)
+        store = MmapVectorStore(AsyncMock(), fallback=AsyncMock())
+
+        assert await store._get_index(project_id) is rebuilt
+        build.assert_awaited_once()
+
+        corpus_version.return_value = 1
+        assert isinstance(await store._get_index(project_id), ProjectVectorIndex)
+
+    @pytest.mark.asyncio
+    async def test_large_project_falls_back_to_postgres(self, monkeypatch):
+        monkeypatch.setattr(get_settings(), "vector_mmap_max_chunks", 10)
+        monkeypatch.setattr(
+            mmap_index,
+            "get_project_stats",
+            AsyncMock(return_value=MagicMock(chunk_count=11)),
+        )
+        fallback = AsyncMock()
+        fallback.search.return_value = []
+        store = MmapVectorStore(AsyncMock(), fallback=fallback)
+
+        await store.search(unit(0).tolist(), uuid4(), limit=5, user_id="u1")
+
+        fallback.search.assert_awaited_once()
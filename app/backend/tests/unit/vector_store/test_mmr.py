@@ -0,0 +1,86 @@
+"""Unit tests for MMR diversification of search results."""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import numpy as np
+import pytest
+from research_agent.infrastructure.vector_store.base import SearchResult
+from research_agent.infrastructure.vector_store.mmr import diversify_results, mmr_select
+
+
+def _result(similarity: float) -> SearchResult:
+    return SearchResult(
+        chunk_id=uuid4(),
+        document_id=uuid4(),
+        content="chunk",
+        page_number=1,
+        similarity=similarity,
+    )
+
+
+# Query on the x axis; candidate 1 is a near-duplicate of candidate 0,
+# candidate 2 is slightly less relevant but points somewhere else.
+QUERY = np.array([1.0, 0.0, 0.0])
+CANDIDATES = np.array(
+    [
+        [0.95, 0.31, 0.0],
+        [0.94, 0.34, 0.0],
+        [0.80, 0.0, 0.60],
+    ]
+)
+
+
+class TestMmrSelect:
+    """Test greedy MMR selection."""
+
+    def test_lambda_one_is_relevance_order(self):
+        assert mmr_select(QUERY, CANDIDATES, k=3, lambda_mult=1.0) == [0, 1, 2]
+
+    def test_diverse_candidate_beats_near_duplicate(self):
+        assert mmr_select(QUERY, CANDIDATES, k=2, lambda_mult=0.5) == [0, 2]
+
+    def test_k_larger_than_candidates(self):
+        assert sorted(mmr_select(QUERY, CANDIDATES, k=10, lambda_mult=0.5)) == [0, 1, 2]
+
+
+class TestDiversifyResults:
+    """Test re-selection of over-fetched search results."""
+
+    @pytest.mark.asyncio
+    async def test_uses_stored_embeddings(self):
+        results = [_result(0.95), _result(0.94), _result(0.80)]
+        store = MagicMock()
+        store.get_embeddings = AsyncMock(
+            return_value={r.chunk_id: CANDIDATES[i] for i, r in enumerate(results)}
+        )
+
+        diversified = await diversify_results(store, QUERY, results, k=2, lambda_mult=0.5)
+
+        assert diversified == [results[0], results[2]]
+        store.get_embeddings.assert_awaited_once_with([r.chunk_id for r in results])
+
+    @pytest.mark.asyncio
+    async def test_without_embeddings_keeps_top_k(self):
+        results = [_result(0.95), _result(0.94), _result(0.80)]
+        store = MagicMock()
+        store.get_embeddings = AsyncMock(return_value={})
+
+        diversified = await diversify_results(store, QUERY, results, k=2, lambda_mult=0.5)
+
+        assert diversified == results[:2]
+
+    @pytest.mark.asyncio
+    async def test_fused_scores_are_the_relevance_term(self):
+        # RRF scores from hybrid search rank candidate 1 first, unlike cosine
+        results = [_result(0.010), _result(0.016), _result(0.012)]
+        store = MagicMock()
+        store.get_embeddings = AsyncMock(
+            return_value={r.chunk_id: CANDIDATES[i] for i, r in enumerate(results)}
+        )
+
+        by_cosine = await diversify_results(store, QUERY, results, k=2, lambda_mult=1.0)
+        by_fused = await diversify_results(store, QUERY, results, k=2, lambda_mult=1.0, fused=True)
+
+        assert by_cosine == [results[0], results[1]]
+        assert by_fused == [results[1], results[2]]
@@ -0,0 +1,89 @@
+"""Unit tests for PgVectorStore hybrid search fusion modes."""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from research_agent.infrastructure.vector_store import pgvector
+from research_agent.infrastructure.vector_store.ann_index import ProjectAnnStats, plan_search
+from research_agent.infrastructure.vector_store.pgvector import PgVectorStore
+
+
+class TestPgVectorHybridFusion:
+    """Test python vs sql RRF fusion modes."""
+
+    @pytest.fixture
+    def mock_session(self):
+        session = AsyncMock()
+        session.execute = AsyncMock(return_value=MagicMock(fetchall=lambda: []))
+        session.rollback = AsyncMock()
+        return session
+
+    @pytest.mark.asyncio
+    async def test_sql_fusion_runs_single_statement(self, mock_session):
+        store = PgVectorStore(mock_session, hybrid_fusion="sql")
+
+        await store.hybrid_search(
+            query_embedding=[0.1] * 1536,
+            query_text="main conclusion",
+            project_id=uuid4(),
+            limit=5,
+            k=20,
+            user_id="user-123",
+        )
+
+        statements = [call[0][0] for call in mock_session.execute.call_args_list]
+        hybrid = [s for s in statements if "FULL OUTER JOIN" in str(s)]
+        assert len(hybrid) == 1
+        assert not any("ts_rank_cd" in str(s) for s in statements if s is not hybrid[0])
+        statement = hybrid[0]
+        sql = str(statement)
+        assert "FULL OUTER JOIN" in sql
+        assert "websearch_to_tsquery" in sql
+        assert sql.count("user_id = :user_id") == 2
+        assert statement.compile().params["k"] == 20
+        assert statement.compile().params["limit"] == 5
+
+    @pytest.mark.asyncio
+    async def test_python_fusion_runs_two_searches(self, mock_session):
+        store = PgVectorStore(mock_session, hybrid_fusion="python")
+
+        await store.hybrid_search(
+            query_embedding=[0.1] * 1536,
+            query_text="main conclusion",
+            project_id=uuid4(),
+        )
+
+        statements = [str(call[0][0]) for call in mock_session.execute.call_args_list]
+        assert sum("ts_rank_cd" in s for s in statements) == 1
+        assert sum("ORDER BY embedding::vector(1536) <=>" in s for s in statements) == 1
+
+    def test_rejects_unknown_fusion_mode(self, mock_session):
+        with pytest.raises(ValueError):
+            PgVectorStore(mock_session, hybrid_fusion="bogus")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("fusion", ["sql", "python"])
+    async def test_document_scoped_search_skips_the_project_index(
+        self, mock_session, monkeypatch, fusion
+    ):
+        project_id = uuid4()
+        index_plan = plan_search(
+            ProjectAnnStats(chunk_count=50_000, has_partial_index=True), project_id, 20
+        )
+        monkeypatch.setattr(pgvector, "plan_project_search", AsyncMock(return_value=index_plan))
+        store = PgVectorStore(mock_session, hybrid_fusion=fusion)
+
+        await store.hybrid_search(
+            query_embedding=[0.1] * 1536,
+            query_text="main conclusion",
+            project_id=project_id,
+            k=20,
+            document_id=uuid4(),
+        )
+
+        statements = [str(call[0][0]) for call in mock_session.execute.call_args_list]
+        vector = [s for s in statements if "nearest AS" in s or "vector_hits AS" in s]
+        assert len(vector) == 1
+        assert "+ 0" in vector[0]
+        assert not any("set_config" in s for s in statements)
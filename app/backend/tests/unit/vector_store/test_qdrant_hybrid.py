@@ -0,0 +1,124 @@
+"""Unit tests for Qdrant dense + sparse hybrid search."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from qdrant_client.models import RrfQuery, SparseVector
+from research_agent.infrastructure.vector_store import qdrant as qdrant_module
+from research_agent.infrastructure.vector_store.qdrant import (
+    RRF_K,
+    SPARSE_VECTOR_NAME,
+    QdrantVectorStore,
+)
+from research_agent.infrastructure.vector_store.sparse_encoder import BM25SparseEncoder
+
+
+class TestBM25SparseEncoder:
+    """Test local sparse term weighting."""
+
+    def test_tokenize_drops_stopwords_and_splits_cjk(self):
+        encoder = BM25SparseEncoder()
+
+        tokens = encoder.tokenize("The conclusion of 检索增强")
+
+        assert tokens == ["conclusion", "检索", "索增", "增强"]
+
+    def test_document_weights_saturate_with_term_frequency(self):
+        encoder = BM25SparseEncoder()
+
+        vector = encoder.encode_document("rag rag rag retrieval")
+        weights = dict(zip(vector.indices, vector.values))
+
+        rag = weights[encoder.token_index("rag")]
+        retrieval = weights[encoder.token_index("retrieval")]
+        assert retrieval < rag < 3 * retrieval
+
+    def test_query_uses_unit_weights(self):
+        encoder = BM25SparseEncoder()
+
+        vector = encoder.encode_query("rag rag retrieval")
+
+        assert sorted(vector.values) == [1.0, 1.0]
+        assert vector.indices == sorted(vector.indices)
+
+
+class TestQdrantHybridSearch:
+    """Test that hybrid search issues one fused prefetch query."""
+
+    @pytest.fixture
+    def mock_qdrant_client(self):
+        client = AsyncMock()
+        client.query_points = AsyncMock(return_value=MagicMock(points=[]))
+        return client
+
+    @pytest.fixture(autouse=True)
+    def sparse_supported(self):
+        with patch.object(
+            qdrant_module, "collection_has_sparse_vectors", AsyncMock(return_value=True)
+        ) as mock:
+            yield mock
+
+    @pytest.mark.asyncio
+    async def test_hybrid_search_single_weighted_rrf_query(self, mock_qdrant_client):
+        store = QdrantVectorStore(client=mock_qdrant_client)
+
+        await store.hybrid_search(
+            query_embedding=[0.1] * 1536,
+            query_text="main conclusion",
+            project_id=uuid4(),
+            limit=5,
+            vector_weight=0.6,
+            keyword_weight=0.4,
+            k=30,
+            user_id="user-123",
+        )
+
+        mock_qdrant_client.query_points.assert_called_once()
+        call_kwargs = mock_qdrant_client.query_points.call_args.kwargs
+
+        query = call_kwargs["query"]
+        assert isinstance(query, RrfQuery)
+        assert query.rrf.k == RRF_K
+        assert query.rrf.weights == [0.6, 0.4]
+        assert call_kwargs["limit"] == 5
+
+        dense, sparse = call_kwargs["prefetch"]
+        assert dense.limit == 30 and dense.using is None
+        assert sparse.limit == 30 and sparse.using == SPARSE_VECTOR_NAME
+        assert isinstance(sparse.query, SparseVector)
+
+        # Tenant filter must apply to both candidate lists
+        for prefetch in (dense, sparse):
+            keys = [c.key for c in prefetch.filter.must]
+            assert "project_id" in keys and "user_id" in keys
+
+    @pytest.mark.asyncio
+    async def test_hybrid_search_without_terms_uses_dense_only(self, mock_qdrant_client):
+        store = QdrantVectorStore(client=mock_qdrant_client)
+
+        await store.hybrid_search(
+            query_embedding=[0.1] * 1536,
+            query_text="the of and",
+            project_id=uuid4(),
+        )
+
+        call_kwargs = mock_qdrant_client.query_points.call_args.kwargs
+        assert len(call_kwargs["prefetch"]) == 1
+        assert call_kwargs["query"].rrf.weights == [0.7]
+
+    @pytest.mark.asyncio
+    async def test_hybrid_search_falls_back_without_sparse_config(
+        self, mock_qdrant_client, sparse_supported
+    ):
+        sparse_supported.return_value = False
+        store = QdrantVectorStore(client=mock_qdrant_client)
+
+        await store.hybrid_search(
+            query_embedding=[0.1] * 1536,
+            query_text="main conclusion",
+            project_id=uuid4(),
+        )
+
+        call_kwargs = mock_qdrant_client.query_points.call_args.kwargs
+        assert "prefetch" not in call_kwargs
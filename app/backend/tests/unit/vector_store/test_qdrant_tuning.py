@@ -0,0 +1,117 @@
+"""Unit tests for the Qdrant tuning profile (indexes, quantization, upserts)."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from research_agent.config import get_settings
+from research_agent.domain.entities.resource import ResourceType
+from research_agent.infrastructure.vector_store import qdrant as qdrant_module
+from research_agent.infrastructure.vector_store.qdrant import (
+    PAYLOAD_INDEX_FIELDS,
+    QdrantVectorStore,
+    dense_search_params,
+    ensure_collection_tuning,
+)
+
+
+def _chunk(content: str = "text") -> dict:
+    return {
+        "chunk_id": uuid4(),
+        "resource_id": uuid4(),
+        "resource_type": ResourceType.DOCUMENT,
+        "project_id": uuid4(),
+        "chunk_index": 0,
+        "content": content,
+        "embedding": [0.1] * 8,
+        "metadata": {},
+        "user_id": "user-1",
+    }
+
+
+class TestCollectionTuning:
+    """Test idempotent payload indexes and quantization."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_state(self, monkeypatch):
+        monkeypatch.setattr(qdrant_module, "_tuned_collections", set())
+
+    @pytest.mark.asyncio
+    async def test_creates_only_missing_payload_indexes(self, monkeypatch):
+        monkeypatch.setattr(get_settings(), "qdrant_quantization", "none")
+        client = AsyncMock()
+        client.get_collection = AsyncMock(
+            return_value=MagicMock(payload_schema={"project_id": MagicMock()})
+        )
+
+        await ensure_collection_tuning(client, "chunks")
+        await ensure_collection_tuning(client, "chunks")
+
+        created = [call.kwargs["field_name"] for call in client.create_payload_index.call_args_list]
+        assert created == [f for f in PAYLOAD_INDEX_FIELDS if f != "project_id"]
+        client.update_collection.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_enables_int8_quantization_on_existing_collection(self, monkeypatch):
+        monkeypatch.setattr(get_settings(), "qdrant_quantization", "int8")
+        client = AsyncMock()
+        client.get_collection = AsyncMock(
+            return_value=MagicMock(
+                payload_schema={f: MagicMock() for f in PAYLOAD_INDEX_FIELDS},
+                config=MagicMock(quantization_config=None),
+            )
+        )
+
+        await ensure_collection_tuning(client, "chunks")
+
+        client.update_collection.assert_awaited_once()
+        assert dense_search_params().quantization.rescore is True
+
+    def test_unknown_quantization_mode(self, monkeypatch):
+        monkeypatch.setattr(get_settings(), "qdrant_quantization", "pq")
+        with pytest.raises(ValueError):
+            dense_search_params()
+
+
+class TestParallelUpsert:
+    """Test size-bounded batches with bounded concurrency."""
+
+    @pytest.mark.asyncio
+    async def test_batches_bounded_by_count_bytes_and_concurrency(self, monkeypatch):
+        settings = get_settings()
+        monkeypatch.setattr(settings, "qdrant_upsert_concurrency", 2)
+        monkeypatch.setattr(settings, "qdrant_upsert_max_batch_bytes", 3000)
+
+        in_flight = 0
+        peak = 0
+        batch_sizes = []
+
+        async def upsert(collection_name, points):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            batch_sizes.append(len(points))
+            in_flight -= 1
+
+        client = AsyncMock()
+        client.upsert = upsert
+        store = QdrantVectorStore(client=client)
+        monkeypatch.setattr(store, "_sparse_vectors_enabled", AsyncMock(return_value=False))
+
+        # ~1.1 KB per point -> byte limit closes batches at 2 points
+        await store.upsert_resource_chunks_batch([_chunk() for _ in range(9)], batch_size=5)
+
+        assert sorted(batch_sizes) == [1, 2, 2, 2, 2]
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_is_raised(self, monkeypatch):
+        client = AsyncMock()
+        client.upsert = AsyncMock(side_effect=RuntimeError("boom"))
+        store = QdrantVectorStore(client=client)
+        monkeypatch.setattr(store, "_sparse_vectors_enabled", AsyncMock(return_value=False))
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await store.upsert_resource_chunks_batch([_chunk() for _ in range(3)], batch_size=1)
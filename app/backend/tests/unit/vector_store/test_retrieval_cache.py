@@ -0,0 +1,99 @@
+"""Unit tests for the versioned retrieval result cache."""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from research_agent.config import get_settings
+from research_agent.infrastructure.vector_store import retrieval_cache
+from research_agent.infrastructure.vector_store.base import SearchResult
+from research_agent.infrastructure.vector_store.retrieval_cache import (
+    CachedVectorStore,
+    get_retrieval_cache_stats,
+    reset_retrieval_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def local_cache_only(monkeypatch):
+    monkeypatch.setattr(get_settings(), "retrieval_cache_redis", False)
+    reset_retrieval_cache()
+    yield
+    reset_retrieval_cache()
+
+
+def _store(versions: list[int]):
+    inner = MagicMock()
+    inner.search = AsyncMock(
+        side_effect=lambda **kwargs: [
+            SearchResult(
+                chunk_id=uuid4(),
+                document_id=uuid4(),
+                content="hit",
+                page_number=1,
+                similarity=0.9,
+            )
+        ]
+    )
+    session = AsyncMock()
+    session.execute = AsyncMock(
+        side_effect=[MagicMock(scalar=lambda v=v: v) for v in versions]
+    )
+    return CachedVectorStore(inner, session), inner
+
+
+class TestCachedVectorStore:
+    """Test cache hits, misses and corpus-version invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_search_is_served_from_cache(self):
+        store, inner = _store([3, 3])
+        project_id = uuid4()
+
+        first = await store.search([0.1] * 8, project_id, limit=5, user_id="u1")
+        second = await store.search([0.1] * 8, project_id, limit=5, user_id="u1")
+
+        assert first == second
+        assert inner.search.await_count == 1
+        stats = get_retrieval_cache_stats()
+        assert stats["local_hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_corpus_version_bump_invalidates(self):
+        store, inner = _store([3, 4])
+        project_id = uuid4()
+
+        await store.search([0.1] * 8, project_id, limit=5)
+        await store.search([0.1] * 8, project_id, limit=5)
+
+        assert inner.search.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_key_includes_user_and_filters(self):
+        store, inner = _store([1, 1, 1])
+        project_id = uuid4()
+
+        await store.search([0.1] * 8, project_id, limit=5, user_id="u1")
+        await store.search([0.1] * 8, project_id, limit=5, user_id="u2")
+        await store.search([0.1] * 8, project_id, limit=5, user_id="u1", document_id=uuid4())
+
+        assert inner.search.await_count == 3
+
+    def test_embedding_digest_absorbs_float_noise(self):
+        base = [0.123456] * 8
+        noisy = [0.123456 + 1e-7] * 8
+        assert retrieval_cache._embedding_digest(base) == retrieval_cache._embedding_digest(noisy)
+
+    def test_encode_roundtrip(self):
+        results = [
+            SearchResult(
+                chunk_id=uuid4(),
+                document_id=uuid4(),
+                content="text",
+                page_number=2,
+                similarity=0.5,
+            )
+        ]
+        assert retrieval_cache._decode(retrieval_cache._encode(results)) == results
@@ -0,0 +1,150 @@
+"""Unit tests for batched multi-query vector search."""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from research_agent.infrastructure.embedding.base import EmbeddingService
+from research_agent.infrastructure.vector_store.base import SearchResult, VectorStore
+from research_agent.infrastructure.vector_store.langchain_pgvector import PGVectorRetriever
+from research_agent.infrastructure.vector_store.pgvector import PgVectorStore
+from research_agent.infrastructure.vector_store.qdrant import QdrantVectorStore
+
+
+class TestPgVectorSearchMany:
+    """Test that all queries are answered by one LATERAL statement."""
+
+    @pytest.mark.asyncio
+    async def test_single_statement_grouped_by_query(self):
+        chunk_id, document_id = uuid4(), uuid4()
+        rows = [
+            MagicMock(
+                query_index=1,
+                id=chunk_id,
+                document_id=document_id,
+                content="hit",
+                page_number=3,
+                similarity=0.9,
+            )
+        ]
+        session = AsyncMock()
+        session.execute = AsyncMock(return_value=MagicMock(fetchall=lambda: rows))
+        store = PgVectorStore(session)
+        doc_a, doc_b = uuid4(), uuid4()
+
+        results = await store.search_many(
+            query_embeddings=[[0.1] * 1536, [0.2] * 1536],
+            project_id=uuid4(),
+            limit=4,
+            user_id="user-123",
+            document_ids=[doc_a, doc_b],
+        )
+
+        statements = [call[0][0] for call in session.execute.call_args_list]
+        batched = [s for s in statements if "CROSS JOIN LATERAL" in str(s)]
+        assert len(batched) == 1
+        sql = str(batched[0])
+        assert "q.query_vector" in sql and "q.query_document_id" in sql
+        params = batched[0].compile().params
+        assert params["limit"] == 4
+        assert params["document_id_0"] == str(doc_a)
+        assert params["document_id_1"] == str(doc_b)
+
+        assert results[0] == []
+        assert [r.chunk_id for r in results[1]] == [chunk_id]
+
+    @pytest.mark.asyncio
+    async def test_document_scoped_queries_run_exactly_in_their_own_statement(self):
+        session = AsyncMock()
+        session.execute = AsyncMock(return_value=MagicMock(fetchall=lambda: []))
+        store = PgVectorStore(session)
+        doc_a = uuid4()
+
+        await store.search_many(
+            query_embeddings=[[0.1] * 1536, [0.2] * 1536],
+            project_id=uuid4(),
+            user_id="user-123",
+            document_ids=[doc_a, None],
+        )
+
+        statements = [str(call[0][0]) for call in session.execute.call_args_list]
+        batched = [s for s in statements if "CROSS JOIN LATERAL" in s]
+        assert len(batched) == 2
+        scoped = [s for s in batched if "resource_id = q.query_document_id" in s]
+        assert len(scoped) == 1
+        assert "+ 0" in scoped[0]
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_skips_database(self):
+        session = AsyncMock()
+        store = PgVectorStore(session)
+
+        assert await store.search_many([], project_id=uuid4()) == []
+        session.execute.assert_not_called()
+
+
+class TestQdrantSearchMany:
+    """Test that Qdrant answers all queries with one batch call."""
+
+    @pytest.mark.asyncio
+    async def test_batch_request_has_per_query_filters(self):
+        client = AsyncMock()
+        client.query_batch_points = AsyncMock(
+            return_value=[MagicMock(points=[]), MagicMock(points=[])]
+        )
+        store = QdrantVectorStore(client=client)
+        doc_a = uuid4()
+
+        results = await store.search_many(
+            query_embeddings=[[0.1] * 1536, [0.2] * 1536],
+            project_id=uuid4(),
+            limit=3,
+            user_id="user-123",
+            document_ids=[doc_a, None],
+        )
+
+        client.query_batch_points.assert_called_once()
+        requests = client.query_batch_points.call_args.kwargs["requests"]
+        assert [r.limit for r in requests] == [3, 3]
+        first_keys = [c.key for c in requests[0].filter.must]
+        second_keys = [c.key for c in requests[1].filter.must]
+        assert "document_id" in first_keys and "document_id" not in second_keys
+        assert results == [[], []]
+
+
+class TestRetrieveByDocument:
+    """Test merging per-document top-k lists."""
+
+    @pytest.mark.asyncio
+    async def test_every_document_gets_its_best_chunk_first(self):
+        big, small = uuid4(), uuid4()
+
+        def hits(document_id, similarities):
+            return [
+                SearchResult(
+                    chunk_id=uuid4(),
+                    document_id=document_id,
+                    content="chunk",
+                    page_number=1,
+                    similarity=similarity,
+                )
+                for similarity in similarities
+            ]
+
+        vector_store = MagicMock(spec=VectorStore)
+        vector_store.search_many = AsyncMock(
+            return_value=[hits(big, [0.9, 0.89, 0.88]), hits(small, [0.5, 0.4, 0.3])]
+        )
+        embedding_service = MagicMock(spec=EmbeddingService)
+        embedding_service.embed = AsyncMock(return_value=[0.1] * 8)
+        retriever = PGVectorRetriever(
+            vector_store=vector_store,
+            embedding_service=embedding_service,
+            project_id=uuid4(),
+            k=3,
+        )
+
+        documents = await retriever.aget_relevant_documents_by_document("q", [big, small])
+
+        assert [d.metadata["document_id"] for d in documents] == [str(big), str(big), str(small)]
+        assert [d.metadata["similarity"] for d in documents] == [0.9, 0.89, 0.5]
@@ -572,6 +572,12 @@ export default function AssistantPanel({ visible, width, onToggle }: AssistantPa
               ? { ...m, content: (m.content || '') + chunk.content }
               : m
           ));
+        } else if (chunk.type === 'reset') {
+          // Speculative draft was invalidated by grading - clear it before the final answer streams
+          setThinkingStatus({ step: 'generating', message: chunk.message || 'Refining the answer...' });
+          setChatMessages(prev => prev.map(m =>
+            m.id === aiMsgId ? { ...m, content: '', citations: undefined } : m
+          ));
         } else if (chunk.type === 'sources') {
           setChatMessages(prev => prev.map(m =>
             m.id === aiMsgId ? { ...m, sources: chunk.sources } : m